@@ -2,15 +2,64 @@
 Módulo com funções de endpoint a serem servidas pela API Flask.
 """
 
+import threading
+
 from flask import Flask, jsonify, render_template, request
 import pandas as pd
-from fraud_detection.pipeline.prediction import PredictionPipeline
-from fraud_detection.components.data_transformation import convert_to_numeric
+from fraud_detection.pipeline.prediction import (
+    PredictionPipeline,
+    model_version,
+)
 from fraud_detection import logger
 
-
 app = Flask(__name__)
 
+# Campos de entrada na ordem dos dados brutos, a mesma do pipeline ajustado
+INPUT_COLUMNS = [
+    "score_1",
+    "score_2",
+    "score_3",
+    "score_4",
+    "score_5",
+    "score_6",
+    "pais",
+    "score_7",
+    "produto",
+    "categoria_produto",
+    "score_8",
+    "score_9",
+    "score_10",
+    "entrega_doc_1",
+    "entrega_doc_2",
+    "entrega_doc_3",
+    "data_compra",
+    "valor_compra",
+    "score_fraude_modelo",
+]
+
+
+# Pipeline de predição compartilhado entre as requisições
+SERVED = {"pipeline": None}
+SERVED_LOCK = threading.Lock()
+
+
+def prediction_pipeline():
+    """
+    Pipeline de predição carregado na primeira requisição e compartilhado
+    entre as seguintes, acumulando as estatísticas das predições. O
+    pipeline é recarregado quando o modelo ou a cascata utilizados são
+    salvos novamente, reiniciando as estatísticas.
+    """
+    version = model_version()
+    with SERVED_LOCK:
+        pipeline = SERVED["pipeline"]
+        if pipeline is None or pipeline.model_version != version:
+            if pipeline is not None:
+                logger.info("Modelo alterado, recarregando o pipeline")
+            pipeline = PredictionPipeline()
+            SERVED["pipeline"] = pipeline
+    return pipeline
+
 
 @app.route("/", methods=["GET"])
 def homePage():
@@ -66,32 +115,9 @@ def index():
         logger.info(data)
 
         data = pd.DataFrame([data])
-        data.columns = [
-            "score_1",
-            "score_2",
-            "score_3",
-            "score_4",
-            "score_5",
-            "score_6",
-            "pais",
-            "score_7",
-            "produto",
-            "categoria_produto",
-            "score_8",
-            "score_9",
-            "score_10",
-            "entrega_doc_1",
-            "entrega_doc_2",
-            "entrega_doc_3",
-            "data_compra",
-            "valor_compra",
-            "score_fraude_modelo",
-        ]
+        data.columns = INPUT_COLUMNS
 
-        obj = PredictionPipeline()
-        data = obj.transform_input_data(data)
-        data = convert_to_numeric(data)
-        predict, predict_proba = obj.predict(data)
+        predict, predict_proba = prediction_pipeline().predict_raw(data)
 
         resultado = {
             "predicted_class": int(predict),
@@ -108,6 +134,37 @@ def index():
         return "falha"
 
 
+@app.route("/explain", methods=["POST"])
+def explain():
+    """
+    Endpoint de predição em lote com os motivos das transações declinadas.
+    Recebe em JSON a lista "transactions" com os dados brutos de cada
+    transação, reordenados para a ordem dos campos do pipeline.
+    """
+    try:
+        data = pd.DataFrame(
+            request.get_json()["transactions"], columns=INPUT_COLUMNS
+        )
+        results = prediction_pipeline().explain(data)
+        return jsonify({"results": results})
+
+    except (KeyError, TypeError, ValueError) as e:
+        logger.exception("Não foi possível explicar as transações: %s", e)
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Estatísticas das predições com saída antecipada e com a cascata"""
+    pipeline = prediction_pipeline()
+    return jsonify(
+        {
+            "early_exit": pipeline.early_exit_stats(),
+            "cascade": pipeline.cascade_stats(),
+        }
+    )
+
+
 if __name__ == "__main__":
     # app.run(host="0.0.0.0", port=8080, debug=True)
     app.run(host="0.0.0.0", port=8080)
@@ -0,0 +1,106 @@
+"""
+Benchmark da codificação da categoria de produto na predição.
+
+Compara o custo por linha do NonFrequentAggregator seguido do
+TargetEncoderTransformer com a tabela de consulta do CategoryLookupEncoder,
+para diferentes quantidades de categorias. A predição da API recebe uma
+linha por requisição, assim o tempo é medido em DataFrames de linha única.
+
+Execução:
+    python benchmarks/bench_category_lookup.py --cardinalities 100 10000 1000000
+"""
+
+import argparse
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from fraud_detection.components.encoders import (
+    CategoryLookupEncoder,
+    NonFrequentAggregator,
+    TargetEncoderTransformer,
+)
+
+
+def _two_step_transform(aggregator, target_encoder, frame):
+    """Codificação original, com as duas etapas do pipeline."""
+    return target_encoder.transform(aggregator.transform(frame))
+
+
+def _time_per_row(function, frames):
+    """Tempo médio, em microssegundos, da função aplicada a cada linha."""
+    start = time.perf_counter()
+    for frame in frames:
+        function(frame)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def run_benchmark(cardinalities, requests):
+    """
+    Executa o benchmark para cada quantidade de categorias.
+
+    Args:
+        cardinalities (list(int)): Quantidades de categorias avaliadas.
+        requests (int): Quantidade de linhas únicas transformadas.
+
+    Returns:
+        list(dict): Tempo por linha de cada forma de codificação.
+    """
+    rng = np.random.default_rng(42)
+    results = []
+    for cardinality in cardinalities:
+        # Quatro ocorrências por categoria, todas consideradas frequentes
+        categories = np.repeat(
+            [f"cat_{i}" for i in range(cardinality)], 4
+        ).astype(object)
+        X = pd.DataFrame({"categoria_produto": categories})
+        y = pd.Series(rng.random(len(X)) < 0.05).astype(int)
+
+        aggregator = NonFrequentAggregator().fit(X)
+        target_encoder = TargetEncoderTransformer().fit(
+            aggregator.transform(X), y
+        )
+        lookup = CategoryLookupEncoder().fit_from_processors(
+            aggregator, target_encoder
+        )
+
+        frames = [
+            X.iloc[[index]] for index in rng.integers(0, len(X), size=requests)
+        ]
+        results.append(
+            {
+                "categorias": cardinality,
+                "agregador + target encoder (µs/linha)": _time_per_row(
+                    partial(_two_step_transform, aggregator, target_encoder),
+                    frames,
+                ),
+                "tabela de consulta (µs/linha)": _time_per_row(
+                    lookup.transform, frames
+                ),
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cardinalities",
+        type=int,
+        nargs="+",
+        default=[100, 10_000, 100_000],
+    )
+    parser.add_argument("--requests", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(args.cardinalities, args.requests),
+            headers="keys",
+            floatfmt=".1f",
+        )
+    )
@@ -0,0 +1,145 @@
+"""
+Benchmark dos modos de features da transformação dos dados.
+
+Compara a codificação atual, com one-hot e target encoding ("encoded"), aos
+códigos inteiros utilizados como features categóricas nativas do LightGBM
+("categorical"). São informados a quantidade de features, os tempos de
+ajuste e de transformação do pipeline, o tempo de treino, a AUC de teste e
+a latência mediana da predição de uma linha pelo pipeline de predição.
+
+Execução:
+    python benchmarks/bench_feature_mode.py \
+        --data artifacts/data_ingestion/dados.csv
+"""
+
+import argparse
+import time
+
+import lightgbm as lgb
+import numpy as np
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+from tabulate import tabulate
+
+from fraud_detection.components.encoders import CategoryLookupEncoder
+from fraud_detection.components.processors import convert_to_numeric
+from fraud_detection.components.preprocessing_pipeline import (
+    build_preprocessing_pipeline,
+    build_serving_pipeline,
+)
+from fraud_detection.constants import SCHEMA_FILE_PATH
+from fraud_detection.utils.commons import read_yaml
+from fraud_detection.utils.raw_data import read_raw_data
+
+PARAMS = {"objective": "binary", "learning_rate": 0.05, "verbose": -1}
+
+
+def serving_pipeline(pipeline):
+    """Pipeline de predição equivalente ao do PredictionPipeline."""
+    steps = pipeline.named_steps
+    if "target_encoder" not in steps:
+        return build_serving_pipeline(pipeline, None)
+    return build_serving_pipeline(
+        pipeline,
+        CategoryLookupEncoder().fit_from_processors(
+            steps["column_aggregator"], steps["target_encoder"]
+        ),
+    )
+
+
+def run_benchmark(data_path, rounds, rows):
+    """
+    Executa o benchmark nos dados brutos.
+
+    Args:
+        data_path (str): Arquivo CSV dos dados brutos.
+        rounds (int): Quantidade de árvores treinadas.
+        rows (int): Quantidade de linhas na medida da latência.
+
+    Returns:
+        list(dict): Medidas de cada modo de features.
+    """
+    schema = read_yaml(SCHEMA_FILE_PATH)
+    target_column = next(iter(schema.TARGET_COLUMN))
+    data = read_raw_data(data_path, schema.COLUMNS)
+    X_train, X_test, y_train, y_test = train_test_split(
+        data.drop(columns=target_column),
+        data[target_column],
+        test_size=0.2,
+        random_state=42,
+    )
+
+    results = []
+    for feature_mode in ["encoded", "categorical"]:
+        pipeline = build_preprocessing_pipeline(feature_mode=feature_mode)
+
+        start = time.perf_counter()
+        X_fit = convert_to_numeric(pipeline.fit_transform(X_train, y_train))
+        fit_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        X_eval = convert_to_numeric(pipeline.transform(X_test))
+        transform_seconds = time.perf_counter() - start
+
+        categorical_feature = "auto"
+        if feature_mode == "categorical":
+            categorical_feature = pipeline.named_steps[
+                "category_codes"
+            ].categorical_features_
+
+        start = time.perf_counter()
+        booster = lgb.train(
+            PARAMS,
+            lgb.Dataset(
+                X_fit.astype(np.float32),
+                label=y_train,
+                categorical_feature=categorical_feature,
+            ),
+            num_boost_round=rounds,
+        )
+        train_seconds = time.perf_counter() - start
+
+        # O CountryProcessor imputa o país pela moda da própria entrada,
+        # assim as linhas medidas isoladamente devem possuir o país
+        serving = serving_pipeline(pipeline)
+        X_rows = X_test.dropna(subset=["pais"])
+        latencies = []
+        for index in range(min(rows, len(X_rows))):
+            row = X_rows.iloc[[index]]
+            start = time.perf_counter()
+            booster.predict(
+                convert_to_numeric(serving.transform(row)).astype(np.float32)
+            )
+            latencies.append(time.perf_counter() - start)
+
+        results.append(
+            {
+                "modo": feature_mode,
+                "features": X_fit.shape[1],
+                "ajuste (s)": fit_seconds,
+                "transformação (s)": transform_seconds,
+                "treino (s)": train_seconds,
+                "AUC": roc_auc_score(
+                    y_test, booster.predict(X_eval.astype(np.float32))
+                ),
+                "latência por linha (ms)": np.median(latencies) * 1000,
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data", default="artifacts/data_ingestion/dados.csv")
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(args.data, args.rounds, args.rows),
+            headers="keys",
+            floatfmt=".4f",
+        )
+    )
@@ -0,0 +1,94 @@
+"""
+Benchmark da construção do lightgbm.Dataset de treino.
+
+Compara o treino do LGBMClassifier a partir do DataFrame, que discretiza as
+features a cada execução, com o Dataset float32 construído e salvo pelo
+build_dataset, e com o carregamento do Dataset binário já discretizado.
+
+Execução:
+    python benchmarks/bench_lgb_dataset.py --rows 2000000 --features 40
+"""
+
+import argparse
+import tempfile
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from lightgbm import LGBMClassifier
+from tabulate import tabulate
+
+from fraud_detection.components.training_data import build_dataset
+
+PARAMS = {
+    "objective": "binary",
+    "max_bin": 255,
+    "min_data_in_bin": 3,
+    "bin_construct_sample_cnt": 200000,
+    "verbose": -1,
+}
+
+
+def run_benchmark(rows, features, rounds):
+    """
+    Executa o benchmark em dados sintéticos.
+
+    Args:
+        rows (int): Quantidade de linhas geradas.
+        features (int): Quantidade de features.
+        rounds (int): Quantidade de árvores treinadas.
+
+    Returns:
+        list(dict): Tempo de preparação dos dados e de treino de cada forma.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(
+        rng.normal(size=(rows, features)),
+        columns=[f"score_{i}" for i in range(features)],
+    )
+    y = pd.Series((X["score_0"] + rng.normal(size=rows) > 2).astype(int))
+
+    results = []
+
+    start = time.perf_counter()
+    LGBMClassifier(n_estimators=rounds, verbose=-1).fit(X, y)
+    results.append(
+        {
+            "treino": "LGBMClassifier.fit (DataFrame)",
+            "tempo total (s)": time.perf_counter() - start,
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ["build_dataset (construção)", "build_dataset (binário)"]:
+            start = time.perf_counter()
+            dataset, _ = build_dataset(X, y, PARAMS, directory)
+            dataset.construct()
+            prepared = time.perf_counter() - start
+            lgb.train(PARAMS, dataset, num_boost_round=rounds)
+            results.append(
+                {
+                    "treino": name,
+                    "preparação (s)": prepared,
+                    "tempo total (s)": time.perf_counter() - start,
+                }
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--features", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(args.rows, args.features, args.rounds),
+            headers="keys",
+            floatfmt=".2f",
+        )
+    )
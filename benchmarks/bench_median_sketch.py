@@ -0,0 +1,113 @@
+"""
+Benchmark da mediana aproximada por sketch KLL frente à mediana exata.
+
+Compara, para as colunas contínuas do imputer, o tempo de ajuste e o erro
+da mediana estimada em relação à mediana exata do numpy. O sketch é
+calculado de forma sequencial e também em partes processadas em paralelo
+e mescladas ao final.
+
+Execução:
+    python benchmarks/bench_median_sketch.py --rows 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from joblib import Parallel, delayed
+from tabulate import tabulate
+
+from fraud_detection.utils.quantile_sketch import KLLSketch
+
+
+def _partial_sketch(values, error, seed):
+    """Calcula o sketch de uma parte dos dados em um processo separado."""
+    return KLLSketch(error=error, random_state=seed).update(values)
+
+
+def run_benchmark(rows, errors, n_jobs):
+    """
+    Executa o benchmark para cada erro de sketch configurado.
+
+    Args:
+        rows (int): Quantidade de valores gerados.
+        errors (list(float)): Erros de rank dos sketches avaliados.
+        n_jobs (int): Quantidade de processos para o sketch paralelo.
+
+    Returns:
+        list(dict): Resultados de tempo e erro de cada configuração.
+    """
+    rng = np.random.default_rng(42)
+    # Distribuição assimétrica, semelhante a valor_compra
+    values = rng.lognormal(3, 1, rows)
+    values[rng.random(rows) < 0.05] = np.nan
+
+    start = time.perf_counter()
+    exact_median = np.nanmedian(values)
+    exact_time = time.perf_counter() - start
+
+    valid_values = values[~np.isnan(values)]
+    results = [
+        {
+            "método": "exato (np.nanmedian)",
+            "erro configurado": "-",
+            "tempo (s)": exact_time,
+            "erro de rank": 0.0,
+            "erro relativo": 0.0,
+            "itens em memória": len(valid_values),
+        }
+    ]
+
+    for error in errors:
+        start = time.perf_counter()
+        sketch = KLLSketch(error=error)
+        for chunk in np.array_split(values, 100):
+            sketch.update(chunk)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        partial_sketches = Parallel(n_jobs=n_jobs)(
+            delayed(_partial_sketch)(part, error, seed)
+            for seed, part in enumerate(np.array_split(values, n_jobs))
+        )
+        merged = partial_sketches[0]
+        for partial_sketch in partial_sketches[1:]:
+            merged.merge(partial_sketch)
+        parallel_time = time.perf_counter() - start
+
+        for method, fitted, elapsed in [
+            ("sketch em blocos", sketch, sequential_time),
+            (f"sketch paralelo ({n_jobs} processos)", merged, parallel_time),
+        ]:
+            median = fitted.median()
+            results.append(
+                {
+                    "método": method,
+                    "erro configurado": error,
+                    "tempo (s)": elapsed,
+                    "erro de rank": abs((valid_values < median).mean() - 0.5),
+                    "erro relativo": abs(median - exact_median)
+                    / exact_median,
+                    "itens em memória": len(fitted),
+                }
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument(
+        "--errors", type=float, nargs="+", default=[0.01, 0.005, 0.001]
+    )
+    parser.add_argument("--n-jobs", type=int, default=4)
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(args.rows, args.errors, args.n_jobs),
+            headers="keys",
+            floatfmt=".5f",
+        )
+    )
@@ -0,0 +1,141 @@
+"""
+Benchmark da subamostragem das linhas legítimas no treino.
+
+Compara o treino com todos os dados ao treino com diferentes frações das
+linhas legítimas, mantendo todas as fraudes, para as correções por pesos e
+por calibração das probabilidades. São informados o tempo de treino, a AUC
+e o erro de calibração esperado (ECE) em dados de teste com a distribuição
+original das classes.
+
+Os dados sintéticos possuem cerca de 5% de fraudes, e o treino não utiliza
+scale_pos_weight, de forma que as probabilidades do treino completo são
+calibradas.
+
+Execução:
+    python benchmarks/bench_negative_sampling.py --rows 1000000 \
+        --rates 0.5 0.2 0.1 0.05
+"""
+
+import argparse
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+from tabulate import tabulate
+
+from fraud_detection.components.model_trainer import BoosterClassifier
+from fraud_detection.components.training_data import negative_downsample
+
+PARAMS = {"objective": "binary", "learning_rate": 0.1, "verbose": -1}
+
+
+def expected_calibration_error(y, proba, bins=10):
+    """
+    Erro de calibração esperado: diferença média, ponderada pela quantidade
+    de linhas, entre a probabilidade prevista e a taxa de fraudes em
+    intervalos de probabilidade de mesma largura.
+
+    Args:
+        y (np.ndarray): Rótulos.
+        proba (np.ndarray): Probabilidades previstas da fraude.
+        bins (int): Quantidade de intervalos.
+
+    Returns:
+        float: Erro de calibração esperado.
+    """
+    indexes = np.minimum((proba * bins).astype(int), bins - 1)
+    error = 0.0
+    for index in np.unique(indexes):
+        selected = indexes == index
+        error += selected.sum() * abs(
+            proba[selected].mean() - y[selected].mean()
+        )
+    return error / len(y)
+
+
+def synthetic_data(rows, coefficients, rng):
+    """Features normais e fraudes com probabilidade logística."""
+    features = len(coefficients)
+    X = pd.DataFrame(
+        rng.normal(size=(rows, features)),
+        columns=[f"score_{i}" for i in range(features)],
+    )
+    logit = -3.8 + X.to_numpy() @ coefficients
+    y = pd.Series((rng.random(rows) < 1 / (1 + np.exp(-logit))).astype(int))
+    return X, y
+
+
+def run_benchmark(rows, features, rounds, rates):
+    """
+    Executa o benchmark em dados sintéticos.
+
+    Args:
+        rows (int): Quantidade de linhas de treino.
+        features (int): Quantidade de features.
+        rounds (int): Quantidade de árvores treinadas.
+        rates (list(float)): Frações das linhas legítimas mantidas.
+
+    Returns:
+        list(dict): Linhas, tempo, AUC e ECE de cada treino.
+    """
+    rng = np.random.default_rng(42)
+    coefficients = rng.normal(scale=0.4, size=features)
+    X, y = synthetic_data(rows, coefficients, rng)
+    X_test, y_test = synthetic_data(rows // 4, coefficients, rng)
+    y_test = y_test.to_numpy()
+
+    results = []
+    for rate in [1.0, *rates]:
+        for correction in ["weight", "calibration"] if rate < 1 else ["-"]:
+            start = time.perf_counter()
+            X_fit, y_fit, weight, offset = (X, y, None, 0.0)
+            if rate < 1:
+                X_fit, y_fit, weight, offset = negative_downsample(
+                    X, y, rate, correction
+                )
+            model = BoosterClassifier(
+                lgb.train(
+                    PARAMS,
+                    lgb.Dataset(X_fit, y_fit, weight=weight),
+                    num_boost_round=rounds,
+                ),
+                score_offset=offset,
+            )
+            train_seconds = time.perf_counter() - start
+
+            proba = model.predict_proba(X_test)[:, 1]
+            results.append(
+                {
+                    "fração": rate,
+                    "correção": correction,
+                    "linhas": len(X_fit),
+                    "treino (s)": train_seconds,
+                    "AUC": roc_auc_score(y_test, proba),
+                    "ECE": expected_calibration_error(y_test, proba),
+                    "média prevista": proba.mean(),
+                    "taxa de fraudes": y_test.mean(),
+                }
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--features", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument(
+        "--rates", type=float, nargs="+", default=[0.5, 0.2, 0.1, 0.05]
+    )
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(args.rows, args.features, args.rounds, args.rates),
+            headers="keys",
+            floatfmt=".4f",
+        )
+    )
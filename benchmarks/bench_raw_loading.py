@@ -0,0 +1,122 @@
+"""
+Benchmark da leitura dos dados brutos com inferência de tipos padrão do
+pandas frente à leitura guiada pelo config/schema.yaml.
+
+Um arquivo grande é gerado repetindo as linhas dos dados brutos. Cada forma
+de leitura é executada em um processo separado, para que o pico de memória
+residente (RSS) medido seja apenas o da própria leitura.
+
+Execução:
+    python benchmarks/bench_raw_loading.py --rows 5000000
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from tabulate import tabulate
+
+from fraud_detection.components.processors import DropColumns
+from fraud_detection.constants import SCHEMA_FILE_PATH
+from fraud_detection.utils.commons import read_yaml
+from fraud_detection.utils.raw_data import read_raw_data
+
+
+def build_large_file(source_path, rows, target_path):
+    """
+    Gera um arquivo CSV com a quantidade de linhas desejada, repetindo as
+    linhas do arquivo de origem.
+
+    Args:
+        source_path (Path): Dados brutos de origem.
+        rows (int): Quantidade de linhas do arquivo gerado.
+        target_path (Path): Caminho do arquivo gerado.
+    """
+    source = pd.read_csv(source_path)
+    repeats = -(-rows // len(source))
+    with open(target_path, "w", encoding="UTF-8") as f:
+        source.head(0).to_csv(f, index=False)
+        for _ in range(repeats):
+            block = source.head(rows)
+            block.to_csv(f, index=False, header=False)
+            rows -= len(block)
+
+
+def _load(path, method):
+    """
+    Lê o arquivo com o método informado, medindo tempo e pico de memória.
+    Executado em um processo separado.
+    """
+    schema = read_yaml(SCHEMA_FILE_PATH).COLUMNS
+    drop_columns = DropColumns().drop_columns
+    usecols = [col for col in schema if col not in drop_columns]
+
+    start = time.perf_counter()
+    if method == "padrão (inferência)":
+        data = pd.read_csv(path)
+    elif method == "schema":
+        data = read_raw_data(path, schema)
+    elif method == "schema + usecols":
+        data = read_raw_data(path, schema, usecols=usecols)
+    else:
+        data = read_raw_data(
+            path, schema, usecols=usecols, downcast_floats=True
+        )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "leitura": method,
+        "tempo (s)": elapsed,
+        # ru_maxrss é informado em KB no Linux
+        "pico RSS (MB)": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / 1024,
+        "DataFrame (MB)": data.memory_usage(deep=True).sum() / 1024**2,
+        "colunas": data.shape[1],
+    }
+
+
+def run_benchmark(path):
+    """
+    Executa cada forma de leitura em um novo processo.
+
+    Args:
+        path (Path): Arquivo CSV a ser lido.
+
+    Returns:
+        list(dict): Resultados de tempo e memória de cada leitura.
+    """
+    results = []
+    for method in [
+        "padrão (inferência)",
+        "schema",
+        "schema + usecols",
+        "schema + usecols + float32",
+    ]:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results.append(executor.submit(_load, path, method).result())
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument(
+        "--source", default="artifacts/data_ingestion/dados.csv"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        large_file = os.path.join(directory, "dados.csv")
+        build_large_file(args.source, args.rows, large_file)
+
+        print(
+            tabulate(run_benchmark(large_file), headers="keys", floatfmt=".2f")
+        )
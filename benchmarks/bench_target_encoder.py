@@ -0,0 +1,123 @@
+"""
+Benchmark do target encoding nativo frente ao TargetEncoder do scikit-learn.
+
+Compara o tempo do ajuste (fit) e do cross-fitting dos dados de treino
+(fit_transform) em uma coluna de alta cardinalidade, assim como a maior
+diferença absoluta entre os valores codificados. O ajuste em blocos
+(partial_fit) também é avaliado.
+
+Execução:
+    python benchmarks/bench_target_encoder.py --rows 10000000 \
+        --categories 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import TargetEncoder
+from tabulate import tabulate
+
+from fraud_detection.components.encoders import TargetEncoderTransformer
+
+
+def _timed(function):
+    """Executa a função, retornando o resultado e o tempo em segundos."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(rows, categories, cv, chunk_size):
+    """
+    Executa o benchmark em dados sintéticos com distribuição de categorias
+    de cauda longa, semelhante à categoria de produto.
+
+    Args:
+        rows (int): Quantidade de linhas geradas.
+        categories (int): Quantidade de categorias.
+        cv (int): Quantidade de folds do cross-fitting.
+        chunk_size (int): Linhas por bloco no ajuste em blocos.
+
+    Returns:
+        list(dict): Tempo e diferença de cada forma de ajuste.
+    """
+    rng = np.random.default_rng(42)
+    names = np.array([f"cat_{i}" for i in range(categories)], dtype=object)
+    X = pd.DataFrame(
+        {
+            "categoria_produto_reduzida": names[
+                np.minimum(rng.zipf(1.2, rows) - 1, categories - 1)
+            ]
+        }
+    )
+    y = pd.Series((rng.random(rows) < 0.05).astype(int))
+    column = "categoria_produto_reduzida"
+
+    sklearn_encoder = TargetEncoder(cv=cv, shuffle=False)
+    encoder = TargetEncoderTransformer(cv=cv)
+
+    sklearn_train, sklearn_fit_time = _timed(
+        lambda: sklearn_encoder.fit(X, y).transform(X)[:, 0]
+    )
+    native_train, native_fit_time = _timed(
+        lambda: np.asarray(encoder.fit(X, y).transform(X)[column])
+    )
+    sklearn_cv, sklearn_cv_time = _timed(
+        lambda: sklearn_encoder.fit_transform(X, y)[:, 0]
+    )
+    native_cv, native_cv_time = _timed(
+        lambda: np.asarray(encoder.fit_transform(X, y)[column])
+    )
+
+    def chunked_fit():
+        chunked_encoder = TargetEncoderTransformer()
+        for start in range(0, rows, chunk_size):
+            chunked_encoder.partial_fit(
+                X.iloc[start : start + chunk_size],
+                y.iloc[start : start + chunk_size],
+            )
+        return chunked_encoder.transform(X)[column].to_numpy()
+
+    chunked_train, chunked_time = _timed(chunked_fit)
+
+    return [
+        {
+            "etapa": "fit + transform",
+            "scikit-learn (s)": sklearn_fit_time,
+            "nativo (s)": native_fit_time,
+            "diferença máxima": np.abs(sklearn_train - native_train).max(),
+        },
+        {
+            "etapa": f"fit_transform (cv={cv})",
+            "scikit-learn (s)": sklearn_cv_time,
+            "nativo (s)": native_cv_time,
+            "diferença máxima": np.abs(sklearn_cv - native_cv).max(),
+        },
+        {
+            "etapa": f"partial_fit ({chunk_size} linhas) + transform",
+            "scikit-learn (s)": np.nan,
+            "nativo (s)": chunked_time,
+            "diferença máxima": np.abs(sklearn_train - chunked_train).max(),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--categories", type=int, default=100_000)
+    parser.add_argument("--cv", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(
+        tabulate(
+            run_benchmark(
+                args.rows, args.categories, args.cv, args.chunk_size
+            ),
+            headers="keys",
+            floatfmt=".3g",
+        )
+    )
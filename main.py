@@ -5,9 +5,43 @@ O treinamento é dividido em 4 etapas:
 2. Data Transformation: Transformação dos dados de acordo com EDA realizado
 3. Model Trainer: Treinamento do modelo com hiperparâmetros otimizados
 4. Model Evaluation: Avaliação do modelo nos dados de teste
+
+Com --tune, a etapa Model Tuning é executada antes do treinamento,
+otimizando os hiperparâmetros com Optuna e atualizando o params.yaml.
+Com --select-features, a etapa Feature Selection é executada após o
+treinamento, salvando um modelo treinado apenas com as features mais
+importantes. Com --compact, a etapa Model Compaction é executada em seguida,
+salvando um modelo com menos árvores. Os modelos derivados são utilizados
+na avaliação e na predição. Com --cascade, a etapa Model Cascade treina a
+primeira etapa da cascata de modelos da predição, ajustada ao modelo
+utilizado na predição.
+
+As etapas compartilham as configurações carregadas e um armazenamento em
+memória, repassando os artefatos diretamente entre si. Os artefatos são
+salvos em disco em segundo plano, permitindo a execução independente de
+cada etapa posteriormente.
+
+As etapas formam um grafo com entradas, saídas, configurações e código
+declarados. Etapas cuja impressão digital não mudou desde a última execução
+são reutilizadas, podendo ser executadas novamente com --force:
+
+    python main.py --force trainer evaluation
+    python main.py --force all
+
+Com --profile, tempo, CPU, pico de memória e bytes lidos e escritos de cada
+etapa, além do tempo das subetapas, são salvos em profile.json, junto do
+metrics.json. As escritas em segundo plano são aguardadas ao final de cada
+etapa, para que sejam contabilizadas na própria etapa.
 """
 
+import argparse
+import os
+
 from fraud_detection import logger
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.utils.artifact_store import ArtifactStore
+from fraud_detection.utils.profiling import Profiler
+from fraud_detection.utils.stage_graph import Stage, StageRunner
 
 from fraud_detection.pipeline.stage_01_data_validation import (
     DataValidationTrainingPipeline,
@@ -25,28 +59,376 @@ from fraud_detection.pipeline.stage_04_model_evaluation import (
     ModelEvaluationTrainingPipeline,
 )
 
+from fraud_detection.pipeline.stage_05_model_tuning import (
+    ModelTuningTrainingPipeline,
+)
+
+from fraud_detection.pipeline.stage_06_model_compaction import (
+    ModelCompactionTrainingPipeline,
+)
+
+from fraud_detection.pipeline.stage_07_feature_selection import (
+    FeatureSelectionTrainingPipeline,
+)
+
+from fraud_detection.pipeline.stage_08_model_cascade import (
+    ModelCascadeTrainingPipeline,
+)
+
+STAGE_STATE_FILE = "stage_state.json"
+PROFILE_FILE = "profile.json"
+
+
+def build_stages(
+    manager, tune=False, select_features=False, compact=False, cascade=False
+):
+    """
+    Monta o grafo de etapas do treinamento, em ordem topológica, a partir
+    dos caminhos e seções declarados nos arquivos de configuração.
+
+    Args:
+        manager (ConfigurationManager): Configurações carregadas.
+        tune (bool): Inclui a otimização de hiperparâmetros antes do\
+                     treinamento.
+        select_features (bool): Inclui a seleção de features após o\
+                                treinamento.
+        compact (bool): Inclui a compactação do modelo após o treinamento.
+        cascade (bool): Inclui a cascata de modelos após os modelos\
+                        derivados.
+
+    Returns:
+        list(Stage): Etapas do treinamento.
+    """
+    transformation = manager.config.data_transformation
+    trainer = manager.config.model_trainer
+
+    tuning_stages = []
+    if tune:
+        tuning_stages.append(
+            Stage(
+                key="tuning",
+                name="Model Tuning",
+                function=ModelTuningTrainingPipeline,
+                depends_on=("transformation",),
+                outputs=(
+                    os.path.join(
+                        manager.config.model_tuning.root_path,
+                        "best_params.json",
+                    ),
+                ),
+                # Os parâmetros do params.yaml não são incluídos, pois são
+                # escritos pela própria etapa
+                params=("config.model_tuning",),
+                code=(
+                    "fraud_detection.pipeline.stage_05_model_tuning",
+                    "fraud_detection.components.model_tuning",
+                    "fraud_detection.components.model_trainer",
+                    "fraud_detection.components.training_data",
+                ),
+                packages=("lightgbm", "optuna"),
+            )
+        )
+
+    derived_stages = []
+    if select_features:
+        selection = manager.config.feature_selection
+        derived_stages.append(
+            Stage(
+                key="selection",
+                name="Feature Selection",
+                function=FeatureSelectionTrainingPipeline,
+                depends_on=("trainer",),
+                outputs=(
+                    os.path.join(selection.root_path, selection.model_name),
+                    os.path.join(
+                        selection.root_path, "feature_selection_report.json"
+                    ),
+                ),
+                params=("config.feature_selection", "params.LGBMClassifier"),
+                code=(
+                    "fraud_detection.pipeline.stage_07_feature_selection",
+                    "fraud_detection.components.feature_selection",
+                    "fraud_detection.components.encoders",
+                    "fraud_detection.components.preprocessing_pipeline",
+                    "fraud_detection.components.model_trainer",
+                    "fraud_detection.components.training_data",
+                ),
+                packages=("lightgbm", "scikit-learn"),
+            )
+        )
+
+    if compact:
+        compaction = manager.config.model_compaction
+        derived_stages.append(
+            Stage(
+                key="compaction",
+                name="Model Compaction",
+                function=ModelCompactionTrainingPipeline,
+                depends_on=(
+                    "trainer",
+                    *(stage.key for stage in derived_stages),
+                ),
+                outputs=(
+                    os.path.join(compaction.root_path, compaction.model_name),
+                    os.path.join(
+                        compaction.root_path, "compaction_report.json"
+                    ),
+                ),
+                params=("config.model_compaction", "params.LGBMClassifier"),
+                code=(
+                    "fraud_detection.pipeline.stage_06_model_compaction",
+                    "fraud_detection.components.model_compaction",
+                    "fraud_detection.components.model_trainer",
+                    "fraud_detection.components.training_data",
+                    "fraud_detection.utils.base_metrics",
+                ),
+                packages=("lightgbm",),
+            )
+        )
+
+    cascade_stages = []
+    if cascade:
+        model_cascade = manager.config.model_cascade
+        cascade_stages.append(
+            Stage(
+                key="cascade",
+                name="Model Cascade",
+                function=ModelCascadeTrainingPipeline,
+                depends_on=(
+                    "trainer",
+                    *(stage.key for stage in derived_stages),
+                ),
+                outputs=(
+                    os.path.join(
+                        model_cascade.root_path, model_cascade.cascade_name
+                    ),
+                    os.path.join(
+                        model_cascade.root_path, "cascade_report.json"
+                    ),
+                ),
+                params=("config.model_cascade", "params.LGBMClassifier"),
+                code=(
+                    "fraud_detection.pipeline.stage_08_model_cascade",
+                    "fraud_detection.components.model_cascade",
+                    "fraud_detection.components.model_trainer",
+                    "fraud_detection.components.training_data",
+                    "fraud_detection.utils.base_metrics",
+                ),
+                packages=("lightgbm", "scikit-learn"),
+            )
+        )
+
+    return [
+        Stage(
+            key="validation",
+            name="Data Validation",
+            function=DataValidationTrainingPipeline,
+            inputs=(manager.config.data_validation.raw_data_path,),
+            outputs=(manager.config.data_validation.status_file,),
+            params=("config.data_validation", "schema"),
+            code=(
+                "fraud_detection.pipeline.stage_01_data_validation",
+                "fraud_detection.components.data_validation",
+            ),
+        ),
+        Stage(
+            key="transformation",
+            name="Data Transformation",
+            function=DataTransformationTrainingPipeline,
+            depends_on=("validation",),
+            inputs=(transformation.raw_data_path,),
+            outputs=(
+                trainer.train_x_data_path,
+                trainer.train_y_data_path,
+                trainer.test_x_data_path,
+                trainer.test_y_data_path,
+                os.path.join(
+                    transformation.transformed_data_path, "pipeline.joblib"
+                ),
+                trainer.categorical_features_path,
+            ),
+            params=("config.data_transformation", "schema"),
+            code=(
+                "fraud_detection.pipeline.stage_02_data_transformation",
+                "fraud_detection.components.data_transformation",
+                "fraud_detection.components.processors",
+                "fraud_detection.components.encoders",
+                "fraud_detection.components.imputation",
+                "fraud_detection.components.preprocessing_pipeline",
+                "fraud_detection.components.chunked_processing",
+                "fraud_detection.utils.raw_data",
+                "fraud_detection.utils.quantile_sketch",
+            ),
+            packages=("pandas", "numpy", "scikit-learn", "pyarrow"),
+        ),
+        *tuning_stages,
+        Stage(
+            key="trainer",
+            name="Model Trainer",
+            function=ModelTrainerTrainingPipeline,
+            depends_on=(
+                "transformation",
+                *(stage.key for stage in tuning_stages),
+            ),
+            outputs=(
+                os.path.join(trainer.model_target_path, trainer.model_name),
+                os.path.join(trainer.model_target_path, "model_manifest.json"),
+            ),
+            params=("config.model_trainer", "params.LGBMClassifier"),
+            code=(
+                "fraud_detection.pipeline.stage_03_model_trainer",
+                "fraud_detection.components.model_trainer",
+                "fraud_detection.components.training_data",
+            ),
+            packages=("lightgbm", "scikit-learn"),
+        ),
+        *derived_stages,
+        *cascade_stages,
+        Stage(
+            key="evaluation",
+            name="Model Evaluation",
+            function=ModelEvaluationTrainingPipeline,
+            depends_on=(
+                "trainer",
+                *(stage.key for stage in derived_stages),
+            ),
+            outputs=(manager.config.model_evaluation.metric_file_name,),
+            # A saída antecipada é avaliada com os parâmetros da predição
+            params=("config.model_evaluation", "config.prediction"),
+            code=(
+                "fraud_detection.pipeline.stage_04_model_evaluation",
+                "fraud_detection.components.model_evaluation",
+                "fraud_detection.components.model_trainer",
+                "fraud_detection.components.training_data",
+                "fraud_detection.components.score_metrics",
+                "fraud_detection.components.early_exit",
+                "fraud_detection.components.model_cascade",
+                "fraud_detection.utils.base_metrics",
+            ),
+        ),
+    ]
+
+
+def parse_args():
+    """
+    Lê os argumentos de linha de comando do treinamento.
+
+    Returns:
+        argparse.Namespace: Argumentos lidos.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        nargs="+",
+        default=[],
+        choices=[
+            "validation",
+            "transformation",
+            "tuning",
+            "trainer",
+            "selection",
+            "compaction",
+            "cascade",
+            "evaluation",
+            "all",
+        ],
+        help="Etapas executadas mesmo quando atualizadas.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Salva o perfilamento das etapas em profile.json.",
+    )
+    parser.add_argument(
+        "--tune",
+        action="store_true",
+        help="Otimiza os hiperparâmetros antes do treinamento.",
+    )
+    parser.add_argument(
+        "--select-features",
+        action="store_true",
+        help="Seleciona as features mais importantes após o treinamento.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compacta o modelo após o treinamento.",
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="Treina a cascata de modelos da predição.",
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    """
+    Executa as etapas do treinamento, reutilizando as etapas atualizadas.
+
+    Args:
+        args (argparse.Namespace): Argumentos de linha de comando.
+    """
+    config = ConfigurationManager()
+    store = ArtifactStore()
+    runner = StageRunner(
+        build_stages(
+            config,
+            tune=args.tune,
+            select_features=args.select_features,
+            compact=args.compact,
+            cascade=args.cascade,
+        ),
+        config,
+        os.path.join(config.config.artifacts_root, STAGE_STATE_FILE),
+        force=args.force,
+    )
+    profiler = Profiler() if args.profile else None
+    profile_path = os.path.join(
+        config.config.model_evaluation.model_results_path, PROFILE_FILE
+    )
+
+    for stage in runner.stages:
+        if runner.is_up_to_date(stage):
+            logger.info("[ETAPA REUTILIZADA] %s", stage.name)
+            runner.reuse(stage)
+            if profiler is not None:
+                profiler.skip(stage.name)
+            continue
 
-# Utiliza estratégia de programação funcional para iterar sobre etapas
-stages = {
-    "Data Validation": DataValidationTrainingPipeline,
-    "Data Transformation": DataTransformationTrainingPipeline,
-    "Model Trainer": ModelTrainerTrainingPipeline,
-    "Model Evaluation": ModelEvaluationTrainingPipeline,
-}
+        try:
+            logger.info("[INICIO DE ETAPA] %s", stage.name)
 
+            if profiler is None:
+                runner.run(stage, config=config, store=store)
+            else:
+                with profiler.stage(stage.name):
+                    runner.run(stage, config=config, store=store)
+                    store.wait()
 
-for stage_name, stage_function in stages.items():
-    try:
-        logger.info("[INICIO DE ETAPA] %s", stage_name)
+            # Cada arquivo de pipeline precisa possuir o método main
+            logger.info("[FIM DE ETAPA], %s\n\n", stage.name)
+            logger.info("---------------------------------------------")
+        except Exception as e:
+            logger.error("Erro na etapa %s", stage.name)
+            logger.exception(e)
+            store.close()
+            runner.save_state()
+            if profiler is not None:
+                profiler.save(profile_path)
+            raise e
 
-        stage_function()
+    # Aguarda a escrita em disco dos artefatos antes de registrar as etapas
+    store.close()
+    runner.save_state()
+    if profiler is not None:
+        profiler.save(profile_path)
+        logger.info("Perfilamento salvo em: %s", profile_path)
+    logger.info("Resumo da execução:\n%s", runner.summary())
+    logger.info("Treinamento finalizado com sucesso!")
 
-        # Cada arquivo de pipeline precisa possuir o método main
-        logger.info("[FIM DE ETAPA], %s\n\n", stage_name)
-        logger.info("---------------------------------------------")
-    except Exception as e:
-        logger.error("Erro na etapa %s", stage_name)
-        logger.exception(e)
-        raise e
 
-logger.info("Treinamento finalizado com sucesso!")
+# A otimização de hiperparâmetros inicia processos com spawn, que importam
+# este módulo novamente, assim o treinamento é executado apenas no principal
+if __name__ == "__main__":
+    main(parse_args())
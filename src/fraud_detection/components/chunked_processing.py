@@ -0,0 +1,299 @@
+"""
+Módulo para processamento dos dados brutos em blocos.
+
+Utilizado quando os dados brutos não cabem em memória, lendo o arquivo em
+blocos e acumulando apenas as estatísticas necessárias para ajustar os
+processadores de fraud_detection.components.preprocessing_pipeline.
+
+Classes:
+    StreamingFitStatistics: Acumula estatísticas de ajuste bloco a bloco.
+
+Funções:
+    profiled_chunks: Mede a leitura de cada bloco como uma subetapa.
+    split_chunk: Divide um bloco dos dados em treino e teste.
+    read_split_chunks: Lê os dados em blocos já divididos em treino e teste.
+    append_splits: Adiciona blocos de dados aos arquivos de saída.
+
+Dependências:
+    - os
+    - concurrent.futures
+    - pandas
+    - numpy
+    - pycountry_convert
+    - fraud_detection.utils.artifacts
+    - fraud_detection.utils.profiling.profile_step
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import numpy as np
+import pycountry_convert as pc
+
+from fraud_detection.utils.artifacts import FrameWriter, remove_other_formats
+from fraud_detection.utils.profiling import profile_step
+
+
+def profiled_chunks(reader, name):
+    """
+    Percorre os blocos de um leitor de blocos, medindo a leitura de cada
+    bloco na subetapa informada. No pandas, a leitura e a conversão dos
+    dados ocorrem a cada bloco obtido, e não na criação do leitor.
+
+    Args:
+        reader (TextFileReader): Leitor de blocos dos dados brutos.
+        name (str): Nome da subetapa, como "read_csv".
+
+    Yields:
+        pd.DataFrame: Blocos dos dados brutos.
+    """
+    with reader:
+        while True:
+            with profile_step(name):
+                chunk = next(reader, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+def split_chunk(chunk, remove_outliers, chunk_index):
+    """
+    Remove outliers de um bloco dos dados brutos e o divide em treino e
+    teste.
+
+    A divisão utiliza uma semente derivada do índice do bloco, assim
+    leituras diferentes do mesmo arquivo geram a mesma divisão.
+
+    Args:
+        chunk (pd.DataFrame): Bloco dos dados brutos.
+        remove_outliers (callable): Função de remoção de outliers.
+        chunk_index (int): Índice do bloco, utilizado na semente.
+
+    Returns:
+        tuple: Blocos de treino e de teste (pd.DataFrame).
+    """
+    chunk = remove_outliers(chunk)
+
+    # Proporção de 20% para dados de teste, assim como na divisão em
+    # memória realizada pela DataTransformation.
+    rng = np.random.default_rng([42, chunk_index])
+    test_mask = rng.random(len(chunk)) < 0.2
+
+    return chunk[~test_mask], chunk[test_mask]
+
+
+def read_split_chunks(chunks, remove_outliers):
+    """
+    Percorre os blocos dos dados brutos, removendo outliers e dividindo
+    cada bloco em treino e teste com split_chunk.
+
+    Args:
+        chunks (iterable): Blocos dos dados brutos (pd.DataFrame).
+        remove_outliers (callable): Função de remoção de outliers.
+
+    Yields:
+        tuple: Blocos de treino e de teste (pd.DataFrame).
+    """
+    for chunk_index, chunk in enumerate(chunks):
+        yield split_chunk(chunk, remove_outliers, chunk_index)
+
+
+def append_splits(writers, splits, config):
+    """
+    Adiciona blocos de dados aos arquivos de saída, criando os escritores
+    na primeira escrita de cada arquivo, quando os arquivos de mesmo nome em
+    outros formatos são removidos. Os blocos são escritos de forma
+    concorrente.
+
+    Args:
+        writers (dict): Escritores já criados, por nome e formato.
+        splits (dict): Dicionário contendo nome e bloco de dados.
+        config (DataTransformationConfig): Diretório e formato de saída.
+    """
+    formats = [(config.artifact_format, config.artifact_compression)]
+    if config.export_csv and config.artifact_format != "csv":
+        formats.append(("csv", None))
+
+    tasks = []
+    for name, frame in splits.items():
+        path = os.path.join(config.transformed_data_path, name)
+        if (name, config.artifact_format) not in writers:
+            remove_other_formats(path, dict(formats))
+
+        for file_format, compression in formats:
+            if (name, file_format) not in writers:
+                writers[(name, file_format)] = FrameWriter(
+                    path,
+                    file_format,
+                    compression,
+                )
+            tasks.append((writers[(name, file_format)], frame))
+
+    with ThreadPoolExecutor(max_workers=len(tasks) or 1) as executor:
+        for future in [
+            executor.submit(writer.write, frame) for writer, frame in tasks
+        ]:
+            future.result()
+
+
+def _observed_counts(values):
+    """
+    Conta as ocorrências de cada valor, incluindo ausentes. Colunas do tipo
+    category não retornam categorias sem ocorrências no bloco, e o índice é
+    convertido para objeto, permitindo somar blocos com categorias
+    diferentes.
+
+    Args:
+        values (pd.Series): Valores do bloco de dados.
+
+    Returns:
+        pd.Series: Contagem indexada pelo valor.
+    """
+    counts = values.value_counts(dropna=False)
+    counts = counts[counts > 0]
+    counts.index = counts.index.astype(object)
+    return counts
+
+
+def _add_counts(current_counts, new_counts):
+    """
+    Soma duas contagens de valores, alinhando-as pelo índice.
+
+    Args:
+        current_counts (pd.Series): Contagem acumulada.
+        new_counts (pd.Series): Contagem do novo bloco de dados.
+
+    Returns:
+        pd.Series: Contagem resultante.
+    """
+    return current_counts.add(new_counts, fill_value=0)
+
+
+class StreamingFitStatistics:
+    """
+    Acumula, a partir de blocos dos dados de treino, as estatísticas
+    necessárias para ajustar o pipeline de pré-processamento.
+
+    São armazenadas apenas contagens, somas e sketches de quantis, assim a
+    memória utilizada não depende da quantidade de linhas lidas:
+
+    - Contagem das colunas discretas e sketches das colunas contínuas,\
+      acumulados pelo partial_fit do ImputeValuesProcessor.
+    - Valores de "score_1" e "pais", para as categorias do OneHotEncoder.
+    - Contagem e soma da classe alvo por categoria de produto, para o\
+      NonFrequentAggregator e o TargetEncoderTransformer.
+
+    No modo "categorical", as mesmas contagens ajustam o CategoryCodeEncoder.
+
+    Args:
+        pipeline (Pipeline): Pipeline não ajustado, criado por\
+                             build_preprocessing_pipeline.
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        steps = pipeline.named_steps
+
+        self.country_column = steps["country"].country_column
+        self.encoder_columns = ["score_1", self.country_column]
+        self.category_column = "categoria_produto"
+
+        self.value_counts = {
+            col: pd.Series(dtype=float) for col in self.encoder_columns
+        }
+        self.category_counts = pd.Series(dtype=float)
+        self.category_target_sums = pd.Series(dtype=float)
+
+    def update(self, X, y):
+        """
+        Atualiza as estatísticas com um bloco dos dados de treino.
+
+        Args:
+            X (pd.DataFrame): Bloco de dados de treino não transformado.
+            y (pd.Series): Classes de saída do bloco.
+        """
+        steps = self.pipeline.named_steps
+        steps["imputer"].partial_fit(steps["dropper"].transform(X))
+
+        for col, counts in self.value_counts.items():
+            self.value_counts[col] = _add_counts(
+                counts, _observed_counts(X[col])
+            )
+
+        categories = X[self.category_column]
+        self.category_counts = _add_counts(
+            self.category_counts, _observed_counts(categories)
+        )
+        target_sums = y.groupby(categories, dropna=False, observed=True).sum()
+        target_sums.index = target_sums.index.astype(object)
+        self.category_target_sums = _add_counts(
+            self.category_target_sums, target_sums
+        )
+
+    def continent_counts(self):
+        """
+        Retorna a contagem de cada continente, a partir da contagem dos
+        países convertidos em continentes, assim como no CountryProcessor.
+
+        Returns:
+            pd.Series: Contagem indexada pelo continente.
+        """
+        countries = self.value_counts[self.country_column]
+        countries = countries[countries.index.notna()]
+        return countries.groupby(
+            [
+                pc.country_alpha2_to_continent_code(country)
+                for country in countries.index
+            ]
+        ).sum()
+
+    def encoder_categories(self):
+        """
+        Retorna as categorias observadas das colunas do OneHotEncoder.
+
+        Returns:
+            dict: Lista de categorias de "score_1" e "continente".
+        """
+        return {
+            "score_1": list(self.value_counts["score_1"].index),
+            "continente": sorted(self.continent_counts().index),
+        }
+
+    def fit_pipeline(self):
+        """
+        Ajusta os processadores do pipeline com as estatísticas acumuladas.
+
+        Returns:
+            Pipeline: Pipeline ajustado.
+        """
+        steps = self.pipeline.named_steps
+        if "category_codes" in steps:
+            steps["category_codes"].fit_from_counts(
+                {
+                    "score_1": self.value_counts["score_1"],
+                    "continente": self.continent_counts(),
+                    self.category_column: self.category_counts,
+                }
+            )
+            return self.pipeline
+
+        steps["encoder"].fit_from_categories(self.encoder_categories())
+
+        aggregator = steps["column_aggregator"].fit_from_counts(
+            self.category_counts[self.category_counts.index.notna()]
+        )
+
+        # As contagens e somas por categoria original são agrupadas nas
+        # categorias reduzidas vistas pelo TargetEncoderTransformer.
+        reduced = aggregator.reduce_categories(
+            pd.Series(self.category_counts.index)
+        ).to_numpy()
+        steps["target_encoder"].fit_from_statistics(
+            self.category_counts.groupby(reduced).sum(),
+            self.category_target_sums.reindex(self.category_counts.index)
+            .groupby(reduced)
+            .sum(),
+        )
+
+        return self.pipeline
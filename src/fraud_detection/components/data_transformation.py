@@ -2,27 +2,13 @@
 Componente para tarefas de transformação de dados.
 
 Fornece funcionalidades para pré-processar e transformar os dados ao formato
-adequado. Ele inclui diversos transformadores para lidar com a imputação de
-valores ausentes, feature engineering e a divisão de conjuntos de dados.
+adequado, incluindo a divisão em treino e teste, o ajuste do pipeline de
+pré-processamento e a escrita dos dados transformados. Os processadores do
+pipeline estão nos módulos processors, encoders e imputation, e a construção
+dos pipelines em preprocessing_pipeline.
 
 **Classes**:
 
-- **CustomProcessor**: Classe base customizada para criar processadores \
-                       de transformação.
-- **DropColumns**: Remove colunas específicas do conjunto de dados.
-- **DocumentsProcessor**: Processa colunas de documentos, imputando valores \
-                      vazios e convertendo binários em inteiros.
-- **CountryProcessor**: Transforma a coluna de país para continentes.
-- **OneHotEncoderProcessor**: Realiza codificação one-hot em colunas \
-                              categóricas.
-- **DateProcessor**: Realiza engenharia de features para coluna de data, \
-                     criando variáveis como hora, turno e dia da semana.
-- **ImputeValuesProcessor**: Trata valores ausentes em colunas numéricas.
-- **TransformColumns**: Aplica transformações matemáticas (log, raiz cúbica).
-- **NonFrequentAggregator**: Transforma dados de categoria de produto não \
-                             frequentes em uma única classificação Outros.
-- **TargetEncoderTransformer**: Aplica TargetEncoder a coluna de categoria de \
-                                produtos.
 - **DataTransformation**: Encapsula todo o pipeline de transformação de dados,\
                           incluindo a divisão em treino e teste, aplicando\
                           transformações e salvando os dados transformados.
@@ -30,564 +16,198 @@ valores ausentes, feature engineering e a divisão de conjuntos de dados.
 
 Dependências:
     - pandas
-    - numpy
     - sklearn
     - joblib
-    - pycountry_convert
     - fraud_detection.logger
     - fraud_detection.entity.config_entity.DataTransformationConfig
+    - fraud_detection.components.processors
+    - fraud_detection.components.encoders
+    - fraud_detection.components.preprocessing_pipeline
+    - fraud_detection.components.chunked_processing
+    - fraud_detection.utils.artifacts
+    - fraud_detection.utils.artifact_store
+    - fraud_detection.utils.raw_data
+    - fraud_detection.utils.commons.save_json
+    - fraud_detection.utils.profiling.profile_step
 """
 
-import os
+import json
+from pathlib import Path
 
 import pandas as pd
-import numpy as np
 import joblib
 
-from sklearn.pipeline import Pipeline
-from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import TargetEncoder, OneHotEncoder
 
-import pycountry_convert as pc
 from fraud_detection import logger
 from fraud_detection.entity.config_entity import DataTransformationConfig
+from fraud_detection.components.processors import (
+    DropColumns,
+    convert_to_numeric,
+)
+from fraud_detection.components.encoders import CategoryLookupEncoder
+from fraud_detection.components.preprocessing_pipeline import (
+    build_preprocessing_pipeline,
+)
+from fraud_detection.components.chunked_processing import (
+    StreamingFitStatistics,
+    append_splits,
+    profiled_chunks,
+    read_split_chunks,
+    split_chunk,
+)
+from fraud_detection.utils.artifacts import append_frame, save_frames
+from fraud_detection.utils.artifact_store import load_artifact
+from fraud_detection.utils.raw_data import (
+    raw_data_mark,
+    read_new_raw_data,
+    read_raw_data,
+)
+from fraud_detection.utils.commons import save_json
+from fraud_detection.utils.profiling import profile_step
+
+CATEGORICAL_FEATURES_FILE = "categorical_features.json"
 
 
-# Classe que servirá para o pai dos transformadores customizados
-class CustomProcessor(BaseEstimator, TransformerMixin):
-    """
-    Classe para abstrair processadores base da biblioteca
-    scikit-learn, sobrescreve o método fit para um retorno arbitrário.
-
-    Utilizamos para garantir a aplicabilidade da transformação ao processo
-    do fit_transform do pipeline, porém em que as alterações serão ditas
-    apenas pela função transform, ou seja não serão armazenadas informações
-    no fit para evitar data leakege, as etapas que necessitam este
-    armazenamento não utilizarão este placeholder.
-    """
-
-    def __init__(self):
-        pass
-
-    def fit(self, _, _y=None):
-        """
-        Sobrescrita do fit para compatibilidade com classes
-        pais do scikit-learn, as transformações serão aplicadas com a
-        função transform.
-        """
-        return self
-
-
-class DropColumns(CustomProcessor):
-    """
-    Função do pipeline de transformação para exclusão de colunas.
-    As colunas foram selecionadas a partir da análise estatística dos dados
-    ou não possuem informações práticas para o modelo, ou apresentam
-    distribuições não aderentes como uniforme ou de com alta cardinalidade
-    de categorias.
-
-    Colunas a serem excluídas: "score_fraude_modelo", "produto", "score_8"
-    """
-
-    def __init__(self):
-        self.drop_columns = ["score_fraude_modelo", "produto", "score_8"]
-
-    def transform(self, X):
-        """
-        Retorna os dados de entrada sem a presença das colunas declaradas
-        na inicialização da classe.
-
-        Args:
-            X (pd.DataFrame): Conjunto de dados originais.
-
-        Returns:
-            pd.DataFrame: Dados sem as colunas desejadas.
-        """
-        return X.drop(self.drop_columns, axis=1)
-
-
-class DocumentsProcessor(CustomProcessor):
-    """
-    Processador direcionado para transformações nas colunas de documentos.
-
-    Colunas transformadas: "entrega_doc_1", "entrega_doc_2", "entrega_doc_3"
+class DataTransformation:
     """
+    Classe que irá agregar e chamar todas as funções de processamento,
+    recebendo as configurações e caminhos de arquivos de entrada e saída.
 
-    def __init__(self):
-        self.document_columns = [
-            "entrega_doc_1",
-            "entrega_doc_2",
-            "entrega_doc_3",
-        ]
-
-    def transform(self, X):
-        """
-        Trata as colunas de documento, preenchendo valores ausentes com o
-        valor padrão "N" e posteriormente converte os valores para binário.
-
-        Args:
-            X (pd.DataFrame): Conjunto de dados originais.
-
-        Returns:
-            pd.DataFrame: Dados com colunas de documentos processadas.
-        """
-        X_new = X.copy()
-        X_new[self.document_columns] = (
-            X_new[self.document_columns].astype(str).fillna("N")
-        )
-        X_new[self.document_columns] = (
-            (X_new[self.document_columns] == "Y")
-            | (X_new[self.document_columns] == "1")
-        ).astype(int)
-
-        return X_new
-
-
-class CountryProcessor(CustomProcessor):
-    """Processador direcionado para transformação da coluna país."""
-
-    def __init__(self):
-        self.country_column = "pais"
-
-    def transform(self, X):
-        """
-        Realiza o feature engineering na coluna de país da compra.
-        Transformando a coluna em uma nova contendo o continente.
-
-        Args:
-            X (pd.DataFrame): Conjunto de dados originais.
-
-        Returns:
-            pd.DataFrame: Dados com nova coluna de continente.
-        """
-
-        X_new = X.copy()
-        # Insere valores ausentes baseado no valor mais frequente
-        X_new[self.country_column] = X_new[self.country_column].fillna(
-            X_new[self.country_column].mode()[0]
-        )
-
-        # Utiliza biblioteca pycountry_convert para transformar os códigos
-        # de países em continentes.
-        X_new["continente"] = X_new[self.country_column].apply(
-            pc.country_alpha2_to_continent_code
-        )
-        # Remove a coluna de país para evitar duplicidade de informação
-        X_new = X_new.drop(self.country_column, axis=1)
-
-        return X_new
-
-
-class DateProcessor(CustomProcessor):
-    """
-    Processador direcionado para transformações da coluna de data da compra.
+    Args:
+        DataTransformationConfig (dataclass): Classe de valores de \
+                                              configuração.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional. Quando fornecido, os\
+                               dados são repassados às próximas etapas e\
+                               salvos em disco em segundo plano.
     """
 
-    def __init__(self):
-        self.date_column = "data_compra"
-
-    def _hour_to_period(self, hour):
-        """
-        Função para ser mapeada aos dados, criando a coluna turno.
-
-        Args:
-            hour (int): Valor inteiro da hora da compra.
+    def __init__(self, config: DataTransformationConfig, store=None):
+        self.config = config
+        self.store = store
 
-        Returns:
-            int: Inteiro representando o turno da compra.
+    def _save_splits(self, splits):
         """
-        if 6 <= hour < 12:
-            return 0  # "Manhã"
-        if 12 <= hour < 18:
-            return 1  # "Tarde"
-        if 18 <= hour < 24:
-            return 2  # "Noite"
+        Método privado para salvar os pedaços de dados após divisão.
+        Os arquivos são escritos de forma concorrente no formato de
+        artefato configurado.
 
-        return 3  # "Madrugada"
-
-    def transform(self, X):
-        """
-        Realiza o feature engineering para a coluna de data.
-        Cria features de hora da compra, dia da semana da compra e turno.
+        Com o armazenamento em memória, os dados ficam disponíveis para as
+        próximas etapas e a escrita ocorre em segundo plano.
 
         Args:
-            X (pd.DataFrame): Conjunto de dados originais.
-
-        Returns:
-            pd.DataFrame: Dados com novas colunas relacionadas a data.
-        """
-        X_new = X.copy()
-
-        date = pd.to_datetime(X_new[self.date_column])
-
-        X_new["hora_compra"] = date.dt.hour
-        X_new["dia_compra"] = date.dt.dayofweek
-        X_new["turno_compra"] = X_new["hora_compra"].apply(
-            self._hour_to_period
-        )
-
-        # Remove coluna de data para evitar informação duplicada
-        # A coluna de data removida também impede que o modelo deprecie
-        # para datas mais recentes sendo inseridas.
-        X_new = X_new.drop(self.date_column, axis=1)
-
-        return X_new
-
-
-class OneHotEncoderProcessor(CustomProcessor):
-    """
-    Classe de transformação para aplicar OneHotEncoder a colunas categóricas
-    de baixa cardinalidade.
-
-    Utiliza OneHotEncoder provindo do pacote scikit-learn.
-
-    Lida com dados não desconhecidos com a tratativa "ignore"
-
-    Colunas que serão aplicadas: "score_1", "continente"
-    """
-
-    def __init__(self):
-        self.columns_to_encode = ["score_1", "continente"]
-        self.encoder = OneHotEncoder(
-            sparse_output=False, dtype=int, handle_unknown="ignore"
-        )
-        self.fitted = False
-
-    def fit(self, X, _y=None):
+            splits (dict): Dicionário contendo nome e dados divididos.
         """
-        Realiza o fit do encoder com os dados de treino.
+        if self.store is not None:
+            for name, split_transform in splits.items():
+                self.store.put(name, split_transform)
+            self.store.persist(self._write_splits, splits)
+            return
 
-        Args:
-            X (pd.DataFrame): Dados de treino de entrada.
+        self._write_splits(splits)
 
-        Returns:
-            OneHotEncoderProcessor: Processador com dados ajustados.
+    def _write_splits(self, splits):
         """
-        self.encoder.fit(X[self.columns_to_encode])
-        self.fitted = True
-        return self
-
-    def transform(self, X):
-        """
-        Aplica o OneHotEncoding utilizando o processador previamente ajustado.
+        Método privado para escrever em disco os pedaços de dados. Medido
+        no perfilamento também quando executado em segundo plano.
 
         Args:
-            X (pd.DataFrame): Conjunto de dados originais.
-
-        Returns:
-            pd.DataFrame: Dados com novas colunas de one hot encoding.
+            splits (dict): Dicionário contendo nome e dados divididos.
         """
-        if not self.fitted:
-            raise ValueError(
-                "O encoder não foi ajustado previamente (Fit necessário)."
+        with profile_step("_write_splits"):
+            saved_paths = save_frames(
+                splits,
+                self.config.transformed_data_path,
+                self.config.artifact_format,
+                self.config.artifact_compression,
+                self.config.export_csv,
             )
 
-        X_new = X.copy()
-
-        # Cria novas colunas com Hot Encodings a partir dos dados recebidos
-        encoded_columns = self.encoder.transform(X_new[self.columns_to_encode])
-
-        # Transforma as colunas de resultado em um DataFrame
-        encoded_df = pd.DataFrame(
-            encoded_columns,
-            columns=self.encoder.get_feature_names_out(self.columns_to_encode),
-            index=X_new.index,
-        )
-
-        # Remove as colunas originais dos dados de entrada
-        X_new = X_new.drop(columns=self.columns_to_encode)
-
-        # Concatena os dados originais as colunas de hot encoding criadas
-        X_encoded = pd.concat([X_new, encoded_df], axis=1)
-        return X_encoded
-
-
-class ImputeValuesProcessor(CustomProcessor):
-    """
-    Classe para aplicar transformações nas colunas numéricas existentes.
-    Aplica as classes discretas e contínuas aos respectivos Imputers,
-    aplicando-os a um ColumnTransformer.
-
-    Utiliza a moda para colunas numéricas discretas e mediana para colunas
-    contínuas.
-
-    Colunas discretas: "score_4" e "score_7"
-    Colunas contínuas: "score_2", "score_3", "score_5", "score_6", "score_9",\
-                       "score_10" e "valor_compra"
-    """
-
-    def __init__(self):
-        self.discrete_columns = ["score_4", "score_7"]
-        self.continuous_columns = [
-            "score_2",
-            "score_3",
-            "score_5",
-            "score_6",
-            "score_9",
-            "score_10",
-            "valor_compra",
-        ]
-
-        # Utiliza dois imputers para os tipos numéricos diferentes
-        # Aplica ambos a um ColumnTransformer
-        self.numerical_imputer = ColumnTransformer(
-            transformers=[
-                (
-                    "discrete",
-                    SimpleImputer(strategy="most_frequent"),
-                    self.discrete_columns,
-                ),
-                (
-                    "continuous",
-                    SimpleImputer(strategy="median"),
-                    self.continuous_columns,
-                ),
-            ],
-            # Configuração que evita o transformador de excluir os dados
-            # não utilizados para a resposta.
-            remainder="passthrough",
-        )
-
-    def fit(self, X, _y=None):
-        """
-        Realiza o fit do imputer numérico com os dados de treino.
-
-        Args:
-            X (pd.DataFrame): Dados de treino de entrada.
-
-        Returns:
-            ImputeValuesProcessor: Processador com dados ajustados.
-        """
-        self.numerical_imputer.fit(X)
-        return self
-
-    def transform(self, X):
-        """
-        Aplica os dados de entrada ao imputer numérico previamente ajustados
-        aos dados de treino. Aplica novamente os labels as colunas para seguir
-         o pipeline corretamente.
-
-        Args:
-            X (pd.DataFrame): Dados de entraga a serem transformados.
-
-        Returns:
-            pd.DataFrame: Dados com as colunas numéricas transformadas.
-
-        """
-
-        X_transformed = self.numerical_imputer.transform(X)
-        X_transformed = pd.DataFrame(
-            X_transformed, columns=self._get_column_names(X)
-        )
-        return X_transformed
-
-    def _get_column_names(self, X):
-        """
-        Função para concatenar o nome das colunas originais com as colunas
-        transformadas, uma vez que o resultado da transformação retorna em
-        arrays não indexados.
-
-        Args:
-            X (pd.DataFrame): Conjunto de dados com colunas originais.
-
-        Returns:
-            list(str): Lista de nomes das colunas concatenadas.
-
-        """
-
-        transformed_columns = (
-            self.discrete_columns
-            + self.continuous_columns
-            + [
-                col
-                for col in X.columns
-                if col not in self.discrete_columns + self.continuous_columns
-            ]
-        )
-        return transformed_columns
-
-
-class TransformColumns(CustomProcessor):
-    """
-    Classe de processador para aplicar transformação log
-    as colunas aplicáveis.
-
-    Colunas: "score_3" e "valor_compra"
-    """
-
-    def __init__(self):
-        self.log_columns = ["score_3", "valor_compra"]
-
-    def transform(self, X):
-        """
-        Aplica transformação log as colunas ditas na inicialização.
-        Insere as transformações em novas colunas e retira as originais.
-
-        Args:
-            X (pd.DataFrame): Dados recebidos a serem transformados.
-
-        Returns:
-            pd.DataFrame: Dados com as novas colunas logarítmicas.
-        """
-        X_new = X.copy()
-        for col in self.log_columns:
-            X_new[f"log_{col}"] = np.log1p(X_new[col].astype(float))
-
-        X_new = X_new.drop(self.log_columns, axis=1)
-
-        return X_new
-
-
-class NonFrequentAggregator(CustomProcessor):
-    """
-    Classe de processador para agregas valores não frequentes de categorias
-    de produto.
-    """
-
-    def __init__(self):
-        self.column = "categoria_produto"
-        self.valid_categories = None
-        self.threshold = 2  # Limiar de no mínimo 3 arquivos para uma categoria
-
-    def fit(self, X, _y=None):
-        """
-        Método de ajuste irá criar o array de categorias válidas.
-        Transformações posteriores irão ser realizadas utilizando este array.
-
-        Args:
-            X (pd.DataFrame): Dados de entrada
+        for name, split_transform in splits.items():
+            logger.info(
+                "Dados divididos salvos em: %s, de tamanho: %s",
+                saved_paths[name],
+                split_transform.shape,
+            )
 
-        Returns:
-            NonFrequentAggregator: Processador ajustado.
+    def _save_pipeline(self, pipeline):
         """
-        frequent_categories = X[self.column].value_counts()
-        self.valid_categories = frequent_categories[
-            frequent_categories > self.threshold
-        ].index
-        return self
+        Método privado para salvar o pipeline ajustado, a tabela de
+        consulta da categoria de produto, utilizada no pipeline de predição,
+        e a lista de features categóricas, utilizada no treinamento.
 
-    def transform(self, X):
-        """
-        Recebe os dados que irão consultar o vetor de categorias
-        frequentes e agrupar os que não estão com mais de 2 ocorrências.
+        No modo "categorical" não há tabela de consulta.
 
         Args:
-            X (pd.DataFrame): Dados a serem ajustados.
-
-        Returns:
-            pd.DataFrame: Dados com a nova coluna agregada.
-        """
-        X_new = X.copy()
-
-        new_column_name = self.column + "_reduzida"
-
-        X_new[new_column_name] = X_new[self.column]
-        X_new.loc[
-            ~X_new[self.column].isin(self.valid_categories),
-            new_column_name,
-        ] = "Outros"
-
-        X_new = X_new.drop(self.column, axis=1)
-        return X_new
-
+            pipeline (Pipeline): Pipeline de pré-processamento ajustado.
+        """
+        steps = pipeline.named_steps
+        category_lookup = None
+        categorical_features = []
+        if "category_codes" in steps:
+            categorical_features = steps[
+                "category_codes"
+            ].categorical_features_
+        else:
+            category_lookup = CategoryLookupEncoder().fit_from_processors(
+                steps["column_aggregator"], steps["target_encoder"]
+            )
 
-class TargetEncoderTransformer(CustomProcessor):
-    """
-    Transformer para aplicar Target Encoding a uma coluna categórica
-    de alta cardinalidade.
+        transformed_data_path = Path(self.config.transformed_data_path)
+        files = {
+            transformed_data_path
+            / CATEGORICAL_FEATURES_FILE: {"columns": categorical_features},
+        }
+        if category_lookup is not None:
+            files[transformed_data_path / "category_lookup.json"] = (
+                category_lookup.to_dict()
+            )
+        pipeline_path = transformed_data_path / "pipeline.joblib"
 
-    Coluna a ser aplicada: "categoria_produto_reduzida"
-    """
+        if self.store is not None:
+            self.store.put("pipeline", pipeline)
+            if category_lookup is not None:
+                self.store.put("category_lookup", category_lookup)
+            self.store.put("categorical_features", categorical_features)
+            self.store.persist(joblib.dump, pipeline, pipeline_path)
+            for path, data in files.items():
+                self.store.persist(save_json, path, data)
+            return
 
-    def __init__(self):
-        self.column = "categoria_produto_reduzida"
-        self.encoder = TargetEncoder(shuffle=False)
+        joblib.dump(pipeline, pipeline_path)
+        for path, data in files.items():
+            save_json(path, data)
 
-    def fit(self, X, y=None):
+    def _read_raw_data(self, chunksize=None):
         """
-        Ajusta o TargetEncoder usando os dados de treino.
+        Método privado para leitura dos dados brutos com os tipos do schema.
+        As colunas removidas pelo DropColumns não são lidas.
 
         Args:
-            X (pd.DataFrame): Conjunto de dados de treino.
-            y (pd.Series): Coluna de classes de saída.
+            chunksize (int): Quantidade de linhas por bloco, caso informado\
+                             retorna um iterador de blocos.
 
         Returns:
-            self: O próprio objeto transformador.
-        """
-        self.encoder.fit(X[[self.column]], y)
-        return self
-
-    def transform(self, X):
-        """
-        Transforma os dados usando o TargetEncoder previamente ajustado.
-
-        Args:
-            X (pd.DataFrame): Conjunto de dados a ser transformado.
-
-        Retorna:
-        - pd.DataFrame: Conjunto de dados transformados.
-        """
-        X_transformed = X.copy()
-        X_transformed[self.column] = self.encoder.transform(X[[self.column]])
-        return X_transformed
-
-
-def convert_to_numeric(X):
-    """
-    Função para converter colunas de objeto para numérico.
-    Será utilizado após as transformações, garantindo uma correta tipagem
-    dos dados de entrada do modelo.
-
-    Args:
-        X (pd.DataFrame): Dados a serem convertidos em numérico.
-
-    Returns:
-        pd.DataFrame: Dados após a conversão numérica.
-    """
-    X_new = X.copy()
-    for col in X_new.select_dtypes(include=["object"]).columns:
-        try:
-            X_new[col] = pd.to_numeric(X_new[col], errors="coerce")
-        except ValueError as e:
-            print(e)
-
-    return X_new
-
-
-class DataTransformation:
-    """
-    Classe que irá agregar e chamar todas as funções de processamento,
-    recebendo as configurações e caminhos de arquivos de entrada e saída.
-
-    Args:
-        DataTransformationConfig (dataclass): Classe de valores de \
-                                              configuração.
-    """
-
-    def __init__(self, config: DataTransformationConfig):
-        self.config = config
-
-    def _save_splits(self, splits):
-        """
-        Método privado para dividir os pedaços de dados após divisão.
-
-        Args:
-            splits (dict): Dicionário contendo nome e dados divididos.
-        """
-        for name, split_transform in splits.items():
-            split_transform.to_csv(
-                os.path.join(self.config.transformed_data_path, f"{name}.csv"),
-                index=False,
-            )
-
-            logger.info(
-                "Dados divididos salvos em: %s.csv, de tamanho: %s",
-                name,
-                split_transform.shape,
+            pd.DataFrame | Iterator: Dados lidos ou iterador de blocos, com\
+                                     a leitura de cada bloco medida.
+        """
+        drop_columns = DropColumns().drop_columns
+        with profile_step("read_csv"):
+            data = read_raw_data(
+                self.config.raw_data_path,
+                self.config.schema,
+                usecols=[
+                    col
+                    for col in self.config.schema
+                    if col not in drop_columns
+                ],
+                downcast_floats=self.config.downcast_floats,
+                chunksize=chunksize,
             )
+        if chunksize is None:
+            return data
+        return profiled_chunks(data, "read_csv")
 
     def _remove_outliers(self, data):
         """
@@ -597,10 +217,11 @@ class DataTransformation:
           Valor máximo de 10 para "score_5"
           Valor máximo de 483 para "score_6"
         """
-        data_sem_outliers = data[data["score_5"] < 10]
-        data_sem_outliers = data_sem_outliers[
-            data_sem_outliers["score_6"] < 483
-        ]
+        with profile_step("_remove_outliers"):
+            data_sem_outliers = data[data["score_5"] < 10]
+            data_sem_outliers = data_sem_outliers[
+                data_sem_outliers["score_6"] < 483
+            ]
 
         return data_sem_outliers
 
@@ -620,13 +241,14 @@ class DataTransformation:
             - y_train (pd.DataFrame): Rótulos do conjunto de treino.
             - y_test (pd.DataFrame): Rótulos do conjunto de teste
         """
-        X = data.drop(target_column, axis=1)
-        y = data[target_column]
+        with profile_step("_split_data"):
+            X = data.drop(target_column, axis=1)
+            y = data[target_column]
 
-        # Dividindo os dados na proporção (0.8, 0.2).
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42
-        )
+            # Dividindo os dados na proporção (0.8, 0.2).
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=0.2, random_state=42
+            )
 
         logger.info("Dados divididos em treino e teste")
 
@@ -650,8 +272,28 @@ class DataTransformation:
         processadores presentes neste módulo.
 
         Remove outliers, divide os dados, processa e salva os resultados.
+
+        Caso um tamanho de bloco seja configurado, os dados são processados
+        em blocos, sem carregar o arquivo inteiro em memória.
+
+        No modo incremental, apenas as linhas adicionadas aos dados brutos
+        desde a última execução são transformadas, com o pipeline salvo.
         """
-        data = pd.read_csv(self.config.raw_data_path)
+        if self.config.incremental:
+            state = self._load_incremental_state()
+            if state is not None:
+                self.incremental_preprocessing_pipeline(state)
+                return
+
+        # Marca de leitura obtida antes da leitura dos dados brutos
+        mark = raw_data_mark(self.config.raw_data_path)
+
+        if self.config.chunk_size:
+            rows = self.chunked_preprocessing_pipeline()
+            self._save_incremental_state(mark, rows)
+            return
+
+        data = load_artifact(self.store, "raw_data", self._read_raw_data)
 
         # Remove outliers antes da divisão de treino e teste
         data_without_outliers = self._remove_outliers(data)
@@ -660,23 +302,18 @@ class DataTransformation:
             data_without_outliers, self.config.target_column
         )
 
-        pipeline = Pipeline(
-            [
-                ("dropper", DropColumns()),
-                ("imputer", ImputeValuesProcessor()),
-                ("docs", DocumentsProcessor()),
-                ("country", CountryProcessor()),
-                ("date", DateProcessor()),
-                ("encoder", OneHotEncoderProcessor()),
-                ("transform", TransformColumns()),
-                ("column_aggregator", NonFrequentAggregator()),
-                ("target_encoder", TargetEncoderTransformer()),
-            ]
+        pipeline = build_preprocessing_pipeline(
+            self.config.median_strategy,
+            self.config.sketch_error,
+            self.config.target_encoder_cv,
+            self.config.feature_mode,
         )
 
         # Aplica pipeline de processamento para as colunas
-        X_train_transformed = pipeline.fit_transform(X_train, y_train)
-        X_test_transformed = pipeline.transform(X_test)
+        with profile_step("fit_transform"):
+            X_train_transformed = pipeline.fit_transform(X_train, y_train)
+        with profile_step("transform"):
+            X_test_transformed = pipeline.transform(X_test)
 
         # Garante que as colunas transformadas sejam numéricas para modelo
         X_train_transformed = convert_to_numeric(X_train_transformed)
@@ -692,6 +329,245 @@ class DataTransformation:
 
         # Salva pipeline de processamento para que este seja aplicável
         # aos dados de predição utilizando transform.
-        joblib.dump(
-            pipeline, f"{self.config.transformed_data_path}/pipeline.joblib"
+        self._save_pipeline(pipeline)
+        self._save_incremental_state(mark, len(data))
+
+    def _transform_split_chunks(self, pipeline, train_chunk, test_chunk):
+        """
+        Método privado para transformar blocos de treino e teste com o
+        pipeline ajustado.
+
+        Args:
+            pipeline (Pipeline): Pipeline de pré-processamento ajustado.
+            train_chunk (pd.DataFrame): Bloco de treino.
+            test_chunk (pd.DataFrame): Bloco de teste.
+
+        Returns:
+            dict: Nome e dados dos blocos divididos e transformados.
+        """
+        target_column = self.config.target_column
+
+        splits = {}
+        for split_name, split_frame in [
+            ("train", train_chunk),
+            ("test", test_chunk),
+        ]:
+            if split_frame.empty:
+                continue
+
+            X_chunk = split_frame.drop(target_column, axis=1)
+            splits[f"X_{split_name}"] = X_chunk
+            splits[f"y_{split_name}"] = split_frame[target_column]
+            splits[f"X_{split_name}_transformed"] = convert_to_numeric(
+                pipeline.transform(X_chunk)
+            )
+
+        return splits
+
+    def chunked_preprocessing_pipeline(self):
+        """
+        Método para realizar o processamento dos dados em duas passagens
+        sobre o arquivo, com memória limitada pelo tamanho do bloco.
+
+        A primeira passagem acumula as estatísticas de ajuste do pipeline
+        a partir dos blocos de treino. A segunda passagem transforma cada
+        bloco com o pipeline ajustado e o adiciona aos arquivos de saída.
+
+        O cross-fitting do target encoding não é realizado nos blocos, pois
+        cada bloco de treino é transformado com as estatísticas de todos os
+        dados de treino.
+
+        Raises:
+            ValueError: Caso target_encoder_cv seja configurado.
+
+        Returns:
+            int: Quantidade de linhas lidas dos dados brutos.
+        """
+        if self.config.target_encoder_cv:
+            raise ValueError(
+                "target_encoder_cv não é suportado na leitura em blocos,"
+                " remova chunk_size ou target_encoder_cv"
+            )
+
+        target_column = self.config.target_column
+
+        # A leitura em blocos sempre utiliza a mediana aproximada
+        statistics = StreamingFitStatistics(
+            build_preprocessing_pipeline(
+                "sketch",
+                self.config.sketch_error,
+                feature_mode=self.config.feature_mode,
+            )
+        )
+        for train_chunk, _ in read_split_chunks(
+            self._read_raw_data(self.config.chunk_size),
+            self._remove_outliers,
+        ):
+            if not train_chunk.empty:
+                statistics.update(
+                    train_chunk.drop(target_column, axis=1),
+                    train_chunk[target_column],
+                )
+
+        pipeline = statistics.fit_pipeline()
+        logger.info("Pipeline ajustado a partir das estatísticas em blocos")
+
+        writers = {}
+        rows = 0
+        for chunk_index, chunk in enumerate(
+            self._read_raw_data(self.config.chunk_size)
+        ):
+            rows += len(chunk)
+            splits = self._transform_split_chunks(
+                pipeline,
+                *split_chunk(chunk, self._remove_outliers, chunk_index),
+            )
+            append_splits(writers, splits, self.config)
+
+        for writer in writers.values():
+            writer.close()
+
+        logger.info(
+            "Dados transformados em blocos salvos em: %s",
+            self.config.transformed_data_path,
+        )
+
+        self._save_pipeline(pipeline)
+        return rows
+
+    def _incremental_state_path(self):
+        """
+        Caminho do arquivo de estado da transformação incremental.
+
+        Returns:
+            Path: Caminho do arquivo JSON de estado.
+        """
+        return Path(self.config.transformed_data_path) / (
+            "incremental_state.json"
+        )
+
+    def _save_incremental_state(self, mark, rows):
+        """
+        Método privado para salvar a marca de leitura dos dados brutos já
+        transformados, utilizada pela próxima execução incremental.
+
+        Args:
+            mark (dict): Tamanho em bytes e colunas dos dados lidos.
+            rows (int): Quantidade de linhas lidas dos dados brutos.
+        """
+        state = {
+            "raw_data_path": str(self.config.raw_data_path),
+            "bytes": mark["bytes"],
+            "columns": mark["columns"],
+            "rows": int(rows),
+        }
+        if self.store is not None:
+            self.store.persist(
+                save_json, self._incremental_state_path(), state
+            )
+        else:
+            save_json(self._incremental_state_path(), state)
+
+    def _load_incremental_state(self):
+        """
+        Método privado para carregar o estado da última transformação.
+        O estado é descartado caso os dados brutos não sejam mais uma
+        continuação dos dados já transformados.
+
+        Returns:
+            dict: Estado da transformação, ou None caso inválido.
+        """
+        state_path = self._incremental_state_path()
+        pipeline_path = Path(self.config.transformed_data_path) / (
+            "pipeline.joblib"
+        )
+        if not (state_path.exists() and pipeline_path.exists()):
+            logger.info("Estado incremental não encontrado")
+            return None
+
+        with open(state_path, encoding="UTF-8") as f:
+            state = json.load(f)
+
+        mark = raw_data_mark(self.config.raw_data_path)
+        if (
+            state["raw_data_path"] != str(self.config.raw_data_path)
+            or state["columns"] != mark["columns"]
+            or state["bytes"] > mark["bytes"]
+        ):
+            logger.info(
+                "Dados brutos alterados desde a última execução, "
+                "realizando transformação completa"
+            )
+            return None
+
+        return state
+
+    def incremental_preprocessing_pipeline(self, state):
+        """
+        Método para transformar apenas as linhas adicionadas aos dados
+        brutos desde a última execução, a partir da marca de leitura salva.
+
+        As novas linhas são divididas em treino e teste, transformadas com
+        o pipeline já ajustado e adicionadas aos artefatos existentes, assim
+        o custo é proporcional às novas linhas. O pipeline não é ajustado
+        novamente, para isso deve ser executada a transformação completa.
+
+        Args:
+            state (dict): Estado da última transformação.
+        """
+        pipeline = load_artifact(
+            self.store,
+            "pipeline",
+            lambda: joblib.load(
+                Path(self.config.transformed_data_path) / "pipeline.joblib"
+            ),
+        )
+
+        drop_columns = DropColumns().drop_columns
+        data, end_offset = read_new_raw_data(
+            self.config.raw_data_path,
+            self.config.schema,
+            state["bytes"],
+            usecols=[
+                col for col in self.config.schema if col not in drop_columns
+            ],
+            downcast_floats=self.config.downcast_floats,
+            chunksize=self.config.chunk_size,
+        )
+        if data is None:
+            logger.info("Nenhuma nova linha nos dados brutos")
+            return
+
+        formats = [self.config.artifact_format]
+        if self.config.export_csv and self.config.artifact_format != "csv":
+            formats.append("csv")
+
+        rows = 0
+        for chunk in [data] if isinstance(data, pd.DataFrame) else data:
+            # A semente da divisão depende da posição das linhas no arquivo
+            splits = self._transform_split_chunks(
+                pipeline,
+                *split_chunk(
+                    chunk, self._remove_outliers, state["rows"] + rows
+                ),
+            )
+            rows += len(chunk)
+
+            for name, split in splits.items():
+                for file_format in formats:
+                    append_frame(
+                        split,
+                        Path(self.config.transformed_data_path)
+                        / f"{name}.{file_format}",
+                        self.config.artifact_compression,
+                    )
+
+        logger.info(
+            "Transformação incremental de %s novas linhas salva em: %s",
+            rows,
+            self.config.transformed_data_path,
+        )
+        self._save_incremental_state(
+            {"bytes": end_offset, "columns": state["columns"]},
+            state["rows"] + rows,
         )
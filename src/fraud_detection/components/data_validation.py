@@ -37,7 +37,9 @@ class DataValidation:
         try:
             validation_status = None
 
-            data = pd.read_csv(self.config.raw_data_path)
+            # Apenas o cabeçalho é lido, os dados são lidos com os tipos do
+            # schema e somente as colunas utilizadas na transformação.
+            data = pd.read_csv(self.config.raw_data_path, nrows=0)
             all_cols = list(data.columns)
 
             # Carrega o arquivo de schema e cria o arquivo
@@ -0,0 +1,207 @@
+"""
+Este módulo realiza a predição com saída antecipada (early exit), somando
+as árvores do modelo em blocos e interrompendo a soma das transações
+classificadas com confiança.
+
+Após cada bloco de block_size árvores, as transações cujo score parcial
+(somado ao deslocamento do modelo) está a mais de margin do limiar de
+decisão, em escala logit, deixam de ser avaliadas, assim como o
+pred_early_stop do LightGBM. O limiar é o mesmo do BoosterClassifier.predict
+(probabilidade 0.5). A probabilidade retornada é a do score parcial.
+
+A concordância das decisões com a avaliação de todas as árvores é medida
+nos dados de teste (early_exit_report), junto da fração de transações com
+saída antecipada e da média de árvores avaliadas.
+
+As estatísticas acumuladas são protegidas por um lock, já que o mesmo
+classificador é compartilhado entre as requisições concorrentes da API.
+
+Classes:
+    EarlyExitClassifier: Classificador com saída antecipada.
+
+Funções:
+    early_exit_scores: Scores parciais e árvores avaliadas por linha.
+    early_exit_report: Comparação com a avaliação de todas as árvores.
+
+Dependências:
+    - threading
+    - numpy
+    - sklearn
+"""
+
+import threading
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+EARLY_EXIT_REPORT_NAME = "early_exit_report.json"
+
+# Limiar de probabilidade utilizado na decisão da classe
+DECISION_THRESHOLD = 0.5
+
+
+def early_exit_scores(model, X, block_size, margin):
+    """
+    Soma as árvores do modelo em blocos, interrompendo as linhas cujo score
+    parcial está a mais de margin do limiar de decisão.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame | np.ndarray): Dados transformados.
+        block_size (int): Quantidade de árvores somadas por bloco.
+        margin (float): Distância do limiar, em escala logit, a partir da\
+                        qual a soma é interrompida.
+
+    Returns:
+        tuple:
+            - np.ndarray: Score de cada linha, somado ao deslocamento.
+            - np.ndarray: Quantidade de árvores avaliadas em cada linha.
+    """
+    X = model.model_input(X)
+    total_trees = model.best_iteration or model.booster.num_trees()
+    boundary = np.log(DECISION_THRESHOLD / (1 - DECISION_THRESHOLD))
+
+    scores = np.full(len(X), model.score_offset, dtype=float)
+    trees = np.zeros(len(X), dtype=int)
+    active = np.arange(len(X))
+    for start in range(0, total_trees, block_size):
+        if active.size == 0:
+            break
+        count = min(block_size, total_trees - start)
+        scores[active] += model.booster.predict(
+            X[active],
+            start_iteration=start,
+            num_iteration=count,
+            raw_score=True,
+        )
+        trees[active] += count
+        active = active[np.abs(scores[active] - boundary) <= margin]
+    return scores, trees
+
+
+class EarlyExitClassifier:
+    """
+    Classificador com a interface do BoosterClassifier que realiza a
+    predição com saída antecipada, acumulando a quantidade de predições,
+    de saídas antecipadas e de árvores avaliadas.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        block_size (int): Quantidade de árvores somadas por bloco.
+        margin (float): Distância do limiar, em escala logit, a partir da\
+                        qual a soma é interrompida.
+    """
+
+    def __init__(self, model, block_size, margin):
+        self.model = model
+        self.block_size = block_size
+        self.margin = margin
+        self.classes_ = model.classes_
+        self.total_trees = model.best_iteration or model.booster.num_trees()
+        self.predictions = 0
+        self.early_exits = 0
+        self.trees_evaluated = 0
+        self._lock = threading.Lock()
+
+    @property
+    def feature_name_(self):
+        """Nomes das features utilizadas no treino."""
+        return self.model.feature_name_
+
+    @property
+    def n_features_in_(self):
+        """Quantidade de features utilizadas no treino."""
+        return self.model.n_features_in_
+
+    def predict_proba(self, X):
+        """
+        Retorna a probabilidade de cada classe, a partir do score parcial.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Dados transformados.
+
+        Returns:
+            np.ndarray: Probabilidades das classes 0 e 1.
+        """
+        scores, trees = early_exit_scores(
+            self.model, X, self.block_size, self.margin
+        )
+        with self._lock:
+            self.predictions += len(trees)
+            self.early_exits += int((trees < self.total_trees).sum())
+            self.trees_evaluated += int(trees.sum())
+
+        proba = 1 / (1 + np.exp(-scores))
+        return np.column_stack([1 - proba, proba])
+
+    def predict(self, X):
+        """
+        Retorna a classe prevista, com limiar de 0.5.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Dados transformados.
+
+        Returns:
+            np.ndarray: Classes previstas.
+        """
+        proba = self.predict_proba(X)[:, 1]
+        return self.classes_[(proba > DECISION_THRESHOLD).astype(int)]
+
+    def stats(self):
+        """
+        Estatísticas das predições realizadas.
+
+        Returns:
+            dict: Quantidade de predições, fração com saída antecipada e\
+                  média de árvores avaliadas.
+        """
+        with self._lock:
+            predictions = self.predictions
+            early_exits = self.early_exits
+            trees_evaluated = self.trees_evaluated
+        return {
+            "predictions": predictions,
+            "early_exit_fraction": early_exits / max(predictions, 1),
+            "mean_trees": trees_evaluated / max(predictions, 1),
+            "total_trees": self.total_trees,
+        }
+
+
+def early_exit_report(model, X, y, block_size, margin):
+    """
+    Compara a predição com saída antecipada à avaliação de todas as
+    árvores do modelo.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados de teste transformados.
+        y (pd.DataFrame | np.ndarray): Rótulos de teste.
+        block_size (int): Quantidade de árvores somadas por bloco.
+        margin (float): Distância do limiar, em escala logit, a partir da\
+                        qual a soma é interrompida.
+
+    Returns:
+        dict: Concordância das decisões, maior diferença de probabilidade,
+              AUC das duas avaliações, fração com saída antecipada e média
+              de árvores avaliadas.
+    """
+    y = np.asarray(y).ravel()
+    full_proba = model.predict_proba(X)[:, 1]
+
+    classifier = EarlyExitClassifier(model, block_size, margin)
+    proba = classifier.predict_proba(X)[:, 1]
+
+    return {
+        "block_size": block_size,
+        "margin": margin,
+        "agreement": float(
+            np.mean(
+                (proba > DECISION_THRESHOLD)
+                == (full_proba > DECISION_THRESHOLD)
+            )
+        ),
+        "max_proba_diff": float(np.max(np.abs(proba - full_proba))),
+        "auc": float(roc_auc_score(y, proba)),
+        "full_auc": float(roc_auc_score(y, full_proba)),
+        **classifier.stats(),
+    }
@@ -0,0 +1,804 @@
+"""
+Módulo com os codificadores das colunas categóricas.
+
+Classes:
+    OneHotEncoderProcessor: Realiza codificação one-hot em colunas\
+                            categóricas.
+    NonFrequentAggregator: Transforma dados de categoria de produto não\
+                           frequentes em uma única classificação Outros.
+    TargetEncoderTransformer: Aplica Target Encoding, com cross-fitting\
+                              opcional, a coluna de categoria de produtos.
+    CategoryLookupEncoder: Une a agregação e o TargetEncoder da categoria de\
+                           produtos em uma tabela de consulta.
+    CategoryCodeEncoder: Codifica as colunas categóricas em códigos\
+                         inteiros, utilizados como features categóricas\
+                         nativas do LightGBM.
+
+Dependências:
+    - copy
+    - pandas
+    - numpy
+    - scipy
+    - sklearn
+    - fraud_detection.components.processors
+"""
+
+import copy
+
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+from sklearn.model_selection import StratifiedKFold
+from sklearn.preprocessing import OneHotEncoder
+
+from fraud_detection.components.processors import (
+    CustomProcessor,
+    derive_lineage,
+)
+
+
+class OneHotEncoderProcessor(CustomProcessor):
+    """
+    Classe de transformação para aplicar OneHotEncoder a colunas categóricas
+    de baixa cardinalidade.
+
+    Utiliza OneHotEncoder provindo do pacote scikit-learn para aprender as
+    categorias. A transformação escreve os indicadores diretamente na matriz
+    de saída a partir do código inteiro de cada categoria, e os nomes das
+    novas colunas são calculados uma única vez no ajuste.
+
+    Lida com dados não desconhecidos com a tratativa "ignore"
+
+    Colunas que serão aplicadas: "score_1", "continente"
+
+    Args:
+        sparse_output (bool): Retorna as colunas codificadas como colunas\
+                              esparsas do pandas.
+    """
+
+    def __init__(self, sparse_output=False):
+        self.columns_to_encode = ["score_1", "continente"]
+        self.sparse_output = sparse_output
+        self.encoder = OneHotEncoder(
+            sparse_output=False, dtype=int, handle_unknown="ignore"
+        )
+        self.fitted = False
+        self.categories_ = None
+        self.feature_names_ = None
+
+    def fit(self, X, _y=None):
+        """
+        Realiza o fit do encoder com os dados de treino.
+
+        Args:
+            X (pd.DataFrame): Dados de treino de entrada.
+
+        Returns:
+            OneHotEncoderProcessor: Processador com dados ajustados.
+        """
+        self.encoder.fit(X[self.columns_to_encode])
+        self.categories_ = [
+            pd.Index(categories) for categories in self.encoder.categories_
+        ]
+        self.feature_names_ = list(
+            self.encoder.get_feature_names_out(self.columns_to_encode)
+        )
+        self.fitted = True
+        return self
+
+    def fit_from_categories(self, categories):
+        """
+        Realiza o fit do encoder a partir das categorias já conhecidas de
+        cada coluna, sem a necessidade de todos os dados de treino.
+
+        Args:
+            categories (dict): Dicionário de coluna para lista de categorias\\
+                               observadas nos dados de treino.
+
+        Returns:
+            OneHotEncoderProcessor: Processador com dados ajustados.
+        """
+        length = max(len(values) for values in categories.values())
+
+        # Completa as colunas repetindo a primeira categoria, o que não
+        # altera o conjunto de categorias aprendidas pelo encoder.
+        categories_frame = pd.DataFrame(
+            {
+                col: pd.Series(
+                    list(categories[col])
+                    + [categories[col][0]] * (length - len(categories[col])),
+                    dtype=object,
+                )
+                for col in self.columns_to_encode
+            }
+        )
+        return self.fit(categories_frame)
+
+    def encode(self, X, sparse_output=False):
+        """
+        Cria o bloco de colunas codificadas a partir do código inteiro de
+        cada categoria, sem criar DataFrames intermediários. Categorias
+        desconhecidas resultam em uma linha sem indicadores na coluna.
+
+        Args:
+            X (pd.DataFrame): Dados contendo as colunas a serem codificadas.
+            sparse_output (bool): Retorna uma matriz esparsa CSR.
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: Bloco codificado, na ordem\
+                                                   de feature_names_.
+        """
+        if not self.fitted:
+            raise ValueError(
+                "O encoder não foi ajustado previamente (Fit necessário)."
+            )
+
+        n_rows = len(X)
+        row_indices = []
+        column_indices = []
+        offset = 0
+        for col, categories in zip(self.columns_to_encode, self.categories_):
+            codes = categories.get_indexer(X[col])
+            known = codes >= 0
+            row_indices.append(np.flatnonzero(known))
+            column_indices.append(codes[known] + offset)
+            offset += len(categories)
+
+        rows = np.concatenate(row_indices)
+        columns = np.concatenate(column_indices)
+
+        if sparse_output:
+            return sparse.csr_matrix(
+                (
+                    np.ones(len(rows), dtype=self.encoder.dtype),
+                    (rows, columns),
+                ),
+                shape=(n_rows, offset),
+            )
+
+        encoded = np.zeros((n_rows, offset), dtype=self.encoder.dtype)
+        encoded[rows, columns] = 1
+        return encoded
+
+    def transform(self, X):
+        """
+        Aplica o OneHotEncoding utilizando o processador previamente ajustado.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados originais.
+
+        Returns:
+            pd.DataFrame: Dados com novas colunas de one hot encoding.
+        """
+        encoded = self.encode(X, self.sparse_output)
+
+        # Remove as colunas originais dos dados de entrada e insere as
+        # colunas codificadas, sem concatenação por índice
+        X_encoded = X.drop(columns=self.columns_to_encode)
+        if self.sparse_output:
+            encoded = pd.DataFrame.sparse.from_spmatrix(
+                encoded, index=X_encoded.index, columns=self.feature_names_
+            )
+        X_encoded[self.feature_names_] = encoded
+        return X_encoded
+
+    def prune(self, features):
+        """
+        Restringe a codificação às colunas com alguma coluna codificada
+        utilizada.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            OneHotEncoderProcessor | None: Processador restrito às colunas\
+                                           utilizadas, ou None caso nenhuma.
+        """
+        kept = []
+        offset = 0
+        for col, categories in zip(self.columns_to_encode, self.categories_):
+            names = self.feature_names_[offset : offset + len(categories)]
+            offset += len(categories)
+            if any(name in features for name in names):
+                kept.append((col, categories, names))
+        if not kept:
+            return None
+
+        pruned = copy.copy(self)
+        pruned.columns_to_encode = [col for col, _, _ in kept]
+        pruned.categories_ = [categories for _, categories, _ in kept]
+        pruned.feature_names_ = [
+            name for _, _, names in kept for name in names
+        ]
+        return pruned
+
+    def lineage(self, lineage):
+        """
+        Cada coluna codificada tem origem na coluna categórica original.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com as colunas codificadas.
+        """
+        sources = {}
+        offset = 0
+        for col, categories in zip(self.columns_to_encode, self.categories_):
+            for name in self.feature_names_[offset : offset + len(categories)]:
+                sources[name] = col
+            offset += len(categories)
+        return derive_lineage(lineage, sources, self.feature_names_)
+
+
+class NonFrequentAggregator(CustomProcessor):
+    """
+    Classe de processador para agregas valores não frequentes de categorias
+    de produto.
+    """
+
+    def __init__(self):
+        self.column = "categoria_produto"
+        self.valid_categories = None
+        self.threshold = 2  # Limiar de no mínimo 3 arquivos para uma categoria
+
+    def fit(self, X, _y=None):
+        """
+        Método de ajuste irá criar o array de categorias válidas.
+        Transformações posteriores irão ser realizadas utilizando este array.
+
+        Args:
+            X (pd.DataFrame): Dados de entrada
+
+        Returns:
+            NonFrequentAggregator: Processador ajustado.
+        """
+        return self.fit_from_counts(X[self.column].value_counts())
+
+    def fit_from_counts(self, category_counts):
+        """
+        Cria o array de categorias válidas a partir da contagem de
+        ocorrências de cada categoria nos dados de treino.
+
+        Args:
+            category_counts (pd.Series): Contagem indexada pela categoria.
+
+        Returns:
+            NonFrequentAggregator: Processador ajustado.
+        """
+        self.valid_categories = category_counts[
+            category_counts > self.threshold
+        ].index
+        return self
+
+    def reduce_categories(self, categories):
+        """
+        Retorna a categoria agregada correspondente a cada categoria
+        original, utilizando o array de categorias válidas.
+
+        Args:
+            categories (pd.Series): Categorias originais.
+
+        Returns:
+            pd.Series: Categorias com as não frequentes agregadas em Outros.
+        """
+        # O tipo category não aceita a nova categoria Outros
+        if isinstance(categories.dtype, pd.CategoricalDtype):
+            categories = categories.astype(object)
+
+        return categories.where(
+            categories.isin(self.valid_categories), "Outros"
+        )
+
+    def transform(self, X):
+        """
+        Recebe os dados que irão consultar o vetor de categorias
+        frequentes e agrupar os que não estão com mais de 2 ocorrências.
+
+        Args:
+            X (pd.DataFrame): Dados a serem ajustados.
+
+        Returns:
+            pd.DataFrame: Dados com a nova coluna agregada.
+        """
+        X_new = X.copy()
+
+        new_column_name = self.column + "_reduzida"
+
+        X_new[new_column_name] = self.reduce_categories(X_new[self.column])
+
+        X_new = X_new.drop(self.column, axis=1)
+        return X_new
+
+    def lineage(self, lineage):
+        """
+        A categoria agregada tem origem na categoria de produto.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com a categoria agregada.
+        """
+        created = self.column + "_reduzida"
+        return derive_lineage(lineage, {created: self.column}, [created])
+
+
+def _category_statistics(categories, y, groups=None, n_groups=1):
+    """
+    Calcula a contagem de linhas e a soma da classe alvo de cada categoria
+    com np.bincount sobre os códigos inteiros das categorias. Valores
+    ausentes são tratados como uma categoria.
+
+    Args:
+        categories (pd.Series): Categorias de cada linha.
+        y (pd.Series): Classe alvo de cada linha.
+        groups (np.ndarray): Grupo (fold) de cada linha, opcional.
+        n_groups (int): Quantidade de grupos.
+
+    Returns:
+        tuple:
+            - pd.Index: Categorias encontradas.
+            - np.ndarray: Contagens, de formato (n_groups, categorias).
+            - np.ndarray: Somas da classe alvo, de mesmo formato.
+    """
+    codes, uniques = pd.factorize(categories, use_na_sentinel=False)
+    n_categories = len(uniques)
+    if groups is not None:
+        codes = groups * n_categories + codes
+
+    size = n_groups * n_categories
+    counts = np.bincount(codes, minlength=size).reshape(n_groups, -1)
+    target_sums = np.bincount(
+        codes, weights=np.asarray(y, dtype=float), minlength=size
+    ).reshape(n_groups, -1)
+    return pd.Index(uniques), counts, target_sums
+
+
+def _smoothed_encodings(counts, target_sums, target_mean):
+    """
+    Aplica a suavização "auto" do TargetEncoder do scikit-learn para classes
+    binárias, em que a variância de cada categoria é obtida a partir da sua
+    média. Categorias sem variância ou sem linhas recebem a média global.
+
+    Args:
+        counts (np.ndarray): Quantidade de linhas por categoria.
+        target_sums (np.ndarray): Soma da classe alvo por categoria.
+        target_mean (float | np.ndarray): Média global da classe alvo,\
+                                          uma por linha de counts.
+
+    Returns:
+        np.ndarray: Valor codificado de cada categoria.
+    """
+    target_mean = np.asarray(target_mean, dtype=float)
+    if target_mean.ndim:
+        target_mean = target_mean[:, np.newaxis]
+    target_variance = target_mean * (1 - target_mean)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        category_means = target_sums / counts
+        category_variances = category_means * (1 - category_means)
+        smoothing = (target_variance * counts) / (
+            target_variance * counts + category_variances
+        )
+
+    encodings = smoothing * category_means + (1 - smoothing) * target_mean
+    return np.where(np.isnan(encodings), target_mean, encodings)
+
+
+class TargetEncoderTransformer(CustomProcessor):
+    """
+    Transformer para aplicar Target Encoding a uma coluna categórica
+    de alta cardinalidade.
+
+    Implementação nativa da suavização "auto" do TargetEncoder do
+    scikit-learn para classes binárias, calculada a partir de contagens e
+    somas da classe alvo por categoria (np.bincount). Permite ajuste em
+    blocos com partial_fit.
+
+    Com cv informado, o fit_transform utilizado no treino realiza o
+    cross-fitting: cada linha é codificada com as estatísticas dos demais
+    folds, assim como no fit_transform do scikit-learn. As estatísticas de
+    todos os folds são calculadas em uma única passagem pelos dados.
+
+    Coluna a ser aplicada: "categoria_produto_reduzida"
+
+    Args:
+        cv (int): Quantidade de folds do cross-fitting, caso vazio o\
+                  fit_transform apenas ajusta e transforma os dados.
+    """
+
+    def __init__(self, cv=None):
+        self.column = "categoria_produto_reduzida"
+        self.cv = cv
+        self.encodings_ = None
+        self.target_mean_ = None
+        self.counts_ = None
+        self.target_sums_ = None
+
+    def fit(self, X, y=None):
+        """
+        Ajusta o encoding usando os dados de treino.
+
+        Os valores codificados de cada categoria são armazenados em uma
+        série indexada pela categoria, utilizada na transformação.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados de treino.
+            y (pd.Series): Coluna de classes de saída.
+
+        Returns:
+            self: O próprio objeto transformador.
+        """
+        self.counts_ = None
+        self.target_sums_ = None
+        self.partial_fit(X, y)
+        return self.fit_from_statistics(self.counts_, self.target_sums_)
+
+    def partial_fit(self, X, y):
+        """
+        Acumula as contagens e somas da classe alvo de um bloco dos dados
+        de treino e atualiza o encoding.
+
+        Args:
+            X (pd.DataFrame): Bloco dos dados de treino.
+            y (pd.Series): Classes de saída do bloco.
+
+        Returns:
+            self: O próprio objeto transformador.
+        """
+        categories, counts, target_sums = _category_statistics(
+            X[self.column], y
+        )
+        counts = pd.Series(counts[0], index=categories)
+        target_sums = pd.Series(target_sums[0], index=categories)
+
+        if self.counts_ is not None:
+            counts = self.counts_.add(counts, fill_value=0)
+            target_sums = self.target_sums_.add(target_sums, fill_value=0)
+
+        self.counts_ = counts
+        self.target_sums_ = target_sums
+        return self.fit_from_statistics(counts, target_sums)
+
+    def fit_from_statistics(self, counts, target_sums):
+        """
+        Ajusta o encoding a partir da contagem de ocorrências e da soma
+        da classe alvo de cada categoria, sem a necessidade dos dados de
+        treino completos.
+
+        Args:
+            counts (pd.Series): Quantidade de linhas por categoria.
+            target_sums (pd.Series): Soma da classe alvo por categoria.
+
+        Returns:
+            self: O próprio objeto transformador.
+        """
+        counts = counts.astype(float)
+        target_sums = target_sums.reindex(counts.index).astype(float)
+
+        self.target_mean_ = target_sums.sum() / counts.sum()
+        self.encodings_ = pd.Series(
+            _smoothed_encodings(
+                counts.to_numpy(), target_sums.to_numpy(), self.target_mean_
+            ),
+            index=counts.index,
+        )
+        return self
+
+    def fit_transform(self, X, y=None, **fit_params):
+        """
+        Ajusta o encoding com todos os dados de treino e os transforma.
+        Com cv informado, os dados de treino são codificados por
+        cross-fitting com folds estratificados, sem embaralhamento.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados de treino.
+            y (pd.Series): Coluna de classes de saída.
+
+        Returns:
+            pd.DataFrame: Dados de treino transformados.
+        """
+        if not self.cv:
+            return self.fit(X, y).transform(X)
+
+        # Fold de cada linha, com a mesma divisão do scikit-learn
+        folds = np.empty(len(X), dtype=np.int64)
+        splitter = StratifiedKFold(n_splits=self.cv, shuffle=False)
+        for fold, (_, test_index) in enumerate(splitter.split(X, y)):
+            folds[test_index] = fold
+
+        categories, counts, target_sums = _category_statistics(
+            X[self.column], y, folds, self.cv
+        )
+        self.fit_from_statistics(
+            pd.Series(counts.sum(axis=0), index=categories),
+            pd.Series(target_sums.sum(axis=0), index=categories),
+        )
+
+        # Estatísticas fora do fold: total menos o próprio fold
+        out_of_fold_counts = counts.sum(axis=0) - counts
+        out_of_fold_sums = target_sums.sum(axis=0) - target_sums
+        out_of_fold_means = out_of_fold_sums.sum(
+            axis=1
+        ) / out_of_fold_counts.sum(axis=1)
+        encodings = _smoothed_encodings(
+            out_of_fold_counts, out_of_fold_sums, out_of_fold_means
+        )
+
+        codes = categories.get_indexer(X[self.column])
+        X_transformed = X.copy()
+        X_transformed[self.column] = encodings[folds, codes]
+        return X_transformed
+
+    def transform(self, X):
+        """
+        Transforma os dados usando o encoding previamente ajustado.
+        Categorias desconhecidas recebem a média global da classe alvo.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados a ser transformado.
+
+        Retorna:
+        - pd.DataFrame: Conjunto de dados transformados.
+        """
+        X_transformed = X.copy()
+        X_transformed[self.column] = (
+            X[self.column]
+            .map(self.encodings_)
+            .fillna(self.target_mean_)
+            .astype(float)
+        )
+        return X_transformed
+
+
+class CategoryLookupEncoder(CustomProcessor):
+    """
+    Codificação da categoria de produto em uma única tabela de consulta,
+    unindo o NonFrequentAggregator e o TargetEncoderTransformer ajustados.
+
+    Cada categoria original frequente é associada diretamente ao seu valor
+    codificado. Categorias agregadas em "Outros", ausentes ou desconhecidas
+    recebem o valor padrão pré-calculado, assim o custo por linha é de uma
+    consulta em dicionário, independente da quantidade de categorias.
+
+    Utilizada no pipeline de predição, no lugar das duas etapas originais.
+    """
+
+    def __init__(self):
+        self.column = "categoria_produto"
+        self.output_column = "categoria_produto_reduzida"
+        self.table_ = None
+        self.default_ = None
+
+    def fit(self, X, y=None):
+        """
+        Ajusta o agregador e o target encoding com os dados de treino e
+        cria a tabela de consulta.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados de treino.
+            y (pd.Series): Coluna de classes de saída.
+
+        Returns:
+            CategoryLookupEncoder: Tabela de consulta ajustada.
+        """
+        aggregator = NonFrequentAggregator().fit(X)
+        target_encoder = TargetEncoderTransformer().fit(
+            aggregator.transform(X), y
+        )
+        return self.fit_from_processors(aggregator, target_encoder)
+
+    def fit_from_processors(self, aggregator, target_encoder):
+        """
+        Cria a tabela de consulta a partir dos processadores já ajustados.
+
+        Args:
+            aggregator (NonFrequentAggregator): Agregador ajustado.
+            target_encoder (TargetEncoderTransformer): Encoding ajustado.
+
+        Returns:
+            CategoryLookupEncoder: Tabela de consulta ajustada.
+        """
+        encodings = target_encoder.encodings_
+        target_mean = float(target_encoder.target_mean_)
+
+        # Valor das categorias agregadas, também utilizado para as
+        # categorias desconhecidas, transformadas em Outros pelo agregador.
+        self.default_ = float(encodings.get("Outros", target_mean))
+        self.table_ = {
+            category: float(encodings.get(category, target_mean))
+            for category in aggregator.valid_categories
+        }
+        return self
+
+    def transform(self, X):
+        """
+        Substitui a coluna de categoria pelo valor codificado, consultado
+        na tabela linha a linha.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados a ser transformado.
+
+        Returns:
+            pd.DataFrame: Dados com a coluna de categoria codificada.
+        """
+        table, default = self.table_, self.default_
+        encoded = np.fromiter(
+            (table.get(category, default) for category in X[self.column]),
+            dtype=float,
+            count=len(X),
+        )
+
+        X_new = X.drop(columns=self.column)
+        X_new[self.output_column] = encoded
+        return X_new
+
+    def prune(self, features):
+        """
+        Mantém a tabela de consulta apenas caso a categoria codificada seja
+        utilizada.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            CategoryLookupEncoder | None: Tabela de consulta, ou None caso a\
+                                          categoria não seja utilizada.
+        """
+        return self if self.output_column in features else None
+
+    def lineage(self, lineage):
+        """
+        A categoria codificada tem origem na categoria de produto.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com a categoria codificada.
+        """
+        return derive_lineage(
+            lineage, {self.output_column: self.column}, [self.output_column]
+        )
+
+    def to_dict(self):
+        """
+        Exporta a tabela de consulta em formato serializável em JSON.
+
+        Returns:
+            dict: Coluna, tabela de valores e valor padrão.
+        """
+        return {
+            "column": self.column,
+            "output_column": self.output_column,
+            "default": self.default_,
+            "table": {
+                str(category): value for category, value in self.table_.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Carrega a tabela de consulta exportada por to_dict.
+
+        Args:
+            data (dict): Tabela exportada.
+
+        Returns:
+            CategoryLookupEncoder: Tabela de consulta ajustada.
+        """
+        encoder = cls()
+        encoder.column = data["column"]
+        encoder.output_column = data["output_column"]
+        encoder.default_ = data["default"]
+        encoder.table_ = dict(data["table"])
+        return encoder
+
+
+class CategoryCodeEncoder(CustomProcessor):
+    """
+    Codifica as colunas categóricas em códigos inteiros compactos, no lugar
+    do OneHotEncoderProcessor, do NonFrequentAggregator e do
+    TargetEncoderTransformer, para uso como features categóricas nativas
+    do LightGBM.
+
+    As categorias são aprendidas nos dados de treino e recebem os códigos
+    a partir de 1. O código 0 é reservado para categorias desconhecidas,
+    ausentes ou pouco frequentes, com no máximo threshold ocorrências,
+    assim como as agregadas em "Outros" pelo NonFrequentAggregator.
+
+    Colunas que serão aplicadas: "score_1", "continente" e
+    "categoria_produto"
+    """
+
+    def __init__(self):
+        self.columns_to_encode = ["score_1", "continente", "categoria_produto"]
+        self.threshold = 2
+        self.reserved_code = 0
+        self.categories_ = None
+
+    def fit(self, X, _y=None):
+        """
+        Aprende as categorias de cada coluna com os dados de treino.
+
+        Args:
+            X (pd.DataFrame): Dados de treino de entrada.
+
+        Returns:
+            CategoryCodeEncoder: Processador ajustado.
+        """
+        return self.fit_from_counts(
+            {col: X[col].value_counts() for col in self.columns_to_encode}
+        )
+
+    def fit_from_counts(self, category_counts):
+        """
+        Aprende as categorias a partir da contagem de ocorrências de cada
+        categoria nos dados de treino.
+
+        Args:
+            category_counts (dict): Dicionário de coluna para a contagem\
+                                    (pd.Series) indexada pela categoria.
+
+        Returns:
+            CategoryCodeEncoder: Processador ajustado.
+        """
+        self.categories_ = {}
+        for col in self.columns_to_encode:
+            counts = category_counts[col]
+            counts = counts[counts.index.notna() & (counts > self.threshold)]
+            self.categories_[col] = pd.Index(
+                sorted(counts.index.astype(object))
+            )
+        return self
+
+    @property
+    def categorical_features_(self):
+        """Colunas codificadas, repassadas como categóricas ao LightGBM."""
+        return list(self.columns_to_encode)
+
+    def transform(self, X):
+        """
+        Substitui as categorias pelos seus códigos inteiros.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados a ser transformado.
+
+        Returns:
+            pd.DataFrame: Dados com as colunas categóricas codificadas.
+        """
+        if self.categories_ is None:
+            raise ValueError(
+                "O encoder não foi ajustado previamente (Fit necessário)."
+            )
+
+        X_new = X.copy()
+        for col, categories in self.categories_.items():
+            codes = categories.get_indexer(X[col].astype(object))
+            X_new[col] = np.where(
+                codes >= 0, codes + 1, self.reserved_code
+            ).astype(np.int32)
+        return X_new
+
+    def prune(self, features):
+        """
+        Restringe a codificação às colunas utilizadas.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            CategoryCodeEncoder | None: Processador restrito às colunas\
+                                        utilizadas, ou None caso nenhuma.
+        """
+        columns = [col for col in self.columns_to_encode if col in features]
+        if not columns:
+            return None
+
+        pruned = copy.copy(self)
+        pruned.columns_to_encode = columns
+        pruned.categories_ = {col: self.categories_[col] for col in columns}
+        return pruned
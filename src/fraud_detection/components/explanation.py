@@ -0,0 +1,116 @@
+"""
+Este módulo gera os motivos de cada predição (reason codes) a partir das
+contribuições das features calculadas pelo próprio LightGBM (pred_contrib,
+TreeSHAP), sem o pacote shap.
+
+As contribuições das features do modelo, em escala logit, são somadas por
+campo de entrada de origem, obtido pela linhagem das features no pipeline
+de pré-processamento (pipeline_lineage): as colunas one-hot de continente
+são atribuídas ao país e as colunas de data à data da compra, por exemplo.
+Features com mais de um campo de origem dividem a contribuição igualmente.
+
+Os motivos são os campos com maior contribuição positiva, ou seja, que mais
+aproximam a transação da fraude.
+
+Funções:
+    field_contributions: Contribuições agregadas por campo de entrada.
+    top_reasons: Campos com maiores contribuições de cada transação.
+
+Dependências:
+    - numpy
+    - pandas
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def field_contributions(model, X, lineage):
+    """
+    Calcula as contribuições das features com pred_contrib e as soma por
+    campo de entrada de origem.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados transformados.
+        lineage (dict): Campos de entrada de origem de cada feature.
+
+    Returns:
+        pd.DataFrame: Contribuição de cada campo de entrada por linha, em\
+                      escala logit.
+    """
+    contributions = model.booster.predict(
+        model.model_input(X),
+        num_iteration=model.best_iteration or 0,
+        pred_contrib=True,
+    )
+
+    # A última coluna das contribuições é o valor esperado do score
+    features = model.feature_name_
+    fields = list(
+        dict.fromkeys(
+            field for feature in features for field in lineage[feature]
+        )
+    )
+    weights = np.zeros((len(features), len(fields)))
+    for row, feature in enumerate(features):
+        for field in lineage[feature]:
+            weights[row, fields.index(field)] = 1 / len(lineage[feature])
+
+    return pd.DataFrame(contributions[:, :-1] @ weights, columns=fields)
+
+
+def top_reasons(contributions, data, top_k=3):
+    """
+    Seleciona os campos com maior contribuição positiva de cada linha,
+    junto do valor recebido no campo.
+
+    Args:
+        contributions (pd.DataFrame): Contribuições por campo de entrada.
+        data (pd.DataFrame): Dados brutos, na mesma ordem das linhas.
+        top_k (int): Quantidade máxima de motivos por linha.
+
+    Returns:
+        list(list(dict)): Campo, valor e contribuição de cada motivo, em\
+                          ordem decrescente de contribuição.
+    """
+    values = contributions.to_numpy()
+    order = np.argsort(-values, axis=1, kind="stable")[:, :top_k]
+
+    reasons = []
+    for row in range(len(values)):
+        row_reasons = []
+        for column in order[row]:
+            if values[row, column] <= 0:
+                break
+            field = contributions.columns[column]
+            row_reasons.append(
+                {
+                    "field": field,
+                    "value": _json_value(
+                        data[field].iloc[row] if field in data else None
+                    ),
+                    "contribution": float(values[row, column]),
+                }
+            )
+        reasons.append(row_reasons)
+    return reasons
+
+
+def _json_value(value):
+    """
+    Converte o valor de um campo para um tipo serializável em JSON.
+
+    Args:
+        value: Valor do campo nos dados brutos.
+
+    Returns:
+        Valor nativo do Python, ou None caso ausente.
+    """
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -0,0 +1,332 @@
+"""
+Este módulo realiza a seleção das features a partir da importância no
+modelo treinado, reduzindo as features calculadas em cada predição.
+
+As features são ordenadas pelo ganho total dos seus splits no modelo
+(importance_type "gain") ou pela média absoluta das contribuições SHAP,
+calculadas pelo TreeSHAP do próprio LightGBM (pred_contrib), em uma amostra
+dos dados de treino ("shap"). Modelos são treinados novamente com as
+feature_counts features mais importantes, e com todas as features, com os
+mesmos hiperparâmetros, quantidade de árvores e subamostragem das linhas
+legítimas do modelo treinado, sem uma validação estratificada separada dos
+dados de treino.
+
+Cada modelo é avaliado pela AUC de validação e pelas latências p50 e p99
+da predição de uma linha por todo o caminho da predição: o pipeline de
+pré-processamento podado para as features do modelo (prune_pipeline),
+seguido do modelo. O menor conjunto de features cuja AUC permanece dentro
+da tolerância em relação ao modelo com todas as features é treinado
+novamente com todos os dados de treino e salvo. O relatório registra a
+AUC, as latências e as etapas do pipeline de cada conjunto, e a AUC de
+teste do modelo treinado e do modelo escolhido, sendo os dados de teste
+utilizados apenas no relatório.
+
+Classes:
+    FeatureSelection: Classe para seleção das features.
+
+Funções:
+    feature_importance: Importância de cada feature no modelo.
+
+Dependências:
+    - os
+    - json
+    - time
+    - numpy
+    - pandas
+    - joblib
+    - sklearn
+    - fraud_detection.logger
+    - fraud_detection.entity.config_entity.FeatureSelectionConfig
+    - fraud_detection.components.encoders
+    - fraud_detection.components.preprocessing_pipeline
+    - fraud_detection.components.model_trainer
+    - fraud_detection.components.training_data
+    - fraud_detection.utils.artifact_store.load_artifact
+    - fraud_detection.utils.commons.save_json
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+
+from fraud_detection import logger
+from fraud_detection.entity.config_entity import FeatureSelectionConfig
+from fraud_detection.components.encoders import CategoryLookupEncoder
+from fraud_detection.components.preprocessing_pipeline import (
+    build_serving_pipeline,
+    prune_pipeline,
+)
+from fraud_detection.components.model_trainer import (
+    load_model,
+    retrain_model,
+    save_model,
+)
+from fraud_detection.components.training_data import (
+    load_raw_test_data,
+    load_test_data,
+    load_training_data,
+    validation_split,
+)
+from fraud_detection.utils.artifact_store import load_artifact
+from fraud_detection.utils.commons import save_json
+
+# Ordenações aceitas para as features
+IMPORTANCE_TYPES = ("gain", "shap")
+
+FEATURE_SELECTION_REPORT_NAME = "feature_selection_report.json"
+
+# Quantidade máxima de linhas de treino utilizadas nas contribuições SHAP
+SHAP_ROWS = 20_000
+
+
+def feature_importance(model, X, importance_type="gain"):
+    """
+    Importância de cada feature no modelo, considerando apenas as árvores
+    utilizadas na predição.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados de treino, utilizados nas contribuições\
+                          SHAP.
+        importance_type (str): "gain" ou "shap".
+
+    Raises:
+        ValueError: Caso o tipo de importância seja inválido.
+
+    Returns:
+        pd.Series: Importância indexada pela feature, em ordem decrescente.
+    """
+    if importance_type not in IMPORTANCE_TYPES:
+        raise ValueError(f"Tipo de importância inválido: {importance_type}")
+
+    booster = model.booster
+    if importance_type == "gain":
+        importance = booster.feature_importance(
+            "gain", iteration=model.best_iteration
+        )
+    else:
+        # A última coluna das contribuições é o valor esperado do score
+        contributions = booster.predict(
+            X[model.feature_name_].to_numpy(dtype=np.float32),
+            num_iteration=model.best_iteration or 0,
+            pred_contrib=True,
+        )
+        importance = np.abs(contributions[:, :-1]).mean(axis=0)
+
+    return pd.Series(
+        importance, index=model.feature_name_, dtype=float
+    ).sort_values(ascending=False, kind="stable")
+
+
+class FeatureSelection:
+    """
+    Classe para seleção das features do modelo.
+
+    Args:
+        FeatureSelectionConfig (dataclass): Configurações da seleção.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
+    """
+
+    def __init__(self, config: FeatureSelectionConfig, store=None):
+        self.config = config
+        self.store = store
+
+    def _serving_pipeline(self):
+        """
+        Método privado para obter o pipeline de predição completo, o mesmo
+        utilizado pela API.
+
+        Returns:
+            Pipeline: Pipeline de predição.
+        """
+        pipeline = load_artifact(
+            self.store,
+            "pipeline",
+            lambda: joblib.load(self.config.pipeline_path),
+        )
+
+        # No modo de features categóricas não há target encoding
+        category_lookup = None
+        if "target_encoder" in pipeline.named_steps:
+
+            def read_category_lookup():
+                with open(
+                    self.config.category_lookup_path, encoding="UTF-8"
+                ) as f:
+                    return CategoryLookupEncoder.from_dict(json.load(f))
+
+            category_lookup = load_artifact(
+                self.store, "category_lookup", read_category_lookup
+            )
+        return build_serving_pipeline(pipeline, category_lookup)
+
+    def _evaluate(self, model, pipeline, evaluation_data):
+        """
+        Método privado para avaliar um modelo pela AUC de validação ou de
+        teste e pelas latências da predição de uma linha, do pipeline
+        podado ao modelo.
+
+        Args:
+            model (BoosterClassifier): Modelo avaliado.
+            pipeline (Pipeline): Pipeline de predição completo.
+            evaluation_data (tuple): Features e rótulos transformados e as\
+                                     linhas brutas medidas na latência.
+
+        Returns:
+            dict: Features, etapas do pipeline, AUC e latências do modelo.
+        """
+        X_test, y_test, latency_rows = evaluation_data
+        scoring_pipeline = prune_pipeline(pipeline, model.feature_name_)
+
+        latencies = []
+        for index in range(len(latency_rows)):
+            row = latency_rows.iloc[[index]]
+            start = time.perf_counter()
+            model.predict_proba(scoring_pipeline.transform(row))
+            latencies.append(time.perf_counter() - start)
+        latencies = np.array(latencies) * 1000
+
+        return {
+            "n_features": model.n_features_in_,
+            "features": model.feature_name_,
+            "pipeline_steps": [name for name, _ in scoring_pipeline.steps],
+            "auc": float(
+                roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+            ),
+            "p50_latency_ms": float(np.percentile(latencies, 50)),
+            "p99_latency_ms": float(np.percentile(latencies, 99)),
+        }
+
+    def select(self):
+        """
+        Ordena as features, treina os modelos com os conjuntos menores de
+        features e salva o menor conjunto dentro da tolerância, junto do
+        relatório da seleção.
+
+        Returns:
+            BoosterClassifier: Modelo com as features selecionadas.
+        """
+        model = load_model(self.store, self.config.model_path)
+        X_train, y_train = load_training_data(self.config, self.store)
+
+        sample = X_train
+        if len(X_train) > SHAP_ROWS:
+            sample = X_train.sample(SHAP_ROWS, random_state=42)
+        importance = feature_importance(
+            model, sample, self.config.importance_type
+        )
+
+        feature_sets = {"all": model.feature_name_}
+        for count in sorted(self.config.feature_counts, reverse=True):
+            if 0 < count < len(importance):
+                feature_sets[f"top_{count}"] = list(importance.index[:count])
+
+        # Os conjuntos são treinados sem as linhas de validação, nas quais
+        # são escolhidos
+        X_fit, X_valid, y_fit, y_valid = validation_split(
+            X_train, y_train, self.config.validation_size
+        )
+        num_boost_round = model.best_iteration or model.booster.num_trees()
+
+        X_test_raw = load_raw_test_data(self.config, self.store)
+        # O CountryProcessor preenche o país pela moda dos dados recebidos,
+        # inexistente em uma linha sem país
+        latency_rows = X_test_raw.dropna(subset=["pais"]).head(
+            self.config.latency_rows
+        )
+
+        pipeline = self._serving_pipeline()
+        validation_data = (
+            X_valid,
+            np.asarray(y_valid).ravel(),
+            latency_rows,
+        )
+        results = {
+            name: self._evaluate(
+                retrain_model(
+                    self.config,
+                    X_fit[features],
+                    y_fit,
+                    num_boost_round,
+                    self.store,
+                ),
+                pipeline,
+                validation_data,
+            )
+            for name, features in feature_sets.items()
+        }
+        for name, result in results.items():
+            result["accepted"] = (
+                result["auc"]
+                >= results["all"]["auc"] - self.config.auc_tolerance
+            )
+            logger.info(
+                "Conjunto %s: %s features, AUC %.5f, latência p50 %.3f ms"
+                " e p99 %.3f ms, etapas do pipeline: %s",
+                name,
+                result["n_features"],
+                result["auc"],
+                result["p50_latency_ms"],
+                result["p99_latency_ms"],
+                result["pipeline_steps"],
+            )
+
+        chosen = min(
+            (name for name, result in results.items() if result["accepted"]),
+            key=lambda name: results[name]["n_features"],
+        )
+
+        # O conjunto escolhido é treinado novamente com todos os dados de
+        # treino, e comparado ao modelo treinado nos dados de teste
+        selected = model
+        if chosen != "all":
+            selected = retrain_model(
+                self.config,
+                X_train[feature_sets[chosen]],
+                y_train,
+                num_boost_round,
+                self.store,
+            )
+            selected.fingerprint = model.fingerprint
+
+        X_test, y_test = load_test_data(self.config, self.store)
+        test_data = (X_test, np.asarray(y_test).ravel(), latency_rows)
+        test_results = {
+            name: self._evaluate(candidate, pipeline, test_data)
+            for name, candidate in {"all": model, chosen: selected}.items()
+        }
+        logger.info(
+            "Features selecionadas: %s, com %s de %s features. AUC de teste"
+            " %.5f, contra %.5f do modelo treinado",
+            chosen,
+            results[chosen]["n_features"],
+            results["all"]["n_features"],
+            test_results[chosen]["auc"],
+            test_results["all"]["auc"],
+        )
+
+        save_json(
+            path=Path(self.config.root_path) / FEATURE_SELECTION_REPORT_NAME,
+            data={
+                "importance_type": self.config.importance_type,
+                "importance": importance.to_dict(),
+                "chosen": chosen,
+                "auc_tolerance": self.config.auc_tolerance,
+                "validation_size": self.config.validation_size,
+                "candidates": results,
+                "test": test_results,
+            },
+        )
+
+        model_path = os.path.join(
+            self.config.root_path, self.config.model_name
+        )
+        save_model(self.store, selected, model_path, self.config.model_path)
+        return selected
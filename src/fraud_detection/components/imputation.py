@@ -0,0 +1,257 @@
+"""
+Módulo com o processador de imputação dos valores ausentes.
+
+A mediana das colunas numéricas pode ser exata ou aproximada por um sketch
+de quantis (KLL), e as estatísticas podem ser acumuladas bloco a bloco no
+processamento em blocos de fraud_detection.components.chunked_processing.
+
+Classes:
+    ImputeValuesProcessor: Trata valores ausentes em colunas numéricas.
+
+Dependências:
+    - copy
+    - pandas
+    - numpy
+    - sklearn
+    - fraud_detection.components.processors
+    - fraud_detection.utils.quantile_sketch
+"""
+
+import copy
+
+import pandas as pd
+import numpy as np
+
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+
+from fraud_detection.components.processors import CustomProcessor
+from fraud_detection.utils.quantile_sketch import KLLSketch
+
+
+class ImputeValuesProcessor(CustomProcessor):
+    """
+    Classe para aplicar transformações nas colunas numéricas existentes.
+    Aplica as classes discretas e contínuas aos respectivos Imputers,
+    aplicando-os a um ColumnTransformer.
+
+    Utiliza a moda para colunas numéricas discretas e mediana para colunas
+    contínuas.
+
+    Colunas discretas: "score_4" e "score_7"
+    Colunas contínuas: "score_2", "score_3", "score_5", "score_6", "score_9",\
+                       "score_10" e "valor_compra"
+
+    A mediana pode ser exata, ordenando as colunas completas, ou aproximada
+    por sketches KLL, que podem ser calculados em blocos ou processos
+    diferentes e mesclados posteriormente.
+
+    Args:
+        median_strategy (str): "exact" para mediana exata ou "sketch" para\
+                               mediana aproximada.
+        sketch_error (float): Erro de rank aproximado aceitável pelo sketch.
+    """
+
+    def __init__(self, median_strategy="exact", sketch_error=0.01):
+        if median_strategy not in ("exact", "sketch"):
+            raise ValueError(
+                f"Estratégia de mediana inválida: {median_strategy}"
+            )
+
+        self.median_strategy = median_strategy
+        self.sketch_error = sketch_error
+        self.columns_ = None
+        self.mode_counts_ = None
+        self.sketches_ = None
+
+        self.discrete_columns = ["score_4", "score_7"]
+        self.continuous_columns = [
+            "score_2",
+            "score_3",
+            "score_5",
+            "score_6",
+            "score_9",
+            "score_10",
+            "valor_compra",
+        ]
+
+        # Utiliza dois imputers para os tipos numéricos diferentes
+        # Aplica ambos a um ColumnTransformer
+        self.numerical_imputer = ColumnTransformer(
+            transformers=[
+                (
+                    "discrete",
+                    SimpleImputer(strategy="most_frequent"),
+                    self.discrete_columns,
+                ),
+                (
+                    "continuous",
+                    SimpleImputer(strategy="median"),
+                    self.continuous_columns,
+                ),
+            ],
+            # Configuração que evita o transformador de excluir os dados
+            # não utilizados para a resposta.
+            remainder="passthrough",
+        )
+
+    def fit(self, X, _y=None):
+        """
+        Realiza o fit do imputer numérico com os dados de treino.
+
+        Args:
+            X (pd.DataFrame): Dados de treino de entrada.
+
+        Returns:
+            ImputeValuesProcessor: Processador com dados ajustados.
+        """
+        if self.median_strategy == "sketch":
+            self.sketches_ = None
+            return self.partial_fit(X)
+
+        self.numerical_imputer.fit(X)
+        return self
+
+    def partial_fit(self, X, _y=None):
+        """
+        Atualiza as contagens das colunas discretas e os sketches das
+        colunas contínuas com um bloco dos dados de treino, ajustando o
+        imputer com os valores acumulados até o momento.
+
+        Args:
+            X (pd.DataFrame): Bloco dos dados de treino de entrada.
+
+        Returns:
+            ImputeValuesProcessor: Processador com dados ajustados.
+        """
+        if self.sketches_ is None:
+            self.columns_ = list(X.columns)
+            self.mode_counts_ = {
+                col: pd.Series(dtype=float) for col in self.discrete_columns
+            }
+            self.sketches_ = {
+                col: KLLSketch(self.sketch_error)
+                for col in self.continuous_columns
+            }
+
+        for col in self.discrete_columns:
+            self.mode_counts_[col] = self.mode_counts_[col].add(
+                X[col].value_counts(), fill_value=0
+            )
+
+        for col in self.continuous_columns:
+            self.sketches_[col].update(X[col].to_numpy(dtype=float))
+
+        return self._fit_from_partial_statistics()
+
+    def merge(self, other):
+        """
+        Mescla as contagens e sketches de outro processador, ajustado com
+        partial_fit em outro bloco de dados ou processo.
+
+        Args:
+            other (ImputeValuesProcessor): Processador parcialmente ajustado.
+
+        Returns:
+            ImputeValuesProcessor: Processador com dados ajustados.
+        """
+        if self.sketches_ is None:
+            self.columns_ = other.columns_
+            self.mode_counts_ = dict(other.mode_counts_)
+            # Os sketches são copiados, já que as próximas mesclas os alteram
+            self.sketches_ = copy.deepcopy(other.sketches_)
+            return self._fit_from_partial_statistics()
+
+        for col in self.discrete_columns:
+            self.mode_counts_[col] = self.mode_counts_[col].add(
+                other.mode_counts_[col], fill_value=0
+            )
+
+        for col in self.continuous_columns:
+            self.sketches_[col].merge(other.sketches_[col])
+
+        return self._fit_from_partial_statistics()
+
+    def _fit_from_partial_statistics(self):
+        """
+        Ajusta o imputer com a moda das contagens e a mediana dos sketches.
+
+        Returns:
+            ImputeValuesProcessor: Processador com dados ajustados.
+        """
+        fill_values = {}
+        for col, counts in self.mode_counts_.items():
+            # Assim como o SimpleImputer, empates resultam no menor valor
+            fill_values[col] = counts[counts == counts.max()].index.min()
+
+        for col, sketch in self.sketches_.items():
+            fill_values[col] = sketch.median()
+
+        return self.fit_from_statistics(self.columns_, fill_values)
+
+    def fit_from_statistics(self, columns, fill_values):
+        """
+        Realiza o fit do imputer numérico a partir de valores de
+        preenchimento já calculados, como a moda e a mediana acumuladas na
+        leitura em blocos dos dados de treino.
+
+        Args:
+            columns (list(str)): Colunas esperadas na entrada do imputer.
+            fill_values (dict): Valor de preenchimento de cada coluna\\
+                                discreta e contínua.
+
+        Returns:
+            ImputeValuesProcessor: Processador com dados ajustados.
+        """
+        # Em uma única linha a moda e a mediana são o próprio valor, assim os
+        # SimpleImputers aprendem exatamente os valores recebidos.
+        statistics_row = pd.DataFrame(
+            [{col: fill_values.get(col, np.nan) for col in columns}]
+        )
+        self.numerical_imputer.fit(statistics_row)
+        return self
+
+    def transform(self, X):
+        """
+        Aplica os dados de entrada ao imputer numérico previamente ajustados
+        aos dados de treino. Aplica novamente os labels as colunas para seguir
+         o pipeline corretamente.
+
+        Args:
+            X (pd.DataFrame): Dados de entraga a serem transformados.
+
+        Returns:
+            pd.DataFrame: Dados com as colunas numéricas transformadas.
+
+        """
+
+        X_transformed = self.numerical_imputer.transform(X)
+        X_transformed = pd.DataFrame(
+            X_transformed, columns=self._get_column_names(X)
+        )
+        return X_transformed
+
+    def _get_column_names(self, X):
+        """
+        Função para concatenar o nome das colunas originais com as colunas
+        transformadas, uma vez que o resultado da transformação retorna em
+        arrays não indexados.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados com colunas originais.
+
+        Returns:
+            list(str): Lista de nomes das colunas concatenadas.
+
+        """
+
+        transformed_columns = (
+            self.discrete_columns
+            + self.continuous_columns
+            + [
+                col
+                for col in X.columns
+                if col not in self.discrete_columns + self.continuous_columns
+            ]
+        )
+        return transformed_columns
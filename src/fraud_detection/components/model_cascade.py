@@ -0,0 +1,465 @@
+"""
+Este módulo realiza o treinamento da cascata de modelos utilizada na
+predição, reduzindo o custo médio de cada predição.
+
+Um modelo de primeira etapa, um LightGBM com poucas árvores, é treinado com
+features brutas de baixo custo: o valor da compra, os scores e a entrega
+dos documentos, lidas diretamente dos dados recebidos, sem o pipeline de
+pré-processamento. As transações com probabilidade da primeira etapa abaixo
+de approve_below são aprovadas e a partir de decline_above são declinadas;
+apenas a faixa ambígua é encaminhada ao pipeline de predição completo.
+
+Os limites da faixa são ajustados em uma validação estratificada separada
+dos dados de treino, entre os quantis da probabilidade da primeira etapa,
+treinada sem as linhas de validação: é escolhida a faixa que decide a maior
+fração das transações na primeira etapa, com perda de faturamento, em
+relação às decisões do modelo utilizado na predição, de no máximo
+max_revenue_loss do faturamento desse modelo (tune_band). Como o modelo
+utilizado pode ter sido treinado nas linhas de validação, suas decisões na
+validação são as de um modelo treinado novamente sem elas, com as mesmas
+features, hiperparâmetros e quantidade de árvores. Os dados de teste
+são utilizados apenas no relatório da faixa escolhida (band_report).
+
+Após salva, a cascata é registrada como ajustada ao modelo utilizado na
+predição (record_active_model), e o registro é descartado quando um novo
+modelo é salvo.
+
+Classes:
+    CascadeClassifier: Primeira etapa da cascata com a faixa ajustada.
+    ModelCascade: Classe para treinamento da cascata.
+
+Funções:
+    cascade_features: Features brutas da primeira etapa.
+    transaction_revenue: Faturamento de cada transação.
+    band_report: Frações de decisões e faturamentos de uma faixa.
+    tune_band: Ajuste dos limites da faixa encaminhada.
+
+Dependências:
+    - os
+    - time
+    - numpy
+    - pandas
+    - lightgbm
+    - joblib
+    - sklearn
+    - fraud_detection.logger
+    - fraud_detection.entity.config_entity.ModelCascadeConfig
+    - fraud_detection.components.model_trainer
+    - fraud_detection.components.training_data
+    - fraud_detection.utils.commons.save_json
+"""
+
+import os
+import time
+from pathlib import Path
+
+import joblib
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+
+from fraud_detection import logger
+from fraud_detection.entity.config_entity import ModelCascadeConfig
+from fraud_detection.components.model_trainer import (
+    BoosterClassifier,
+    load_serving_model,
+    record_active_model,
+    resolve_model_path,
+    retrain_model,
+)
+from fraud_detection.components.training_data import (
+    load_raw_test_data,
+    load_raw_training_data,
+    load_test_data,
+    load_training_data,
+    validation_split,
+)
+from fraud_detection.utils.commons import save_json
+
+CASCADE_REPORT_NAME = "cascade_report.json"
+
+# Features brutas numéricas utilizadas pela primeira etapa
+NUMERIC_FEATURES = (
+    *(f"score_{number}" for number in (1, 2, 3, 4, 5, 6, 7, 9, 10)),
+    "valor_compra",
+)
+
+# Indicadores de entrega dos documentos, "Y"/"N" ou 1/0 nos dados brutos
+DOCUMENT_FEATURES = ("entrega_doc_1", "entrega_doc_2", "entrega_doc_3")
+DOCUMENT_FLAGS = {"Y": 1.0, "1": 1.0, "N": 0.0, "0": 0.0}
+
+# Decisões da primeira etapa
+APPROVE = 0
+DECLINE = 1
+FORWARD = -1
+
+# Quantis da probabilidade da primeira etapa candidatos a limites da faixa
+BAND_QUANTILES = np.linspace(0, 1, 41)
+
+
+def cascade_features(X):
+    """
+    Features brutas da primeira etapa, sem o pipeline de pré-processamento.
+
+    Args:
+        X (pd.DataFrame): Dados brutos, como recebidos pela API.
+
+    Returns:
+        np.ndarray: Features da primeira etapa, com NaN nos valores\
+                    ausentes ou inválidos.
+    """
+    numeric = X[list(NUMERIC_FEATURES)]
+    try:
+        numeric = numeric.to_numpy(dtype=np.float32)
+    except (TypeError, ValueError):
+        numeric = numeric.apply(pd.to_numeric, errors="coerce").to_numpy(
+            dtype=np.float32
+        )
+
+    # Conversão por valor, mais rápida que o map do pandas em uma linha
+    documents = X[list(DOCUMENT_FEATURES)].to_numpy(dtype=object)
+    flags = np.array(
+        [DOCUMENT_FLAGS.get(str(value), np.nan) for value in documents.flat],
+        dtype=np.float32,
+    ).reshape(documents.shape)
+    return np.hstack([numeric, flags])
+
+
+def transaction_revenue(decisions, y, values):
+    """
+    Faturamento de cada transação a partir das decisões de aprovação e
+    declínio, com as premissas do BaseMetrics: 10% do valor das compras
+    legítimas aprovadas é recebido e o valor das fraudes aprovadas é
+    perdido.
+
+    Args:
+        decisions (np.ndarray): APPROVE ou DECLINE por transação.
+        y (np.ndarray): Rótulos de fraude.
+        values (np.ndarray): Valores das transações.
+
+    Returns:
+        np.ndarray: Faturamento de cada transação.
+    """
+    return np.where(
+        decisions == APPROVE, np.where(y == 1, -values, 0.1 * values), 0.0
+    )
+
+
+def band_report(band, first_proba, full_decisions, y, values):
+    """
+    Avalia uma faixa: frações de transações aprovadas, declinadas e
+    encaminhadas, perda de faturamento nas divergências com o modelo
+    completo e faturamentos do modelo completo e da cascata.
+
+    Args:
+        band (dict): Limites approve_below e decline_above da faixa.
+        first_proba (np.ndarray): Probabilidades da primeira etapa.
+        full_decisions (np.ndarray): Decisões do modelo completo.
+        y (np.ndarray): Rótulos de fraude.
+        values (np.ndarray): Valores das transações.
+
+    Returns:
+        dict: Limites da faixa, frações de transações de cada decisão,\
+              perda e faturamentos do modelo completo e da cascata.
+    """
+    approved = first_proba < band["approve_below"]
+    declined = first_proba >= band["decline_above"]
+    decisions = np.where(
+        approved, APPROVE, np.where(declined, DECLINE, full_decisions)
+    )
+    full_revenue = transaction_revenue(full_decisions, y, values)
+    cascade_revenue = transaction_revenue(decisions, y, values)
+    return {
+        "approve_below": float(band["approve_below"]),
+        "decline_above": float(band["decline_above"]),
+        "approved_share": float(np.mean(approved)),
+        "declined_share": float(np.mean(declined)),
+        "forwarded_share": float(1 - np.mean(approved | declined)),
+        "revenue_loss": float(
+            np.maximum(full_revenue - cascade_revenue, 0).sum()
+        ),
+        "full_revenue": float(full_revenue.sum()),
+        "cascade_revenue": float(cascade_revenue.sum()),
+    }
+
+
+def tune_band(first_proba, full_decisions, y, values, max_revenue_loss):
+    """
+    Ajusta os limites da faixa encaminhada ao modelo completo, decidindo a
+    maior fração das transações na primeira etapa com perda de faturamento
+    dentro do limite.
+
+    A perda é o faturamento perdido nas transações em que a primeira etapa
+    diverge do modelo completo, sem compensação pelas divergências que
+    aumentam o faturamento, de forma que a primeira etapa não substitui as
+    decisões do modelo completo na faixa ambígua.
+
+    Args:
+        first_proba (np.ndarray): Probabilidades da primeira etapa.
+        full_decisions (np.ndarray): Decisões do modelo completo.
+        y (np.ndarray): Rótulos de fraude.
+        values (np.ndarray): Valores das transações.
+        max_revenue_loss (float): Perda máxima de faturamento, em fração\
+                                  do faturamento do modelo completo.
+
+    Returns:
+        dict: Limites da faixa, frações de transações de cada decisão,\
+              perda e faturamentos do modelo completo e da cascata.
+    """
+    full_revenue = transaction_revenue(full_decisions, y, values)
+    approve_revenue = transaction_revenue(np.full(len(y), APPROVE), y, values)
+    approve_loss = np.maximum(full_revenue - approve_revenue, 0)
+    decline_loss = np.maximum(full_revenue, 0)
+    budget = max_revenue_loss * abs(full_revenue.sum())
+
+    quantiles = np.quantile(first_proba, BAND_QUANTILES)
+    # Limites fora do intervalo das probabilidades não decidem transações
+    approve_candidates = np.unique(np.concatenate([[0.0], quantiles]))
+    decline_candidates = np.unique(np.concatenate([quantiles, [np.inf]]))
+
+    best_share, best_band = -1.0, None
+    for approve_below in approve_candidates:
+        approved = first_proba < approve_below
+        for decline_above in decline_candidates[
+            decline_candidates >= approve_below
+        ]:
+            declined = first_proba >= decline_above
+            loss = approve_loss[approved].sum() + decline_loss[declined].sum()
+            share = np.mean(approved | declined)
+            if loss > budget or share <= best_share:
+                continue
+
+            best_share = share
+            best_band = {
+                "approve_below": approve_below,
+                "decline_above": decline_above,
+            }
+    return band_report(best_band, first_proba, full_decisions, y, values)
+
+
+class CascadeClassifier:
+    """
+    Primeira etapa da cascata: decide as transações fora da faixa ambígua
+    a partir das features brutas.
+
+    Args:
+        model (BoosterClassifier): Modelo da primeira etapa.
+        approve_below (float): Probabilidade abaixo da qual a transação é\
+                               aprovada.
+        decline_above (float): Probabilidade a partir da qual a transação\
+                               é declinada.
+    """
+
+    def __init__(self, model, approve_below, decline_above):
+        self.model = model
+        self.approve_below = approve_below
+        self.decline_above = decline_above
+
+    def predict_proba(self, X):
+        """
+        Retorna a probabilidade de cada classe pela primeira etapa.
+
+        Args:
+            X (pd.DataFrame): Dados brutos.
+
+        Returns:
+            np.ndarray: Probabilidades das classes 0 e 1.
+        """
+        return self.model.predict_proba(cascade_features(X))
+
+    def route(self, X):
+        """
+        Decide as transações fora da faixa e encaminha as demais.
+
+        Args:
+            X (pd.DataFrame): Dados brutos.
+
+        Returns:
+            tuple:
+                - np.ndarray: APPROVE, DECLINE ou FORWARD por transação.
+                - np.ndarray: Probabilidade de fraude da primeira etapa.
+        """
+        proba = self.predict_proba(X)[:, 1]
+        decisions = np.where(
+            proba < self.approve_below,
+            APPROVE,
+            np.where(proba >= self.decline_above, DECLINE, FORWARD),
+        )
+        return decisions, proba
+
+
+class ModelCascade:
+    """
+    Classe para treinamento da cascata de modelos.
+
+    Args:
+        ModelCascadeConfig (dataclass): Configurações da cascata.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
+    """
+
+    def __init__(self, config: ModelCascadeConfig, store=None):
+        self.config = config
+        self.store = store
+
+    def _train_first_stage(self, X_raw, y):
+        """
+        Método privado para treinar o modelo da primeira etapa.
+
+        Args:
+            X_raw (pd.DataFrame): Features de treino brutas.
+            y (pd.DataFrame): Rótulos de treino.
+
+        Returns:
+            BoosterClassifier: Modelo da primeira etapa.
+        """
+        params = {
+            "objective": "binary",
+            "num_leaves": self.config.num_leaves,
+            "learning_rate": 0.1,
+            "random_state": 42,
+            "verbose": -1,
+        }
+        dataset = lgb.Dataset(
+            cascade_features(X_raw),
+            label=np.asarray(y, dtype=np.float32).ravel(),
+            feature_name=[*NUMERIC_FEATURES, *DOCUMENT_FEATURES],
+            params=params,
+        )
+        return BoosterClassifier(
+            lgb.train(params, dataset, num_boost_round=self.config.num_trees)
+        )
+
+    def _first_stage_latencies(self, cascade, X_raw):
+        """
+        Método privado para medir a latência, em milissegundos, da primeira
+        etapa em uma linha bruta por vez.
+
+        Args:
+            cascade (CascadeClassifier): Primeira etapa da cascata.
+            X_raw (pd.DataFrame): Dados brutos.
+
+        Returns:
+            np.ndarray: Latência de cada linha medida.
+        """
+        latencies = []
+        for index in range(min(self.config.latency_rows, len(X_raw))):
+            row = X_raw.iloc[[index]]
+            start = time.perf_counter()
+            cascade.route(row)
+            latencies.append(time.perf_counter() - start)
+        return np.array(latencies) * 1000
+
+    def build(self):
+        """
+        Treina a primeira etapa, ajusta a faixa encaminhada ao modelo
+        completo e salva a cascata, junto do relatório.
+
+        Returns:
+            CascadeClassifier: Primeira etapa da cascata.
+        """
+        model = load_serving_model(self.config, self.store)
+        X_train, y_train = load_training_data(self.config, self.store)
+        X_train_raw = load_raw_training_data(self.config, self.store)
+
+        # A primeira etapa é treinada sem as linhas de validação, nas quais
+        # a faixa é ajustada
+        fit_rows, valid_rows, y_fit, y_valid = validation_split(
+            np.arange(len(y_train)), y_train, self.config.validation_size
+        )
+        first_stage = self._train_first_stage(
+            X_train_raw.iloc[fit_rows], y_fit
+        )
+
+        # O modelo utilizado pode ter sido treinado nas linhas de validação
+        # (sem early stopping, ou com as features selecionadas), e as
+        # decisões do modelo completo na validação são as de um modelo
+        # treinado novamente sem elas, com as mesmas features, hiperparâmetros
+        # e quantidade de árvores
+        X_train = X_train[model.feature_name_]
+        full_model = retrain_model(
+            self.config,
+            X_train.iloc[fit_rows],
+            y_fit,
+            model.best_iteration or model.booster.num_trees(),
+            self.store,
+        )
+
+        X_valid_raw = X_train_raw.iloc[valid_rows]
+        band = tune_band(
+            first_stage.predict_proba(cascade_features(X_valid_raw))[:, 1],
+            full_model.predict(X_train.iloc[valid_rows]),
+            np.asarray(y_valid).ravel(),
+            X_valid_raw["valor_compra"].to_numpy(),
+            self.config.max_revenue_loss,
+        )
+        cascade = CascadeClassifier(
+            first_stage, band["approve_below"], band["decline_above"]
+        )
+
+        # A faixa escolhida é avaliada nos dados de teste
+        X_test, y_test = load_test_data(self.config, self.store)
+        X_test_raw = load_raw_test_data(self.config, self.store)
+        y_test = np.asarray(y_test).ravel()
+        first_proba = first_stage.predict_proba(cascade_features(X_test_raw))[
+            :, 1
+        ]
+        test_band = band_report(
+            band,
+            first_proba,
+            model.predict(X_test),
+            y_test,
+            X_test_raw["valor_compra"].to_numpy(),
+        )
+        latencies = self._first_stage_latencies(cascade, X_test_raw)
+
+        logger.info(
+            "Faixa encaminhada: [%.4f, %.4f). No teste, aprovadas %.1f%%,"
+            " declinadas %.1f%% e encaminhadas %.1f%% das transações."
+            " Faturamento de R$ %.2f com a cascata e R$ %.2f com o modelo"
+            " completo",
+            band["approve_below"],
+            band["decline_above"],
+            test_band["approved_share"] * 100,
+            test_band["declined_share"] * 100,
+            test_band["forwarded_share"] * 100,
+            test_band["cascade_revenue"],
+            test_band["full_revenue"],
+        )
+
+        save_json(
+            path=Path(self.config.root_path) / CASCADE_REPORT_NAME,
+            data={
+                "validation": band,
+                "test": test_band,
+                "validation_size": self.config.validation_size,
+                "max_revenue_loss": self.config.max_revenue_loss,
+                "first_stage_auc": float(roc_auc_score(y_test, first_proba)),
+                "first_stage_p50_latency_ms": float(
+                    np.percentile(latencies, 50)
+                ),
+                "first_stage_p99_latency_ms": float(
+                    np.percentile(latencies, 99)
+                ),
+            },
+        )
+
+        cascade_path = os.path.join(
+            self.config.root_path, self.config.cascade_name
+        )
+        if self.store is not None:
+            self.store.put("cascade", cascade)
+        joblib.dump(cascade, cascade_path)
+        # A cascata é registrada como ajustada ao modelo utilizado, após ser
+        # salva, e o registro é descartado quando um novo modelo é salvo
+        record_active_model(
+            resolve_model_path(
+                self.config.model_path,
+                self.config.selected_model_path,
+                self.config.compact_model_path,
+            ),
+            self.config.model_path,
+            cascade=True,
+        )
+        return cascade
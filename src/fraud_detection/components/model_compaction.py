@@ -0,0 +1,525 @@
+"""
+Este módulo realiza a compactação do modelo LightGBM treinado, reduzindo a
+quantidade de árvores percorridas em cada predição, da qual a latência da
+inferência cresce linearmente.
+
+Três formas de compactação geram os modelos candidatos:
+    - Truncamento: apenas as primeiras árvores do modelo são mantidas.
+    - Remoção de árvores: as árvores de menor contribuição média, em valor
+      absoluto, nos dados de treino são removidas. A contribuição média das
+      árvores removidas é somada ao deslocamento do score do modelo.
+    - Destilação: um modelo menor é treinado nos scores (probabilidades) do
+      modelo original nos dados de treino.
+
+Os candidatos são gerados sem uma validação estratificada separada dos
+dados de treino, na qual são avaliados pela AUC e pelo faturamento do
+melhor limiar (BaseMetrics.revenue_sweep). Como o modelo original pode ter
+sido treinado nas linhas de validação, a referência da escolha é o modelo
+treinado novamente sem elas, com os mesmos hiperparâmetros e quantidade de
+árvores, do qual os candidatos avaliados são gerados. O menor candidato
+cuja AUC e faturamento permanecem dentro da tolerância configurada em
+relação à referência é gerado novamente a partir do modelo original, com
+todos os dados de treino, e salvo, e o relatório compara tamanho, AUC, faturamento e
+latências p50 e p99 da predição de uma linha de todos os candidatos. Os
+dados de teste são utilizados apenas no relatório do modelo original e do
+candidato escolhido.
+
+Classes:
+    ModelCompaction: Classe para compactação do modelo treinado.
+
+Funções:
+    select_trees: Cria um lightgbm.Booster apenas com as árvores escolhidas.
+    tree_contributions: Contribuição de cada árvore no score de cada linha.
+
+Dependências:
+    - os
+    - re
+    - numpy
+    - pandas
+    - lightgbm
+    - sklearn
+    - fraud_detection.logger
+    - fraud_detection.entity.config_entity.ModelCompactionConfig
+    - fraud_detection.components.model_trainer
+    - fraud_detection.components.training_data
+    - fraud_detection.utils.base_metrics.BaseMetrics
+    - fraud_detection.utils.commons.save_json
+"""
+
+import os
+import re
+from pathlib import Path
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+
+from fraud_detection import logger
+from fraud_detection.entity.config_entity import ModelCompactionConfig
+from fraud_detection.components.model_trainer import (
+    BoosterClassifier,
+    load_model,
+    retrain_model,
+    row_latencies,
+    save_model,
+)
+from fraud_detection.components.training_data import (
+    DATASET_PARAMS,
+    load_categorical_features,
+    load_test_data,
+    load_raw_test_data,
+    load_raw_training_data,
+    load_training_data,
+    validation_split,
+)
+from fraud_detection.utils.base_metrics import BaseMetrics
+from fraud_detection.utils.commons import save_json
+
+COMPACTION_REPORT_NAME = "compaction_report.json"
+
+# Quantidade máxima de linhas de treino utilizadas na destilação e no
+# cálculo das contribuições das árvores, que gera uma matriz de linhas por
+# árvores
+DISTILLATION_ROWS = 200_000
+CONTRIBUTION_ROWS = 20_000
+
+# Parâmetros do modelo original mantidos no modelo destilado
+DISTILLED_PARAMS = (
+    "num_leaves",
+    "max_depth",
+    "subsample",
+    "colsample_bytree",
+    "reg_alpha",
+    "reg_lambda",
+    *DATASET_PARAMS,
+)
+
+
+def select_trees(booster, trees):
+    """
+    Cria um lightgbm.Booster apenas com as árvores escolhidas, editando o
+    modelo em texto: os blocos das árvores removidas são descartados, as
+    demais são renumeradas e os tamanhos dos blocos no cabeçalho são
+    recalculados.
+
+    Args:
+        booster (lightgbm.Booster): Modelo com uma árvore por iteração.
+        trees (list(int)): Índices das árvores mantidas, em ordem.
+
+    Returns:
+        lightgbm.Booster: Modelo com as árvores escolhidas.
+    """
+    model_str = booster.model_to_string()
+    header, rest = model_str.split("Tree=0\n", 1)
+    tree_blocks, tail = ("Tree=0\n" + rest).split("end of trees", 1)
+    blocks = re.split(r"(?=^Tree=\d+\n)", tree_blocks, flags=re.M)[1:]
+
+    kept = [
+        re.sub(r"^Tree=\d+\n", f"Tree={position}\n", blocks[tree])
+        for position, tree in enumerate(trees)
+    ]
+    tree_sizes = " ".join(str(len(block.encode())) for block in kept)
+    header = re.sub(
+        r"^tree_sizes=.*$", f"tree_sizes={tree_sizes}", header, flags=re.M
+    )
+    return lgb.Booster(
+        model_str=header + "".join(kept) + "end of trees" + tail
+    )
+
+
+def tree_contributions(booster, X):
+    """
+    Contribuição de cada árvore no score (antes da sigmoide) de cada linha,
+    obtida pelo valor da folha alcançada pela linha em cada árvore.
+
+    Args:
+        booster (lightgbm.Booster): Modelo treinado.
+        X (np.ndarray): Dados transformados em float32.
+
+    Returns:
+        np.ndarray: Matriz de linhas por árvores com as contribuições.
+    """
+    leaves = booster.predict(X, pred_leaf=True).astype(np.int64)
+    tree_info = booster.dump_model()["tree_info"]
+
+    leaf_values = np.zeros(
+        (len(tree_info), max(tree["num_leaves"] for tree in tree_info))
+    )
+    for tree, info in enumerate(tree_info):
+        for leaf in range(info["num_leaves"]):
+            leaf_values[tree, leaf] = booster.get_leaf_output(tree, leaf)
+
+    return leaf_values[np.arange(len(tree_info)), leaves]
+
+
+class ModelCompaction:
+    """
+    Classe para compactação do modelo treinado.
+
+    Args:
+        ModelCompactionConfig (dataclass): Configurações da compactação.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
+    """
+
+    def __init__(self, config: ModelCompactionConfig, store=None):
+        self.config = config
+        self.store = store
+
+    def _sample(self, X_train, rows):
+        """
+        Método privado para amostrar as linhas de treino utilizadas nas
+        contribuições das árvores e na destilação.
+
+        Args:
+            X_train (pd.DataFrame): Features de treino.
+            rows (int): Quantidade máxima de linhas.
+
+        Returns:
+            pd.DataFrame: Linhas amostradas.
+        """
+        if len(X_train) <= rows:
+            return X_train
+        return X_train.sample(rows, random_state=42)
+
+    def _truncated(self, reference):
+        """
+        Método privado para gerar os candidatos truncados, mantendo as
+        primeiras árvores do modelo.
+
+        Args:
+            reference (BoosterClassifier): Modelo original.
+
+        Returns:
+            list(tuple): Nome e modelo de cada candidato.
+        """
+        num_trees = reference.booster.num_trees()
+        candidates = []
+        for fraction in self.config.prefix_fractions:
+            trees = max(int(round(num_trees * fraction)), 1)
+            booster = lgb.Booster(
+                model_str=reference.booster.model_to_string(
+                    num_iteration=trees
+                )
+            )
+            candidates.append(
+                (
+                    f"truncate_{trees}",
+                    BoosterClassifier(
+                        booster, score_offset=reference.score_offset
+                    ),
+                )
+            )
+        return candidates
+
+    def _pruned(self, reference, X_sample):
+        """
+        Método privado para gerar os candidatos sem as árvores de menor
+        contribuição média absoluta. A contribuição média das árvores
+        removidas é somada ao deslocamento do score, preservando a
+        probabilidade média do modelo.
+
+        Args:
+            reference (BoosterClassifier): Modelo original.
+            X_sample (pd.DataFrame): Linhas de treino amostradas.
+
+        Returns:
+            list(tuple): Nome e modelo de cada candidato.
+        """
+        contributions = tree_contributions(
+            reference.booster, X_sample.to_numpy(dtype=np.float32)
+        )
+        # Árvores em ordem crescente de contribuição
+        order = np.argsort(np.abs(contributions).mean(axis=0), kind="stable")
+
+        candidates = []
+        for fraction in self.config.drop_fractions:
+            dropped = order[: int(len(order) * fraction)]
+            kept = np.setdiff1d(order, dropped)
+            if not dropped.size or not kept.size:
+                continue
+            candidates.append(
+                (
+                    f"drop_{len(dropped)}",
+                    BoosterClassifier(
+                        select_trees(reference.booster, kept.tolist()),
+                        score_offset=reference.score_offset
+                        + float(contributions[:, dropped].sum(axis=1).mean()),
+                    ),
+                )
+            )
+        return candidates
+
+    def _distilled(self, reference, X_sample):
+        """
+        Método privado para gerar os candidatos destilados, treinados com
+        entropia cruzada nas probabilidades do modelo original.
+
+        Args:
+            reference (BoosterClassifier): Modelo original.
+            X_sample (pd.DataFrame): Linhas de treino amostradas.
+
+        Returns:
+            list(tuple): Nome e modelo de cada candidato.
+        """
+        params = {
+            "objective": "cross_entropy",
+            "learning_rate": self.config.distill_learning_rate,
+            **{
+                name: self.config.all_params[name] for name in DISTILLED_PARAMS
+            },
+            "random_state": 42,
+            "verbose": -1,
+        }
+        categorical_features = load_categorical_features(
+            self.config, self.store
+        )
+        dataset = lgb.Dataset(
+            X_sample.to_numpy(dtype=np.float32),
+            label=reference.predict_proba(X_sample)[:, 1],
+            feature_name=[str(col) for col in X_sample.columns],
+            categorical_feature=categorical_features or "auto",
+            params=params,
+            free_raw_data=False,
+        )
+
+        candidates = []
+        for trees in self.config.distill_trees:
+            booster = lgb.train(params, dataset, num_boost_round=trees)
+            candidates.append((f"distill_{trees}", BoosterClassifier(booster)))
+        return candidates
+
+    def _candidates(self, reference, X_train, kind=None):
+        """
+        Método privado para gerar os candidatos compactados a partir de um
+        modelo de referência.
+
+        Args:
+            reference (BoosterClassifier): Modelo de referência.
+            X_train (pd.DataFrame): Features de treino amostradas nas\
+                                    contribuições e na destilação.
+            kind (str): Apenas os candidatos do tipo informado ("truncate",\
+                        "drop" ou "distill"), opcional.
+
+        Returns:
+            list(tuple): Nome e modelo de cada candidato, incluindo a\
+                         referência quando todos os tipos são gerados.
+        """
+        generators = {
+            "truncate": lambda: self._truncated(reference),
+            "drop": lambda: self._pruned(
+                reference, self._sample(X_train, CONTRIBUTION_ROWS)
+            ),
+            "distill": lambda: self._distilled(
+                reference, self._sample(X_train, DISTILLATION_ROWS)
+            ),
+        }
+        if kind is not None:
+            return generators[kind]()
+        return [
+            ("reference", reference),
+            *(
+                candidate
+                for generate in generators.values()
+                for candidate in generate()
+            ),
+        ]
+
+    def _evaluate(self, model, X, y, transaction_values):
+        """
+        Método privado para avaliar um candidato na validação ou nos dados
+        de teste.
+
+        O faturamento é o do limiar de score que o maximiza, com o score
+        em escala de 0 a 100, como no modelo base.
+
+        Args:
+            model (BoosterClassifier): Modelo candidato.
+            X (pd.DataFrame): Features de avaliação.
+            y (np.ndarray): Rótulos de avaliação.
+            transaction_values (np.ndarray): Valores das transações.
+
+        Returns:
+            dict: Tamanho, AUC, faturamento e latências do candidato.
+        """
+        proba = model.predict_proba(X)[:, 1]
+        metrics = BaseMetrics(
+            pd.DataFrame(
+                {
+                    "score": proba * 100,
+                    "fraude": y,
+                    "valor_compra": transaction_values,
+                }
+            ),
+            score_column="score",
+            fraud_column="fraude",
+            value_column="valor_compra",
+        )
+        latencies = row_latencies(model, X, self.config.latency_rows)
+        return {
+            "num_trees": model.booster.num_trees(),
+            "size_bytes": len(model.booster.model_to_string().encode()),
+            "auc": float(roc_auc_score(y, proba)),
+            "revenue": float(
+                metrics.revenue_sweep(range(1, 100))["revenue"].max()
+            ),
+            "p50_latency_ms": float(np.percentile(latencies, 50)),
+            "p99_latency_ms": float(np.percentile(latencies, 99)),
+        }
+
+    def _within_tolerance(self, result, reference):
+        """
+        Método privado para verificar se a AUC e o faturamento de um
+        candidato permanecem dentro da tolerância em relação ao original.
+
+        Args:
+            result (dict): Avaliação do candidato.
+            reference (dict): Avaliação do modelo original.
+
+        Returns:
+            bool: Verdadeiro caso o candidato seja aceito.
+        """
+        return result["auc"] >= (
+            reference["auc"] - self.config.auc_tolerance
+        ) and result["revenue"] >= reference["revenue"] - (
+            self.config.revenue_tolerance * abs(reference["revenue"])
+        )
+
+    def compact(self):
+        """
+        Gera e avalia os candidatos, salvando o menor modelo dentro da
+        tolerância e o relatório da compactação.
+
+        Returns:
+            BoosterClassifier: Modelo escolhido.
+        """
+        model = load_model(
+            self.store, self.config.model_path, self.config.selected_model_path
+        )
+        # Apenas as árvores utilizadas na predição são mantidas
+        reference = BoosterClassifier(
+            lgb.Booster(
+                model_str=model.booster.model_to_string(
+                    num_iteration=model.best_iteration or 0
+                )
+            ),
+            fingerprint=model.fingerprint,
+            score_offset=model.score_offset,
+        )
+
+        # Com features selecionadas, apenas as features do modelo são
+        # utilizadas
+        features = reference.feature_name_
+        X_train, y_train = load_training_data(self.config, self.store)
+        X_train = X_train[features]
+
+        # Os candidatos são gerados sem as linhas de validação, nas quais
+        # são escolhidos. O modelo utilizado pode ter sido treinado nessas
+        # linhas (sem early stopping, ou com as features selecionadas), e a
+        # referência da escolha é treinada novamente sem elas, com a mesma
+        # quantidade de árvores, assim como os candidatos derivados dela
+        fit_rows, valid_rows, y_fit, y_valid = validation_split(
+            np.arange(len(y_train)), y_train, self.config.validation_size
+        )
+        X_fit = X_train.iloc[fit_rows]
+        candidates = self._candidates(
+            retrain_model(
+                self.config,
+                X_fit,
+                y_fit,
+                reference.booster.num_trees(),
+                self.store,
+            ),
+            X_fit,
+        )
+
+        validation_data = (
+            X_train.iloc[valid_rows],
+            np.asarray(y_valid).ravel(),
+            load_raw_training_data(self.config, self.store)[
+                "valor_compra"
+            ].to_numpy()[valid_rows],
+        )
+        results = {
+            name: self._evaluate(candidate, *validation_data)
+            for name, candidate in candidates
+        }
+        for name, result in results.items():
+            result["accepted"] = self._within_tolerance(
+                result, results["reference"]
+            )
+            logger.info(
+                "Candidato %s: %s árvores, %s bytes, AUC %.5f, faturamento"
+                " %.2f, latência p50 %.3f ms e p99 %.3f ms",
+                name,
+                result["num_trees"],
+                result["size_bytes"],
+                result["auc"],
+                result["revenue"],
+                result["p50_latency_ms"],
+                result["p99_latency_ms"],
+            )
+
+        chosen = min(
+            (name for name, result in results.items() if result["accepted"]),
+            key=lambda name: (
+                results[name]["num_trees"],
+                results[name]["size_bytes"],
+            ),
+        )
+
+        # O candidato escolhido é gerado novamente a partir do modelo
+        # utilizado, com todas as linhas de treino
+        compacted = reference
+        if chosen != "reference":
+            compacted = dict(
+                self._candidates(reference, X_train, chosen.split("_")[0])
+            )[chosen]
+
+        # O modelo original e o escolhido são avaliados nos dados de teste
+        X_test, y_test = load_test_data(self.config, self.store)
+        test_data = (
+            X_test[features],
+            np.asarray(y_test).ravel(),
+            load_raw_test_data(self.config, self.store)[
+                "valor_compra"
+            ].to_numpy(),
+        )
+        test_results = {
+            name: self._evaluate(candidate, *test_data)
+            for name, candidate in {
+                "reference": reference,
+                chosen: compacted,
+            }.items()
+        }
+        logger.info(
+            "Modelo compactado escolhido: %s, com %s de %s árvores. AUC de"
+            " teste %.5f e faturamento %.2f, contra %.5f e %.2f do original",
+            chosen,
+            results[chosen]["num_trees"],
+            results["reference"]["num_trees"],
+            test_results[chosen]["auc"],
+            test_results[chosen]["revenue"],
+            test_results["reference"]["auc"],
+            test_results["reference"]["revenue"],
+        )
+
+        save_json(
+            path=Path(self.config.root_path) / COMPACTION_REPORT_NAME,
+            data={
+                "chosen": chosen,
+                "auc_tolerance": self.config.auc_tolerance,
+                "revenue_tolerance": self.config.revenue_tolerance,
+                "validation_size": self.config.validation_size,
+                "candidates": results,
+                "test": test_results,
+            },
+        )
+
+        compacted.fingerprint = model.fingerprint
+        model_path = os.path.join(
+            self.config.root_path, self.config.model_name
+        )
+        save_model(self.store, compacted, model_path, self.config.model_path)
+        return compacted
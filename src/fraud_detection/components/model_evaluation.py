@@ -3,35 +3,59 @@ Este módulo realiza a avaliação do modelo de Machine Learning treinado.
 
 Irá coletar as métricas e salvá-las utilizando MLFlow.
 
+As métricas são calculadas a partir das probabilidades de fraude, salvas
+em disco e reutilizadas enquanto o modelo e os dados de teste não mudarem.
+A AUC e a precisão média são obtidas das curvas ROC e precisão-revocação,
+e precisão, revocação, F1 e faturamento do limiar de decisão da predição.
+Os intervalos de confiança das métricas são calculados por bootstrap.
+
+A predição com saída antecipada, configurada no pipeline de predição, é
+comparada à avaliação de todas as árvores nos dados de teste, e o relatório
+registra a concordância das decisões, a fração de saídas antecipadas e a
+média de árvores avaliadas.
+
 Classes:
     ModelEvaluation: Classe para obtenção e registro de métricas.
 
 Dependências:
-    - pandas
-    - sklearn
     - urlib
     - mlflow
-    - joblib
     - pathlib
     - fraud_detection.utils.commons.save_json
+    - fraud_detection.utils.artifacts.save_frame
+    - fraud_detection.components.model_trainer
+    - fraud_detection.components.training_data
+    - fraud_detection.components.score_metrics
+    - fraud_detection.components.early_exit
     - fraud_detection.entity.config_entity.ModelEvaluationConfig
 """
 
 from urllib.parse import urlparse
 from pathlib import Path
-import joblib
-
-import pandas as pd
-from sklearn.metrics import (
-    roc_auc_score,
-    precision_score,
-    recall_score,
-    f1_score,
-)
+
+import numpy as np
 import mlflow
 import mlflow.sklearn
 from fraud_detection.entity.config_entity import ModelEvaluationConfig
 from fraud_detection.utils.commons import save_json
+from fraud_detection.utils.artifacts import save_frame
+from fraud_detection.components.model_trainer import load_serving_model
+from fraud_detection.components.training_data import (
+    load_raw_test_data,
+    load_test_data,
+)
+from fraud_detection.components.score_metrics import (
+    CURVES_NAME,
+    METRIC_INTERVALS_NAME,
+    bootstrap_intervals,
+    cached_scores,
+    ranking_curves,
+    score_metrics,
+)
+from fraud_detection.components.early_exit import (
+    EARLY_EXIT_REPORT_NAME,
+    early_exit_report,
+)
 
 
 class ModelEvaluation:
@@ -39,37 +63,41 @@ class ModelEvaluation:
     Classe responsável por coletar métricas e salvá-las em ambiente
     do MLFlow.
 
-    Irá avaliar os valores de AUC, Precision, Recall e F1 Score para
-    o modelo treinado.
+    Irá avaliar os valores de AUC, Average Precision, Precision, Recall,
+    F1 Score e faturamento para o modelo treinado.
 
     Args:
         ModelEvaluationConfig (dataclass): Classe com valores de configuração.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
     """
 
-    def __init__(self, config: ModelEvaluationConfig):
+    def __init__(self, config: ModelEvaluationConfig, store=None):
         self.config = config
+        self.store = store
 
-    def evaluate_metrics(self, actual, pred):
+    def evaluate_metrics(self, actual, proba, values):
         """
-        Função para retornar métricas do modelo a partir dos dados preditos
-        comparando com os valores reais.
+        Função para retornar métricas do modelo a partir das probabilidades
+        preditas comparando com os valores reais, junto dos intervalos de
+        confiança por bootstrap.
 
         Args:
             actual (Series): Série contendo valores reais das classes de saída.
-            pred (Series): Série contendo os valores preditos das classes.
+            proba (np.ndarray): Probabilidades de fraude preditas.
+            values (np.ndarray): Valores das transações.
 
         Returns:
             tuple:
-                - auc (float): Métrica de Área sob a cuva
-                - precision (float): Métrica de precisão
-                - recall (float): Métrica de revocação
-                - f1 (float): Métrica de F1 Score
+                - scores (dict): Métricas AUC, Average Precision, Precision,
+                  Recall, F1 e faturamento
+                - intervals (dict): Limites inferior e superior de cada
+                  métrica
         """
-        auc = roc_auc_score(actual, pred)
-        precision = precision_score(actual, pred)
-        recall = recall_score(actual, pred)
-        f1 = f1_score(actual, pred)
-        return auc, precision, recall, f1
+        actual = np.asarray(actual).ravel()
+        scores = score_metrics(actual, proba, values)
+        intervals = bootstrap_intervals(actual, proba, values, self.config)
+        return scores, intervals
 
     def start_mlflow(self):
         """
@@ -77,11 +105,11 @@ class ModelEvaluation:
         """
 
         # Lê os dados de teste
-        X_test = pd.read_csv(self.config.test_x_data_path)
-        y_test = pd.read_csv(self.config.test_y_data_path)
+        X_test, y_test = load_test_data(self.config, self.store)
 
-        # Carrega o arquivo do modelo já treinado
-        model = joblib.load(self.config.model_path)
+        # Carrega o arquivo do modelo já treinado, ou do modelo derivado
+        # (features selecionadas ou compactado) salvo após o treino
+        model = load_serving_model(self.config, self.store)
 
         # Configurações respectivas ao login do MLFlow
         # Para este projeto foi utilizado o DagsHub
@@ -89,24 +117,57 @@ class ModelEvaluation:
         tracking_url_type_store = urlparse(mlflow.get_tracking_uri()).scheme
 
         with mlflow.start_run():
-            # Cria valores de predição
-            predicted_values = model.predict(X_test)
-
-            (auc, precision, recall, f1) = self.evaluate_metrics(
-                y_test, predicted_values
+            # Obtém as probabilidades salvas ou cria valores de predição
+            proba = cached_scores(
+                model, X_test, self.config.scores_cache_path
+            )
+            values = load_raw_test_data(self.config, self.store)[
+                "valor_compra"
+            ].to_numpy()
+
+            scores, intervals = self.evaluate_metrics(y_test, proba, values)
+            save_json(
+                path=Path(self.config.model_results_path)
+                / METRIC_INTERVALS_NAME,
+                data=intervals,
+            )
+            save_frame(
+                ranking_curves(np.asarray(y_test).ravel(), proba),
+                Path(self.config.model_results_path) / CURVES_NAME,
             )
 
-            scores = {
-                "auc": auc,
-                "precision": precision,
-                "recall": recall,
-                "f1": f1,
-            }
+            # Compara a saída antecipada com a avaliação de todas as árvores
+            early_exit = early_exit_report(
+                model,
+                X_test,
+                y_test,
+                self.config.early_exit_block_size,
+                self.config.early_exit_margin,
+            )
+            save_json(
+                path=Path(self.config.model_results_path)
+                / EARLY_EXIT_REPORT_NAME,
+                data=early_exit,
+            )
 
             # Salva as métricas em arquivo texto e envia para MLFlow
             save_json(path=Path(self.config.metric_file_name), data=scores)
             mlflow.log_params(self.config.all_params)
             mlflow.log_metrics(scores)
+            mlflow.log_metrics(
+                {
+                    f"{name}_{bound}": value
+                    for name, interval in intervals.items()
+                    for bound, value in interval.items()
+                }
+            )
+            mlflow.log_metrics(
+                {
+                    "early_exit_agreement": early_exit["agreement"],
+                    "early_exit_fraction": early_exit["early_exit_fraction"],
+                    "early_exit_mean_trees": early_exit["mean_trees"],
+                }
+            )
 
             # Verifica se há o servidor alcançavel do MLFlow
             if tracking_url_type_store != "file":
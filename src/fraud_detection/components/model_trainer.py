@@ -2,25 +2,449 @@
 Este módulo realiza o treinamento do modelo LightGBM utilizando os parâmetros
 repassados como configuração ao pipeline.
 
+O treino utiliza um lightgbm.Dataset construído a partir de um array float32
+contíguo, salvo já discretizado e reutilizado em novos treinos
+(fraud_detection.components.training_data).
+
+No modo de features categóricas da transformação dos dados, as colunas
+codificadas em inteiros são repassadas ao Dataset como categorical_feature.
+
+Opcionalmente, uma parte estratificada dos dados de treino é separada para
+validação, interrompendo o treino quando a métrica configurada deixa de
+melhorar (early stopping). Apenas as árvores até a melhor iteração são
+utilizadas na predição, e um relatório registra a economia de tempo de
+treino e de latência da predição.
+
+Opcionalmente, as linhas legítimas são subamostradas, mantendo todas as
+fraudes. A amostragem é corrigida com pesos nas linhas legítimas ou com a
+calibração das probabilidades na predição, deslocando o score do modelo.
+
+Com warm_start, o modelo salvo é utilizado como ponto de partida
+(init_model) e o treino continua por uma quantidade limitada de árvores
+apenas nas linhas novas dos dados de treino, somadas a uma amostra das
+linhas já vistas (replay). O manifesto do modelo registra a linhagem dos
+treinos, e um relatório compara o tempo e a AUC de teste com o treino
+completo.
+
+O modelo utilizado na predição é registrado em ACTIVE_MODEL_NAME, junto do
+modelo treinado, pela última etapa que salvou um modelo (treino, seleção de
+features ou compactação), na ordem das etapas. Os modelos são salvos antes
+do registro, sem persistência em segundo plano, de forma que o modelo
+registrado já esteja completo em disco.
+
 Classes:
     ModelTrainer: Classe para treinamento do modelo.
+    BoosterClassifier: Classificador com interface do scikit-learn para um\
+                       lightgbm.Booster.
+
+Funções:
+    row_latencies: Latências da predição de uma linha por vez.
+    row_latency: Latência mediana da predição de uma linha.
+    active_model_file: Caminho do registro do modelo utilizado na predição.
+    read_active_model: Registro do modelo utilizado na predição.
+    record_active_model: Registra o modelo utilizado na predição.
+    save_model: Salva um modelo e o registra como utilizado na predição.
+    resolve_model_path: Caminho do modelo utilizado na predição.
+    load_model: Obtém o modelo utilizado na predição.
+    load_serving_model: Obtém o modelo utilizado na predição a partir da\
+                        configuração.
+    retrain_model: Treina um novo modelo com os hiperparâmetros do treino.
 
 Dependências:
     - os
+    - json
+    - time
+    - datetime
+    - numpy
     - pandas
     - lightgbm
     - joblib
+    - sklearn
     - fraud_detection.logger
+    - fraud_detection.utils.commons.save_json
     - fraud_detection.entity.config_entity.ModelTrainerConfig
+    - fraud_detection.components.training_data
+    - fraud_detection.utils.artifact_store.load_artifact
+    - fraud_detection.utils.profiling.profile_step
 """
 
+import json
 import os
-import pandas as pd
+import time
+from datetime import datetime
+from pathlib import Path
+
 import joblib
-from lightgbm import LGBMClassifier
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.metrics import roc_auc_score
 
 from fraud_detection import logger
 from fraud_detection.entity.config_entity import ModelTrainerConfig
+from fraud_detection.components.training_data import (
+    DATASET_PARAMS,
+    build_dataset,
+    dataset_fingerprint,
+    load_categorical_features,
+    load_test_data,
+    load_training_data,
+    negative_downsample,
+    validation_split,
+)
+from fraud_detection.utils.artifact_store import load_artifact
+from fraud_detection.utils.commons import save_json
+from fraud_detection.utils.profiling import profile_step
+
+# Métricas de early stopping aceitas e o nome utilizado pelo LightGBM
+EARLY_STOPPING_METRICS = {"auc": "auc", "logloss": "binary_logloss"}
+
+TRAINING_REPORT_NAME = "training_report.json"
+MANIFEST_NAME = "model_manifest.json"
+WARM_START_REPORT_NAME = "warm_start_report.json"
+ACTIVE_MODEL_NAME = "active_model.json"
+
+# Hiperparâmetros do modelo treinado repassados aos novos treinos
+TRAIN_PARAMS = (
+    "subsample",
+    "reg_lambda",
+    "reg_alpha",
+    "num_leaves",
+    "max_depth",
+    "learning_rate",
+    "colsample_bytree",
+    "scale_pos_weight",
+    *DATASET_PARAMS,
+)
+
+
+class BoosterClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Classificador binário com a interface do scikit-learn (predict e
+    predict_proba) para um lightgbm.Booster treinado com lgb.train.
+
+    Os dados de predição são convertidos para float32, o mesmo tipo
+    utilizado na construção do Dataset de treino. DataFrames com colunas
+    além das utilizadas no treino, como nos modelos com features
+    selecionadas, são restritos às features do modelo. Com early stopping, apenas
+    as árvores até a melhor iteração são utilizadas. Com a subamostragem
+    corrigida por calibração, o deslocamento é somado ao score do modelo
+    antes da função sigmoide.
+
+    Args:
+        booster (lightgbm.Booster): Modelo treinado.
+        fingerprint (str): Impressão digital dos dados de treino.
+        best_iteration (int): Quantidade de árvores utilizadas na predição,\
+                              caso vazio todas são utilizadas.
+        score_offset (float): Deslocamento somado ao score do modelo.
+    """
+
+    def __init__(
+        self,
+        booster=None,
+        fingerprint=None,
+        best_iteration=None,
+        score_offset=0.0,
+    ):
+        self.booster = booster
+        self.fingerprint = fingerprint
+        self.best_iteration = best_iteration
+        self.score_offset = score_offset
+        self.classes_ = np.array([0, 1])
+
+    @property
+    def feature_name_(self):
+        """Nomes das features utilizadas no treino."""
+        return self.booster.feature_name()
+
+    @property
+    def n_features_in_(self):
+        """Quantidade de features utilizadas no treino."""
+        return self.booster.num_feature()
+
+    def model_input(self, X):
+        """
+        Converte os dados para o array float32 recebido pelo Booster,
+        restrito às features do modelo.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Dados transformados.
+
+        Returns:
+            np.ndarray: Dados de entrada do Booster.
+        """
+        if (
+            isinstance(X, pd.DataFrame)
+            and X.shape[1] != self.booster.num_feature()
+        ):
+            X = X[self.feature_name_]
+        return np.asarray(X, dtype=np.float32)
+
+    def predict_proba(self, X):
+        """
+        Retorna a probabilidade de cada classe.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Dados transformados.
+
+        Returns:
+            np.ndarray: Probabilidades das classes 0 e 1.
+        """
+        raw_score = self.booster.predict(
+            self.model_input(X),
+            num_iteration=self.best_iteration or 0,
+            raw_score=True,
+        )
+        proba = 1 / (1 + np.exp(-(raw_score + self.score_offset)))
+        return np.column_stack([1 - proba, proba])
+
+    def predict(self, X):
+        """
+        Retorna a classe prevista, com limiar de 0.5.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Dados transformados.
+
+        Returns:
+            np.ndarray: Classes previstas.
+        """
+        return self.classes_[(self.predict_proba(X)[:, 1] > 0.5).astype(int)]
+
+
+def active_model_file(model_path):
+    """
+    Caminho do registro do modelo utilizado na predição, junto do modelo
+    treinado.
+
+    Args:
+        model_path (Path): Caminho do modelo treinado.
+
+    Returns:
+        str: Caminho do registro.
+    """
+    return os.path.join(os.path.dirname(model_path), ACTIVE_MODEL_NAME)
+
+
+def read_active_model(model_path):
+    """
+    Obtém o registro do modelo utilizado na predição.
+
+    Args:
+        model_path (Path): Caminho do modelo treinado.
+
+    Returns:
+        dict: Caminho do modelo utilizado ("model_path") e, caso a cascata\
+              de modelos tenha sido ajustada a ele, "cascade". Vazio caso\
+              nenhum modelo tenha sido registrado.
+    """
+    path = active_model_file(model_path)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="UTF-8") as f:
+        return json.load(f)
+
+
+def record_active_model(active_path, model_path, **fields):
+    """
+    Registra o modelo utilizado na predição. O arquivo é substituído de uma
+    só vez, de forma que leituras concorrentes, como as da API, não
+    encontrem um registro parcial.
+
+    Args:
+        active_path (Path): Caminho do modelo utilizado na predição.
+        model_path (Path): Caminho do modelo treinado.
+        **fields: Informações adicionais do registro.
+    """
+    path = active_model_file(model_path)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="UTF-8") as f:
+        json.dump({"model_path": str(active_path), **fields}, f, indent=4)
+    os.replace(temporary_path, path)
+    logger.info("Modelo utilizado na predição: %s", active_path)
+
+
+def save_model(store, model, active_path, model_path):
+    """
+    Salva um modelo e o registra como o utilizado na predição. Um novo
+    registro descarta o ajuste da cascata de modelos ao modelo anterior.
+
+    Args:
+        store (ArtifactStore): Armazenamento em memória, opcional.
+        model (BoosterClassifier): Modelo a ser salvo.
+        active_path (Path): Caminho do modelo salvo.
+        model_path (Path): Caminho do modelo treinado.
+    """
+    if store is not None:
+        store.put("model", model)
+    joblib.dump(model, active_path)
+    record_active_model(active_path, model_path)
+
+
+def resolve_model_path(model_path, *derived_model_paths):
+    """
+    Caminho do modelo utilizado na predição: o modelo registrado pela
+    última etapa que salvou um modelo, dentre o treinado e os derivados
+    informados, ou o próprio modelo treinado.
+
+    Args:
+        model_path (Path): Caminho do modelo treinado.
+        *derived_model_paths (Path): Caminhos dos modelos derivados.
+
+    Returns:
+        Path: Caminho do modelo utilizado.
+    """
+    active = read_active_model(model_path).get("model_path")
+    if active is None:
+        return model_path
+    for path in derived_model_paths:
+        if os.path.normpath(active) == os.path.normpath(path):
+            return path
+    return model_path
+
+
+def load_model(store, model_path, *derived_model_paths):
+    """
+    Obtém o modelo da memória, repassado pela etapa anterior, ou do disco,
+    escolhido por resolve_model_path.
+
+    Args:
+        store (ArtifactStore): Armazenamento em memória, opcional.
+        model_path (Path): Caminho do modelo treinado.
+        *derived_model_paths (Path): Caminhos dos modelos derivados.
+
+    Returns:
+        BoosterClassifier: Modelo carregado.
+    """
+    return load_artifact(
+        store,
+        "model",
+        lambda: joblib.load(
+            resolve_model_path(model_path, *derived_model_paths)
+        ),
+    )
+
+
+def load_serving_model(config, store=None):
+    """
+    Obtém o modelo utilizado na predição: o treinado ou o derivado (com
+    features selecionadas ou compactado) registrado por último.
+
+    Args:
+        config (ModelEvaluationConfig | ModelCascadeConfig): Configuração\
+            com os caminhos dos modelos treinado e derivados.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        BoosterClassifier: Modelo carregado.
+    """
+    return load_model(
+        store,
+        config.model_path,
+        config.selected_model_path,
+        config.compact_model_path,
+    )
+
+
+def retrain_model(config, X_train, y_train, num_boost_round, store=None):
+    """
+    Treina um novo modelo com as features e linhas informadas, com os
+    hiperparâmetros e a subamostragem das linhas legítimas do modelo
+    treinado. Utilizado nas comparações que não devem incluir as linhas de
+    validação no treino.
+
+    Args:
+        config (FeatureSelectionConfig | ModelCompactionConfig |\
+                ModelCascadeConfig): Configuração com os hiperparâmetros e a\
+                subamostragem do treino.
+        X_train (pd.DataFrame): Features de treino.
+        y_train (pd.DataFrame): Rótulos de treino.
+        num_boost_round (int): Quantidade de árvores.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        BoosterClassifier: Modelo treinado.
+    """
+    params = {
+        "objective": "binary",
+        **{name: config.all_params[name] for name in TRAIN_PARAMS},
+        "random_state": 42,
+        "verbose": -1,
+    }
+    features = [str(col) for col in X_train.columns]
+    categorical_features = [
+        col
+        for col in load_categorical_features(config, store)
+        if col in features
+    ]
+
+    weight, score_offset = None, 0.0
+    if config.negative_sampling_rate:
+        X_train, y_train, weight, score_offset = negative_downsample(
+            X_train,
+            y_train,
+            config.negative_sampling_rate,
+            config.negative_sampling_correction,
+        )
+
+    dataset = lgb.Dataset(
+        X_train.to_numpy(dtype=np.float32),
+        label=np.asarray(y_train, dtype=np.float32).ravel(),
+        weight=weight,
+        feature_name=features,
+        categorical_feature=categorical_features or "auto",
+        params=params,
+    )
+    return BoosterClassifier(
+        lgb.train(params, dataset, num_boost_round=num_boost_round),
+        score_offset=score_offset,
+    )
+
+
+def row_latencies(model, X, rows=200, num_iteration=None):
+    """
+    Mede a latência, em milissegundos, da predição de uma linha por vez,
+    assim como ocorre nas requisições da API.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados de onde as linhas são amostradas.
+        rows (int): Quantidade de linhas medidas.
+        num_iteration (int): Quantidade de árvores utilizadas, caso vazio\
+                             utiliza as do modelo.
+
+    Returns:
+        np.ndarray: Latência de cada linha medida.
+    """
+    model = BoosterClassifier(
+        model.booster,
+        best_iteration=num_iteration or model.best_iteration,
+        score_offset=model.score_offset,
+    )
+    latencies = []
+    for index in range(min(rows, len(X))):
+        row = X.iloc[[index]]
+        start = time.perf_counter()
+        model.predict_proba(row)
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+def row_latency(model, X, rows=200, num_iteration=None):
+    """
+    Mede a latência mediana, em milissegundos, da predição de uma linha.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados de onde as linhas são amostradas.
+        rows (int): Quantidade de linhas medidas.
+        num_iteration (int): Quantidade de árvores utilizadas, caso vazio\
+                             utiliza as do modelo.
+
+    Returns:
+        float: Latência mediana por linha.
+    """
+    return float(np.median(row_latencies(model, X, rows, num_iteration)))
 
 
 class ModelTrainer:
@@ -29,44 +453,516 @@ class ModelTrainer:
 
     Args:
         ModelTrainerConfig (dataclass): Configurações do treinamento.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
     """
 
-    def __init__(self, config: ModelTrainerConfig):
+    def __init__(self, config: ModelTrainerConfig, store=None):
         self.config = config
+        self.store = store
+
+    def train_params(self):
+        """
+        Parâmetros do lgb.train, equivalentes aos utilizados pelo
+        LGBMClassifier, acrescidos dos parâmetros de discretização.
+
+        Returns:
+            dict: Parâmetros do treino.
+        """
+        return {
+            "objective": "binary",
+            "subsample": self.config.subsample,
+            "reg_lambda": self.config.reg_lambda,
+            "reg_alpha": self.config.reg_alpha,
+            "num_leaves": self.config.num_leaves,
+            "max_depth": self.config.max_depth,
+            "learning_rate": self.config.learning_rate,
+            "colsample_bytree": self.config.colsample_bytree,
+            "scale_pos_weight": self.config.scale_pos_weight,
+            "max_bin": self.config.max_bin,
+            "min_data_in_bin": self.config.min_data_in_bin,
+            "bin_construct_sample_cnt": self.config.bin_construct_sample_cnt,
+            "random_state": 42,
+            "verbose": -1,
+        }
+
+    def _dataset_options(self, weight=None):
+        """
+        Método privado com os argumentos do lightgbm.Dataset de treino: os
+        pesos das linhas e as features categóricas, quando existentes.
+
+        Args:
+            weight (np.ndarray): Pesos das linhas, opcional.
+
+        Returns:
+            dict: Argumentos do lightgbm.Dataset.
+        """
+        options = {"weight": weight}
+        categorical_features = load_categorical_features(
+            self.config, self.store
+        )
+        if categorical_features:
+            options["categorical_feature"] = categorical_features
+        return options
+
+    def _downsample(self, X, y):
+        """
+        Método privado para subamostrar as linhas legítimas, caso
+        negative_sampling_rate esteja configurado.
+
+        Args:
+            X (pd.DataFrame): Features de treino.
+            y (pd.DataFrame): Rótulos de treino.
+
+        Returns:
+            tuple: Features, rótulos, pesos e deslocamento do score, como\
+                   em negative_downsample.
+        """
+        rate = self.config.negative_sampling_rate
+        if not rate:
+            return X, y, None, 0.0
+
+        sampled = negative_downsample(
+            X, y, rate, self.config.negative_sampling_correction
+        )
+        logger.info(
+            "Subamostragem das linhas legítimas (%s, correção %s): %s de %s"
+            " linhas mantidas",
+            rate,
+            self.config.negative_sampling_correction,
+            len(sampled[0]),
+            len(X),
+        )
+        return sampled
+
+    def _train_with_early_stopping(
+        self, X_train, y_train, params, comparison=False
+    ):
+        """
+        Método privado para treino com early stopping. Separa uma parte
+        estratificada dos dados de treino para validação e interrompe o
+        treino quando a métrica não melhora por early_stopping_rounds
+        iterações.
+
+        Salva um relatório com a melhor iteração e as economias de tempo de
+        treino e de latência da predição frente ao total de n_estimators.
+
+        Args:
+            X_train (pd.DataFrame): Features de treino.
+            y_train (pd.DataFrame): Rótulos de treino.
+            params (dict): Parâmetros do treino.
+            comparison (bool): Treino apenas para comparação, sem o\
+                               relatório e sem o Dataset binário salvo.
+
+        Raises:
+            ValueError: Caso a métrica de early stopping seja inválida.
+
+        Returns:
+            BoosterClassifier: Modelo treinado com a melhor iteração.
+        """
+        metric = self.config.early_stopping_metric
+        if metric not in EARLY_STOPPING_METRICS:
+            raise ValueError(f"Métrica de early stopping inválida: {metric}")
+        params = {**params, "metric": EARLY_STOPPING_METRICS[metric]}
+
+        X_fit, X_valid, y_fit, y_valid = validation_split(
+            X_train, y_train, self.config.validation_size
+        )
+        # Apenas os dados de treino são amostrados, e a validação utiliza o
+        # score corrigido, com a distribuição original das classes
+        X_fit, y_fit, weight, score_offset = self._downsample(X_fit, y_fit)
+        train_set, fingerprint = build_dataset(
+            X_fit,
+            y_fit,
+            params,
+            None if comparison else self.config.dataset_cache_path,
+            **self._dataset_options(weight),
+        )
+        valid_set = lgb.Dataset(
+            np.ascontiguousarray(X_valid.to_numpy(dtype=np.float32)),
+            label=np.asarray(y_valid, dtype=np.float32).ravel(),
+            init_score=np.full(len(X_valid), score_offset),
+            reference=train_set,
+            categorical_feature=train_set.categorical_feature,
+        )
+
+        history = {}
+        start = time.perf_counter()
+        with profile_step("lightgbm_fit"):
+            booster = lgb.train(
+                params,
+                train_set,
+                num_boost_round=self.config.n_estimators,
+                valid_sets=[valid_set],
+                callbacks=[
+                    lgb.early_stopping(
+                        self.config.early_stopping_rounds, verbose=False
+                    ),
+                    lgb.record_evaluation(history),
+                ],
+            )
+        train_seconds = time.perf_counter() - start
+
+        # O Booster retornado mantém apenas as árvores até a melhor iteração
+        model = BoosterClassifier(
+            booster,
+            fingerprint,
+            best_iteration=booster.best_iteration,
+            score_offset=score_offset,
+        )
+        if not comparison:
+            scores = history["valid_0"][params["metric"]]
+            self._save_training_report(
+                model, X_valid, metric, scores, train_seconds
+            )
+
+        return model
+
+    def _save_training_report(
+        self, model, X_valid, metric, scores, train_seconds
+    ):
+        """
+        Método privado para salvar o relatório do early stopping, com a
+        melhor iteração e as economias frente ao treino das n_estimators
+        árvores.
+
+        O tempo do treino completo é estimado pelo tempo médio por iteração
+        treinada. A latência do modelo completo é extrapolada a partir das
+        latências medidas com metade e com todas as árvores da melhor
+        iteração, separando o custo fixo da predição do custo por árvore.
+
+        Args:
+            model (BoosterClassifier): Modelo treinado.
+            X_valid (pd.DataFrame): Dados de validação.
+            metric (str): Métrica de early stopping.
+            scores (list(float)): Métrica de validação de cada iteração.
+            train_seconds (float): Tempo do treino com early stopping.
+        """
+        best_iteration = model.best_iteration
+        n_estimators = self.config.n_estimators
+
+        latency = row_latency(model, X_valid)
+        half_iteration = max(best_iteration // 2, 1)
+        latency_per_tree = 0.0
+        if half_iteration < best_iteration:
+            latency_per_tree = max(
+                latency
+                - row_latency(model, X_valid, num_iteration=half_iteration),
+                0.0,
+            ) / (best_iteration - half_iteration)
+
+        report = {
+            "metric": metric,
+            "best_score": scores[best_iteration - 1],
+            "n_estimators": n_estimators,
+            "best_iteration": best_iteration,
+            "trained_iterations": len(scores),
+            "train_seconds": train_seconds,
+            "estimated_full_train_seconds": train_seconds
+            * n_estimators
+            / len(scores),
+            "row_latency_ms": latency,
+            "estimated_full_row_latency_ms": latency
+            + latency_per_tree * (n_estimators - best_iteration),
+        }
+        logger.info(
+            "Early stopping na iteração %s de %s, %s de validação: %.5f",
+            best_iteration,
+            n_estimators,
+            metric,
+            report["best_score"],
+        )
+        save_json(
+            path=Path(self.config.model_target_path) / TRAINING_REPORT_NAME,
+            data=report,
+        )
+
+    def _train_from_scratch(self, X_train, y_train, params, comparison=False):
+        """
+        Método privado para treino de um novo modelo com todos os dados de
+        treino, com early stopping e subamostragem caso configurados.
+
+        Args:
+            X_train (pd.DataFrame): Features de treino.
+            y_train (pd.DataFrame): Rótulos de treino.
+            params (dict): Parâmetros do treino.
+            comparison (bool): Treino apenas para comparação, sem o\
+                               relatório do early stopping e sem o Dataset\
+                               binário salvo.
+
+        Returns:
+            BoosterClassifier: Modelo treinado.
+        """
+        if self.config.validation_size:
+            return self._train_with_early_stopping(
+                X_train, y_train, params, comparison
+            )
+
+        X_fit, y_fit, weight, score_offset = self._downsample(X_train, y_train)
+        train_set, fingerprint = build_dataset(
+            X_fit,
+            y_fit,
+            params,
+            None if comparison else self.config.dataset_cache_path,
+            **self._dataset_options(weight),
+        )
+        with profile_step("lightgbm_fit"):
+            booster = lgb.train(
+                params,
+                train_set,
+                num_boost_round=self.config.n_estimators,
+            )
+        return BoosterClassifier(
+            booster, fingerprint, score_offset=score_offset
+        )
+
+    def _load_parent(self, X_train, y_train, params):
+        """
+        Método privado para carregar o modelo salvo, a partir do qual o
+        treino é continuado.
+
+        O modelo é utilizado apenas quando os dados de treino mantêm as
+        mesmas features e as linhas do treino anterior, inalteradas e no
+        início dos dados, acrescidas de linhas novas, como na transformação
+        incremental.
+
+        Args:
+            X_train (pd.DataFrame): Features de treino.
+            y_train (pd.DataFrame): Rótulos de treino.
+            params (dict): Parâmetros do treino.
+
+        Returns:
+            tuple: Modelo (BoosterClassifier) e manifesto (dict) anteriores,\
+                   ou None caso o treino deva ser completo.
+        """
+        model_path = Path(self.config.model_target_path) / (
+            self.config.model_name
+        )
+        manifest_path = Path(self.config.model_target_path) / MANIFEST_NAME
+        if not (model_path.exists() and manifest_path.exists()):
+            logger.info("Modelo anterior inexistente, treino completo")
+            return None
+
+        with open(manifest_path, "r", encoding="UTF-8") as f:
+            manifest = json.load(f)
+        n_rows = manifest["n_rows"]
+
+        if manifest["features"] != [str(col) for col in X_train.columns]:
+            logger.info("Features alteradas, treino completo")
+            return None
+        if n_rows >= len(X_train):
+            logger.info("Sem linhas novas de treino, treino completo")
+            return None
+        if manifest["data_fingerprint"] != dataset_fingerprint(
+            X_train.iloc[:n_rows], y_train.iloc[:n_rows], params
+        ):
+            logger.info("Dados do treino anterior alterados, treino completo")
+            return None
+
+        parent = joblib.load(model_path)
+        # As árvores novas partiriam do score sem o deslocamento da
+        # calibração, aplicado apenas na predição
+        if getattr(parent, "score_offset", 0.0):
+            logger.info("Modelo anterior calibrado, treino completo")
+            return None
+
+        return parent, manifest
+
+    def _continue_training(self, parent, manifest, X_train, y_train, params):
+        """
+        Método privado para continuar o treino do modelo anterior com
+        warm_start_trees árvores, treinadas nas linhas novas e em uma
+        amostra de replay_fraction das linhas já vistas.
+
+        O Dataset não é carregado do binário, pois as predições do modelo
+        anterior, utilizadas como ponto de partida, são calculadas sobre os
+        dados brutos.
+
+        Args:
+            parent (BoosterClassifier): Modelo anterior.
+            manifest (dict): Manifesto do modelo anterior.
+            X_train (pd.DataFrame): Features de treino.
+            y_train (pd.DataFrame): Rótulos de treino.
+            params (dict): Parâmetros do treino.
+
+        Returns:
+            tuple:
+                - BoosterClassifier: Modelo com as árvores acrescentadas.
+                - dict: Linhas, árvores e tempo do treino continuado.
+        """
+        n_rows = manifest["n_rows"]
+        replay_rows = int(n_rows * self.config.replay_fraction)
+        replay = np.random.default_rng(42).choice(
+            n_rows, size=replay_rows, replace=False
+        )
+        positions = np.concatenate(
+            [np.sort(replay), np.arange(n_rows, len(X_train))]
+        )
+        X_fit = X_train.iloc[positions]
+
+        train_set = lgb.Dataset(
+            np.ascontiguousarray(X_fit.to_numpy(dtype=np.float32)),
+            label=np.asarray(y_train, dtype=np.float32).ravel()[positions],
+            feature_name=[str(col) for col in X_fit.columns],
+            params=params,
+            **self._dataset_options(),
+        )
+        start = time.perf_counter()
+        with profile_step("lightgbm_fit"):
+            booster = lgb.train(
+                params,
+                train_set,
+                num_boost_round=self.config.warm_start_trees,
+                init_model=parent.booster,
+            )
+
+        training = {
+            "train_seconds": time.perf_counter() - start,
+            "parent_fingerprint": manifest["data_fingerprint"],
+            "parent_trees": parent.booster.num_trees(),
+            "new_rows": len(X_train) - n_rows,
+            "replay_rows": replay_rows,
+            "extra_trees": self.config.warm_start_trees,
+        }
+        logger.info(
+            "Treino continuado com %s árvores em %s linhas novas e %s de"
+            " replay",
+            training["extra_trees"],
+            training["new_rows"],
+            training["replay_rows"],
+        )
+        return BoosterClassifier(booster), training
+
+    def _test_auc(self, model):
+        """
+        Método privado para calcular a AUC do modelo nos dados de teste.
+
+        Args:
+            model (BoosterClassifier): Modelo treinado.
+
+        Returns:
+            float: AUC de teste.
+        """
+        X_test, y_test = load_test_data(self.config, self.store)
+        return float(
+            roc_auc_score(
+                np.asarray(y_test).ravel(), model.predict_proba(X_test)[:, 1]
+            )
+        )
+
+    def _save_warm_start_report(self, model, training, X_train, y_train):
+        """
+        Método privado para salvar o relatório do treino continuado. Caso
+        warm_start_compare seja verdadeiro, um modelo completo é treinado
+        apenas para comparação do tempo de treino e da AUC de teste, sem
+        substituir o relatório do treino nem salvar o Dataset binário.
+
+        Args:
+            model (BoosterClassifier): Modelo do treino continuado.
+            training (dict): Linhas, árvores e tempo do treino continuado.
+            X_train (pd.DataFrame): Features de treino.
+            y_train (pd.DataFrame): Rótulos de treino.
+        """
+        report = {**training, "warm_start_auc": self._test_auc(model)}
+
+        if self.config.warm_start_compare:
+            start = time.perf_counter()
+            full_model = self._train_from_scratch(
+                X_train, y_train, self.train_params(), comparison=True
+            )
+            report["full_retrain_seconds"] = time.perf_counter() - start
+            report["full_retrain_auc"] = self._test_auc(full_model)
+            report["saved_seconds"] = (
+                report["full_retrain_seconds"] - training["train_seconds"]
+            )
+            report["auc_difference"] = (
+                report["warm_start_auc"] - report["full_retrain_auc"]
+            )
+            logger.info(
+                "Treino continuado em %.2f s (AUC %.5f), treino completo em"
+                " %.2f s (AUC %.5f)",
+                training["train_seconds"],
+                report["warm_start_auc"],
+                report["full_retrain_seconds"],
+                report["full_retrain_auc"],
+            )
+
+        save_json(
+            path=Path(self.config.model_target_path) / WARM_START_REPORT_NAME,
+            data=report,
+        )
+
+    def _save_manifest(self, model, X_train, lineage):
+        """
+        Método privado para salvar o manifesto do modelo, com as features e
+        a linhagem dos treinos que o geraram, do último treino completo ao
+        atual.
+
+        Args:
+            model (BoosterClassifier): Modelo treinado.
+            X_train (pd.DataFrame): Features de treino.
+            lineage (list(dict)): Treinos do modelo, o último contendo o\
+                                  modo e a impressão digital dos dados do\
+                                  treino atual.
+        """
+        entry = {
+            **lineage[-1],
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "n_rows": len(X_train),
+            "num_trees": model.booster.num_trees(),
+            "best_iteration": model.best_iteration,
+        }
+        save_json(
+            path=Path(self.config.model_target_path) / MANIFEST_NAME,
+            data={
+                **entry,
+                "model_name": self.config.model_name,
+                "features": [str(col) for col in X_train.columns],
+                "lineage": [*lineage[:-1], entry],
+            },
+        )
 
     def train(self):
         """
         Método para treinamento do classificado LGBM.
         Treina o modelo com os dados transformados, e os parâmetros
         e salva em arquivo joblib.
-        """
 
-        # Lê os arquivos de treino, espera-se que estes já estejam
-        # transformados e possuindo apenas valores numéricos.
-        X_train = pd.read_csv(self.config.train_x_data_path)
-        y_train = pd.read_csv(self.config.train_y_data_path)
+        Com warm_start, continua o treino do modelo salvo quando os dados
+        de treino possuem apenas linhas novas em relação ao treino anterior.
+        """
+        X_train, y_train = load_training_data(self.config, self.store)
 
-        lgbm = LGBMClassifier(
-            subsample=self.config.subsample,
-            reg_lambda=self.config.reg_lambda,
-            reg_alpha=self.config.reg_alpha,
-            num_leaves=self.config.num_leaves,
-            n_estimators=self.config.n_estimators,
-            max_depth=self.config.max_depth,
-            learning_rate=self.config.learning_rate,
-            colsample_bytree=self.config.colsample_bytree,
-            scale_pos_weight=self.config.scale_pos_weight,
-            random_state=42,
-        )
+        params = self.train_params()
+        parent = None
+        if self.config.warm_start:
+            parent = self._load_parent(X_train, y_train, params)
 
-        # Utilizando ravel para garantir y como array 1D
-        model = lgbm.fit(X_train, y_train.values.ravel())
+        lineage = [
+            {
+                "mode": "full",
+                "data_fingerprint": dataset_fingerprint(
+                    X_train, y_train, params
+                ),
+            }
+        ]
+        if parent is not None:
+            model, training = self._continue_training(
+                *parent, X_train, y_train, params
+            )
+            self._save_warm_start_report(model, training, X_train, y_train)
+            lineage = [
+                *parent[1]["lineage"],
+                {**lineage[0], "mode": "warm_start", **training},
+            ]
+        else:
+            model = self._train_from_scratch(X_train, y_train, params)
         logger.info("Modelo treinado")
         logger.info(model)
 
-        joblib.dump(
-            model,
-            os.path.join(
-                self.config.model_target_path, self.config.model_name
-            ),
+        self._save_manifest(model, X_train, lineage)
+
+        model_path = os.path.join(
+            self.config.model_target_path, self.config.model_name
         )
+        save_model(self.store, model, model_path, model_path)
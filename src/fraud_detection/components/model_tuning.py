@@ -0,0 +1,388 @@
+"""
+Este módulo realiza a otimização de hiperparâmetros do LightGBM com Optuna,
+substituindo a busca realizada no notebook de modelagem.
+
+Os trials são executados de forma concorrente em um pool de processos. Cada
+processo carrega os dados uma única vez: o Dataset de treino já discretizado
+no formato binário do LightGBM e a matriz de validação float32 por memory
+map, compartilhando o cache de páginas do sistema entre os processos. Com
+features categóricas, que o binário não preserva, o Dataset de treino é
+construído em cada processo a partir da matriz de treino em memory map.
+
+Trials pouco promissores são interrompidos (pruning) a partir da AUC de
+validação intermediária. O estudo é persistido em um arquivo de journal do
+Optuna, podendo ser retomado, e os melhores parâmetros são escritos de volta
+no config/params.yaml.
+
+Classes:
+    ModelTuning: Classe para otimização dos hiperparâmetros.
+
+Dependências:
+    - os
+    - multiprocessing
+    - numpy
+    - optuna
+    - lightgbm
+    - concurrent.futures
+    - fraud_detection.logger
+    - fraud_detection.entity.config_entity.ModelTuningConfig
+    - fraud_detection.components.training_data
+    - fraud_detection.utils.commons
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import lightgbm as lgb
+import numpy as np
+import optuna
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.study import MaxTrialsCallback
+from optuna.trial import TrialState
+
+from fraud_detection import logger
+from fraud_detection.entity.config_entity import ModelTuningConfig
+from fraud_detection.components.training_data import (
+    DATASET_PARAMS,
+    build_dataset,
+    dataset_cache_file,
+    load_categorical_features,
+    load_training_data,
+    validation_split,
+)
+from fraud_detection.utils.commons import read_yaml, save_json, save_yaml
+
+# Parâmetros dos trials otimizados e escritos de volta no params.yaml
+TUNED_PARAMS = (
+    "max_depth",
+    "num_leaves",
+    "learning_rate",
+    "n_estimators",
+    "subsample",
+    "colsample_bytree",
+    "reg_lambda",
+)
+
+# Dados carregados uma única vez em cada processo do pool
+_worker_data = {}
+
+
+def _study_storage(storage_path):
+    """Armazenamento do estudo em arquivo de journal do Optuna."""
+    return JournalStorage(JournalFileBackend(str(storage_path)))
+
+
+def _load_train_set(train_source, params):
+    """
+    Carrega o Dataset de treino de um processo do pool.
+
+    Args:
+        train_source (str | tuple): Dataset no formato binário, ou arquivos\
+                                    .npy das features e rótulos de treino e\
+                                    os índices das features categóricas.
+        params (dict): Parâmetros de discretização e fixos do treino.
+
+    Returns:
+        lightgbm.Dataset: Dataset de treino construído.
+    """
+    if isinstance(train_source, str):
+        return lgb.Dataset(train_source, params=params).construct()
+
+    X_path, y_path, categorical_feature = train_source
+    return lgb.Dataset(
+        np.load(X_path, mmap_mode="r"),
+        label=np.load(y_path, mmap_mode="r"),
+        categorical_feature=categorical_feature,
+        params=params,
+    ).construct()
+
+
+def _init_worker(train_source, valid_paths, params):
+    """
+    Inicializa um processo do pool, carregando o Dataset de treino e a
+    matriz de validação em memory map.
+
+    Args:
+        train_source (str | tuple): Origem do Dataset de treino, como em\
+                                    _load_train_set.
+        valid_paths (tuple(str)): Arquivos .npy das features e rótulos de\
+                                  validação.
+        params (dict): Parâmetros de discretização e fixos do treino.
+    """
+    X_valid = np.load(valid_paths[0], mmap_mode="r")
+    y_valid = np.load(valid_paths[1], mmap_mode="r")
+
+    train_set = _load_train_set(train_source, params)
+    valid_set = lgb.Dataset(
+        X_valid,
+        label=y_valid,
+        reference=train_set,
+        categorical_feature=train_set.categorical_feature,
+        params=params,
+    ).construct()
+
+    _worker_data.update(
+        {"train_set": train_set, "valid_set": valid_set, "params": params}
+    )
+
+
+def _suggest_params(trial):
+    """
+    Espaço de busca dos hiperparâmetros, o mesmo utilizado no notebook de
+    modelagem.
+
+    Args:
+        trial (optuna.Trial): Trial em execução.
+
+    Returns:
+        dict: Hiperparâmetros sugeridos.
+    """
+    return {
+        "max_depth": trial.suggest_int("max_depth", 3, 15),
+        "num_leaves": trial.suggest_int("num_leaves", 8, 256),
+        "learning_rate": trial.suggest_float(
+            "learning_rate", 0.01, 0.3, log=True
+        ),
+        "n_estimators": trial.suggest_int("n_estimators", 50, 1000),
+        "subsample": trial.suggest_float("subsample", 0.5, 1.0),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 1.0),
+        "reg_lambda": trial.suggest_float("reg_lambda", 0.1, 10.0, log=True),
+    }
+
+
+def _objective(trial, pruning_interval):
+    """
+    Treina o modelo com os parâmetros do trial e retorna a AUC de
+    validação. A AUC intermediária é informada ao Optuna a cada
+    pruning_interval iterações, interrompendo trials pouco promissores.
+
+    Args:
+        trial (optuna.Trial): Trial em execução.
+        pruning_interval (int): Iterações entre as avaliações do pruning.
+
+    Raises:
+        optuna.TrialPruned: Caso o trial seja interrompido.
+
+    Returns:
+        float: AUC de validação ao final do treino.
+    """
+    params = {**_worker_data["params"], **_suggest_params(trial)}
+    num_boost_round = params.pop("n_estimators")
+
+    def report_callback(env):
+        iteration = env.iteration + 1
+        if iteration % pruning_interval:
+            return
+        trial.report(env.evaluation_result_list[0][2], step=iteration)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+
+    history = {}
+    lgb.train(
+        params,
+        _worker_data["train_set"],
+        num_boost_round=num_boost_round,
+        valid_sets=[_worker_data["valid_set"]],
+        callbacks=[report_callback, lgb.record_evaluation(history)],
+    )
+    return history["valid_0"]["auc"][-1]
+
+
+def _run_worker(config, worker_index):
+    """
+    Executa trials em um processo do pool até que o estudo possua
+    n_trials finalizados, somando todos os processos.
+
+    Args:
+        config (ModelTuningConfig): Configurações da otimização.
+        worker_index (int): Índice do processo, utilizado na semente.
+    """
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=config.study_name,
+        storage=_study_storage(config.storage_path),
+        sampler=optuna.samplers.TPESampler(seed=42 + worker_index),
+        pruner=optuna.pruners.MedianPruner(
+            n_startup_trials=5,
+            n_warmup_steps=config.pruning_interval,
+        ),
+    )
+    study.optimize(
+        lambda trial: _objective(trial, config.pruning_interval),
+        callbacks=[
+            MaxTrialsCallback(
+                config.n_trials,
+                states=(TrialState.COMPLETE, TrialState.PRUNED),
+            )
+        ],
+    )
+
+
+class ModelTuning:
+    """
+    Classe para otimização dos hiperparâmetros do LightGBM.
+
+    Args:
+        ModelTuningConfig (dataclass): Configurações da otimização.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, opcional.
+    """
+
+    def __init__(self, config: ModelTuningConfig, store=None):
+        self.config = config
+        self.store = store
+
+    def _fixed_params(self):
+        """
+        Parâmetros não otimizados, lidos do params.yaml, como o peso da
+        classe positiva e a discretização dos histogramas.
+
+        Returns:
+            dict: Parâmetros fixos dos trials.
+        """
+        current = read_yaml(Path(self.config.params_path)).LGBMClassifier
+        return {
+            "objective": "binary",
+            "metric": "auc",
+            "reg_alpha": current.reg_alpha,
+            "scale_pos_weight": current.scale_pos_weight,
+            **{name: current[name] for name in DATASET_PARAMS},
+            # Divide os núcleos entre os processos do pool
+            "num_threads": max(
+                (os.cpu_count() or 1) // self.config.n_workers, 1
+            ),
+            "random_state": 42,
+            "verbose": -1,
+        }
+
+    def _prepare_data(self, params):
+        """
+        Método privado para separar a validação estratificada e salvar os
+        dados compartilhados pelos processos: o Dataset binário de treino,
+        ou a matriz de treino com features categóricas, e as matrizes de
+        validação em .npy.
+
+        Args:
+            params (dict): Parâmetros de discretização e fixos do treino.
+
+        Returns:
+            tuple:
+                - str | tuple: Origem do Dataset de treino.
+                - tuple(str): Caminhos das features e rótulos de validação.
+        """
+        X_train, y_train = load_training_data(self.config, self.store)
+        X_fit, X_valid, y_fit, y_valid = validation_split(
+            X_train, y_train, self.config.validation_size
+        )
+
+        valid_paths = self._save_arrays("valid", X_valid, y_valid)
+
+        categorical_features = load_categorical_features(
+            self.config, self.store
+        )
+        if categorical_features:
+            train_source = (
+                *self._save_arrays("fit", X_fit, y_fit),
+                [X_fit.columns.get_loc(col) for col in categorical_features],
+            )
+            return train_source, valid_paths
+
+        _, fingerprint = build_dataset(
+            X_fit, y_fit, params, self.config.dataset_cache_path
+        )
+        dataset_path = dataset_cache_file(
+            self.config.dataset_cache_path, fingerprint
+        )
+        return dataset_path, valid_paths
+
+    def _save_arrays(self, name, X, y):
+        """
+        Método privado para salvar features e rótulos em .npy float32,
+        carregados pelos processos em memory map.
+
+        Args:
+            name (str): Sufixo dos arquivos, como "valid".
+            X (pd.DataFrame): Features.
+            y (pd.Series | pd.DataFrame): Rótulos.
+
+        Returns:
+            tuple(str): Caminhos das features e dos rótulos.
+        """
+        paths = (
+            os.path.join(self.config.root_path, f"X_{name}.npy"),
+            os.path.join(self.config.root_path, f"y_{name}.npy"),
+        )
+        np.save(paths[0], X.to_numpy(dtype=np.float32))
+        np.save(paths[1], np.asarray(y, dtype=np.float32).ravel())
+        return paths
+
+    def tune(self):
+        """
+        Executa a otimização em um pool de processos, retomando o estudo
+        salvo quando existente, e escreve os melhores parâmetros no
+        params.yaml.
+
+        Returns:
+            dict: Melhores parâmetros encontrados.
+        """
+        params = self._fixed_params()
+        train_source, valid_paths = self._prepare_data(params)
+
+        study = optuna.create_study(
+            study_name=self.config.study_name,
+            storage=_study_storage(self.config.storage_path),
+            direction="maximize",
+            load_if_exists=True,
+        )
+
+        # Processos iniciados com spawn, evitando herdar o estado do OpenMP
+        # do processo principal após a construção do Dataset
+        with ProcessPoolExecutor(
+            max_workers=self.config.n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(train_source, valid_paths, params),
+        ) as executor:
+            for future in [
+                executor.submit(_run_worker, self.config, worker_index)
+                for worker_index in range(self.config.n_workers)
+            ]:
+                future.result()
+
+        states = [trial.state for trial in study.get_trials(deepcopy=False)]
+        logger.info(
+            "Otimização finalizada: %s trials completos, %s interrompidos."
+            " Melhor AUC de validação: %.5f",
+            states.count(TrialState.COMPLETE),
+            states.count(TrialState.PRUNED),
+            study.best_value,
+        )
+
+        self._write_best_params(study)
+        return study.best_params
+
+    def _write_best_params(self, study):
+        """
+        Método privado para escrever os melhores parâmetros no params.yaml,
+        mantendo os parâmetros não otimizados, e salvar o resumo do estudo.
+
+        Args:
+            study (optuna.Study): Estudo finalizado.
+        """
+        params_file = read_yaml(Path(self.config.params_path)).to_dict()
+        params_file["LGBMClassifier"].update(
+            {name: study.best_params[name] for name in TUNED_PARAMS}
+        )
+        save_yaml(path=Path(self.config.params_path), data=params_file)
+
+        save_json(
+            path=Path(self.config.root_path) / "best_params.json",
+            data={
+                "best_value": study.best_value,
+                "best_trial": study.best_trial.number,
+                "best_params": study.best_params,
+            },
+        )
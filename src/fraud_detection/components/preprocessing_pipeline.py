@@ -0,0 +1,169 @@
+"""
+Módulo com a construção dos pipelines de pré-processamento e de predição.
+
+Funções:
+    build_preprocessing_pipeline: Cria o pipeline de pré-processamento.
+    build_serving_pipeline: Cria o pipeline de predição com a tabela de\
+                            consulta da categoria de produto.
+    prune_pipeline: Remove do pipeline de predição as etapas que não\
+                    calculam features utilizadas pelo modelo.
+    pipeline_lineage: Campos de entrada de origem de cada feature do\
+                      modelo.
+
+Dependências:
+    - sklearn
+    - fraud_detection.components.processors
+    - fraud_detection.components.encoders
+    - fraud_detection.components.imputation
+"""
+
+from sklearn.pipeline import Pipeline
+
+from fraud_detection.components.processors import (
+    CountryProcessor,
+    DateProcessor,
+    DocumentsProcessor,
+    DropColumns,
+    FeatureSelector,
+    TransformColumns,
+)
+from fraud_detection.components.encoders import (
+    CategoryCodeEncoder,
+    NonFrequentAggregator,
+    OneHotEncoderProcessor,
+    TargetEncoderTransformer,
+)
+from fraud_detection.components.imputation import ImputeValuesProcessor
+
+# Modos de features: codificação one-hot e target encoding, ou códigos
+# inteiros utilizados como features categóricas pelo LightGBM
+FEATURE_MODES = ("encoded", "categorical")
+
+
+def build_preprocessing_pipeline(
+    median_strategy="exact",
+    sketch_error=0.01,
+    target_encoder_cv=None,
+    feature_mode="encoded",
+):
+    """
+    Cria o pipeline de pré-processamento, ainda não ajustado, utilizando as
+    processadores dos módulos processors, encoders e imputation.
+
+    No modo "categorical", as colunas categóricas são codificadas pelo
+    CategoryCodeEncoder, no lugar do one-hot e do target encoding.
+
+    Args:
+        median_strategy (str): Estratégia de mediana do imputer numérico.
+        sketch_error (float): Erro aceitável da mediana aproximada.
+        target_encoder_cv (int): Folds do cross-fitting do target encoding.
+        feature_mode (str): Modo das features, "encoded" ou "categorical".
+
+    Raises:
+        ValueError: Caso o modo das features seja inválido.
+
+    Returns:
+        Pipeline: Pipeline de pré-processamento do scikit-learn.
+    """
+    if feature_mode not in FEATURE_MODES:
+        raise ValueError(f"Modo de features inválido: {feature_mode}")
+
+    steps = [
+        ("dropper", DropColumns()),
+        (
+            "imputer",
+            ImputeValuesProcessor(median_strategy, sketch_error),
+        ),
+        ("docs", DocumentsProcessor()),
+        ("country", CountryProcessor()),
+        ("date", DateProcessor()),
+    ]
+    if feature_mode == "categorical":
+        return Pipeline(
+            steps
+            + [
+                ("category_codes", CategoryCodeEncoder()),
+                ("transform", TransformColumns()),
+            ]
+        )
+
+    return Pipeline(
+        steps
+        + [
+            ("encoder", OneHotEncoderProcessor()),
+            ("transform", TransformColumns()),
+            ("column_aggregator", NonFrequentAggregator()),
+            ("target_encoder", TargetEncoderTransformer(target_encoder_cv)),
+        ]
+    )
+
+
+def build_serving_pipeline(pipeline, category_lookup):
+    """
+    Cria o pipeline de predição a partir do pipeline ajustado, substituindo
+    as etapas de agregação e target encoding da categoria de produto pela
+    tabela de consulta equivalente.
+
+    No modo "categorical" o pipeline não possui target encoding e é
+    utilizado sem alterações.
+
+    Args:
+        pipeline (Pipeline): Pipeline de pré-processamento ajustado.
+        category_lookup (CategoryLookupEncoder): Tabela de consulta ajustada,\
+                                                 vazia no modo "categorical".
+
+    Returns:
+        Pipeline: Pipeline de predição.
+    """
+    if category_lookup is None:
+        return pipeline
+
+    replaced_steps = ("column_aggregator", "target_encoder")
+    return Pipeline(
+        [step for step in pipeline.steps if step[0] not in replaced_steps]
+        + [("category_lookup", category_lookup)]
+    )
+
+
+def prune_pipeline(pipeline, features):
+    """
+    Cria o pipeline de predição que calcula apenas as features utilizadas
+    pelo modelo. Cada processador é restringido às features utilizadas, e
+    as etapas sem features utilizadas são removidas, como a conversão de
+    país em continente quando nenhuma feature de continente é utilizada.
+
+    Args:
+        pipeline (Pipeline): Pipeline de predição ajustado.
+        features (list(str)): Features utilizadas pelo modelo.
+
+    Returns:
+        Pipeline: Pipeline de predição podado, finalizado pela seleção das\
+                  features na ordem do treino.
+    """
+    steps = []
+    for name, step in pipeline.steps:
+        pruned = step.prune(features)
+        if pruned is not None:
+            steps.append((name, pruned))
+
+    return Pipeline(
+        steps + [("feature_selector", FeatureSelector(list(features)))]
+    )
+
+
+def pipeline_lineage(pipeline, features):
+    """
+    Obtém os campos de entrada de origem de cada feature do modelo,
+    percorrendo as etapas do pipeline ajustado.
+
+    Args:
+        pipeline (Pipeline): Pipeline de predição ajustado.
+        features (list(str)): Features utilizadas pelo modelo.
+
+    Returns:
+        dict: Campos de entrada (tuple) de origem de cada feature.
+    """
+    lineage = {}
+    for _, step in pipeline.steps:
+        lineage = step.lineage(lineage)
+    return {feature: lineage.get(feature, (feature,)) for feature in features}
@@ -0,0 +1,485 @@
+"""
+Módulo com os processadores de pré-processamento dos dados.
+
+Contém a classe base dos processadores customizados e as etapas sem
+estatísticas ajustadas, ou com ajuste simples, do pipeline de
+pré-processamento criado em
+fraud_detection.components.preprocessing_pipeline.
+
+Classes:
+    CustomProcessor: Classe base customizada para criar processadores de\
+                     transformação.
+    DropColumns: Remove colunas específicas do conjunto de dados.
+    DocumentsProcessor: Processa colunas de documentos, imputando valores\
+                        vazios e convertendo binários em inteiros.
+    CountryProcessor: Transforma a coluna de país para continentes.
+    DateProcessor: Realiza engenharia de features para coluna de data,\
+                   criando variáveis como hora, turno e dia da semana.
+    TransformColumns: Aplica transformações matemáticas (log, raiz cúbica).
+    FeatureSelector: Seleciona as features utilizadas pelo modelo, ao final\
+                     do pipeline de predição podado.
+
+Funções:
+    derive_lineage: Campos de origem das colunas criadas por uma etapa.
+    convert_to_numeric: Converte colunas de objeto para numérico.
+
+Dependências:
+    - copy
+    - pandas
+    - numpy
+    - sklearn
+    - pycountry_convert
+"""
+
+import copy
+
+import pandas as pd
+import numpy as np
+
+from sklearn.base import BaseEstimator, TransformerMixin
+
+import pycountry_convert as pc
+
+
+# Classe que servirá para o pai dos transformadores customizados
+class CustomProcessor(BaseEstimator, TransformerMixin):
+    """
+    Classe para abstrair processadores base da biblioteca
+    scikit-learn, sobrescreve o método fit para um retorno arbitrário.
+
+    Utilizamos para garantir a aplicabilidade da transformação ao processo
+    do fit_transform do pipeline, porém em que as alterações serão ditas
+    apenas pela função transform, ou seja não serão armazenadas informações
+    no fit para evitar data leakege, as etapas que necessitam este
+    armazenamento não utilizarão este placeholder.
+    """
+
+    def __init__(self):
+        pass
+
+    def fit(self, _, _y=None):
+        """
+        Sobrescrita do fit para compatibilidade com classes
+        pais do scikit-learn, as transformações serão aplicadas com a
+        função transform.
+        """
+        return self
+
+    def prune(self, _features):
+        """
+        Retorna o processador necessário para calcular apenas as features
+        utilizadas pelo modelo. Por padrão o processador é mantido.
+
+        Args:
+            _features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            CustomProcessor | None: Processador restrito às features, ou\
+                                    None caso a etapa seja desnecessária.
+        """
+        return self
+
+    def lineage(self, lineage):
+        """
+        Atualiza os campos de entrada de origem de cada coluna após a
+        etapa. Por padrão as colunas são mantidas.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna criada pelas\
+                            etapas anteriores. Colunas ausentes são campos\
+                            de entrada.
+
+        Returns:
+            dict: Campos de origem de cada coluna após a etapa.
+        """
+        return lineage
+
+
+def derive_lineage(lineage, sources, created):
+    """
+    Atribui às colunas criadas os campos de origem das colunas utilizadas,
+    removendo as colunas substituídas.
+
+    Args:
+        lineage (dict): Campos de origem de cada coluna antes da etapa.
+        sources (dict): Coluna substituída de cada coluna criada.
+        created (list(str)): Colunas criadas pela etapa.
+
+    Returns:
+        dict: Campos de origem de cada coluna após a etapa.
+    """
+    lineage = dict(lineage)
+    origins = {
+        column: lineage.get(sources[column], (sources[column],))
+        for column in created
+    }
+    for source in set(sources.values()):
+        lineage.pop(source, None)
+    lineage.update(origins)
+    return lineage
+
+
+class DropColumns(CustomProcessor):
+    """
+    Função do pipeline de transformação para exclusão de colunas.
+    As colunas foram selecionadas a partir da análise estatística dos dados
+    ou não possuem informações práticas para o modelo, ou apresentam
+    distribuições não aderentes como uniforme ou de com alta cardinalidade
+    de categorias.
+
+    Colunas a serem excluídas: "score_fraude_modelo", "produto", "score_8"
+
+    As colunas podem já estar ausentes, quando a leitura dos dados brutos
+    ignora as colunas excluídas.
+    """
+
+    def __init__(self):
+        self.drop_columns = ["score_fraude_modelo", "produto", "score_8"]
+
+    def transform(self, X):
+        """
+        Retorna os dados de entrada sem a presença das colunas declaradas
+        na inicialização da classe.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados originais.
+
+        Returns:
+            pd.DataFrame: Dados sem as colunas desejadas.
+        """
+        return X.drop(self.drop_columns, axis=1, errors="ignore")
+
+    def lineage(self, lineage):
+        """
+        Remove as colunas excluídas dos campos de origem.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem sem as colunas excluídas.
+        """
+        return {
+            column: origin
+            for column, origin in lineage.items()
+            if column not in self.drop_columns
+        }
+
+
+class DocumentsProcessor(CustomProcessor):
+    """
+    Processador direcionado para transformações nas colunas de documentos.
+
+    Colunas transformadas: "entrega_doc_1", "entrega_doc_2", "entrega_doc_3"
+    """
+
+    def __init__(self):
+        self.document_columns = [
+            "entrega_doc_1",
+            "entrega_doc_2",
+            "entrega_doc_3",
+        ]
+
+    def transform(self, X):
+        """
+        Trata as colunas de documento, preenchendo valores ausentes com o
+        valor padrão "N" e posteriormente converte os valores para binário.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados originais.
+
+        Returns:
+            pd.DataFrame: Dados com colunas de documentos processadas.
+        """
+        X_new = X.copy()
+        X_new[self.document_columns] = (
+            X_new[self.document_columns].astype(str).fillna("N")
+        )
+        X_new[self.document_columns] = (
+            (X_new[self.document_columns] == "Y")
+            | (X_new[self.document_columns] == "1")
+        ).astype(int)
+
+        return X_new
+
+    def prune(self, features):
+        """
+        Restringe o processamento às colunas de documento utilizadas.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            DocumentsProcessor | None: Processador restrito às colunas\
+                                       utilizadas, ou None caso nenhuma.
+        """
+        columns = [col for col in self.document_columns if col in features]
+        if not columns:
+            return None
+
+        pruned = copy.copy(self)
+        pruned.document_columns = columns
+        return pruned
+
+
+class CountryProcessor(CustomProcessor):
+    """Processador direcionado para transformação da coluna país."""
+
+    def __init__(self):
+        self.country_column = "pais"
+
+    def transform(self, X):
+        """
+        Realiza o feature engineering na coluna de país da compra.
+        Transformando a coluna em uma nova contendo o continente.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados originais.
+
+        Returns:
+            pd.DataFrame: Dados com nova coluna de continente.
+        """
+
+        X_new = X.copy()
+        # Insere valores ausentes baseado no valor mais frequente
+        X_new[self.country_column] = X_new[self.country_column].fillna(
+            X_new[self.country_column].mode()[0]
+        )
+
+        # Utiliza biblioteca pycountry_convert para transformar os códigos
+        # de países em continentes.
+        X_new["continente"] = X_new[self.country_column].apply(
+            pc.country_alpha2_to_continent_code
+        )
+        # Remove a coluna de país para evitar duplicidade de informação
+        X_new = X_new.drop(self.country_column, axis=1)
+
+        return X_new
+
+    def prune(self, features):
+        """
+        Mantém a conversão de país em continente apenas caso alguma feature
+        de continente seja utilizada.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            CountryProcessor | None: Processador, ou None caso nenhuma\
+                                     feature de continente seja utilizada.
+        """
+        if any(feature.startswith("continente") for feature in features):
+            return self
+        return None
+
+    def lineage(self, lineage):
+        """
+        O continente tem origem no país da compra.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com o continente.
+        """
+        return derive_lineage(
+            lineage, {"continente": self.country_column}, ["continente"]
+        )
+
+
+class DateProcessor(CustomProcessor):
+    """
+    Processador direcionado para transformações da coluna de data da compra.
+    """
+
+    def __init__(self):
+        self.date_column = "data_compra"
+
+    def _hour_to_period(self, hour):
+        """
+        Função para ser mapeada aos dados, criando a coluna turno.
+
+        Args:
+            hour (int): Valor inteiro da hora da compra.
+
+        Returns:
+            int: Inteiro representando o turno da compra.
+        """
+        if 6 <= hour < 12:
+            return 0  # "Manhã"
+        if 12 <= hour < 18:
+            return 1  # "Tarde"
+        if 18 <= hour < 24:
+            return 2  # "Noite"
+
+        return 3  # "Madrugada"
+
+    def transform(self, X):
+        """
+        Realiza o feature engineering para a coluna de data.
+        Cria features de hora da compra, dia da semana da compra e turno.
+
+        Args:
+            X (pd.DataFrame): Conjunto de dados originais.
+
+        Returns:
+            pd.DataFrame: Dados com novas colunas relacionadas a data.
+        """
+        X_new = X.copy()
+
+        date = pd.to_datetime(X_new[self.date_column])
+
+        X_new["hora_compra"] = date.dt.hour
+        X_new["dia_compra"] = date.dt.dayofweek
+        X_new["turno_compra"] = X_new["hora_compra"].apply(
+            self._hour_to_period
+        )
+
+        # Remove coluna de data para evitar informação duplicada
+        # A coluna de data removida também impede que o modelo deprecie
+        # para datas mais recentes sendo inseridas.
+        X_new = X_new.drop(self.date_column, axis=1)
+
+        return X_new
+
+    def prune(self, features):
+        """
+        Mantém o processamento da data apenas caso alguma das features
+        criadas seja utilizada.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            DateProcessor | None: Processador, ou None caso nenhuma feature\
+                                  de data seja utilizada.
+        """
+        created = ("hora_compra", "dia_compra", "turno_compra")
+        if any(feature in features for feature in created):
+            return self
+        return None
+
+    def lineage(self, lineage):
+        """
+        Hora, dia e turno da compra têm origem na data da compra.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com as colunas de data.
+        """
+        created = ["hora_compra", "dia_compra", "turno_compra"]
+        return derive_lineage(
+            lineage, dict.fromkeys(created, self.date_column), created
+        )
+
+
+class TransformColumns(CustomProcessor):
+    """
+    Classe de processador para aplicar transformação log
+    as colunas aplicáveis.
+
+    Colunas: "score_3" e "valor_compra"
+    """
+
+    def __init__(self):
+        self.log_columns = ["score_3", "valor_compra"]
+
+    def transform(self, X):
+        """
+        Aplica transformação log as colunas ditas na inicialização.
+        Insere as transformações em novas colunas e retira as originais.
+
+        Args:
+            X (pd.DataFrame): Dados recebidos a serem transformados.
+
+        Returns:
+            pd.DataFrame: Dados com as novas colunas logarítmicas.
+        """
+        X_new = X.copy()
+        for col in self.log_columns:
+            X_new[f"log_{col}"] = np.log1p(X_new[col].astype(float))
+
+        X_new = X_new.drop(self.log_columns, axis=1)
+
+        return X_new
+
+    def prune(self, features):
+        """
+        Restringe a transformação log às colunas utilizadas.
+
+        Args:
+            features (list(str)): Features utilizadas pelo modelo.
+
+        Returns:
+            TransformColumns | None: Processador restrito às colunas\
+                                     utilizadas, ou None caso nenhuma.
+        """
+        columns = [col for col in self.log_columns if f"log_{col}" in features]
+        if not columns:
+            return None
+
+        pruned = copy.copy(self)
+        pruned.log_columns = columns
+        return pruned
+
+    def lineage(self, lineage):
+        """
+        Cada coluna logarítmica tem origem na coluna original.
+
+        Args:
+            lineage (dict): Campos de origem de cada coluna.
+
+        Returns:
+            dict: Campos de origem com as colunas logarítmicas.
+        """
+        sources = {f"log_{col}": col for col in self.log_columns}
+        return derive_lineage(lineage, sources, list(sources))
+
+
+class FeatureSelector(CustomProcessor):
+    """
+    Seleciona as features utilizadas pelo modelo, na ordem do treino.
+    Última etapa do pipeline de predição criado por prune_pipeline.
+
+    Args:
+        features (list(str)): Features utilizadas pelo modelo.
+    """
+
+    def __init__(self, features=None):
+        self.features = features
+
+    def transform(self, X):
+        """
+        Retorna apenas as features utilizadas pelo modelo.
+
+        Args:
+            X (pd.DataFrame): Dados transformados.
+
+        Returns:
+            pd.DataFrame: Dados com as features do modelo.
+        """
+        return X[self.features]
+
+
+def convert_to_numeric(X):
+    """
+    Função para converter colunas de objeto para numérico.
+    Será utilizado após as transformações, garantindo uma correta tipagem
+    dos dados de entrada do modelo.
+
+    Args:
+        X (pd.DataFrame): Dados a serem convertidos em numérico.
+
+    Returns:
+        pd.DataFrame: Dados após a conversão numérica.
+    """
+    X_new = X.copy()
+    for col in X_new.select_dtypes(include=["object"]).columns:
+        try:
+            X_new[col] = pd.to_numeric(X_new[col], errors="coerce")
+        except ValueError as e:
+            print(e)
+
+    return X_new
@@ -0,0 +1,338 @@
+"""
+Este módulo calcula as métricas de avaliação a partir das probabilidades do
+modelo, e não das classes previstas, e os intervalos de confiança por
+bootstrap.
+
+As probabilidades dos dados de teste são calculadas uma única vez e salvas
+em disco, identificadas pela impressão digital do modelo e dos dados, sendo
+reutilizadas em novas avaliações.
+
+As curvas ROC e precisão-revocação são obtidas com uma única ordenação das
+probabilidades e somas acumuladas dos rótulos, uma posição por
+probabilidade distinta, assim como no scikit-learn. As métricas de limiar
+(precisão, revocação, F1 e faturamento) utilizam o limiar de decisão da
+predição.
+
+Os intervalos de confiança reamostram as transações com reposição. Cada
+reamostragem é representada pela quantidade de vezes que cada transação foi
+sorteada, utilizada como peso nas somas acumuladas, sem nova ordenação. As
+reamostragens são divididas entre processos com joblib, e cada uma possui
+sua própria semente derivada da semente configurada, de forma que os
+intervalos não dependem da quantidade de processos.
+
+Funções:
+    scores_fingerprint: Impressão digital do modelo e dos dados.
+    cached_scores: Probabilidades salvas em disco ou calculadas.
+    curve_counts: Verdadeiros e falsos positivos por limiar.
+    ranking_curves: Curvas ROC e precisão-revocação.
+    score_metrics: Métricas de avaliação das probabilidades.
+    bootstrap_intervals: Intervalos de confiança das métricas.
+
+Dependências:
+    - os
+    - hashlib
+    - numpy
+    - pandas
+    - joblib
+    - fraud_detection.utils.artifacts
+    - fraud_detection.components.early_exit.DECISION_THRESHOLD
+    - fraud_detection.components.model_cascade
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
+
+from fraud_detection.components.early_exit import DECISION_THRESHOLD
+from fraud_detection.components.model_cascade import (
+    APPROVE,
+    transaction_revenue,
+)
+from fraud_detection.utils.artifacts import load_frame, save_frame
+
+METRIC_INTERVALS_NAME = "metric_intervals.json"
+CURVES_NAME = "curves"
+
+# Métricas calculadas a partir das probabilidades
+SCORE_METRICS = (
+    "auc",
+    "average_precision",
+    "precision",
+    "recall",
+    "f1",
+    "revenue",
+)
+
+
+def scores_fingerprint(model, X):
+    """
+    Calcula a impressão digital das probabilidades, combinando as árvores
+    utilizadas, o deslocamento do score e o conteúdo dos dados.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados transformados.
+
+    Returns:
+        str: Hash SHA-256 do modelo e dos dados.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        model.booster.model_to_string(
+            num_iteration=model.best_iteration or None
+        ).encode()
+    )
+    digest.update(repr(model.score_offset).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy())
+    digest.update(repr(list(X.columns)).encode())
+    return digest.hexdigest()
+
+
+def cached_scores(model, X, cache_path):
+    """
+    Obtém as probabilidades de fraude salvas em disco para o modelo e os
+    dados, ou as calcula e salva.
+
+    Args:
+        model (BoosterClassifier): Modelo treinado.
+        X (pd.DataFrame): Dados transformados.
+        cache_path (Path): Diretório das probabilidades salvas.
+
+    Returns:
+        np.ndarray: Probabilidade de fraude de cada linha.
+    """
+    fingerprint = scores_fingerprint(model, X)
+    scores_path = os.path.join(cache_path, f"scores_{fingerprint[:16]}")
+
+    if os.path.exists(f"{scores_path}.feather"):
+        return load_frame(scores_path)["proba"].to_numpy()
+
+    scores = model.predict_proba(X)[:, 1]
+    os.makedirs(cache_path, exist_ok=True)
+    save_frame(pd.DataFrame({"proba": scores}), scores_path)
+    return scores
+
+
+def _sorted_counts(scores, y, weights):
+    """
+    Soma acumulada dos rótulos, com pesos, já em ordem decrescente de
+    probabilidade, na última posição de cada probabilidade distinta.
+
+    Args:
+        scores (np.ndarray): Probabilidades em ordem decrescente.
+        y (np.ndarray): Rótulos na mesma ordem.
+        weights (np.ndarray): Peso de cada linha na mesma ordem.
+
+    Returns:
+        tuple: Limiares, verdadeiros positivos e falsos positivos.
+    """
+    last = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+    tps = np.cumsum(weights * y)[last]
+    fps = np.cumsum(weights * (1 - y))[last]
+    return scores[last], tps, fps
+
+
+def curve_counts(y, scores, weights=None):
+    """
+    Calcula, para cada probabilidade distinta utilizada como limiar, a
+    quantidade de verdadeiros e falsos positivos das transações com
+    probabilidade maior ou igual, com uma única ordenação.
+
+    Args:
+        y (np.ndarray): Rótulos de fraude.
+        scores (np.ndarray): Probabilidades de fraude.
+        weights (np.ndarray): Peso de cada linha, opcional.
+
+    Returns:
+        tuple: Limiares em ordem decrescente, verdadeiros positivos e falsos\
+               positivos.
+    """
+    y = np.asarray(y).ravel()
+    scores = np.asarray(scores).ravel()
+    weights = np.ones(len(y)) if weights is None else np.asarray(weights)
+
+    order = np.argsort(scores, kind="stable")[::-1]
+    return _sorted_counts(scores[order], y[order], weights[order])
+
+
+def _curve_metrics(tps, fps):
+    """
+    AUC e precisão média a partir das contagens por limiar.
+
+    Args:
+        tps (np.ndarray): Verdadeiros positivos por limiar.
+        fps (np.ndarray): Falsos positivos por limiar.
+
+    Returns:
+        tuple: AUC da curva ROC e precisão média.
+    """
+    tpr = np.r_[0.0, tps / tps[-1]]
+    fpr = np.r_[0.0, fps / fps[-1]]
+    auc = np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2
+    precision = np.divide(
+        tps, tps + fps, out=np.ones_like(tps), where=tps + fps > 0
+    )
+    average_precision = np.sum(np.diff(tpr) * precision)
+    return float(auc), float(average_precision)
+
+
+def ranking_curves(y, scores):
+    """
+    Curvas ROC e precisão-revocação, uma linha por probabilidade distinta.
+
+    Args:
+        y (np.ndarray): Rótulos de fraude.
+        scores (np.ndarray): Probabilidades de fraude.
+
+    Returns:
+        pd.DataFrame: Limiar, taxa de falsos positivos, taxa de verdadeiros\
+                      positivos (revocação) e precisão.
+    """
+    thresholds, tps, fps = curve_counts(y, scores)
+    return pd.DataFrame(
+        {
+            "threshold": thresholds,
+            "fpr": fps / fps[-1],
+            "tpr": tps / tps[-1],
+            "precision": tps / (tps + fps),
+        }
+    )
+
+
+def _weighted_metrics(data, weights, threshold):
+    """
+    Métricas de avaliação com pesos por linha, a partir dos dados já em
+    ordem decrescente de probabilidade.
+
+    Args:
+        data (tuple): Probabilidades, rótulos e faturamento das transações\
+                      aprovadas, em ordem decrescente de probabilidade.
+        weights (np.ndarray): Peso de cada linha na mesma ordem.
+        threshold (float): Limiar de decisão.
+
+    Returns:
+        dict: Valor de cada métrica de SCORE_METRICS.
+    """
+    scores, y, revenue = data
+    _, tps, fps = _sorted_counts(scores, y, weights)
+    auc, average_precision = _curve_metrics(tps, fps)
+
+    declined = weights * (scores > threshold)
+    true_positives = np.sum(declined * y)
+    precision = true_positives / max(np.sum(declined), 1e-12)
+    recall = true_positives / tps[-1]
+    return {
+        "auc": auc,
+        "average_precision": average_precision,
+        "precision": float(precision),
+        "recall": float(recall),
+        "f1": float(2 * precision * recall / max(precision + recall, 1e-12)),
+        "revenue": float(np.sum(weights * (scores <= threshold) * revenue)),
+    }
+
+
+def _sorted_data(y, scores, values):
+    """
+    Ordena as probabilidades em ordem decrescente, junto dos rótulos e do
+    faturamento de cada transação caso aprovada.
+
+    Args:
+        y (np.ndarray): Rótulos de fraude.
+        scores (np.ndarray): Probabilidades de fraude.
+        values (np.ndarray): Valores das transações.
+
+    Returns:
+        tuple: Probabilidades, rótulos e faturamento ordenados.
+    """
+    y = np.asarray(y).ravel()
+    scores = np.asarray(scores).ravel()
+    values = np.asarray(values, dtype=float).ravel()
+
+    order = np.argsort(scores, kind="stable")[::-1]
+    revenue = transaction_revenue(np.full(len(y), APPROVE), y, values)
+    return scores[order], y[order], revenue[order]
+
+
+def score_metrics(y, scores, values, threshold=DECISION_THRESHOLD):
+    """
+    Calcula as métricas de avaliação a partir das probabilidades: AUC e
+    precisão média pelas curvas, e precisão, revocação, F1 e faturamento
+    pelo limiar de decisão.
+
+    Args:
+        y (np.ndarray): Rótulos de fraude.
+        scores (np.ndarray): Probabilidades de fraude.
+        values (np.ndarray): Valores das transações.
+        threshold (float): Limiar de decisão.
+
+    Returns:
+        dict: Valor de cada métrica de SCORE_METRICS.
+    """
+    data = _sorted_data(y, scores, values)
+    return _weighted_metrics(data, np.ones(len(data[0])), threshold)
+
+
+def _bootstrap_batch(data, seeds, threshold):
+    """
+    Calcula as métricas de um lote de reamostragens.
+
+    Args:
+        data (tuple): Dados ordenados de _sorted_data.
+        seeds (list(np.random.SeedSequence)): Semente de cada reamostragem.
+        threshold (float): Limiar de decisão.
+
+    Returns:
+        list(list(float)): Métricas de cada reamostragem.
+    """
+    rows = len(data[0])
+    results = []
+    for seed in seeds:
+        sample = np.random.default_rng(seed).integers(0, rows, rows)
+        weights = np.bincount(sample, minlength=rows).astype(float)
+        metrics = _weighted_metrics(data, weights, threshold)
+        results.append([metrics[name] for name in SCORE_METRICS])
+    return results
+
+
+def bootstrap_intervals(y, scores, values, config):
+    """
+    Calcula os intervalos de confiança das métricas por bootstrap,
+    dividindo as reamostragens entre processos.
+
+    Args:
+        y (np.ndarray): Rótulos de fraude.
+        scores (np.ndarray): Probabilidades de fraude.
+        values (np.ndarray): Valores das transações.
+        config (ModelEvaluationConfig): Configuração com a quantidade de\
+            reamostragens, o nível de confiança, a semente e a quantidade de\
+            processos.
+
+    Returns:
+        dict: Limites inferior e superior de cada métrica.
+    """
+    data = _sorted_data(y, scores, values)
+    seeds = np.random.SeedSequence(config.bootstrap_seed).spawn(
+        config.bootstrap_resamples
+    )
+    n_jobs = min(effective_n_jobs(config.bootstrap_n_jobs), len(seeds))
+
+    batches = Parallel(n_jobs=n_jobs)(
+        delayed(_bootstrap_batch)(data, batch, DECISION_THRESHOLD)
+        for batch in np.array_split(np.array(seeds, dtype=object), n_jobs)
+    )
+    # Os processos reutilizáveis do joblib são encerrados, de forma que a
+    # CPU utilizada seja contabilizada no perfilamento da etapa
+    if n_jobs > 1:
+        get_reusable_executor().shutdown(wait=True)
+    results = np.array([row for batch in batches for row in batch])
+
+    alpha = (1 - config.bootstrap_confidence) / 2
+    lower, upper = np.nanquantile(results, [alpha, 1 - alpha], axis=0)
+    return {
+        name: {"lower": float(low), "upper": float(high)}
+        for name, low, high in zip(SCORE_METRICS, lower, upper)
+    }
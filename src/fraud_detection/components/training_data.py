@@ -0,0 +1,370 @@
+"""
+Este módulo reúne a leitura dos dados de treino e de teste utilizados pelas
+etapas de modelagem e a construção do lightgbm.Dataset de treino.
+
+O Dataset já discretizado em histogramas é salvo no formato binário do
+LightGBM, identificado pela impressão digital dos dados transformados e dos
+parâmetros de discretização, sendo reutilizado em novos treinos. Apenas
+os CACHED_DATASETS binários utilizados mais recentemente são mantidos, como
+o da otimização de hiperparâmetros e o do treino, e os demais são removidos
+quando um binário é salvo ou reutilizado.
+
+As linhas legítimas podem ser subamostradas, mantendo todas as fraudes, e
+uma parte estratificada dos dados de treino pode ser separada para
+validação, a mesma em todas as etapas.
+
+Funções:
+    dataset_fingerprint: Impressão digital dos dados de treino.
+    dataset_cache_file: Caminho do Dataset binário de uma impressão digital.
+    build_dataset: Constrói ou carrega o lightgbm.Dataset de treino.
+    negative_downsample: Subamostra as linhas legítimas de treino.
+    load_categorical_features: Obtém as features categóricas.
+    load_training_data: Obtém as features e rótulos de treino.
+    load_test_data: Obtém as features e rótulos de teste.
+    load_raw_test_data: Obtém as features de teste antes da transformação.
+    load_raw_training_data: Obtém as features de treino antes da\
+                            transformação.
+    validation_split: Separa a validação estratificada dos dados de treino.
+
+Dependências:
+    - os
+    - glob
+    - hashlib
+    - json
+    - numpy
+    - pandas
+    - lightgbm
+    - sklearn
+    - fraud_detection.logger
+    - fraud_detection.utils.artifacts.load_frame
+    - fraud_detection.utils.artifact_store.load_artifact
+    - fraud_detection.utils.profiling.profile_step
+"""
+
+import glob
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from fraud_detection import logger
+from fraud_detection.utils.artifacts import load_frame
+from fraud_detection.utils.artifact_store import load_artifact
+from fraud_detection.utils.profiling import profile_step
+
+# Parâmetros que definem a discretização dos dados no Dataset
+DATASET_PARAMS = ("max_bin", "min_data_in_bin", "bin_construct_sample_cnt")
+
+# Quantidade de Datasets binários mantidos, os utilizados mais recentemente
+CACHED_DATASETS = 2
+
+# Correções aceitas para a subamostragem das linhas legítimas
+NEGATIVE_SAMPLING_CORRECTIONS = ("weight", "calibration")
+
+
+def dataset_fingerprint(X, y, params, **dataset_options):
+    """
+    Calcula a impressão digital dos dados de treino, combinando o conteúdo
+    das features e dos rótulos, os nomes das colunas, os parâmetros de
+    discretização, a versão do LightGBM e as opções do Dataset, como os
+    pesos e as features categóricas.
+
+    Args:
+        X (pd.DataFrame): Features de treino.
+        y (pd.Series | pd.DataFrame): Rótulos de treino.
+        params (dict): Parâmetros do treino.
+        **dataset_options: Argumentos do lightgbm.Dataset, opcionais.
+
+    Returns:
+        str: Hash SHA-256 dos dados e parâmetros.
+    """
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy())
+    digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy())
+    for name, value in sorted(dataset_options.items()):
+        if value is not None:
+            digest.update(name.encode())
+            digest.update(np.asarray(value).tobytes())
+    digest.update(repr(list(X.columns)).encode())
+    digest.update(
+        repr(
+            [(name, params.get(name)) for name in DATASET_PARAMS]
+            + [lgb.__version__]
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def dataset_cache_file(cache_path, fingerprint):
+    """
+    Caminho do Dataset binário salvo para uma impressão digital.
+
+    Args:
+        cache_path (Path): Diretório dos Datasets binários.
+        fingerprint (str): Impressão digital dos dados de treino.
+
+    Returns:
+        str: Caminho do arquivo binário.
+    """
+    return os.path.join(cache_path, f"train_{fingerprint[:16]}.bin")
+
+
+def _prune_dataset_cache(cache_path):
+    """
+    Remove os Datasets binários além dos CACHED_DATASETS utilizados mais
+    recentemente.
+
+    Args:
+        cache_path (Path): Diretório dos Datasets binários.
+    """
+    cached = sorted(
+        glob.glob(os.path.join(cache_path, "train_*.bin")),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for path in cached[CACHED_DATASETS:]:
+        os.remove(path)
+        logger.info("Dataset discretizado antigo removido: %s", path)
+
+
+def build_dataset(X, y, params, cache_path, **dataset_options):
+    """
+    Constrói o lightgbm.Dataset de treino, ou carrega a versão binária já
+    discretizada quando os mesmos dados e parâmetros foram utilizados antes.
+
+    O binário do LightGBM não preserva as features categóricas, assim
+    Datasets com categorical_feature não são salvos nem carregados.
+
+    Args:
+        X (pd.DataFrame): Features de treino.
+        y (pd.Series | pd.DataFrame): Rótulos de treino.
+        params (dict): Parâmetros do treino, incluindo a discretização.
+        cache_path (Path): Diretório dos Datasets binários, ou None para não\
+                           salvar nem carregar o binário.
+        **dataset_options: Argumentos do lightgbm.Dataset, como weight e\
+                           categorical_feature.
+
+    Returns:
+        tuple:
+            - lightgbm.Dataset: Dataset de treino.
+            - str: Impressão digital dos dados.
+    """
+    fingerprint = dataset_fingerprint(X, y, params, **dataset_options)
+    cached = cache_path is not None and not dataset_options.get(
+        "categorical_feature"
+    )
+    dataset_path = (
+        dataset_cache_file(cache_path, fingerprint) if cached else None
+    )
+
+    if cached and os.path.exists(dataset_path):
+        logger.info("Dataset discretizado carregado de: %s", dataset_path)
+        # O binário é marcado como utilizado, sendo mantido no diretório
+        os.utime(dataset_path)
+        _prune_dataset_cache(cache_path)
+        return lgb.Dataset(dataset_path, params=params), fingerprint
+
+    with profile_step("lightgbm_dataset"):
+        dataset = lgb.Dataset(
+            np.ascontiguousarray(X.to_numpy(dtype=np.float32)),
+            label=np.asarray(y, dtype=np.float32).ravel(),
+            feature_name=[str(col) for col in X.columns],
+            params=params,
+            **dataset_options,
+        ).construct()
+
+    if not cached:
+        return dataset, fingerprint
+
+    # Escrita em arquivo temporário, evitando um binário incompleto
+    os.makedirs(cache_path, exist_ok=True)
+    temporary_path = f"{dataset_path}.tmp"
+    dataset.save_binary(temporary_path)
+    os.replace(temporary_path, dataset_path)
+    logger.info("Dataset discretizado salvo em: %s", dataset_path)
+    _prune_dataset_cache(cache_path)
+
+    return dataset, fingerprint
+
+
+def negative_downsample(X, y, rate, correction="calibration", random_state=42):
+    """
+    Mantém todas as fraudes e uma fração rate das linhas legítimas.
+
+    Com a correção "weight", as linhas legítimas mantidas recebem peso
+    1 / rate, preservando a função de perda esperada dos dados completos.
+    Com "calibration", o modelo é treinado sem pesos e as probabilidades
+    são corrigidas na predição, multiplicando a razão de chances por rate,
+    o que equivale a somar log(rate) ao score do modelo.
+
+    Args:
+        X (pd.DataFrame): Features de treino.
+        y (pd.Series | pd.DataFrame): Rótulos de treino.
+        rate (float): Fração das linhas legítimas mantidas, em (0, 1].
+        correction (str): Correção da amostragem, "weight" ou\
+                          "calibration".
+        random_state (int): Semente da amostragem.
+
+    Raises:
+        ValueError: Caso a fração ou a correção sejam inválidas.
+
+    Returns:
+        tuple:
+            - pd.DataFrame: Features amostradas.
+            - pd.Series | pd.DataFrame: Rótulos amostrados.
+            - np.ndarray: Pesos das linhas, ou None.
+            - float: Deslocamento do score aplicado na predição.
+    """
+    if not 0 < rate <= 1:
+        raise ValueError(f"Fração de amostragem inválida: {rate}")
+    if correction not in NEGATIVE_SAMPLING_CORRECTIONS:
+        raise ValueError(f"Correção de amostragem inválida: {correction}")
+
+    labels = np.asarray(y).ravel()
+    keep = (labels == 1) | (
+        np.random.default_rng(random_state).random(len(labels)) < rate
+    )
+
+    if correction == "weight":
+        weight = np.where(labels[keep] == 1, 1.0, 1.0 / rate)
+        return X.iloc[keep], y.iloc[keep], weight, 0.0
+    return X.iloc[keep], y.iloc[keep], None, float(np.log(rate))
+
+
+def load_categorical_features(config, store=None):
+    """
+    Obtém as features categóricas salvas na transformação dos dados, da
+    memória ou do disco.
+
+    Args:
+        config (ModelTrainerConfig | ModelTuningConfig): Configuração com o\
+            caminho da lista de features categóricas.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        list(str): Features categóricas, vazia no modo "encoded".
+    """
+
+    def read_categorical_features():
+        path = Path(config.categorical_features_path)
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="UTF-8") as f:
+            return json.load(f)["columns"]
+
+    return load_artifact(
+        store, "categorical_features", read_categorical_features
+    )
+
+
+def load_training_data(config, store=None):
+    """
+    Obtém as features e rótulos de treino transformados, da memória ou do
+    disco.
+
+    Args:
+        config (ModelTrainerConfig | ModelTuningConfig): Configuração com os\
+                                                         caminhos de treino.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        tuple: Features (pd.DataFrame) e rótulos de treino.
+    """
+    # Espera-se que os dados já estejam transformados e possuindo apenas
+    # valores numéricos.
+    X_train = load_artifact(
+        store,
+        "X_train_transformed",
+        lambda: load_frame(config.train_x_data_path),
+    )
+    y_train = load_artifact(
+        store,
+        "y_train",
+        lambda: load_frame(config.train_y_data_path),
+    )
+    return X_train, y_train
+
+
+def load_test_data(config, store=None):
+    """
+    Obtém as features e rótulos de teste transformados, da memória ou do
+    disco.
+
+    Args:
+        config (ModelTrainerConfig | ModelEvaluationConfig): Configuração\
+            com os caminhos de teste.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        tuple: Features (pd.DataFrame) e rótulos de teste.
+    """
+    X_test = load_artifact(
+        store,
+        "X_test_transformed",
+        lambda: load_frame(config.test_x_data_path),
+    )
+    y_test = load_artifact(
+        store,
+        "y_test",
+        lambda: load_frame(config.test_y_data_path),
+    )
+    return X_test, y_test
+
+
+def load_raw_test_data(config, store=None):
+    """
+    Obtém as features de teste antes da transformação, da memória ou do
+    disco, com as colunas originais como o valor da transação.
+
+    Args:
+        config (FeatureSelectionConfig | ModelCompactionConfig):\
+            Configuração com o caminho dos dados de teste brutos.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        pd.DataFrame: Features de teste brutas.
+    """
+    return load_artifact(
+        store, "X_test", lambda: load_frame(config.test_raw_x_data_path)
+    )
+
+
+def load_raw_training_data(config, store=None):
+    """
+    Obtém as features de treino antes da transformação, da memória ou do
+    disco.
+
+    Args:
+        config (ModelCascadeConfig): Configuração com o caminho dos dados\
+                                     de treino brutos.
+        store (ArtifactStore): Armazenamento em memória, opcional.
+
+    Returns:
+        pd.DataFrame: Features de treino brutas.
+    """
+    return load_artifact(
+        store, "X_train", lambda: load_frame(config.train_raw_x_data_path)
+    )
+
+
+def validation_split(X, y, validation_size):
+    """
+    Separa uma parte estratificada dos dados de treino para validação, a
+    mesma no early stopping e na otimização de hiperparâmetros.
+
+    Args:
+        X (pd.DataFrame): Features de treino.
+        y (pd.Series | pd.DataFrame): Rótulos de treino.
+        validation_size (float): Fração dos dados utilizada na validação.
+
+    Returns:
+        tuple: X_fit, X_valid, y_fit, y_valid.
+    """
+    return train_test_split(
+        X, y, test_size=validation_size, stratify=y, random_state=42
+    )
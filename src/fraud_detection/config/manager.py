@@ -17,7 +17,12 @@ from fraud_detection.entity.config_entity import (
     DataTransformationConfig,
     DataValidationConfig,
     ModelTrainerConfig,
+    ModelTuningConfig,
+    FeatureSelectionConfig,
+    ModelCompactionConfig,
+    ModelCascadeConfig,
     ModelEvaluationConfig,
+    PredictionConfig,
 )
 
 
@@ -44,6 +49,7 @@ class ConfigurationManager:
             params_filepath (str): Path para arquivo de parâmetros do modelo.
             schema_filepath (str): Path para arquivo de esquema dos dados.
         """
+        self.params_filepath = params_filepath
         self.config = read_yaml(config_filepath)
         self.params = read_yaml(params_filepath)
         self.schema = read_yaml(schema_filepath)
@@ -84,6 +90,17 @@ class ConfigurationManager:
             transformed_data_path=config.transformed_data_path,
             raw_data_path=config.raw_data_path,
             target_column=config.target_column,
+            chunk_size=config.chunk_size,
+            median_strategy=config.median_strategy,
+            sketch_error=config.sketch_error,
+            artifact_format=config.artifact_format,
+            artifact_compression=config.artifact_compression,
+            export_csv=config.export_csv,
+            schema=self.schema.COLUMNS,
+            downcast_floats=config.downcast_floats,
+            target_encoder_cv=config.target_encoder_cv,
+            incremental=config.incremental,
+            feature_mode=config.feature_mode,
         )
 
     def get_model_trainer_config(self) -> ModelTrainerConfig:
@@ -107,6 +124,17 @@ class ConfigurationManager:
             test_x_data_path=config.test_x_data_path,
             test_y_data_path=config.test_y_data_path,
             model_name=config.model_name,
+            dataset_cache_path=config.dataset_cache_path,
+            categorical_features_path=config.categorical_features_path,
+            validation_size=config.validation_size,
+            early_stopping_rounds=config.early_stopping_rounds,
+            early_stopping_metric=config.early_stopping_metric,
+            warm_start=config.warm_start,
+            warm_start_trees=config.warm_start_trees,
+            replay_fraction=config.replay_fraction,
+            warm_start_compare=config.warm_start_compare,
+            negative_sampling_rate=config.negative_sampling_rate,
+            negative_sampling_correction=config.negative_sampling_correction,
             subsample=params.subsample,
             reg_lambda=params.reg_lambda,
             reg_alpha=params.reg_alpha,
@@ -116,9 +144,169 @@ class ConfigurationManager:
             learning_rate=params.learning_rate,
             colsample_bytree=params.colsample_bytree,
             scale_pos_weight=params.scale_pos_weight,
+            max_bin=params.max_bin,
+            min_data_in_bin=params.min_data_in_bin,
+            bin_construct_sample_cnt=params.bin_construct_sample_cnt,
             target_column=schema.fraude,
         )
 
+    def get_model_tuning_config(self) -> ModelTuningConfig:
+        """
+        Obtém a configuração para a etapa de otimização de hiperparâmetros.
+
+        Returns:
+            ModelTuningConfig: Objeto contendo os caminhos dos dados de\
+             treino e as configurações do estudo do Optuna.
+        """
+        config = self.config.model_tuning
+
+        create_directories([config.root_path])
+
+        return ModelTuningConfig(
+            root_path=config.root_path,
+            train_x_data_path=config.train_x_data_path,
+            train_y_data_path=config.train_y_data_path,
+            dataset_cache_path=self.config.model_trainer.dataset_cache_path,
+            categorical_features_path=(
+                self.config.model_trainer.categorical_features_path
+            ),
+            params_path=self.params_filepath,
+            study_name=config.study_name,
+            storage_path=config.storage_path,
+            n_trials=config.n_trials,
+            n_workers=config.n_workers,
+            validation_size=config.validation_size,
+            pruning_interval=config.pruning_interval,
+        )
+
+    def reload_params(self):
+        """
+        Relê o arquivo de parâmetros do modelo, após a escrita dos
+        hiperparâmetros otimizados.
+        """
+        self.params = read_yaml(self.params_filepath)
+
+    def get_feature_selection_config(self) -> FeatureSelectionConfig:
+        """
+        Obtém a configuração para a etapa de seleção de features.
+
+        Returns:
+            FeatureSelectionConfig: Objeto contendo os caminhos do modelo,\
+             dos dados e do pipeline e as opções da seleção.
+        """
+        config = self.config.feature_selection
+        trainer = self.config.model_trainer
+
+        create_directories([config.root_path])
+
+        return FeatureSelectionConfig(
+            root_path=config.root_path,
+            model_path=os.path.join(
+                trainer.model_target_path, trainer.model_name
+            ),
+            model_name=config.model_name,
+            train_x_data_path=trainer.train_x_data_path,
+            train_y_data_path=trainer.train_y_data_path,
+            test_x_data_path=trainer.test_x_data_path,
+            test_y_data_path=trainer.test_y_data_path,
+            test_raw_x_data_path=config.test_raw_x_data_path,
+            categorical_features_path=trainer.categorical_features_path,
+            pipeline_path=config.pipeline_path,
+            category_lookup_path=config.category_lookup_path,
+            all_params=self.params.LGBMClassifier,
+            importance_type=config.importance_type,
+            feature_counts=list(config.feature_counts),
+            auc_tolerance=config.auc_tolerance,
+            latency_rows=config.latency_rows,
+            negative_sampling_rate=trainer.negative_sampling_rate,
+            negative_sampling_correction=trainer.negative_sampling_correction,
+            # As linhas de validação do early stopping não são utilizadas
+            # no treino do modelo
+            validation_size=trainer.validation_size or config.validation_size,
+        )
+
+    def get_model_compaction_config(self) -> ModelCompactionConfig:
+        """
+        Obtém a configuração para a etapa de compactação do modelo.
+
+        Returns:
+            ModelCompactionConfig: Objeto contendo os caminhos do modelo e\
+             dos dados e as opções dos candidatos compactados.
+        """
+        config = self.config.model_compaction
+        trainer = self.config.model_trainer
+
+        create_directories([config.root_path])
+
+        return ModelCompactionConfig(
+            root_path=config.root_path,
+            model_path=config.model_path,
+            selected_model_path=os.path.join(
+                self.config.feature_selection.root_path,
+                self.config.feature_selection.model_name,
+            ),
+            model_name=config.model_name,
+            train_x_data_path=trainer.train_x_data_path,
+            train_y_data_path=trainer.train_y_data_path,
+            test_x_data_path=trainer.test_x_data_path,
+            test_y_data_path=trainer.test_y_data_path,
+            test_raw_x_data_path=config.test_raw_x_data_path,
+            categorical_features_path=trainer.categorical_features_path,
+            all_params=self.params.LGBMClassifier,
+            prefix_fractions=list(config.prefix_fractions),
+            drop_fractions=list(config.drop_fractions),
+            distill_trees=list(config.distill_trees),
+            distill_learning_rate=config.distill_learning_rate,
+            auc_tolerance=config.auc_tolerance,
+            revenue_tolerance=config.revenue_tolerance,
+            latency_rows=config.latency_rows,
+            train_raw_x_data_path=config.train_raw_x_data_path,
+            # As linhas de validação do early stopping não são utilizadas
+            # no treino do modelo
+            validation_size=trainer.validation_size or config.validation_size,
+            negative_sampling_rate=trainer.negative_sampling_rate,
+            negative_sampling_correction=trainer.negative_sampling_correction,
+        )
+
+    def get_model_cascade_config(self) -> ModelCascadeConfig:
+        """
+        Obtém a configuração para a etapa da cascata de modelos.
+
+        Returns:
+            ModelCascadeConfig: Objeto contendo os caminhos dos modelos e\
+             dos dados e as opções da primeira etapa e da faixa.
+        """
+        config = self.config.model_cascade
+        trainer = self.config.model_trainer
+        evaluation = self.config.model_evaluation
+
+        create_directories([config.root_path])
+
+        return ModelCascadeConfig(
+            root_path=config.root_path,
+            cascade_name=config.cascade_name,
+            model_path=evaluation.model_path,
+            selected_model_path=evaluation.selected_model_path,
+            compact_model_path=evaluation.compact_model_path,
+            train_x_data_path=trainer.train_x_data_path,
+            train_y_data_path=trainer.train_y_data_path,
+            train_raw_x_data_path=config.train_raw_x_data_path,
+            test_x_data_path=trainer.test_x_data_path,
+            test_y_data_path=trainer.test_y_data_path,
+            test_raw_x_data_path=config.test_raw_x_data_path,
+            num_trees=config.num_trees,
+            num_leaves=config.num_leaves,
+            max_revenue_loss=config.max_revenue_loss,
+            latency_rows=config.latency_rows,
+            # As linhas de validação do early stopping não são utilizadas
+            # no treino do modelo
+            validation_size=trainer.validation_size or config.validation_size,
+            categorical_features_path=trainer.categorical_features_path,
+            all_params=self.params.LGBMClassifier,
+            negative_sampling_rate=trainer.negative_sampling_rate,
+            negative_sampling_correction=trainer.negative_sampling_correction,
+        )
+
     def get_model_evaluation_config(self) -> ModelEvaluationConfig:
         """
         Obtém a configuração para a etapa de avaliação do modelo.
@@ -128,6 +316,7 @@ class ConfigurationManager:
              métricas e caminhos de dados de teste e modelo.
         """
         config = self.config.model_evaluation
+        prediction = self.config.prediction
         params = self.params.LGBMClassifier
         schema = self.schema.TARGET_COLUMN
 
@@ -140,8 +329,36 @@ class ConfigurationManager:
             test_x_data_path=config.test_x_data_path,
             test_y_data_path=config.test_y_data_path,
             model_path=config.model_path,
+            selected_model_path=config.selected_model_path,
+            compact_model_path=config.compact_model_path,
             all_params=params,
             metric_file_name=config.metric_file_name,
             target_column=schema.fraude,
             mlflow_uri=os.getenv("MLFLOW_TRACKING_URI"),
+            early_exit_block_size=prediction.early_exit_block_size,
+            early_exit_margin=prediction.early_exit_margin,
+            test_raw_x_data_path=config.test_raw_x_data_path,
+            scores_cache_path=config.scores_cache_path,
+            bootstrap_resamples=config.bootstrap_resamples,
+            bootstrap_confidence=config.bootstrap_confidence,
+            bootstrap_seed=config.bootstrap_seed,
+            bootstrap_n_jobs=config.bootstrap_n_jobs,
+        )
+
+    def get_prediction_config(self) -> PredictionConfig:
+        """
+        Obtém a configuração do pipeline de predição.
+
+        Returns:
+            PredictionConfig: Objeto com configurações da predição.
+        """
+        config = self.config.prediction
+
+        return PredictionConfig(
+            early_exit=config.early_exit,
+            cascade=config.cascade,
+            early_exit_block_size=config.early_exit_block_size,
+            early_exit_margin=config.early_exit_margin,
+            explanation_top_k=config.explanation_top_k,
+            explanation_max_rows=config.explanation_max_rows,
         )
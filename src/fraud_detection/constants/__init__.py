@@ -7,7 +7,11 @@ Armazena valores de:
 - PARAMS_FILE_PATH: Caminho para arquivo de parâmetros do modelo.
 - SCHEMA_FILE_PATH: Caminho para schema dos dados de entrada.
 - PIPELINE_PATH: Caminho para arquivo do pipeline de pré-processamento.
+- CATEGORY_LOOKUP_PATH: Caminho da tabela de consulta da categoria de produto.
 - MODEL_PATH: Caminho para arquivo do modelo treinado.
+- SELECTED_MODEL_PATH: Caminho para arquivo do modelo com features selecionadas.
+- COMPACT_MODEL_PATH: Caminho para arquivo do modelo compactado.
+- CASCADE_PATH: Caminho para arquivo da primeira etapa da cascata de modelos.
 """
 
 from pathlib import Path
@@ -16,5 +20,11 @@ CONFIG_FILE_PATH = Path("config/config.yaml")
 PARAMS_FILE_PATH = Path("config/params.yaml")
 SCHEMA_FILE_PATH = Path("config/schema.yaml")
 
-PIPELINE_PATH = Path("artifacts/data_transformation/pipeline.pkl")
+PIPELINE_PATH = Path("artifacts/data_transformation/pipeline.joblib")
+CATEGORY_LOOKUP_PATH = Path(
+    "artifacts/data_transformation/category_lookup.json"
+)
 MODEL_PATH = Path("artifacts/model_output/model.joblib")
+SELECTED_MODEL_PATH = Path("artifacts/feature_selection/model.joblib")
+COMPACT_MODEL_PATH = Path("artifacts/model_compaction/model.joblib")
+CASCADE_PATH = Path("artifacts/model_cascade/cascade.joblib")
@@ -38,11 +38,46 @@ class DataTransformationConfig:
         transformed_data_path (Path): Diretório que os dados transformados\
                                       serão salvos.
         target_column (str): Coluna alvo para ser usada na transformação.
+        chunk_size (int): Quantidade de linhas por bloco na leitura dos dados\
+                          brutos, caso vazio os dados são lidos inteiramente.
+        median_strategy (str): Mediana "exact" ou aproximada por "sketch"\
+                               no imputer das colunas contínuas.
+        sketch_error (float): Erro de rank aceitável da mediana aproximada.
+        artifact_format (str): Formato dos dados salvos: "feather",\
+                               "parquet" ou "csv".
+        artifact_compression (str): Compressão dos dados salvos.
+        export_csv (bool): Também exporta os dados salvos em CSV.
+        schema (dict): Colunas e tipos dos dados brutos, utilizados na\
+                       leitura.
+        downcast_floats (bool): Lê as colunas float64 dos dados brutos\
+                                como float32.
+        target_encoder_cv (int): Folds do cross-fitting do target encoding\
+                                 nos dados de treino, caso vazio não é\
+                                 realizado. Não suportado na leitura em\
+                                 blocos (chunk_size).
+        incremental (bool): Transforma apenas as linhas adicionadas aos\
+                            dados brutos desde a última execução, com o\
+                            pipeline já ajustado.
+        feature_mode (str): Codificação "encoded" (one-hot e target\
+                            encoding) ou códigos inteiros "categorical",\
+                            utilizados como features categóricas pelo\
+                            LightGBM.
     """
 
     raw_data_path: Path
     transformed_data_path: Path
     target_column: str
+    chunk_size: int
+    median_strategy: str
+    sketch_error: float
+    artifact_format: str
+    artifact_compression: str
+    export_csv: bool
+    schema: dict
+    downcast_floats: bool
+    target_encoder_cv: int
+    incremental: bool
+    feature_mode: str
 
 
 @dataclass(frozen=True)
@@ -53,11 +88,35 @@ class ModelTrainerConfig:
 
     Args:
         model_target_path (Path): Caminho para salvar o modelo treinado.
-        train_x_data_path (Path): Caminho para os dados de treino (features).
+        train_x_data_path (Path): Caminho para os dados de treino (features),\
+                                  a extensão do formato é opcional.
         test_x_data_path (Path): Caminho para os dados de teste (features).
         train_y_data_path (Path): Caminho para os rótulos de treino.
         test_y_data_path (Path): Caminho para os rótulos de teste.
         model_name (str): Nome do modelo.
+        dataset_cache_path (Path): Diretório dos lightgbm.Dataset binários\
+                                   já discretizados.
+        categorical_features_path (Path): Lista de features categóricas\
+                                          salva na transformação dos dados.
+        validation_size (float): Fração estratificada dos dados de treino\
+                                 separada para early stopping, caso vazio\
+                                 todas as árvores são treinadas.
+        early_stopping_rounds (int): Iterações sem melhora na validação até\
+                                     a interrupção do treino.
+        early_stopping_metric (str): Métrica de validação, "auc" ou\
+                                     "logloss".
+        warm_start (bool): Continua o treino do modelo salvo quando há\
+                           apenas linhas novas nos dados de treino.
+        warm_start_trees (int): Árvores acrescentadas no treino continuado.
+        replay_fraction (float): Fração das linhas já vistas amostrada junto\
+                                 às linhas novas no treino continuado.
+        warm_start_compare (bool): Treina também um modelo completo para\
+                                   comparar tempo e AUC com o continuado.
+        negative_sampling_rate (float): Fração das linhas legítimas mantidas\
+                                        no treino, caso vazio todas são\
+                                        utilizadas.
+        negative_sampling_correction (str): Correção da amostragem,\
+                                            "weight" ou "calibration".
 
         Hiperparâmetros do LightGBM (consulte a documentação do scikit-learn):
         https://lightgbm.readthedocs.io/en/latest/pythonapi/lightgbm.LGBMClassifier.html
@@ -72,6 +131,10 @@ class ModelTrainerConfig:
         colsample_bytree (float): Fração de colunas usadas por árvore.
         scale_pos_weight (float): Proporção para lidar com desbalanceamento\
                                   de classe
+        max_bin (int): Quantidade máxima de intervalos dos histogramas.
+        min_data_in_bin (int): Quantidade mínima de amostras por intervalo.
+        bin_construct_sample_cnt (int): Amostras utilizadas para definir os\
+                                        intervalos.
         target_column (str): Nome da coluna alvo para predição.
     """
 
@@ -81,6 +144,17 @@ class ModelTrainerConfig:
     train_y_data_path: Path
     test_y_data_path: Path
     model_name: str
+    dataset_cache_path: Path
+    categorical_features_path: Path
+    validation_size: float
+    early_stopping_rounds: int
+    early_stopping_metric: str
+    warm_start: bool
+    warm_start_trees: int
+    replay_fraction: float
+    warm_start_compare: bool
+    negative_sampling_rate: float
+    negative_sampling_correction: str
     subsample: float
     reg_lambda: float
     reg_alpha: float
@@ -90,9 +164,245 @@ class ModelTrainerConfig:
     learning_rate: float
     colsample_bytree: float
     scale_pos_weight: float
+    max_bin: int
+    min_data_in_bin: int
+    bin_construct_sample_cnt: int
     target_column: str
 
 
+@dataclass(frozen=True)
+class ModelTuningConfig:
+    """
+    Armazena o modelo de configuração para a otimização de hiperparâmetros.
+
+    Args:
+        root_path (Path): Diretório dos resultados e dados compartilhados\
+                          pelos processos da otimização.
+        train_x_data_path (Path): Caminho para os dados de treino (features).
+        train_y_data_path (Path): Caminho para os rótulos de treino.
+        dataset_cache_path (Path): Diretório dos lightgbm.Dataset binários\
+                                   já discretizados.
+        categorical_features_path (Path): Lista de features categóricas\
+                                          salva na transformação dos dados.
+        params_path (Path): Arquivo de parâmetros onde os melhores\
+                            hiperparâmetros são escritos.
+        study_name (str): Nome do estudo do Optuna.
+        storage_path (Path): Arquivo de journal onde o estudo é salvo.
+        n_trials (int): Quantidade total de trials do estudo, incluindo os\
+                        de execuções anteriores.
+        n_workers (int): Quantidade de processos executando trials.
+        validation_size (float): Fração estratificada dos dados de treino\
+                                 utilizada na validação.
+        pruning_interval (int): Iterações entre as avaliações de pruning.
+    """
+
+    root_path: Path
+    train_x_data_path: Path
+    train_y_data_path: Path
+    dataset_cache_path: Path
+    categorical_features_path: Path
+    params_path: Path
+    study_name: str
+    storage_path: Path
+    n_trials: int
+    n_workers: int
+    validation_size: float
+    pruning_interval: int
+
+
+@dataclass(frozen=True)
+class FeatureSelectionConfig:
+    """
+    Armazena o modelo de configuração para a seleção de features.
+
+    Args:
+        root_path (Path): Diretório do modelo com as features selecionadas\
+                          e do relatório.
+        model_path (Path): Caminho para o modelo treinado.
+        model_name (str): Nome do arquivo do modelo com as features\
+                          selecionadas.
+        train_x_data_path (Path): Caminho para os dados de treino (features).
+        train_y_data_path (Path): Caminho para os rótulos de treino.
+        test_x_data_path (Path): Caminho para os dados de teste (features).
+        test_y_data_path (Path): Caminho para os rótulos de teste.
+        test_raw_x_data_path (Path): Caminho para os dados de teste antes\
+                                     da transformação.
+        categorical_features_path (Path): Lista de features categóricas\
+                                          salva na transformação dos dados.
+        pipeline_path (Path): Caminho do pipeline de pré-processamento\
+                              ajustado.
+        category_lookup_path (Path): Caminho da tabela de consulta da\
+                                     categoria de produto.
+        all_params (dict): Hiperparâmetros do modelo treinado.
+        importance_type (str): Ordenação das features, "gain" ou "shap".
+        feature_counts (list(int)): Quantidades de features mantidas nos\
+                                    modelos treinados novamente.
+        auc_tolerance (float): Queda máxima de AUC aceita.
+        latency_rows (int): Linhas medidas nas latências de predição.
+        negative_sampling_rate (float): Fração das linhas legítimas mantidas\
+                                        no treino, como no modelo treinado.
+        negative_sampling_correction (str): Correção da subamostragem,\
+                                            "weight" ou "calibration".
+        validation_size (float): Fração estratificada dos dados de treino\
+                                 utilizada na escolha das features. A do\
+                                 early stopping do treino, quando\
+                                 configurada.
+    """
+
+    root_path: Path
+    model_path: Path
+    model_name: str
+    train_x_data_path: Path
+    train_y_data_path: Path
+    test_x_data_path: Path
+    test_y_data_path: Path
+    test_raw_x_data_path: Path
+    categorical_features_path: Path
+    pipeline_path: Path
+    category_lookup_path: Path
+    all_params: dict
+    importance_type: str
+    feature_counts: list
+    auc_tolerance: float
+    latency_rows: int
+    negative_sampling_rate: float
+    negative_sampling_correction: str
+    validation_size: float
+
+
+@dataclass(frozen=True)
+class ModelCompactionConfig:
+    """
+    Armazena o modelo de configuração para a compactação do modelo.
+
+    Args:
+        root_path (Path): Diretório do modelo compactado e do relatório.
+        model_path (Path): Caminho para o modelo treinado.
+        selected_model_path (Path): Caminho para o modelo com features\
+                                    selecionadas, compactado quando salvo\
+                                    após o treino.
+        model_name (str): Nome do arquivo do modelo compactado.
+        train_x_data_path (Path): Caminho para os dados de treino (features).
+        train_y_data_path (Path): Caminho para os rótulos de treino.
+        test_x_data_path (Path): Caminho para os dados de teste (features).
+        test_y_data_path (Path): Caminho para os rótulos de teste.
+        test_raw_x_data_path (Path): Caminho para os dados de teste antes\
+                                     da transformação, com o valor das\
+                                     transações.
+        categorical_features_path (Path): Lista de features categóricas\
+                                          salva na transformação dos dados.
+        all_params (dict): Hiperparâmetros do modelo treinado.
+        prefix_fractions (list(float)): Frações das árvores mantidas nos\
+                                        candidatos truncados.
+        drop_fractions (list(float)): Frações das árvores de menor\
+                                      contribuição removidas.
+        distill_trees (list(int)): Quantidades de árvores dos candidatos\
+                                   destilados.
+        distill_learning_rate (float): Taxa de aprendizado da destilação.
+        auc_tolerance (float): Queda máxima de AUC aceita.
+        revenue_tolerance (float): Queda relativa máxima de faturamento\
+                                   aceita.
+        latency_rows (int): Linhas medidas nas latências de predição.
+        train_raw_x_data_path (Path): Caminho para os dados de treino antes\
+                                      da transformação, com o valor das\
+                                      transações da validação.
+        validation_size (float): Fração estratificada dos dados de treino\
+                                 utilizada na escolha do candidato.
+                                 A do early stopping do treino, quando\
+                                 configurada.
+        negative_sampling_rate (float): Fração das linhas legítimas mantidas\
+                                        no treino da referência da escolha.
+        negative_sampling_correction (str): Correção da subamostragem,\
+                                            "weight" ou "calibration".
+    """
+
+    root_path: Path
+    model_path: Path
+    selected_model_path: Path
+    model_name: str
+    train_x_data_path: Path
+    train_y_data_path: Path
+    test_x_data_path: Path
+    test_y_data_path: Path
+    test_raw_x_data_path: Path
+    categorical_features_path: Path
+    all_params: dict
+    prefix_fractions: list
+    drop_fractions: list
+    distill_trees: list
+    distill_learning_rate: float
+    auc_tolerance: float
+    revenue_tolerance: float
+    latency_rows: int
+    train_raw_x_data_path: Path
+    validation_size: float
+    negative_sampling_rate: float
+    negative_sampling_correction: str
+
+
+@dataclass(frozen=True)
+class ModelCascadeConfig:
+    """
+    Armazena o modelo de configuração para a cascata de modelos.
+
+    Args:
+        root_path (Path): Diretório da cascata e do relatório.
+        cascade_name (str): Nome do arquivo da cascata.
+        model_path (Path): Caminho para o modelo treinado.
+        selected_model_path (Path): Caminho para o modelo com features\
+                                    selecionadas.
+        compact_model_path (Path): Caminho para o modelo compactado. A faixa\
+                                   é ajustada para o modelo utilizado na\
+                                   predição.
+        train_x_data_path (Path): Caminho para os dados de treino (features).
+        train_y_data_path (Path): Caminho para os rótulos de treino.
+        train_raw_x_data_path (Path): Caminho para os dados de treino antes\
+                                      da transformação.
+        test_x_data_path (Path): Caminho para os dados de teste (features).
+        test_y_data_path (Path): Caminho para os rótulos de teste.
+        test_raw_x_data_path (Path): Caminho para os dados de teste antes\
+                                     da transformação.
+        num_trees (int): Quantidade de árvores da primeira etapa.
+        num_leaves (int): Quantidade de folhas das árvores da primeira etapa.
+        max_revenue_loss (float): Perda máxima de faturamento, em fração do\
+                                  faturamento do modelo completo.
+        latency_rows (int): Linhas medidas na latência da primeira etapa.
+        validation_size (float): Fração estratificada dos dados de treino\
+                                 utilizada no ajuste da faixa.
+                                 A do early stopping do treino, quando\
+                                 configurada.
+        categorical_features_path (Path): Lista de features categóricas\
+                                          salva na transformação dos dados.
+        all_params (dict): Hiperparâmetros do modelo treinado.
+        negative_sampling_rate (float): Fração das linhas legítimas mantidas\
+                                        no treino do modelo completo da\
+                                        validação.
+        negative_sampling_correction (str): Correção da subamostragem,\
+                                            "weight" ou "calibration".
+    """
+
+    root_path: Path
+    cascade_name: str
+    model_path: Path
+    selected_model_path: Path
+    compact_model_path: Path
+    train_x_data_path: Path
+    train_y_data_path: Path
+    train_raw_x_data_path: Path
+    test_x_data_path: Path
+    test_y_data_path: Path
+    test_raw_x_data_path: Path
+    num_trees: int
+    num_leaves: int
+    max_revenue_loss: float
+    latency_rows: int
+    validation_size: float
+    categorical_features_path: Path
+    all_params: dict
+    negative_sampling_rate: float
+    negative_sampling_correction: str
+
+
 @dataclass(frozen=True)
 class ModelEvaluationConfig:
     """
@@ -104,19 +414,71 @@ class ModelEvaluationConfig:
         test_x_data_path (Path): Caminho para os dados de teste (features).
         test_y_data_path (Path): Caminho para os rótulos de teste.
         model_path (Path): Caminho para o modelo treinado a ser avaliado.
+        selected_model_path (Path): Caminho para o modelo com features\
+                                    selecionadas.
+        compact_model_path (Path): Caminho para o modelo compactado. Os\
+                                   modelos derivados são avaliados quando\
+                                   salvos após o treino.
         all_params (dict): Dicionário contendo os hiperparâmetros usados no \
                            modelo.
         metric_file_name (Path): Nome do arquivo onde as métricas de \
                                  avaliação serão salvas.
         target_column (str): Nome da coluna alvo para predição.
         mlflow_uri (str): URI do MLflow para rastreamento dos experimentos.
+        early_exit_block_size (int): Árvores somadas por bloco na predição\
+                                     com saída antecipada.
+        early_exit_margin (float): Distância do limiar, em escala logit, da\
+                                   saída antecipada.
+        test_raw_x_data_path (Path): Caminho para os dados de teste antes da\
+                                     transformação, com o valor da transação.
+        scores_cache_path (Path): Diretório das probabilidades de teste\
+                                  salvas para reutilização.
+        bootstrap_resamples (int): Quantidade de reamostragens do bootstrap.
+        bootstrap_confidence (float): Nível de confiança dos intervalos.
+        bootstrap_seed (int): Semente das reamostragens.
+        bootstrap_n_jobs (int): Quantidade de processos do bootstrap, -1\
+                                para todos os núcleos.
     """
 
     model_results_path: Path
     test_x_data_path: Path
     test_y_data_path: Path
     model_path: Path
+    selected_model_path: Path
+    compact_model_path: Path
     all_params: dict
     metric_file_name: Path
     target_column: str
     mlflow_uri: str
+    early_exit_block_size: int
+    early_exit_margin: float
+    test_raw_x_data_path: Path
+    scores_cache_path: Path
+    bootstrap_resamples: int
+    bootstrap_confidence: float
+    bootstrap_seed: int
+    bootstrap_n_jobs: int
+
+
+@dataclass(frozen=True)
+class PredictionConfig:
+    """
+    Armazena o padrão de configurações do pipeline de predição.
+
+    Args:
+        early_exit (bool): Indica se a predição utiliza saída antecipada.
+        cascade (bool): Indica se a predição utiliza a cascata de modelos.
+        early_exit_block_size (int): Árvores somadas por bloco.
+        early_exit_margin (float): Distância do limiar, em escala logit, a\
+                                   partir da qual a soma é interrompida.
+        explanation_top_k (int): Quantidade de motivos por transação.
+        explanation_max_rows (int): Quantidade máxima de transações\
+                                    explicadas por lote.
+    """
+
+    early_exit: bool
+    cascade: bool
+    early_exit_block_size: int
+    early_exit_margin: float
+    explanation_top_k: int
+    explanation_max_rows: int
@@ -5,24 +5,159 @@ Pensado inicialmente para processamento de apenas um dados recebido.
 
 A partir do dado recebido carrega o modelo, aplica o pré-processamento
 adequado aos dados de entrada e devolve a probabilidade da classe.
+
+A categoria de produto é codificada pela tabela de consulta exportada na
+transformação dos dados, com custo constante por linha. No modo de features
+categóricas, o pipeline ajustado é utilizado diretamente.
+
+O modelo utilizado é o registrado pela última etapa de treino que salvou um
+modelo: o treinado, o com features selecionadas ou o compactado. O pipeline
+é podado para as features do modelo utilizado, sem calcular as features que
+o modelo não utiliza.
+
+Com early_exit na configuração da predição, as árvores do modelo são
+somadas em blocos e a soma é interrompida nas transações classificadas com
+confiança (EarlyExitClassifier). A fração de predições com saída antecipada
+e a média de árvores avaliadas são acumuladas no pipeline.
+
+Com cascade na configuração da predição, a primeira etapa da cascata de
+modelos decide as transações claramente legítimas ou fraudulentas a partir
+dos dados brutos, e apenas a faixa ambígua é submetida ao pré-processamento
+e ao modelo completo. A fração das predições realizadas por cada etapa é
+acumulada no pipeline.
+
+Os motivos das transações declinadas são obtidos em lote pelas
+contribuições calculadas pelo LightGBM (pred_contrib), somadas por campo de
+entrada pela linhagem das features no pipeline. As transações são decididas
+pelo mesmo caminho da predição, incluindo a cascata, e apenas as
+explanation_max_rows transações declinadas de maior probabilidade de cada
+lote são explicadas, limitando o custo da explicação.
+
+As estatísticas acumuladas são protegidas por locks, já que o pipeline é
+compartilhado entre as requisições concorrentes da API. A versão do modelo
+carregado (model_version) permite à API recarregar o pipeline quando um
+modelo ou a cascata são registrados novamente.
 """
 
+import json
+import os
+import threading
+
 import joblib
+import numpy as np
 from sklearn.exceptions import NotFittedError
-from fraud_detection.constants import MODEL_PATH, PIPELINE_PATH
+from fraud_detection.components.encoders import CategoryLookupEncoder
+from fraud_detection.components.processors import convert_to_numeric
+from fraud_detection.components.preprocessing_pipeline import (
+    build_serving_pipeline,
+    pipeline_lineage,
+    prune_pipeline,
+)
+from fraud_detection.components.explanation import (
+    field_contributions,
+    top_reasons,
+)
+from fraud_detection.components.model_cascade import (
+    APPROVE,
+    DECLINE,
+    FORWARD,
+)
+from fraud_detection.components.early_exit import (
+    DECISION_THRESHOLD,
+    EarlyExitClassifier,
+)
+from fraud_detection.components.model_trainer import (
+    active_model_file,
+    read_active_model,
+    resolve_model_path,
+)
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.constants import (
+    CASCADE_PATH,
+    CATEGORY_LOOKUP_PATH,
+    COMPACT_MODEL_PATH,
+    MODEL_PATH,
+    PIPELINE_PATH,
+    SELECTED_MODEL_PATH,
+)
 from fraud_detection import logger
 
 
+def model_version():
+    """
+    Versão dos modelos utilizados na predição: a data de modificação do
+    registro do modelo utilizado, substituído após cada modelo ou cascata
+    salvos, ou do modelo treinado, caso não haja registro.
+
+    Returns:
+        tuple: Caminho do arquivo e data de modificação.
+    """
+    path = active_model_file(MODEL_PATH)
+    if not os.path.exists(path):
+        path = MODEL_PATH
+    return (str(path), os.path.getmtime(path))
+
+
 class PredictionPipeline:
     """
     Class contendo pipeline de predição, submete os dados de entrada ao mesmo
     pipeline de transformação ajustado na etapa de pré-processamento dos dados
     de treino.
+
+    Args:
+        config (PredictionConfig): Configurações da predição, caso vazio\
+                                   são lidas do arquivo de configuração.
     """
 
-    def __init__(self):
-        self.pipeline = joblib.load(PIPELINE_PATH)
-        self.model = joblib.load(MODEL_PATH)
+    def __init__(self, config=None):
+        if config is None:
+            config = ConfigurationManager().get_prediction_config()
+
+        pipeline = joblib.load(PIPELINE_PATH)
+
+        # No modo de features categóricas não há target encoding
+        category_lookup = None
+        if "target_encoder" in pipeline.named_steps:
+            with open(CATEGORY_LOOKUP_PATH, encoding="UTF-8") as f:
+                category_lookup = CategoryLookupEncoder.from_dict(json.load(f))
+
+        # Versão obtida antes do carregamento, de forma que um modelo
+        # registrado durante o carregamento resulte em uma nova recarga
+        self.model_version = model_version()
+        model_path = resolve_model_path(
+            MODEL_PATH, SELECTED_MODEL_PATH, COMPACT_MODEL_PATH
+        )
+        self.model = joblib.load(model_path)
+        # Modelo completo, utilizado nas contribuições das explicações
+        self.base_model = self.model
+        if config.early_exit:
+            self.model = EarlyExitClassifier(
+                self.model,
+                config.early_exit_block_size,
+                config.early_exit_margin,
+            )
+        self.pipeline = prune_pipeline(
+            build_serving_pipeline(pipeline, category_lookup),
+            self.model.feature_name_,
+        )
+        self.lineage = pipeline_lineage(
+            self.pipeline, self.model.feature_name_
+        )
+        self.explanation_top_k = config.explanation_top_k
+        self.explanation_max_rows = config.explanation_max_rows
+
+        self.cascade = None
+        self.cascade_counts = {"approved": 0, "declined": 0, "forwarded": 0}
+        self._lock = threading.Lock()
+        if config.cascade:
+            self.cascade = joblib.load(CASCADE_PATH)
+            # A faixa da cascata é ajustada ao modelo utilizado na predição
+            if not read_active_model(MODEL_PATH).get("cascade"):
+                logger.warning(
+                    "Cascata de modelos não ajustada ao modelo %s, a faixa"
+                    " encaminhada deve ser ajustada novamente",
+                    model_path,
+                )
 
     def transform_input_data(self, data):
         """
@@ -60,6 +195,170 @@ class PredictionPipeline:
                 - prediction int: Classe a qual os dados foram classificados
                 - prediction_proba list: Lista de probabilidades das classes
         """
-        prediction = self.model.predict(data)
         prediction_proba = self.model.predict_proba(data)
+        prediction = self.model.classes_[
+            (prediction_proba[:, 1] > DECISION_THRESHOLD).astype(int)
+        ]
         return (prediction[0], prediction_proba[0][1])
+
+    def predict_raw(self, data):
+        """
+        Realiza a predição a partir dos dados brutos recebidos. Com a
+        cascata de modelos, as transações fora da faixa ambígua são
+        decididas pela primeira etapa, com a probabilidade da primeira
+        etapa, sem o pré-processamento e o modelo completo.
+
+        Args:
+            data (pd.DataFrame): DataFrame de linha única com os dados\
+                                 brutos recebidos.
+
+        Returns:
+            tuple:
+                - prediction int: Classe a qual os dados foram classificados
+                - prediction_proba float: Probabilidade da fraude
+        """
+        if self.cascade is not None:
+            decisions, proba = self.cascade.route(data)
+            self._count_cascade(decisions)
+            if decisions[0] != FORWARD:
+                return (int(decisions[0]), proba[0])
+
+        data = convert_to_numeric(self.transform_input_data(data))
+        return self.predict(data)
+
+    def _count_cascade(self, decisions):
+        """
+        Método privado para acumular as decisões da cascata de modelos.
+
+        Args:
+            decisions (np.ndarray): APPROVE, DECLINE ou FORWARD por\
+                                    transação.
+        """
+        counts = {
+            "approved": int(np.sum(decisions == APPROVE)),
+            "declined": int(np.sum(decisions == DECLINE)),
+            "forwarded": int(np.sum(decisions == FORWARD)),
+        }
+        with self._lock:
+            for outcome, count in counts.items():
+                self.cascade_counts[outcome] += count
+
+    def _decide(self, data):
+        """
+        Método privado para decidir um lote de transações brutas pelo mesmo
+        caminho de predict_raw: a primeira etapa da cascata, quando
+        habilitada, e o pré-processamento e o modelo nas transações
+        encaminhadas.
+
+        Args:
+            data (pd.DataFrame): Dados brutos recebidos.
+
+        Returns:
+            tuple:
+                - np.ndarray: Classe de cada transação.
+                - np.ndarray: Probabilidade da fraude de cada transação.
+        """
+        decisions = np.full(len(data), FORWARD)
+        proba = np.zeros(len(data))
+        if self.cascade is not None:
+            decisions, proba = self.cascade.route(data)
+            self._count_cascade(decisions)
+            proba = proba.astype(float)
+
+        forwarded = np.flatnonzero(decisions == FORWARD)
+        if forwarded.size:
+            X = convert_to_numeric(
+                self.transform_input_data(data.iloc[forwarded])
+            )
+            proba[forwarded] = self.model.predict_proba(X)[:, 1]
+            decisions = np.where(
+                decisions == FORWARD, proba > DECISION_THRESHOLD, decisions
+            )
+        return decisions.astype(int), proba
+
+    def explain(self, data):
+        """
+        Realiza a predição de um lote de transações brutas, pelo mesmo
+        caminho de predict_raw, e explica as transações declinadas, com os
+        campos de entrada que mais contribuíram para a fraude no modelo
+        completo.
+
+        Args:
+            data (pd.DataFrame): Dados brutos recebidos.
+
+        Returns:
+            list(dict): Classe, probabilidade da fraude e motivos de cada\
+                        transação. Os motivos são vazios (None) nas\
+                        transações aprovadas e nas declinadas além do\
+                        limite de explicações do lote.
+        """
+        predictions, proba = self._decide(data)
+        declined = np.flatnonzero(predictions == DECLINE)
+
+        # Limita o custo explicando as declinadas de maior probabilidade
+        explained = declined[np.argsort(-proba[declined], kind="stable")][
+            : self.explanation_max_rows
+        ]
+        reasons = [None] * len(data)
+        if explained.size:
+            X = convert_to_numeric(
+                self.transform_input_data(data.iloc[explained])
+            )
+            contributions = field_contributions(
+                self.base_model, X, self.lineage
+            )
+            for index, row_reasons in zip(
+                explained,
+                top_reasons(
+                    contributions,
+                    data.iloc[explained],
+                    self.explanation_top_k,
+                ),
+            ):
+                reasons[index] = row_reasons
+
+        return [
+            {
+                "predicted_class": int(row_prediction),
+                "predict_proba": float(row_proba),
+                "reasons": row_reasons,
+            }
+            for row_prediction, row_proba, row_reasons in zip(
+                predictions, proba, reasons
+            )
+        ]
+
+    def cascade_stats(self):
+        """
+        Estatísticas das predições com a cascata de modelos.
+
+        Returns:
+            dict: Quantidade de predições de cada decisão e fração das\
+                  predições realizadas por cada etapa, vazio caso a cascata\
+                  não esteja habilitada.
+        """
+        if self.cascade is None:
+            return {}
+        with self._lock:
+            counts = dict(self.cascade_counts)
+        predictions = sum(counts.values())
+        return {
+            **counts,
+            "predictions": predictions,
+            "first_stage_share": (counts["approved"] + counts["declined"])
+            / max(predictions, 1),
+            "full_model_share": counts["forwarded"] / max(predictions, 1),
+        }
+
+    def early_exit_stats(self):
+        """
+        Estatísticas das predições com saída antecipada.
+
+        Returns:
+            dict: Fração de predições com saída antecipada e média de\
+                  árvores avaliadas, vazio caso a saída antecipada não\
+                  esteja habilitada.
+        """
+        if isinstance(self.model, EarlyExitClassifier):
+            return self.model.stats()
+        return {}
@@ -9,17 +9,26 @@ from fraud_detection.config.manager import ConfigurationManager
 from fraud_detection.components.data_validation import DataValidation
 from fraud_detection import logger
 
-
 STAGE_NAME = "Data Validation"
 
 
-def DataValidationTrainingPipeline():
+def DataValidationTrainingPipeline(config=None, store=None):
     """
     Função para repassar configuração para etapa de Validação dos dados
     Invoca método do componente de Validação para validar todas as colunas.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas. Não utilizado por esta etapa, que\
+                               lê apenas o cabeçalho dos dados brutos.
     """
 
-    config = ConfigurationManager()
+    # A validação lê apenas o cabeçalho, sem artefatos a compartilhar
+    del store
+
+    config = config or ConfigurationManager()
     data_validation_config = config.get_data_validation_config()
     data_validation = DataValidation(config=data_validation_config)
     data_validation.validate_all_columns()
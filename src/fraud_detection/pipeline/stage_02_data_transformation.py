@@ -9,18 +9,26 @@ from fraud_detection.config.manager import ConfigurationManager
 from fraud_detection.components.data_transformation import DataTransformation
 from fraud_detection import logger
 
-
 STAGE_NAME = "Data Transformation"
 
 
-def DataTransformationTrainingPipeline():
+def DataTransformationTrainingPipeline(config=None, store=None):
     """
     Função para repassar configuração para etapa de Transformação dos dados
     Invoca método de pré-processamento dos dados para o modelo ser treinado.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
     """
-    config = ConfigurationManager()
+    config = config or ConfigurationManager()
     data_transformation_config = config.get_data_transformation_config()
-    data_transformation = DataTransformation(config=data_transformation_config)
+    data_transformation = DataTransformation(
+        config=data_transformation_config, store=store
+    )
     data_transformation.preprocessing_pipeline()
 
 
@@ -9,18 +9,26 @@ from fraud_detection.config.manager import ConfigurationManager
 from fraud_detection.components.model_trainer import ModelTrainer
 from fraud_detection import logger
 
-
 STAGE_NAME = "Model Trainer"
 
 
-def ModelTrainerTrainingPipeline():
+def ModelTrainerTrainingPipeline(config=None, store=None):
     """
     Função para repassar configuração para etapa de Treinamento dos dados
     Invoca método de treino do modelo com os dados processados.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
     """
-    config = ConfigurationManager()
+    config = config or ConfigurationManager()
     model_trainer_config = config.get_model_trainer_config()
-    model_trainer_config = ModelTrainer(config=model_trainer_config)
+    model_trainer_config = ModelTrainer(
+        config=model_trainer_config, store=store
+    )
     model_trainer_config.train()
 
 
@@ -12,15 +12,24 @@ from fraud_detection import logger
 STAGE_NAME = "Model Evaluation"
 
 
-def ModelEvaluationTrainingPipeline():
+def ModelEvaluationTrainingPipeline(config=None, store=None):
     """
     Função para repassar configuração para etapa de Avaliação dos dados
     Invoca método de avaliação do modelo após o treinamento.
     Também salva as métricas na plataforma MLFlow
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
     """
-    config = ConfigurationManager()
+    config = config or ConfigurationManager()
     model_evaluation_config = config.get_model_evaluation_config()
-    model_evaluation_config = ModelEvaluation(config=model_evaluation_config)
+    model_evaluation_config = ModelEvaluation(
+        config=model_evaluation_config, store=store
+    )
     model_evaluation_config.start_mlflow()
 
 
@@ -0,0 +1,45 @@
+"""
+Arquivo contendo etapa do pipeline para Otimização dos Hiperparâmetros.
+
+Serve para acoplar as configurações lidas do arquivo yaml no componente.
+Executada entre a transformação dos dados e o treinamento, quando o
+main.py recebe --tune. Pode ser executado independentemente.
+"""
+
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.components.model_tuning import ModelTuning
+from fraud_detection import logger
+
+STAGE_NAME = "Model Tuning"
+
+
+def ModelTuningTrainingPipeline(config=None, store=None):
+    """
+    Função para repassar configuração para etapa de Otimização dos
+    Hiperparâmetros. Invoca a otimização e relê o params.yaml atualizado,
+    para que o treinamento utilize os melhores parâmetros.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
+    """
+    config = config or ConfigurationManager()
+    model_tuning_config = config.get_model_tuning_config()
+    model_tuning = ModelTuning(config=model_tuning_config, store=store)
+    model_tuning.tune()
+    config.reload_params()
+
+
+if __name__ == "__main__":
+    try:
+        logger.info("[INICIO DE ETAPA] %s", STAGE_NAME)
+
+        ModelTuningTrainingPipeline()
+
+        logger.info("[FIM DE ETAPA] %s completo.\n\n", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
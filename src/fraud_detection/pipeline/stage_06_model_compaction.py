@@ -0,0 +1,46 @@
+"""
+Arquivo contendo etapa do pipeline para Compactação do modelo.
+
+Serve para acoplar as configurações lidas do arquivo yaml no componente.
+Executada entre o treinamento e a avaliação, quando o main.py recebe
+--compact. Pode ser executado independentemente.
+"""
+
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.components.model_compaction import ModelCompaction
+from fraud_detection import logger
+
+STAGE_NAME = "Model Compaction"
+
+
+def ModelCompactionTrainingPipeline(config=None, store=None):
+    """
+    Função para repassar configuração para etapa de Compactação do modelo.
+    Invoca a geração e avaliação dos modelos compactados, salvando o menor
+    modelo dentro da tolerância.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
+    """
+    config = config or ConfigurationManager()
+    model_compaction_config = config.get_model_compaction_config()
+    model_compaction = ModelCompaction(
+        config=model_compaction_config, store=store
+    )
+    model_compaction.compact()
+
+
+if __name__ == "__main__":
+    try:
+        logger.info("[INICIO DE ETAPA] %s", STAGE_NAME)
+
+        ModelCompactionTrainingPipeline()
+
+        logger.info("[FIM DE ETAPA] %s completo.\n\n", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
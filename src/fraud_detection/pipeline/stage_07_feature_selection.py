@@ -0,0 +1,46 @@
+"""
+Arquivo contendo etapa do pipeline para Seleção de Features.
+
+Serve para acoplar as configurações lidas do arquivo yaml no componente.
+Executada após o treinamento, quando o main.py recebe --select-features.
+Pode ser executado independentemente.
+"""
+
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.components.feature_selection import FeatureSelection
+from fraud_detection import logger
+
+STAGE_NAME = "Feature Selection"
+
+
+def FeatureSelectionTrainingPipeline(config=None, store=None):
+    """
+    Função para repassar configuração para etapa de Seleção de Features.
+    Invoca a ordenação das features e o treino dos modelos com menos
+    features, salvando o menor conjunto dentro da tolerância.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
+    """
+    config = config or ConfigurationManager()
+    feature_selection_config = config.get_feature_selection_config()
+    feature_selection = FeatureSelection(
+        config=feature_selection_config, store=store
+    )
+    feature_selection.select()
+
+
+if __name__ == "__main__":
+    try:
+        logger.info("[INICIO DE ETAPA] %s", STAGE_NAME)
+
+        FeatureSelectionTrainingPipeline()
+
+        logger.info("[FIM DE ETAPA] %s completo.\n\n", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -0,0 +1,44 @@
+"""
+Arquivo contendo etapa do pipeline para Cascata de Modelos.
+
+Serve para acoplar as configurações lidas do arquivo yaml no componente.
+Executada após o treinamento e os modelos derivados, quando o main.py recebe --cascade.
+Pode ser executado independentemente.
+"""
+
+from fraud_detection.config.manager import ConfigurationManager
+from fraud_detection.components.model_cascade import ModelCascade
+from fraud_detection import logger
+
+STAGE_NAME = "Model Cascade"
+
+
+def ModelCascadeTrainingPipeline(config=None, store=None):
+    """
+    Função para repassar configuração para etapa de Cascata de Modelos.
+    Invoca o treino da primeira etapa e o ajuste da faixa encaminhada ao
+    modelo completo, salvando a cascata.
+
+    Args:
+        config (ConfigurationManager): Configurações já carregadas, caso\
+                                       vazio os arquivos YAML são lidos.
+        store (ArtifactStore): Armazenamento em memória compartilhado entre\
+                               as etapas, caso vazio os artefatos são lidos\
+                               do disco.
+    """
+    config = config or ConfigurationManager()
+    model_cascade_config = config.get_model_cascade_config()
+    model_cascade = ModelCascade(config=model_cascade_config, store=store)
+    model_cascade.build()
+
+
+if __name__ == "__main__":
+    try:
+        logger.info("[INICIO DE ETAPA] %s", STAGE_NAME)
+
+        ModelCascadeTrainingPipeline()
+
+        logger.info("[FIM DE ETAPA] %s completo.\n\n", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
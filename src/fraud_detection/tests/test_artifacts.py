@@ -0,0 +1,125 @@
+"""
+Módulo de teste para leitura e escrita dos artefatos tabulares.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fraud_detection.utils.artifact_store import ArtifactStore, load_artifact
+from fraud_detection.utils.artifacts import (
+    FrameWriter,
+    append_frame,
+    load_frame,
+    save_frame,
+    save_frames,
+)
+
+
+@pytest.mark.parametrize("file_format", ["feather", "parquet", "csv"])
+def test_save_and_load_frames(tmp_path, file_format):
+    """Os dados salvos devem ser carregados sem perda de valores"""
+    frames = {
+        "X": pd.DataFrame({"a": [1, 2, 3], "b": [0.5, np.nan, 1.5]}),
+        "y": pd.Series([0, 1, 0], name="fraude"),
+    }
+
+    paths = save_frames(frames, tmp_path, file_format, export_csv=True)
+
+    assert paths["X"].suffix == f".{file_format}", "Formato não respeitado"
+    assert (tmp_path / "X.csv").exists(), "Exportação em CSV não realizada"
+
+    pd.testing.assert_frame_equal(load_frame(tmp_path / "X"), frames["X"])
+    assert load_frame(tmp_path / "y")["fraude"].tolist() == [0, 1, 0]
+
+
+def test_format_change_removes_stale_frames(tmp_path):
+    """
+    Após a troca de formato, o artefato carregado deve ser o novo, mesmo com
+    o arquivo antigo em um formato buscado antes.
+    """
+    old = pd.DataFrame({"a": [1, 2]})
+    new = pd.DataFrame({"a": [3]})
+
+    save_frame(old, tmp_path / "X", "feather")
+    append_frame(old, tmp_path / "X.feather")
+    save_frames({"X": new}, tmp_path, "parquet", export_csv=True)
+
+    pd.testing.assert_frame_equal(load_frame(tmp_path / "X"), new)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "X.csv",
+        "X.parquet",
+    ]
+
+
+def test_frame_writer_chunks(tmp_path):
+    """
+    Blocos escritos em sequência devem formar um único artefato, com os
+    tipos do primeiro bloco.
+    """
+    writer = FrameWriter(tmp_path / "X_train", "feather", "zstd")
+    writer.write(pd.DataFrame({"pais": ["BR", "US"], "valor": [1.0, 2.0]}))
+    writer.write(pd.DataFrame({"pais": [np.nan], "valor": [3.0]}))
+    writer.close()
+
+    loaded = load_frame(tmp_path / "X_train")
+
+    assert loaded.shape == (3, 2), "Blocos não adicionados ao artefato"
+    assert loaded["pais"].tolist() == ["BR", "US", None]
+    assert loaded["valor"].dtype == np.float64, "Tipo da coluna alterado"
+
+
+def test_frame_writer_category_chunks(tmp_path):
+    """Blocos com categorias diferentes devem ser salvos pelos valores"""
+    writer = FrameWriter(tmp_path / "X_train", "feather")
+    writer.write(pd.DataFrame({"pais": pd.Categorical(["BR", "US"])}))
+    writer.write(pd.DataFrame({"pais": pd.Categorical(["AR"])}))
+    writer.close()
+
+    assert load_frame(tmp_path / "X_train")["pais"].tolist() == [
+        "BR",
+        "US",
+        "AR",
+    ]
+
+
+@pytest.mark.parametrize("file_format", ["feather", "parquet", "csv"])
+def test_append_frame(tmp_path, file_format):
+    """
+    Linhas adicionadas devem ser lidas em conjunto com o artefato, e uma
+    nova escrita completa deve descartar as partes adicionadas.
+    """
+    first = pd.DataFrame({"pais": pd.Categorical(["BR"]), "valor": [1.0]})
+    second = pd.DataFrame({"pais": pd.Categorical(["US"]), "valor": [2.0]})
+
+    save_frame(first, tmp_path / "X", file_format)
+    append_frame(second, tmp_path / f"X.{file_format}")
+
+    loaded = load_frame(tmp_path / "X")
+    assert loaded["pais"].astype(str).tolist() == ["BR", "US"]
+    assert loaded["valor"].tolist() == [1.0, 2.0]
+
+    save_frame(first, tmp_path / "X", file_format)
+    assert len(load_frame(tmp_path / "X")) == 1, "Partes não descartadas"
+
+
+def test_artifact_store_reuses_loaded_artifact(tmp_path):
+    """
+    Verifica que o artefato é carregado do disco apenas uma vez e que a
+    persistência em segundo plano é concluída ao finalizar o armazenamento.
+    """
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "artefato"
+
+    store = ArtifactStore(max_workers=1)
+    assert load_artifact(store, "dados", loader) == "artefato"
+    assert load_artifact(store, "dados", loader) == "artefato"
+    assert len(calls) == 1
+    assert load_artifact(None, "dados", loader) == "artefato"
+
+    frame = pd.DataFrame({"valor": [1, 2, 3]})
+    store.persist(save_frame, frame, tmp_path / "dados")
+    store.close()
+    pd.testing.assert_frame_equal(load_frame(tmp_path / "dados"), frame)
@@ -0,0 +1,130 @@
+"""
+Módulo de teste para as métricas do negócio.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fraud_detection.utils.base_metrics import BaseMetrics
+
+
+def _metrics(rng, scores):
+    """Métricas de uma amostra sintética com os scores fornecidos."""
+    rows = len(scores)
+    data = pd.DataFrame(
+        {
+            "score": scores,
+            "fraude": (rng.random(rows) < 0.1).astype(int),
+            "valor_compra": rng.uniform(1, 500, size=rows).round(2),
+        }
+    )
+    return BaseMetrics(data, "score", "fraude", "valor_compra")
+
+
+def test_revenue_sweep_matches_calculate_revenue():
+    """
+    O faturamento de cada limiar da varredura deve ser igual ao de
+    calculate_revenue, para limiares inteiros e para scores contínuos.
+    """
+    rng = np.random.default_rng(42)
+    metrics = _metrics(rng, rng.integers(0, 101, size=2000).astype(float))
+    metrics.data.loc[:9, "score"] = np.nan
+
+    sweep = metrics.revenue_sweep(range(1, 100))
+    expected = [metrics.calculate_revenue(t) for t in range(1, 100)]
+    np.testing.assert_allclose(
+        sweep[["income", "loss", "revenue"]], expected, rtol=1e-12
+    )
+
+    metrics = _metrics(rng, rng.random(2000))
+    sweep = metrics.revenue_sweep()
+    assert len(sweep) == 2001
+    for row in sweep.sample(50, random_state=0).itertuples():
+        assert (row.income, row.loss, row.revenue) == pytest.approx(
+            metrics.calculate_revenue(row.threshold)
+        )
+
+
+def test_find_best_threshold_returns_threshold():
+    """
+    O melhor limiar deve ser o limiar de maior faturamento, e não a sua
+    posição na varredura.
+    """
+    rng = np.random.default_rng(42)
+    metrics = _metrics(rng, rng.integers(0, 101, size=2000).astype(float))
+
+    best_threshold = metrics.find_best_threshold()
+    revenues = {t: metrics.calculate_revenue(t)[2] for t in range(1, 100)}
+    assert best_threshold == max(revenues, key=revenues.get)
+
+    best_threshold = metrics.find_best_threshold(continuous=True)
+    assert metrics.calculate_revenue(best_threshold)[2] == pytest.approx(
+        metrics.revenue_sweep()["revenue"].max()
+    )
+    assert metrics.calculate_revenue(best_threshold)[2] >= max(
+        revenues.values()
+    )
+
+
+def test_kpis_from_cached_confusion_counts(monkeypatch):
+    """
+    Os KPIs devem ser derivados da mesma matriz de confusão, com as
+    transações de score igual ao limiar declinadas, e calculados uma única
+    vez por limiar.
+    """
+    rng = np.random.default_rng(42)
+    metrics = _metrics(rng, rng.integers(0, 101, size=2000).astype(float))
+    metrics.best_threshold = 60
+
+    calls = []
+    metrics_table = metrics.metrics_table
+
+    def counted_metrics_table(thresholds=None, score_columns=None):
+        calls.append(thresholds)
+        return metrics_table(thresholds, score_columns)
+
+    monkeypatch.setattr(metrics, "metrics_table", counted_metrics_table)
+    scores = metrics.data["score"]
+    fraud = metrics.data["fraude"] == 1
+    declined = scores >= 60
+
+    assert metrics.get_approval_rate() + metrics.get_decline_rate() == (
+        pytest.approx(100)
+    )
+    assert metrics.get_decline_rate() == pytest.approx(declined.mean() * 100)
+    assert metrics.get_precision() == pytest.approx(
+        (declined & fraud).sum() / declined.sum() * 100
+    )
+    assert metrics.get_recall() == pytest.approx(
+        (declined & fraud).sum() / fraud.sum() * 100
+    )
+    assert metrics.get_false_positive_rate() == pytest.approx(
+        (declined & ~fraud).sum() / (~fraud).sum() * 100
+    )
+    assert calls == [[60]]
+
+    metrics.best_threshold = 40
+    metrics.get_precision()
+    metrics.get_recall()
+    assert calls == [[60], [40]]
+
+
+def test_metrics_table_for_many_score_columns():
+    """
+    A tabela deve ter uma linha por coluna de score e limiar, com o mesmo
+    faturamento de calculate_revenue.
+    """
+    rng = np.random.default_rng(42)
+    metrics = _metrics(rng, rng.integers(0, 101, size=2000).astype(float))
+    metrics.data["other_score"] = rng.random(2000) * 100
+
+    table = metrics.metrics_table([25, 50, 75], ["score", "other_score"])
+    assert table.shape[0] == 6
+    assert list(table["score_column"]) == ["score"] * 3 + ["other_score"] * 3
+    np.testing.assert_allclose(
+        table.loc[:2, "revenue"],
+        [metrics.calculate_revenue(t)[2] for t in [25, 50, 75]],
+    )
+    np.testing.assert_allclose(
+        table[["vp", "fp", "vn", "fn"]].sum(axis=1), len(metrics.data)
+    )
@@ -4,18 +4,38 @@ Módulo de teste para etapa de pré-processamento dos dados.
 Armazena os testes unitários referentes a todos os passos do pipeline criado.
 """
 
+import json
+from types import SimpleNamespace
+
 import pytest
 import numpy as np
 import pandas as pd
-from fraud_detection.components.data_transformation import (
+from sklearn.preprocessing import TargetEncoder
+from fraud_detection.components.processors import (
     DropColumns,
     DocumentsProcessor,
     DateProcessor,
+    TransformColumns,
+)
+from fraud_detection.components.encoders import (
     NonFrequentAggregator,
     OneHotEncoderProcessor,
-    ImputeValuesProcessor,
+    CategoryLookupEncoder,
+    CategoryCodeEncoder,
     TargetEncoderTransformer,
-    TransformColumns,
+)
+from fraud_detection.components.imputation import ImputeValuesProcessor
+from fraud_detection.components.preprocessing_pipeline import (
+    build_preprocessing_pipeline,
+    build_serving_pipeline,
+    pipeline_lineage,
+    prune_pipeline,
+)
+from fraud_detection.components.chunked_processing import (
+    StreamingFitStatistics,
+)
+from fraud_detection.components.data_transformation import (
+    DataTransformation,
 )
 
 
@@ -209,6 +229,39 @@ def test_one_hot_encoder_processor():
     ), "Colunas presentes no teste codificadas incorretamente"
 
 
+def test_one_hot_encoder_processor_sparse_output():
+    """
+    A codificação por códigos inteiros deve ser igual à do OneHotEncoder do
+    scikit-learn, tanto densa quanto esparsa.
+    """
+    data_train = pd.DataFrame(
+        {"score_1": [1, 2, 3, 4], "continente": ["NA", "EU", "EU", "SA"]}
+    )
+    data_test = pd.DataFrame(
+        {
+            "score_1": [1, 2, 2, 6],
+            "continente": ["NA", "OC", "OC", "SA"],
+            "valor": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+    dense = OneHotEncoderProcessor().fit(data_train)
+    np.testing.assert_array_equal(
+        dense.encode(data_test),
+        dense.encoder.transform(data_test[dense.columns_to_encode]),
+    )
+
+    processor = OneHotEncoderProcessor(sparse_output=True).fit(data_train)
+    transformed = processor.transform(data_test)
+
+    assert list(transformed.columns) == ["valor"] + processor.feature_names_
+    assert isinstance(transformed["score_1_1"].dtype, pd.SparseDtype)
+    pd.testing.assert_frame_equal(
+        transformed[processor.feature_names_].sparse.to_dense(),
+        dense.transform(data_test)[dense.feature_names_],
+    )
+
+
 def test_impute_values_processor():
     """
     Teste para etapa do pré-processamento de impute de valores vazios
@@ -449,3 +502,326 @@ def test_target_encoder_transformer():
     assert (
         "valor" in transformed.columns
     ), "Coluna 'valor' foi removida incorretamente"
+
+
+def test_target_encoder_transformer_matches_sklearn():
+    """
+    O encoding nativo deve ser igual ao TargetEncoder do scikit-learn, no
+    ajuste completo, no ajuste em blocos e no cross-fitting do treino.
+    """
+    rng = np.random.default_rng(0)
+    categories = np.array(["A", "B", "C", "D", "E", np.nan], dtype=object)
+    data = pd.DataFrame(
+        {
+            "categoria_produto_reduzida": categories[
+                rng.integers(0, len(categories), 500)
+            ]
+        }
+    )
+    y = pd.Series((rng.random(500) < 0.2).astype(int))
+
+    sklearn_encoder = TargetEncoder(cv=5, shuffle=False)
+    expected_train = sklearn_encoder.fit_transform(data, y)[:, 0]
+    expected_test = sklearn_encoder.transform(data.iloc[:10])[:, 0]
+
+    encoder = TargetEncoderTransformer(cv=5)
+    np.testing.assert_allclose(
+        encoder.fit_transform(data, y)["categoria_produto_reduzida"],
+        expected_train,
+    )
+    np.testing.assert_allclose(
+        encoder.transform(data.iloc[:10])["categoria_produto_reduzida"],
+        expected_test,
+    )
+
+    chunked_encoder = TargetEncoderTransformer()
+    for chunk in range(0, len(data), 150):
+        chunked_encoder.partial_fit(
+            data.iloc[chunk : chunk + 150], y.iloc[chunk : chunk + 150]
+        )
+    np.testing.assert_allclose(
+        chunked_encoder.transform(data.iloc[:10])[
+            "categoria_produto_reduzida"
+        ],
+        expected_test,
+    )
+
+
+def test_category_lookup_encoder():
+    """
+    A tabela de consulta deve reproduzir o NonFrequentAggregator seguido do
+    TargetEncoderTransformer, inclusive após exportação em JSON.
+    """
+    data_train = pd.DataFrame(
+        {
+            "categoria_produto": ["A"] * 4 + ["B"] * 3 + ["C", "D"],
+            "valor": range(9),
+        }
+    )
+    y_train = pd.Series([1, 0, 1, 1, 0, 0, 1, 1, 0])
+    data_test = pd.DataFrame(
+        {
+            "categoria_produto": ["A", "B", "C", "E", np.nan],
+            "valor": range(5),
+        }
+    )
+
+    aggregator = NonFrequentAggregator().fit(data_train)
+    target_encoder = TargetEncoderTransformer().fit(
+        aggregator.transform(data_train), y_train
+    )
+    expected = target_encoder.transform(aggregator.transform(data_test))
+
+    lookup = CategoryLookupEncoder().fit(data_train, y_train)
+    assert set(lookup.table_) == {"A", "B"}, "Tabela com categorias raras"
+    pd.testing.assert_frame_equal(lookup.transform(data_test), expected)
+
+    exported = CategoryLookupEncoder.from_dict(
+        json.loads(json.dumps(lookup.to_dict()))
+    )
+    pd.testing.assert_frame_equal(exported.transform(data_test), expected)
+
+
+def test_category_code_encoder():
+    """
+    Teste para os códigos inteiros das categorias, CategoryCodeEncoder.
+    Categorias desconhecidas, ausentes ou pouco frequentes devem receber o
+    código reservado.
+    """
+    train = pd.DataFrame(
+        {
+            "score_1": [1, 1, 1, 2, 2, 2, 3],
+            "continente": ["SA", "SA", "SA", "EU", "EU", "EU", "EU"],
+            "categoria_produto": pd.Categorical(
+                ["a", "a", "a", "b", "b", "b", "raro"]
+            ),
+            "score_2": np.arange(7.0),
+        }
+    )
+    test = pd.DataFrame(
+        {
+            "score_1": [2, 3, 4],
+            "continente": ["EU", None, "AF"],
+            "categoria_produto": ["b", "raro", "nova"],
+            "score_2": [1.0, 2.0, 3.0],
+        }
+    )
+
+    encoder = CategoryCodeEncoder().fit(train)
+    transformed = encoder.transform(test)
+
+    assert transformed["score_1"].tolist() == [2, 0, 0]
+    assert transformed["continente"].tolist() == [1, 0, 0]
+    assert transformed["categoria_produto"].tolist() == [2, 0, 0]
+    assert transformed["score_2"].tolist() == [1.0, 2.0, 3.0]
+    assert encoder.categorical_features_ == [
+        "score_1",
+        "continente",
+        "categoria_produto",
+    ]
+
+    codes = encoder.transform(train)["categoria_produto"]
+    assert codes.dtype == np.int32
+    assert codes.tolist() == [1, 1, 1, 2, 2, 2, 0], "Categoria rara mantida"
+
+
+def _raw_data(size, rng):
+    """Dados brutos sintéticos com todas as colunas de entrada."""
+    data = pd.DataFrame(
+        {
+            "score_1": rng.integers(1, 4, size),
+            "score_2": rng.random(size),
+            "score_3": rng.exponential(10, size),
+            "score_4": rng.integers(0, 3, size).astype(float),
+            "score_5": rng.random(size),
+            "score_6": rng.normal(100, 10, size),
+            "pais": rng.choice(["BR", "US", "ES", None], size),
+            "score_7": rng.integers(0, 10, size),
+            "produto": "A",
+            "categoria_produto": rng.choice(["A", "B", "C", "D", "E"], size),
+            "score_8": rng.random(size),
+            "score_9": rng.random(size),
+            "score_10": rng.random(size),
+            "entrega_doc_1": rng.integers(0, 2, size),
+            "entrega_doc_2": rng.choice(["Y", "N", None], size),
+            "entrega_doc_3": rng.choice(["Y", "N"], size),
+            "data_compra": "2020-03-01 10:00:00",
+            "valor_compra": rng.exponential(50, size),
+            "score_fraude_modelo": rng.integers(0, 100, size),
+        }
+    )
+    data.loc[[1, 5, 9], ["score_2", "score_4"]] = np.nan
+    data.loc[[0, 1, 2, 3], "categoria_produto"] = "F"
+    return data
+
+
+@pytest.mark.parametrize("feature_mode", ["encoded", "categorical"])
+def test_streaming_fit_statistics(feature_mode):
+    """
+    Testes para o ajuste do pipeline a partir de estatísticas acumuladas
+    em blocos, StreamingFitStatistics. Com poucos dados os sketches não são
+    compactados e o resultado deve ser igual ao ajuste em memória.
+    """
+    rng = np.random.default_rng(0)
+    size = 60
+
+    data = _raw_data(size, rng)
+    y = pd.Series(rng.integers(0, 2, size))
+
+    statistics = StreamingFitStatistics(
+        build_preprocessing_pipeline(
+            median_strategy="sketch", feature_mode=feature_mode
+        )
+    )
+    for start in range(0, size, 25):
+        statistics.update(
+            data.iloc[start : start + 25], y.iloc[start : start + 25]
+        )
+
+    streaming_pipeline = statistics.fit_pipeline()
+    pipeline = build_preprocessing_pipeline(feature_mode=feature_mode).fit(
+        data, y
+    )
+
+    pd.testing.assert_frame_equal(
+        streaming_pipeline.transform(data),
+        pipeline.transform(data),
+        check_dtype=False,
+    )
+
+
+def test_chunked_pipeline_rejects_target_encoder_cv():
+    """
+    A leitura em blocos não realiza o cross-fitting do target encoding, e
+    deve recusar a configuração em vez de ignorá-la.
+    """
+    config = SimpleNamespace(chunk_size=100, target_encoder_cv=5)
+
+    with pytest.raises(ValueError, match="target_encoder_cv"):
+        DataTransformation(config).chunked_preprocessing_pipeline()
+
+
+def test_impute_values_processor_sketch_merge():
+    """
+    Teste para a mediana aproximada do ImputeValuesProcessor, ajustada em
+    blocos separados e mesclada posteriormente.
+    """
+    rng = np.random.default_rng(0)
+    columns = ImputeValuesProcessor().discrete_columns + [
+        "score_2",
+        "score_3",
+        "score_5",
+        "score_6",
+        "score_9",
+        "score_10",
+        "valor_compra",
+    ]
+    data = pd.DataFrame(
+        rng.exponential(10, (20_000, len(columns))).round(), columns=columns
+    )
+
+    processors = []
+    for start in range(0, len(data), 5_000):
+        processor = ImputeValuesProcessor(median_strategy="sketch")
+        processors.append(
+            processor.partial_fit(data.iloc[start : start + 5_000])
+        )
+
+    # A mescla em um processador não ajustado não deve alterar os
+    # processadores mesclados
+    merged = ImputeValuesProcessor(median_strategy="sketch")
+    for processor in processors:
+        merged.merge(processor)
+    assert processors[0].sketches_["valor_compra"].count == 5_000
+
+    exact = ImputeValuesProcessor().fit(data)
+    missing = pd.DataFrame([[np.nan] * len(columns)], columns=columns)
+
+    approximate_values = merged.transform(missing).iloc[0]
+    exact_values = exact.transform(missing).iloc[0]
+
+    for col in exact.continuous_columns:
+        rank = (data[col] < approximate_values[col]).mean()
+        upper_rank = (data[col] <= approximate_values[col]).mean()
+        assert (
+            rank - 0.02 <= 0.5 <= upper_rank + 0.02
+        ), f"Mediana aproximada fora do erro esperado para {col}"
+
+    assert (
+        approximate_values[exact.discrete_columns].tolist()
+        == exact_values[exact.discrete_columns].tolist()
+    ), "Moda das colunas discretas diferente do ajuste exato"
+
+
+@pytest.mark.parametrize("feature_mode", ["encoded", "categorical"])
+def test_prune_pipeline(feature_mode):
+    """
+    O pipeline podado deve calcular as features utilizadas iguais às do
+    pipeline completo, sem as etapas das features removidas.
+    """
+    rng = np.random.default_rng(0)
+    data = _raw_data(60, rng)
+    y = pd.Series(rng.integers(0, 2, 60))
+
+    pipeline = build_preprocessing_pipeline(feature_mode=feature_mode).fit(
+        data, y
+    )
+    category_lookup = None
+    category_feature = "categoria_produto"
+    if feature_mode == "encoded":
+        category_lookup = CategoryLookupEncoder().fit_from_processors(
+            pipeline.named_steps["column_aggregator"],
+            pipeline.named_steps["target_encoder"],
+        )
+        category_feature = "categoria_produto_reduzida"
+    serving_pipeline = build_serving_pipeline(pipeline, category_lookup)
+    transformed = serving_pipeline.transform(data)
+
+    features = ["log_valor_compra", "score_2", category_feature]
+    pruned = prune_pipeline(serving_pipeline, features)
+    steps = [name for name, _ in pruned.steps]
+    assert "country" not in steps and "date" not in steps
+    assert "docs" not in steps
+    pd.testing.assert_frame_equal(
+        pruned.transform(data), transformed[features], check_dtype=False
+    )
+
+    continent = [col for col in transformed if col.startswith("continente")]
+    features = ["hora_compra", continent[0]]
+    pruned = prune_pipeline(serving_pipeline, features)
+    assert "country" in [name for name, _ in pruned.steps]
+    pd.testing.assert_frame_equal(
+        pruned.transform(data), transformed[features], check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("feature_mode", ["encoded", "categorical"])
+def test_pipeline_lineage(feature_mode):
+    """
+    Cada feature transformada deve ter origem em um campo dos dados brutos,
+    também no pipeline de predição podado.
+    """
+    rng = np.random.default_rng(0)
+    data = _raw_data(60, rng)
+    y = pd.Series(rng.integers(0, 2, 60))
+
+    pipeline = build_preprocessing_pipeline(feature_mode=feature_mode).fit(
+        data, y
+    )
+    features = list(pipeline.transform(data).columns)
+    lineage = pipeline_lineage(pipeline, features)
+
+    assert all(
+        len(origin) == 1 and origin[0] in data.columns
+        for origin in lineage.values()
+    )
+    assert lineage["log_valor_compra"] == ("valor_compra",)
+    assert lineage["hora_compra"] == ("data_compra",)
+    assert lineage["entrega_doc_1"] == ("entrega_doc_1",)
+    continent = [col for col in features if col.startswith("continente")]
+    assert all(lineage[col] == ("pais",) for col in continent)
+
+    pruned = prune_pipeline(pipeline, features[:5])
+    assert pipeline_lineage(pruned, features[:5]) == {
+        feature: lineage[feature] for feature in features[:5]
+    }
@@ -0,0 +1,89 @@
+"""
+Módulo de teste para a predição com saída antecipada.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+from fraud_detection.components.early_exit import (
+    EarlyExitClassifier,
+    early_exit_report,
+    early_exit_scores,
+)
+from fraud_detection.components.model_trainer import BoosterClassifier
+
+PARAMS = {"objective": "binary", "num_leaves": 7, "verbose": -1}
+
+
+def _model_and_data(rng, score_offset=0.0):
+    """Modelo treinado e dados de teste sintéticos."""
+    X = pd.DataFrame(rng.normal(size=(3000, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + X["b"] + rng.normal(size=3000) > 1).astype(int))
+    booster = lgb.train(PARAMS, lgb.Dataset(X[:2000], label=y[:2000]), 95)
+    model = BoosterClassifier(booster, score_offset=score_offset)
+    return model, X[2000:], y[2000:]
+
+
+def test_early_exit_scores_match_full_evaluation():
+    """
+    Sem saída antecipada, os blocos devem somar todas as árvores, e com
+    saída antecipada apenas as linhas confiantes devem ser interrompidas.
+    """
+    rng = np.random.default_rng(42)
+    model, X, _ = _model_and_data(rng, score_offset=-0.5)
+    full_scores = model.booster.predict(X, raw_score=True) - 0.5
+
+    scores, trees = early_exit_scores(model, X, 10, np.inf)
+    np.testing.assert_allclose(scores, full_scores)
+    assert (trees == 95).all()
+
+    scores, trees = early_exit_scores(model, X, 10, 2.0)
+    exited = trees < 95
+    assert exited.any() and not exited.all()
+    assert set(np.unique(trees)) <= {10, 20, 30, 40, 50, 60, 70, 80, 90, 95}
+    assert (np.abs(scores[exited]) > 2.0).all()
+    np.testing.assert_allclose(scores[~exited], full_scores[~exited])
+
+
+def test_early_exit_classifier_stats_and_report():
+    """
+    O classificador deve acumular as estatísticas das predições, e o
+    relatório deve comparar as decisões com a avaliação completa.
+    """
+    rng = np.random.default_rng(42)
+    model, X, y = _model_and_data(rng)
+
+    classifier = EarlyExitClassifier(model, 10, 3.0)
+    assert classifier.feature_name_ == model.feature_name_
+    for index in range(100):
+        classifier.predict(X.iloc[[index]])
+    stats = classifier.stats()
+    assert stats["predictions"] == 100
+    assert 0 < stats["early_exit_fraction"] < 1
+    assert 10 <= stats["mean_trees"] < 95
+
+    report = early_exit_report(model, X, y, 10, 3.0)
+    assert report["agreement"] > 0.99
+    assert report["total_trees"] == 95
+    assert abs(report["auc"] - report["full_auc"]) < 0.01
+
+
+def test_early_exit_classifier_counts_concurrent_predictions():
+    """
+    As estatísticas devem contabilizar todas as predições realizadas por
+    requisições concorrentes.
+    """
+    rng = np.random.default_rng(42)
+    model, X, _ = _model_and_data(rng)
+
+    classifier = EarlyExitClassifier(model, 10, 3.0)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda rows: classifier.predict(X.iloc[rows]),
+                np.array_split(np.arange(len(X)), 200),
+            )
+        )
+    assert classifier.stats()["predictions"] == len(X)
@@ -0,0 +1,68 @@
+"""
+Módulo de teste para os motivos das predições.
+"""
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+from fraud_detection.components.explanation import (
+    field_contributions,
+    top_reasons,
+)
+from fraud_detection.components.model_trainer import BoosterClassifier
+
+PARAMS = {"objective": "binary", "num_leaves": 7, "verbose": -1}
+
+
+def test_field_contributions_and_top_reasons():
+    """
+    As contribuições das features de um mesmo campo devem ser somadas, e
+    os motivos devem ser os campos de maior contribuição positiva.
+    """
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame(
+        {
+            "pais": rng.choice(["BR", "US"], size=2000),
+            "valor_compra": rng.uniform(10, 500, size=2000),
+            "score_1": rng.normal(size=2000),
+        }
+    )
+    X = pd.DataFrame(
+        {
+            "continente_SA": (data["pais"] == "BR").astype(int),
+            "continente_NA": (data["pais"] == "US").astype(int),
+            "log_valor_compra": np.log1p(data["valor_compra"]),
+            "score_1": data["score_1"],
+        }
+    )
+    y = (X["log_valor_compra"] + X["continente_SA"] > 5.5).astype(int)
+    model = BoosterClassifier(
+        lgb.train(PARAMS, lgb.Dataset(X, label=y), 30), score_offset=0.5
+    )
+    lineage = {
+        "continente_SA": ("pais",),
+        "continente_NA": ("pais",),
+        "log_valor_compra": ("valor_compra",),
+        "score_1": ("score_1",),
+    }
+
+    contributions = field_contributions(model, X, lineage)
+    assert list(contributions.columns) == ["pais", "valor_compra", "score_1"]
+    bias = model.booster.predict(X, pred_contrib=True)[:, -1]
+    np.testing.assert_allclose(
+        contributions.sum(axis=1) + bias,
+        model.booster.predict(X, raw_score=True),
+    )
+
+    reasons = top_reasons(contributions, data, top_k=2)
+    assert len(reasons) == len(data)
+    for row, row_reasons in enumerate(reasons):
+        assert len(row_reasons) <= 2
+        values = [reason["contribution"] for reason in row_reasons]
+        assert all(value > 0 for value in values)
+        assert values == sorted(values, reverse=True)
+        for reason in row_reasons:
+            assert reason["value"] == data[reason["field"]].iloc[row]
+
+    fraud = int(np.argmax(model.predict_proba(X)[:, 1]))
+    assert reasons[fraud][0]["field"] in ("pais", "valor_compra")
@@ -0,0 +1,42 @@
+"""
+Módulo de teste para a seleção de features.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import lightgbm as lgb
+from fraud_detection.components.feature_selection import feature_importance
+from fraud_detection.components.model_trainer import BoosterClassifier
+
+PARAMS = {"objective": "binary", "num_leaves": 7, "verbose": -1}
+
+
+@pytest.mark.parametrize("importance_type", ["gain", "shap"])
+def test_feature_importance_ranks_informative_features(importance_type):
+    """
+    As features que definem o rótulo devem ser as mais importantes, e o
+    modelo treinado com elas deve aceitar dados com todas as colunas.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(
+        rng.normal(size=(2000, 4)), columns=["ruido", "a", "b", "ruido_2"]
+    )
+    y = pd.Series(
+        (2 * X["a"] + X["b"] + rng.normal(size=2000) > 1).astype(int)
+    )
+    model = BoosterClassifier(lgb.train(PARAMS, lgb.Dataset(X, label=y), 50))
+
+    importance = feature_importance(model, X, importance_type)
+    assert list(importance.index[:2]) == ["a", "b"]
+    assert importance.is_monotonic_decreasing
+
+    selected = BoosterClassifier(
+        lgb.train(PARAMS, lgb.Dataset(X[["a", "b"]], label=y), 50)
+    )
+    np.testing.assert_allclose(
+        selected.predict_proba(X), selected.predict_proba(X[["a", "b"]])
+    )
+
+    with pytest.raises(ValueError):
+        feature_importance(model, X, "split")
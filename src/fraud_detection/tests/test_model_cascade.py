@@ -0,0 +1,96 @@
+"""
+Módulo de teste para a cascata de modelos.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fraud_detection.components.model_cascade import (
+    APPROVE,
+    DECLINE,
+    DOCUMENT_FEATURES,
+    NUMERIC_FEATURES,
+    band_report,
+    cascade_features,
+    transaction_revenue,
+    tune_band,
+)
+
+
+def test_cascade_features_from_api_and_raw_data():
+    """
+    As features brutas devem ser iguais para os valores recebidos pela API,
+    em texto, e para os dados brutos, com NaN nos valores inválidos.
+    """
+    raw = pd.DataFrame(
+        {
+            **{col: [1.5, 2.0] for col in NUMERIC_FEATURES},
+            "entrega_doc_1": pd.Series([1, 0], dtype="int8"),
+            "entrega_doc_2": pd.Categorical(["Y", None]),
+            "entrega_doc_3": ["N", "Y"],
+            "pais": ["BR", "US"],
+        }
+    )
+    api = raw.astype(str)
+    api.loc[1, "valor_compra"] = "invalido"
+
+    expected = np.array(
+        [
+            [1.5] * len(NUMERIC_FEATURES) + [1, 1, 0],
+            [2.0] * len(NUMERIC_FEATURES) + [0, np.nan, 1],
+        ],
+        dtype=np.float32,
+    )
+    np.testing.assert_array_equal(cascade_features(raw), expected)
+
+    expected[1, NUMERIC_FEATURES.index("valor_compra")] = np.nan
+    features = cascade_features(api)
+    assert features.shape == (
+        2,
+        len(NUMERIC_FEATURES) + len(DOCUMENT_FEATURES),
+    )
+    np.testing.assert_array_equal(features, expected)
+
+
+@pytest.mark.parametrize("max_revenue_loss", [0.0, 0.05])
+def test_tune_band_respects_revenue_loss(max_revenue_loss):
+    """
+    A faixa deve decidir na primeira etapa as transações claras, sem
+    ultrapassar a perda de faturamento em relação ao modelo completo.
+    """
+    rng = np.random.default_rng(42)
+    y = (rng.random(5000) < 0.05).astype(int)
+    values = rng.uniform(10, 500, size=5000)
+    full_decisions = np.where(rng.random(5000) < 0.9, y, 1 - y)
+    first_proba = np.clip(
+        0.6 * y + rng.normal(0.2, 0.15, size=5000), 0.001, 0.999
+    )
+
+    band = tune_band(first_proba, full_decisions, y, values, max_revenue_loss)
+    full_revenue = transaction_revenue(full_decisions, y, values).sum()
+
+    assert band["approve_below"] <= band["decline_above"]
+    assert band["approved_share"] > 0
+    assert band["revenue_loss"] <= max_revenue_loss * full_revenue + 1e-9
+    assert band["full_revenue"] == pytest.approx(full_revenue)
+    np.testing.assert_allclose(
+        band["approved_share"]
+        + band["declined_share"]
+        + band["forwarded_share"],
+        1.0,
+    )
+
+    # A avaliação da faixa escolhida reproduz o ajuste nos mesmos dados
+    assert band_report(
+        band, first_proba, full_decisions, y, values
+    ) == pytest.approx(band)
+
+    approved = first_proba < band["approve_below"]
+    declined = first_proba >= band["decline_above"]
+    assert band["declined_share"] == pytest.approx(np.mean(declined))
+    if max_revenue_loss == 0:
+        # Sem perda, a primeira etapa não aprova fraudes declinadas nem
+        # declina transações legítimas aprovadas pelo modelo completo
+        assert band["forwarded_share"] > 0
+        assert (full_decisions[approved & (y == 1)] == APPROVE).all()
+        assert (full_decisions[declined & (y == 0)] == DECLINE).all()
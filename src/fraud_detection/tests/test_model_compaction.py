@@ -0,0 +1,155 @@
+"""
+Módulo de teste para a compactação do modelo.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+from fraud_detection.components.model_compaction import (
+    COMPACTION_REPORT_NAME,
+    ModelCompaction,
+    select_trees,
+    tree_contributions,
+)
+from fraud_detection.components.model_trainer import (
+    BoosterClassifier,
+    resolve_model_path,
+)
+from fraud_detection.entity.config_entity import ModelCompactionConfig
+from fraud_detection.utils.artifact_store import ArtifactStore
+
+PARAMS = {
+    "objective": "binary",
+    "num_leaves": 7,
+    "max_depth": 4,
+    "subsample": 1.0,
+    "colsample_bytree": 1.0,
+    "reg_alpha": 0.0,
+    "reg_lambda": 0.0,
+    "learning_rate": 0.1,
+    "scale_pos_weight": 1.0,
+    "max_bin": 63,
+    "min_data_in_bin": 3,
+    "bin_construct_sample_cnt": 200000,
+    "verbose": -1,
+}
+
+
+def _synthetic_data(rows, rng):
+    """Features, rótulos e valores de transação sintéticos."""
+    X = pd.DataFrame(rng.normal(size=(rows, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + X["b"] + rng.normal(size=rows) > 2).astype(int))
+    values = pd.DataFrame({"valor_compra": rng.uniform(10, 500, size=rows)})
+    return X, y, values
+
+
+def test_select_trees_matches_contributions():
+    """
+    O modelo com as árvores escolhidas deve produzir o score igual à soma
+    das contribuições dessas árvores.
+    """
+    rng = np.random.default_rng(42)
+    X, y, _ = _synthetic_data(500, rng)
+    booster = lgb.train(PARAMS, lgb.Dataset(X, label=y), num_boost_round=30)
+
+    contributions = tree_contributions(booster, X.to_numpy(np.float32))
+    np.testing.assert_allclose(
+        contributions.sum(axis=1), booster.predict(X, raw_score=True)
+    )
+
+    kept = [0, 3, 4, 10, 29]
+    selected = select_trees(booster, kept)
+    assert selected.num_trees() == len(kept)
+    np.testing.assert_allclose(
+        selected.predict(X, raw_score=True),
+        contributions[:, kept].sum(axis=1),
+    )
+
+
+def test_model_compaction_chooses_smallest_accepted(tmp_path):
+    """
+    A compactação deve escolher o menor candidato dentro da tolerância,
+    salvando o modelo e o relatório com tamanho e latências.
+    """
+    rng = np.random.default_rng(42)
+    X_train, y_train, X_train_raw = _synthetic_data(3000, rng)
+    X_test, y_test, X_test_raw = _synthetic_data(1000, rng)
+    # Assim como no treino sem validation_size, o modelo utiliza as linhas
+    # de validação, e a referência da escolha é treinada novamente
+    model = BoosterClassifier(
+        lgb.train(PARAMS, lgb.Dataset(X_train, label=y_train), 200)
+    )
+
+    store = ArtifactStore()
+    for name, value in {
+        "model": model,
+        "X_train_transformed": X_train,
+        "y_train": y_train,
+        "X_test_transformed": X_test,
+        "y_test": y_test,
+        "X_test": X_test_raw,
+        "X_train": X_train_raw,
+        "categorical_features": [],
+    }.items():
+        store.put(name, value)
+
+    config = ModelCompactionConfig(
+        root_path=tmp_path,
+        model_path=tmp_path / "trained.joblib",
+        selected_model_path=None,
+        model_name="model.joblib",
+        train_x_data_path=None,
+        train_y_data_path=None,
+        test_x_data_path=None,
+        test_y_data_path=None,
+        test_raw_x_data_path=None,
+        categorical_features_path=None,
+        all_params=PARAMS,
+        prefix_fractions=[0.1, 0.5],
+        drop_fractions=[0.5],
+        distill_trees=[20],
+        distill_learning_rate=0.1,
+        auc_tolerance=0.01,
+        revenue_tolerance=0.05,
+        latency_rows=20,
+        train_raw_x_data_path=None,
+        validation_size=0.2,
+        negative_sampling_rate=None,
+        negative_sampling_correction="weight",
+    )
+    compacted = ModelCompaction(config, store).compact()
+    store.close()
+
+    with open(tmp_path / COMPACTION_REPORT_NAME, encoding="UTF-8") as f:
+        report = json.load(f)
+
+    candidates = report["candidates"]
+    assert set(candidates) == {
+        "reference",
+        "truncate_20",
+        "truncate_100",
+        "drop_100",
+        "distill_20",
+    }
+    assert candidates["reference"]["accepted"]
+    assert all(
+        candidate["p99_latency_ms"] >= candidate["p50_latency_ms"]
+        for candidate in candidates.values()
+    )
+
+    chosen = candidates[report["chosen"]]
+    assert chosen["num_trees"] == min(
+        candidate["num_trees"]
+        for candidate in candidates.values()
+        if candidate["accepted"]
+    )
+    assert chosen["num_trees"] < 200, "Nenhum candidato menor aceito"
+    assert compacted.booster.num_trees() == chosen["num_trees"]
+    assert set(report["test"]) == {"reference", report["chosen"]}
+    assert store.get("model") is compacted
+    assert (tmp_path / "model.joblib").exists()
+    assert resolve_model_path(
+        config.model_path, tmp_path / "model.joblib"
+    ) == (tmp_path / "model.joblib")
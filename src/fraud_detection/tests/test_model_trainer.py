@@ -0,0 +1,273 @@
+"""
+Módulo de teste para o treinamento do modelo.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+from fraud_detection.components.model_trainer import (
+    BoosterClassifier,
+    ModelTrainer,
+    read_active_model,
+    record_active_model,
+    resolve_model_path,
+    save_model,
+)
+from fraud_detection.components.training_data import (
+    build_dataset,
+    negative_downsample,
+)
+from fraud_detection.entity.config_entity import ModelTrainerConfig
+from fraud_detection.utils.artifact_store import ArtifactStore
+
+PARAMS = {
+    "objective": "binary",
+    "max_bin": 63,
+    "min_data_in_bin": 3,
+    "bin_construct_sample_cnt": 200000,
+    "verbose": -1,
+}
+
+
+def test_build_dataset_reuses_binary(tmp_path):
+    """
+    O Dataset binário salvo deve ser reutilizado para os mesmos dados e
+    parâmetros, gerando o mesmo modelo, e recriado caso a discretização
+    seja alterada.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(500, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(size=500) > 0).astype(int))
+
+    dataset, fingerprint = build_dataset(X, y, PARAMS, tmp_path)
+    model = BoosterClassifier(lgb.train(PARAMS, dataset, 10), fingerprint)
+    assert len(list(tmp_path.glob("*.bin"))) == 1, "Dataset não salvo"
+
+    cached, cached_fingerprint = build_dataset(X, y, PARAMS, tmp_path)
+    cached_model = BoosterClassifier(lgb.train(PARAMS, cached, 10))
+    assert cached_fingerprint == fingerprint
+    np.testing.assert_allclose(
+        model.predict_proba(X), cached_model.predict_proba(X)
+    )
+
+    build_dataset(X, y, {**PARAMS, "max_bin": 31}, tmp_path)
+    assert len(list(tmp_path.glob("*.bin"))) == 2, "Parâmetros ignorados"
+
+    # Apenas os binários utilizados mais recentemente são mantidos
+    build_dataset(X, y, PARAMS, tmp_path)
+    _, latest = build_dataset(X, y, {**PARAMS, "max_bin": 15}, tmp_path)
+    assert sorted(path.name for path in tmp_path.glob("*.bin")) == sorted(
+        [
+            f"train_{fingerprint[:16]}.bin",
+            f"train_{latest[:16]}.bin",
+        ]
+    )
+
+    proba = model.predict_proba(X)
+    np.testing.assert_allclose(proba.sum(axis=1), 1)
+    assert set(model.predict(X)) <= {0, 1}
+    assert model.n_features_in_ == 3
+
+
+def _trainer_config(tmp_path, **overrides):
+    """Configuração do treinamento para os testes."""
+    config = {
+        "model_target_path": tmp_path,
+        "train_x_data_path": None,
+        "test_x_data_path": None,
+        "train_y_data_path": None,
+        "test_y_data_path": None,
+        "model_name": "model.joblib",
+        "dataset_cache_path": tmp_path / "datasets",
+        "categorical_features_path": tmp_path / "categorical_features.json",
+        "validation_size": None,
+        "early_stopping_rounds": 50,
+        "early_stopping_metric": "auc",
+        "warm_start": False,
+        "warm_start_trees": 20,
+        "replay_fraction": 0.1,
+        "warm_start_compare": True,
+        "negative_sampling_rate": None,
+        "negative_sampling_correction": "calibration",
+        "subsample": 1.0,
+        "reg_lambda": 0.0,
+        "reg_alpha": 0.0,
+        "num_leaves": 31,
+        "n_estimators": 50,
+        "max_depth": -1,
+        "learning_rate": 0.1,
+        "colsample_bytree": 1.0,
+        "scale_pos_weight": 1,
+        "max_bin": 255,
+        "min_data_in_bin": 3,
+        "bin_construct_sample_cnt": 200000,
+        "target_column": "fraude",
+    }
+    return ModelTrainerConfig(**{**config, **overrides})
+
+
+def test_model_trainer_early_stopping(tmp_path):
+    """
+    Com validação configurada, o treino deve parar antes de n_estimators e
+    o modelo deve utilizar apenas as árvores até a melhor iteração.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(2000, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(size=2000) > 1).astype(int))
+
+    config = _trainer_config(
+        tmp_path,
+        validation_size=0.2,
+        early_stopping_rounds=10,
+        early_stopping_metric="logloss",
+        n_estimators=1000,
+        learning_rate=0.3,
+    )
+    store = ArtifactStore()
+    store.put("X_train_transformed", X)
+    store.put("y_train", y)
+    ModelTrainer(config, store=store).train()
+    store.close()
+
+    model = store.get("model")
+    assert model.best_iteration < config.n_estimators, "Treino não parou"
+    assert model.booster.num_trees() == model.best_iteration
+
+    with open(tmp_path / "training_report.json", encoding="UTF-8") as f:
+        report = json.load(f)
+    assert report["best_iteration"] == model.best_iteration
+    assert report["trained_iterations"] > report["best_iteration"]
+    assert (tmp_path / "model.joblib").exists()
+
+
+def test_model_trainer_warm_start(tmp_path):
+    """
+    Com linhas novas acrescentadas aos dados de treino, o treino deve
+    continuar do modelo salvo com warm_start_trees árvores, registrando a
+    linhagem no manifesto e a comparação com o treino completo, que não
+    salva o Dataset binário.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(3000, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(size=3000) > 1).astype(int))
+
+    def train(config, rows):
+        store = ArtifactStore()
+        store.put("X_train_transformed", X.iloc[:rows])
+        store.put("y_train", y.iloc[:rows])
+        store.put("X_test_transformed", X.iloc[2500:])
+        store.put("y_test", y.iloc[2500:])
+        ModelTrainer(config, store=store).train()
+        store.close()
+        with open(tmp_path / "model_manifest.json", encoding="UTF-8") as f:
+            return store.get("model"), json.load(f)
+
+    config = _trainer_config(tmp_path, warm_start=True)
+    model, manifest = train(config, 2000)
+    assert manifest["mode"] == "full", "Treino continuado sem modelo"
+    assert model.booster.num_trees() == config.n_estimators
+
+    model, manifest = train(config, 2500)
+    assert manifest["mode"] == "warm_start"
+    assert model.booster.num_trees() == (
+        config.n_estimators + config.warm_start_trees
+    )
+    assert [entry["n_rows"] for entry in manifest["lineage"]] == [2000, 2500]
+    assert manifest["new_rows"] == 500
+    assert manifest["replay_rows"] == 200
+
+    with open(tmp_path / "warm_start_report.json", encoding="UTF-8") as f:
+        report = json.load(f)
+    assert {"saved_seconds", "auc_difference"} <= set(report)
+    assert (
+        len(list(config.dataset_cache_path.glob("*.bin"))) == 1
+    ), "Dataset do treino de comparação salvo"
+
+    _, manifest = train(config, 2500)
+    assert manifest["mode"] == "full", "Treino continuado sem linhas novas"
+    assert len(manifest["lineage"]) == 1
+
+
+def test_negative_downsample_corrections():
+    """
+    A subamostragem deve manter todas as fraudes, e as duas correções devem
+    produzir probabilidades próximas às do treino com todos os dados.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(20000, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(size=20000) > 2).astype(int))
+
+    full = BoosterClassifier(lgb.train(PARAMS, lgb.Dataset(X, y), 50))
+    mean_proba = full.predict_proba(X)[:, 1].mean()
+
+    for correction in ["weight", "calibration"]:
+        X_s, y_s, weight, offset = negative_downsample(X, y, 0.5, correction)
+        assert y_s.sum() == y.sum(), "Fraudes descartadas"
+        assert len(X_s) < 0.6 * len(X)
+
+        booster = lgb.train(PARAMS, lgb.Dataset(X_s, y_s, weight=weight), 50)
+        proba = BoosterClassifier(booster, score_offset=offset).predict_proba(
+            X
+        )[:, 1]
+        assert abs(proba.mean() - mean_proba) < 0.005, correction
+
+    # A calibração multiplica a razão de chances pela fração amostrada
+    sampled = booster.predict(X)
+    np.testing.assert_allclose(
+        proba, sampled * 0.5 / (sampled * 0.5 + 1 - sampled)
+    )
+
+
+def test_model_trainer_categorical_features(tmp_path):
+    """
+    As features categóricas salvas na transformação devem ser repassadas
+    ao Dataset, sem o Dataset binário, que não as preserva.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(
+        {"codigo": rng.integers(0, 20, 2000), "a": rng.normal(size=2000)}
+    )
+    y = pd.Series(X["codigo"].isin([3, 7, 11]).astype(int))
+
+    store = ArtifactStore()
+    store.put("X_train_transformed", X)
+    store.put("y_train", y)
+    store.put("categorical_features", ["codigo"])
+    ModelTrainer(_trainer_config(tmp_path, validation_size=0.2), store).train()
+    store.close()
+
+    model = store.get("model")
+    tree = model.booster.dump_model()["tree_info"][0]["tree_structure"]
+    assert tree["decision_type"] == "==", "Feature não categórica"
+    assert not list((tmp_path / "datasets").glob("*.bin"))
+
+
+def test_resolve_model_path_follows_registry(tmp_path):
+    """
+    O modelo utilizado deve ser o registrado por último, independente das
+    datas de modificação dos arquivos, e um novo registro deve descartar o
+    ajuste da cascata.
+    """
+    model_path = tmp_path / "model_output" / "model.joblib"
+    compact_path = tmp_path / "model_compaction" / "model.joblib"
+    model_path.parent.mkdir()
+    compact_path.parent.mkdir()
+    store = ArtifactStore()
+
+    save_model(store, "treinado", model_path, model_path)
+    assert resolve_model_path(model_path, compact_path) == model_path
+
+    save_model(store, "compactado", compact_path, model_path)
+    os.utime(compact_path, (0, 0))
+    assert resolve_model_path(model_path, compact_path) == compact_path
+    assert resolve_model_path(model_path) == model_path
+    assert store.get("model") == "compactado"
+
+    record_active_model(compact_path, model_path, cascade=True)
+    assert read_active_model(model_path)["cascade"]
+    save_model(store, "treinado", model_path, model_path)
+    assert resolve_model_path(model_path, compact_path) == model_path
+    assert "cascade" not in read_active_model(model_path)
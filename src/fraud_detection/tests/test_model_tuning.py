@@ -0,0 +1,73 @@
+"""
+Módulo de teste para a otimização de hiperparâmetros.
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import optuna
+from fraud_detection.components.model_tuning import (
+    ModelTuning,
+    TUNED_PARAMS,
+    _study_storage,
+)
+from fraud_detection.constants import PARAMS_FILE_PATH
+from fraud_detection.entity.config_entity import ModelTuningConfig
+from fraud_detection.utils.artifact_store import ArtifactStore
+from fraud_detection.utils.commons import read_yaml
+
+
+def test_model_tuning_resumes_and_writes_params(tmp_path):
+    """
+    O estudo deve ser retomado do journal, completando apenas os trials
+    restantes, e os melhores parâmetros devem ser escritos no params.yaml
+    mantendo os parâmetros não otimizados.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(1000, 3)), columns=["a", "b", "c"])
+    y = pd.Series((X["a"] + rng.normal(size=1000) > 1).astype(int))
+
+    params_path = tmp_path / "params.yaml"
+    shutil.copy(PARAMS_FILE_PATH, params_path)
+
+    config = ModelTuningConfig(
+        root_path=tmp_path,
+        train_x_data_path=None,
+        train_y_data_path=None,
+        dataset_cache_path=tmp_path / "datasets",
+        categorical_features_path=tmp_path / "categorical_features.json",
+        params_path=params_path,
+        study_name="test",
+        storage_path=tmp_path / "journal.log",
+        n_trials=2,
+        n_workers=1,
+        validation_size=0.2,
+        pruning_interval=10,
+    )
+    store = ArtifactStore()
+    store.put("X_train_transformed", X)
+    store.put("y_train", y)
+
+    ModelTuning(config, store=store).tune()
+
+    # Retomada com features categóricas, sem o Dataset binário
+    X["c"] = rng.integers(0, 5, len(X))
+    store.put("X_train_transformed", X)
+    store.put("categorical_features", ["c"])
+    best_params = ModelTuning(
+        ModelTuningConfig(**{**config.__dict__, "n_trials": 3}), store=store
+    ).tune()
+    store.close()
+
+    study = optuna.load_study(
+        study_name="test", storage=_study_storage(config.storage_path)
+    )
+    assert len(study.trials) == 3, "Estudo não retomado"
+
+    params = read_yaml(params_path).LGBMClassifier
+    assert {name: params[name] for name in TUNED_PARAMS} == best_params
+    assert (
+        params.scale_pos_weight
+        == read_yaml(PARAMS_FILE_PATH).LGBMClassifier.scale_pos_weight
+    ), "Parâmetro fixo alterado"
@@ -0,0 +1,79 @@
+"""
+Módulo de teste para o perfilamento das etapas do treinamento.
+"""
+
+import io
+import json
+import multiprocessing
+
+import pandas as pd
+from fraud_detection.components.chunked_processing import profiled_chunks
+from fraud_detection.utils.profiling import Profiler, profile_step
+
+
+def test_profiler_records_stage_steps(tmp_path):
+    """
+    Subetapas devem ser acumuladas na etapa em execução e ignoradas fora
+    do perfilamento.
+    """
+    profiler = Profiler()
+
+    with profile_step("read_csv"):
+        pass
+
+    with profiler.stage("Data Transformation"):
+        for _ in range(2):
+            with profile_step("read_csv"):
+                sum(range(1000))
+    profiler.skip("Model Trainer")
+
+    profiler.save(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json", "r", encoding="UTF-8") as f:
+        report = json.load(f)
+
+    stage, skipped = report["stages"]
+    assert stage["steps"]["read_csv"]["calls"] == 2, "Subetapas não somadas"
+    assert stage["wall_seconds"] >= stage["steps"]["read_csv"]["wall_seconds"]
+    assert stage["peak_rss_bytes"] > 0
+    assert skipped == {"name": "Model Trainer", "status": "reused"}
+    assert report["total"]["wall_seconds"] == stage["wall_seconds"]
+
+
+def test_profiler_records_children_cpu():
+    """
+    A CPU de um processo filho finalizado dentro da etapa deve ser
+    contabilizada na etapa e na subetapa.
+    """
+    profiler = Profiler()
+
+    with profiler.stage("Model Tuning"):
+        with profile_step("pool"):
+            process = multiprocessing.get_context("spawn").Process(
+                target=sum, args=(range(3_000_000),)
+            )
+            process.start()
+            process.join()
+
+    stage = profiler.report()["stages"][0]
+    assert stage["children_cpu_seconds"] > 0, "CPU do processo filho ausente"
+    assert stage["steps"]["pool"]["children_cpu_seconds"] > 0
+
+
+def test_profiled_chunks_record_each_read():
+    """
+    A leitura de cada bloco, realizada na iteração do leitor, deve ser
+    medida na subetapa, incluindo a chamada que encerra a leitura.
+    """
+    profiler = Profiler()
+    csv = "a,b\n" + "".join(f"{row},{row * 2}\n" for row in range(10))
+
+    with profiler.stage("Data Transformation"):
+        chunks = list(
+            profiled_chunks(
+                pd.read_csv(io.StringIO(csv), chunksize=4), "read_csv"
+            )
+        )
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    steps = profiler.report()["stages"][0]["steps"]
+    assert steps["read_csv"]["calls"] == 4
@@ -0,0 +1,39 @@
+"""
+Módulo de teste para o sketch de quantis aproximados.
+"""
+
+import numpy as np
+from fraud_detection.utils.quantile_sketch import KLLSketch
+
+
+def test_kll_sketch_exact_small_data():
+    """Sem compactação o sketch deve retornar a mediana exata"""
+    sketch = KLLSketch(error=0.01)
+    sketch.update([3, 1, np.nan, 4, 2])
+
+    assert sketch.count == 4, "Valores ausentes não ignorados"
+    assert sketch.median() == 2.5, "Mediana diferente da exata"
+
+
+def test_kll_sketch_merge_error():
+    """
+    Sketches calculados em partes e mesclados devem respeitar o erro
+    de rank configurado, utilizando memória limitada.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.exponential(10, 200_000)
+
+    sketches = [
+        KLLSketch(error=0.01, random_state=seed).update(part)
+        for seed, part in enumerate(np.array_split(values, 8))
+    ]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    assert merged.count == len(values), "Contagem incorreta após mescla"
+    assert len(merged) < 2_000, "Sketch armazenando valores em excesso"
+
+    for q in [0.1, 0.5, 0.9]:
+        rank = (values < merged.quantile(q)).mean()
+        assert abs(rank - q) < 0.01, f"Erro de rank excedido para q={q}"
@@ -0,0 +1,98 @@
+"""
+Módulo de teste para a leitura tipada dos dados brutos.
+"""
+
+import numpy as np
+import pandas as pd
+from fraud_detection.utils.raw_data import (
+    raw_data_mark,
+    read_new_raw_data,
+    read_raw_data,
+)
+
+SCHEMA = {
+    "score_1": "int8",
+    "score_2": "float64",
+    "pais": "category",
+    "produto": "category",
+    "data_compra": "datetime64[ns]",
+}
+
+
+def test_read_raw_data_schema_types(tmp_path):
+    """
+    Os dados devem ser lidos com os tipos do schema, ignorando as colunas
+    não solicitadas.
+    """
+    path = tmp_path / "dados.csv"
+    pd.DataFrame(
+        {
+            "score_1": [1, 4],
+            "score_2": [0.5, np.nan],
+            "pais": ["BR", None],
+            "produto": ["a", "b"],
+            "data_compra": ["2020-03-01 10:00:00", "2020-03-02 22:30:00"],
+        }
+    ).to_csv(path, index=False)
+
+    data = read_raw_data(
+        path,
+        SCHEMA,
+        usecols=["score_1", "score_2", "pais", "data_compra"],
+        downcast_floats=True,
+    )
+
+    assert "produto" not in data.columns, "Coluna ignorada foi lida"
+    assert data["score_1"].dtype == np.int8
+    assert data["score_2"].dtype == np.float32, "Float não convertido"
+    assert isinstance(data["pais"].dtype, pd.CategoricalDtype)
+    assert data["pais"].isna().tolist() == [False, True]
+    assert data["data_compra"].dt.hour.tolist() == [10, 22]
+
+
+def test_read_new_raw_data(tmp_path):
+    """
+    Apenas as linhas completas adicionadas após a marca de leitura devem
+    ser lidas.
+    """
+    path = tmp_path / "dados.csv"
+    path.write_text("score_1,pais\n1,BR\n", encoding="UTF-8")
+    mark = raw_data_mark(path)
+
+    data, offset = read_new_raw_data(
+        path, SCHEMA, mark["bytes"], usecols=mark["columns"]
+    )
+    assert data is None and offset == mark["bytes"], "Linhas inexistentes"
+
+    with open(path, "a", encoding="UTF-8") as f:
+        f.write("2,US\n3,A")
+
+    data, offset = read_new_raw_data(
+        path, SCHEMA, mark["bytes"], usecols=mark["columns"]
+    )
+    assert data["score_1"].tolist() == [2], "Linha incompleta foi lida"
+    assert isinstance(data["pais"].dtype, pd.CategoricalDtype)
+    assert offset == mark["bytes"] + len("2,US\n")
+
+
+def test_read_new_raw_data_chunks(tmp_path, monkeypatch):
+    """
+    Com chunksize, as linhas adicionadas devem ser lidas em blocos do
+    arquivo, inclusive quando a última linha completa está a mais de um
+    bloco de leitura do final.
+    """
+    monkeypatch.setattr("fraud_detection.utils.raw_data.READ_BLOCK_SIZE", 4)
+    path = tmp_path / "dados.csv"
+    path.write_text("score_1,pais\n1,BR\n", encoding="UTF-8")
+    mark = raw_data_mark(path)
+
+    with open(path, "a", encoding="UTF-8") as f:
+        f.write("2,US\n3,AR\n4,BR\n\n5,ARGENTINA")
+
+    data, offset = read_new_raw_data(
+        path, SCHEMA, mark["bytes"], usecols=mark["columns"], chunksize=2
+    )
+    chunks = list(data)
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks)["score_1"].tolist() == [2, 3, 4]
+    assert offset == mark["bytes"] + len("2,US\n3,AR\n4,BR\n\n")
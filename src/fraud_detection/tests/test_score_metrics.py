@@ -0,0 +1,112 @@
+"""
+Módulo de teste para as métricas calculadas a partir das probabilidades.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+import lightgbm as lgb
+from sklearn.metrics import (
+    average_precision_score,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+    roc_curve,
+)
+from fraud_detection.components.model_trainer import BoosterClassifier
+from fraud_detection.components.score_metrics import (
+    SCORE_METRICS,
+    bootstrap_intervals,
+    cached_scores,
+    ranking_curves,
+    score_metrics,
+)
+
+
+def _scores(rng, rows=3000):
+    """Rótulos, probabilidades com empates e valores sintéticos."""
+    y = (rng.random(rows) < 0.05).astype(int)
+    scores = np.round(np.clip(0.3 * y + 0.7 * rng.random(rows), 0, 1), 2)
+    values = rng.uniform(10, 500, size=rows)
+    return y, scores, values
+
+
+def test_score_metrics_match_sklearn():
+    """
+    As métricas obtidas com uma única ordenação devem ser iguais às do
+    scikit-learn, inclusive com probabilidades empatadas.
+    """
+    rng = np.random.default_rng(42)
+    y, scores, values = _scores(rng)
+    declined = scores > 0.5
+
+    metrics = score_metrics(y, scores, values)
+    assert metrics["auc"] == pytest.approx(roc_auc_score(y, scores))
+    assert metrics["average_precision"] == pytest.approx(
+        average_precision_score(y, scores)
+    )
+    assert metrics["precision"] == pytest.approx(precision_score(y, declined))
+    assert metrics["recall"] == pytest.approx(recall_score(y, declined))
+    assert metrics["f1"] == pytest.approx(f1_score(y, declined))
+    assert metrics["revenue"] == pytest.approx(
+        0.1 * values[~declined & (y == 0)].sum()
+        - values[~declined & (y == 1)].sum()
+    )
+
+    curves = ranking_curves(y, scores)
+    fpr, tpr, thresholds = roc_curve(y, scores, drop_intermediate=False)
+    np.testing.assert_allclose(curves["threshold"], thresholds[1:])
+    np.testing.assert_allclose(curves["fpr"], fpr[1:])
+    np.testing.assert_allclose(curves["tpr"], tpr[1:])
+
+
+def test_bootstrap_intervals_do_not_depend_on_n_jobs():
+    """
+    Os intervalos devem conter as métricas e ser os mesmos para qualquer
+    quantidade de processos, a partir da mesma semente.
+    """
+    rng = np.random.default_rng(42)
+    y, scores, values = _scores(rng)
+    config = SimpleNamespace(
+        bootstrap_resamples=200,
+        bootstrap_confidence=0.9,
+        bootstrap_seed=7,
+        bootstrap_n_jobs=1,
+    )
+
+    intervals = bootstrap_intervals(y, scores, values, config)
+    metrics = score_metrics(y, scores, values)
+    assert list(intervals) == list(SCORE_METRICS)
+    for name, interval in intervals.items():
+        assert interval["lower"] <= metrics[name] <= interval["upper"]
+
+    config.bootstrap_n_jobs = 2
+    assert bootstrap_intervals(y, scores, values, config) == intervals
+
+
+def test_cached_scores_are_reused(tmp_path):
+    """
+    As probabilidades devem ser reutilizadas para o mesmo modelo e dados, e
+    calculadas novamente para outro modelo.
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(500, 2)), columns=["a", "b"])
+    y = (X["a"] > 0).astype(int)
+    booster = lgb.train(
+        {"objective": "binary", "verbose": -1}, lgb.Dataset(X, label=y), 10
+    )
+    model = BoosterClassifier(booster)
+
+    scores = cached_scores(model, X, tmp_path)
+    np.testing.assert_allclose(scores, model.predict_proba(X)[:, 1])
+    assert len(list(tmp_path.iterdir())) == 1
+
+    np.testing.assert_array_equal(cached_scores(model, X, tmp_path), scores)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    shifted = BoosterClassifier(booster, score_offset=-1.0)
+    cached_scores(shifted, X, tmp_path)
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,69 @@
+"""
+Módulo de teste para a execução incremental das etapas do treinamento.
+"""
+
+from types import SimpleNamespace
+
+from fraud_detection.utils.stage_graph import Stage, StageRunner
+
+
+def _run_all(runner):
+    """Executa o grafo como o main.py, retornando as etapas executadas."""
+    for stage in runner.stages:
+        if runner.is_up_to_date(stage):
+            runner.reuse(stage)
+        else:
+            runner.run(stage)
+    runner.save_state()
+    return [key for key in runner.fingerprints if key in runner.executed]
+
+
+def test_stage_runner_reuses_up_to_date_stages(tmp_path):
+    """
+    Etapas inalteradas devem ser reutilizadas, e alterações nas entradas,
+    nas configurações ou o --force devem executar a etapa e as seguintes.
+    """
+    raw_data = tmp_path / "dados.csv"
+    raw_data.write_text("a,b\n1,2\n", encoding="UTF-8")
+    output = tmp_path / "saida.txt"
+    config = SimpleNamespace(params=SimpleNamespace(model={"depth": 3}))
+
+    stages = [
+        Stage(
+            key="prepare",
+            name="Prepare",
+            function=lambda: output.write_text("ok", encoding="UTF-8"),
+            inputs=(str(raw_data),),
+            outputs=(str(output),),
+        ),
+        Stage(
+            key="train",
+            name="Train",
+            function=lambda: None,
+            depends_on=("prepare",),
+            params=("params.model",),
+        ),
+    ]
+    state_path = tmp_path / "stage_state.json"
+
+    def run(force=None):
+        return _run_all(StageRunner(stages, config, state_path, force))
+
+    assert run() == ["prepare", "train"]
+    assert not run(), "Etapas atualizadas foram executadas"
+
+    config.params.model = {"depth": 4}
+    assert run() == ["train"], "Alteração de configuração ignorada"
+
+    with open(raw_data, "a", encoding="UTF-8") as f:
+        f.write("3,4\n")
+    assert run() == ["prepare", "train"], "Alteração dos dados ignorada"
+
+    assert run(force=["prepare"]) == ["prepare", "train"]
+
+    output.unlink()
+    assert run() == ["prepare", "train"], "Saída ausente não detectada"
+
+    runner = StageRunner(stages, config, state_path)
+    _run_all(runner)
+    assert "2 etapa(s) reutilizada(s)" in runner.summary()
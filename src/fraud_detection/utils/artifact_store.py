@@ -0,0 +1,131 @@
+"""
+Módulo de armazenamento em memória dos artefatos do pipeline de treinamento.
+
+Quando as etapas são executadas em sequência no mesmo processo (main.py),
+os artefatos produzidos por uma etapa (DataFrames, arrays e objetos
+ajustados) são repassados diretamente às etapas seguintes, sem releitura do
+disco. A escrita em disco continua ocorrendo, porém em segundo plano.
+
+Classes
+-------
+- ArtifactStore: Armazena artefatos em memória e persiste em segundo plano.
+
+Funções
+-------
+- load_artifact: Obtém um artefato da memória ou o carrega do disco.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from fraud_detection import logger
+
+
+class ArtifactStore:
+    """
+    Armazena artefatos em memória, compartilhados entre as etapas do
+    pipeline, e executa a persistência em disco em threads de segundo plano.
+
+    Os artefatos armazenados não devem ser alterados pelas etapas que os
+    consomem, uma vez que são compartilhados sem cópia.
+
+    Args:
+        max_workers (int): Quantidade de threads para persistência.
+    """
+
+    def __init__(self, max_workers=4):
+        self.artifacts = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending = []
+
+    def put(self, name, value):
+        """
+        Armazena um artefato em memória.
+
+        Args:
+            name (str): Nome do artefato.
+            value (object): Artefato a ser armazenado.
+        """
+        self.artifacts[name] = value
+
+    def get(self, name, default=None):
+        """
+        Obtém um artefato armazenado em memória.
+
+        Args:
+            name (str): Nome do artefato.
+            default (object): Valor retornado caso o artefato não exista.
+
+        Returns:
+            object: Artefato armazenado.
+        """
+        return self.artifacts.get(name, default)
+
+    def __contains__(self, name):
+        return name in self.artifacts
+
+    def get_or_load(self, name, loader):
+        """
+        Obtém um artefato da memória, ou o carrega e armazena caso ainda
+        não esteja disponível.
+
+        Args:
+            name (str): Nome do artefato.
+            loader (callable): Função que carrega o artefato do disco.
+
+        Returns:
+            object: Artefato armazenado.
+        """
+        if name not in self.artifacts:
+            self.artifacts[name] = loader()
+        return self.artifacts[name]
+
+    def persist(self, function, *args, **kwargs):
+        """
+        Agenda a persistência de artefatos em segundo plano.
+
+        Args:
+            function (callable): Função responsável pela escrita em disco.
+            *args: Argumentos da função.
+            **kwargs: Argumentos nomeados da função.
+        """
+        self.pending.append(self.executor.submit(function, *args, **kwargs))
+
+    def wait(self):
+        """
+        Aguarda a finalização de todas as persistências agendadas.
+        Erros ocorridos em segundo plano são lançados nesta chamada.
+        """
+        pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+        if pending:
+            logger.info(
+                "Persistência de %s artefatos finalizada", len(pending)
+            )
+
+    def close(self):
+        """Aguarda as persistências pendentes e finaliza as threads."""
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown()
+
+
+def load_artifact(store, name, loader):
+    """
+    Obtém um artefato do armazenamento em memória, quando disponível,
+    ou o carrega do disco. Permite que os componentes funcionem tanto
+    em conjunto no main.py quanto executados de forma independente.
+
+    Args:
+        store (ArtifactStore): Armazenamento em memória, pode ser None.
+        name (str): Nome do artefato.
+        loader (callable): Função que carrega o artefato do disco.
+
+    Returns:
+        object: Artefato obtido.
+    """
+    if store is None:
+        return loader()
+    return store.get_or_load(name, loader)
@@ -0,0 +1,408 @@
+"""
+Módulo para leitura e escrita dos artefatos tabulares do pipeline.
+
+Os dados divididos e transformados são salvos em formato colunar binário
+(Feather ou Parquet), mantendo os tipos das colunas e evitando o custo de
+interpretação de texto do CSV, que continua disponível como exportação.
+Ao salvar um artefato, os arquivos de mesmo nome em outros formatos são
+removidos, de forma que a troca de formato não mantém dados antigos que
+seriam encontrados antes dos novos.
+
+Funções
+-------
+- resolve_artifact_path: Encontra o arquivo de um artefato salvo.
+- remove_other_formats: Remove os arquivos do artefato em outros formatos.
+- save_frame: Salva um DataFrame no formato escolhido.
+- save_frames: Salva vários DataFrames de forma concorrente.
+- load_frame: Carrega um artefato, com memory map quando possível.
+- append_frame: Adiciona novas linhas a um artefato já salvo.
+- artifact_parts: Arquivos que compõem um artefato.
+
+Classes
+-------
+- FrameWriter: Escreve um artefato em blocos, adicionando um bloco por vez.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import feather
+
+ARTIFACT_FORMATS = ("feather", "parquet", "csv")
+
+
+def resolve_artifact_path(path):
+    """
+    Encontra o arquivo de um artefato. O caminho pode conter a extensão ou
+    apenas o nome base, sendo buscados os formatos na ordem de
+    ARTIFACT_FORMATS.
+
+    Args:
+        path (Path): Caminho do artefato, com ou sem extensão.
+
+    Raises:
+        FileNotFoundError: Caso nenhum arquivo do artefato seja encontrado.
+
+    Returns:
+        Path: Caminho do arquivo existente.
+    """
+    path = Path(path)
+    if path.suffix.lstrip(".") in ARTIFACT_FORMATS and path.exists():
+        return path
+
+    for file_format in ARTIFACT_FORMATS:
+        candidate = path.with_name(f"{path.stem}.{file_format}")
+        if candidate.exists():
+            return candidate
+
+    raise FileNotFoundError(f"Artefato não encontrado: {path}")
+
+
+def artifact_parts(path):
+    """
+    Retorna os arquivos que compõem um artefato: o arquivo principal e as
+    partes adicionadas por append_frame, em ordem de escrita.
+
+    Args:
+        path (Path): Caminho do artefato, com ou sem extensão.
+
+    Returns:
+        list(Path): Arquivos do artefato.
+    """
+    path = resolve_artifact_path(path)
+    return [path] + sorted(
+        path.parent.glob(f"{path.stem}.part-*{path.suffix}")
+    )
+
+
+def _remove_parts(path):
+    """
+    Remove as partes adicionadas a um artefato, utilizado quando o arquivo
+    principal é escrito novamente.
+
+    Args:
+        path (Path): Caminho do arquivo principal com extensão.
+    """
+    for part in path.parent.glob(f"{path.stem}.part-*{path.suffix}"):
+        part.unlink()
+
+
+def remove_other_formats(path, formats):
+    """
+    Remove os arquivos de um artefato, e as suas partes, salvos em formatos
+    diferentes dos informados, que seriam encontrados por
+    resolve_artifact_path no lugar dos arquivos escritos.
+
+    Args:
+        path (Path): Caminho do artefato, com ou sem extensão.
+        formats (list(str)): Formatos escritos do artefato.
+    """
+    path = Path(path)
+    stem = (
+        path.stem if path.suffix.lstrip(".") in ARTIFACT_FORMATS else path.name
+    )
+    for file_format in ARTIFACT_FORMATS:
+        if file_format in formats:
+            continue
+        stale = path.with_name(f"{stem}.{file_format}")
+        _remove_parts(stale)
+        stale.unlink(missing_ok=True)
+
+
+def _decoded_schema(schema):
+    """
+    Substitui os tipos dictionary (category do pandas) do esquema pelo tipo
+    dos seus valores.
+
+    Args:
+        schema (pa.Schema): Esquema original.
+
+    Returns:
+        pa.Schema: Esquema sem colunas do tipo dictionary.
+    """
+    return pa.schema(
+        [
+            (
+                field.with_type(field.type.value_type)
+                if pa.types.is_dictionary(field.type)
+                else field
+            )
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+
+def _to_table(frame):
+    """
+    Converte um DataFrame ou Series em tabela do pyarrow, sem o índice.
+
+    Args:
+        frame (pd.DataFrame | pd.Series): Dados a serem convertidos.
+
+    Returns:
+        pa.Table: Tabela do pyarrow.
+    """
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def save_frame(frame, path, file_format="feather", compression=None):
+    """
+    Salva um DataFrame no formato escolhido, removendo os arquivos de mesmo
+    nome em outros formatos.
+
+    Args:
+        frame (pd.DataFrame | pd.Series): Dados a serem salvos.
+        path (Path): Caminho do arquivo sem extensão.
+        file_format (str): "feather", "parquet" ou "csv".
+        compression (str): Compressão do arquivo, por exemplo "zstd" ou\
+                           "lz4". Feather sem compressão permite leitura\
+                           por memory map.
+
+    Returns:
+        Path: Caminho do arquivo salvo.
+    """
+    remove_other_formats(path, [file_format])
+    return _write_frame(frame, path, file_format, compression)
+
+
+def _write_frame(frame, path, file_format, compression):
+    """
+    Escreve um DataFrame no formato escolhido, sem remover os arquivos em
+    outros formatos.
+
+    Args:
+        frame (pd.DataFrame | pd.Series): Dados a serem salvos.
+        path (Path): Caminho do arquivo sem extensão.
+        file_format (str): "feather", "parquet" ou "csv".
+        compression (str): Compressão do arquivo.
+
+    Returns:
+        Path: Caminho do arquivo salvo.
+    """
+    path = Path(path).with_suffix(f".{file_format}")
+    _remove_parts(path)
+
+    if file_format == "feather":
+        feather.write_feather(
+            _to_table(frame),
+            path,
+            compression=compression or "uncompressed",
+        )
+    elif file_format == "parquet":
+        pq.write_table(_to_table(frame), path, compression=compression)
+    elif file_format == "csv":
+        frame.to_csv(path, index=False, compression=compression)
+    else:
+        raise ValueError(f"Formato de artefato inválido: {file_format}")
+
+    return path
+
+
+def save_frames(
+    frames,
+    directory,
+    file_format="feather",
+    compression=None,
+    export_csv=False,
+):
+    """
+    Salva vários DataFrames de forma concorrente, um arquivo por nome,
+    removendo os arquivos de mesmo nome em outros formatos. A escrita do
+    pyarrow libera o GIL, permitindo o uso de threads.
+
+    Args:
+        frames (dict): Dicionário contendo nome e dados a serem salvos.
+        directory (Path): Diretório onde os arquivos serão salvos.
+        file_format (str): Formato dos arquivos.
+        compression (str): Compressão dos arquivos.
+        export_csv (bool): Também salva uma cópia em CSV de cada arquivo.
+
+    Returns:
+        dict: Caminhos dos arquivos salvos por nome.
+    """
+    tasks = [(name, file_format, compression) for name in frames]
+    if export_csv and file_format != "csv":
+        tasks += [(name, "csv", None) for name in frames]
+
+    formats = {task_format for _, task_format, _ in tasks}
+    for name in frames:
+        remove_other_formats(os.path.join(directory, name), formats)
+
+    with ThreadPoolExecutor(max_workers=len(tasks) or 1) as executor:
+        futures = {
+            (name, task_format): executor.submit(
+                _write_frame,
+                frames[name],
+                os.path.join(directory, name),
+                task_format,
+                task_compression,
+            )
+            for name, task_format, task_compression in tasks
+        }
+
+    return {
+        name: future.result()
+        for (name, task_format), future in futures.items()
+        if task_format == file_format
+    }
+
+
+def load_frame(path, memory_map=True):
+    """
+    Carrega um artefato salvo por save_frame ou FrameWriter, incluindo as
+    partes adicionadas por append_frame.
+
+    Arquivos Feather são lidos por memory map, e as colunas numéricas sem
+    valores ausentes são convertidas para o pandas sem cópia quando o
+    arquivo não possui compressão.
+
+    Args:
+        path (Path): Caminho do artefato, com ou sem extensão.
+        memory_map (bool): Utiliza memory map na leitura do Feather.
+
+    Returns:
+        pd.DataFrame: Dados carregados com os tipos originais.
+    """
+    paths = artifact_parts(path)
+    suffix = paths[0].suffix
+
+    if suffix == ".csv":
+        return pd.read_csv(paths[0])
+
+    read_table = feather.read_table if suffix == ".feather" else pq.read_table
+    tables = [read_table(part, memory_map=memory_map) for part in paths]
+    if len(tables) == 1:
+        return tables[0].to_pandas(split_blocks=True)
+
+    # As partes podem ter categorias diferentes, assim as colunas do tipo
+    # category são unidas pelos valores e convertidas após a leitura.
+    category_columns = [
+        field.name
+        for field in tables[0].schema
+        if pa.types.is_dictionary(field.type)
+    ]
+    table = pa.concat_tables(
+        [table.cast(_decoded_schema(table.schema)) for table in tables],
+        promote_options="permissive",
+    )
+    frame = table.to_pandas(split_blocks=True)
+    for col in category_columns:
+        frame[col] = frame[col].astype("category")
+    return frame
+
+
+def append_frame(frame, path, compression=None):
+    """
+    Adiciona novas linhas a um artefato já salvo, sem reescrever os dados
+    existentes. Em CSV as linhas são adicionadas ao final do arquivo, já em
+    Feather e Parquet é criada uma nova parte do artefato, lida em conjunto
+    com o arquivo principal por load_frame.
+
+    Args:
+        frame (pd.DataFrame | pd.Series): Novas linhas.
+        path (Path): Caminho do artefato, com ou sem extensão.
+        compression (str): Compressão da nova parte.
+
+    Returns:
+        Path: Caminho do arquivo escrito.
+    """
+    parts = artifact_parts(path)
+    main_path = parts[0]
+
+    if main_path.suffix == ".csv":
+        frame.to_csv(main_path, mode="a", header=False, index=False)
+        return main_path
+
+    part_path = main_path.with_name(
+        f"{main_path.stem}.part-{len(parts):05d}{main_path.suffix}"
+    )
+    if main_path.suffix == ".feather":
+        feather.write_feather(
+            _to_table(frame),
+            part_path,
+            compression=compression or "uncompressed",
+        )
+    else:
+        pq.write_table(_to_table(frame), part_path, compression=compression)
+    return part_path
+
+
+class FrameWriter:
+    """
+    Escreve um artefato em blocos, permitindo salvar dados maiores que a
+    memória. Os blocos seguintes são convertidos para o esquema do primeiro.
+
+    Colunas do tipo category são salvas com os seus valores, uma vez que as
+    categorias de cada bloco podem ser diferentes.
+
+    Args:
+        path (Path): Caminho do arquivo sem extensão.
+        file_format (str): "feather", "parquet" ou "csv".
+        compression (str): Compressão do arquivo.
+    """
+
+    def __init__(self, path, file_format="feather", compression=None):
+        if file_format not in ARTIFACT_FORMATS:
+            raise ValueError(f"Formato de artefato inválido: {file_format}")
+
+        self.path = Path(path).with_suffix(f".{file_format}")
+        _remove_parts(self.path)
+        self.file_format = file_format
+        self.compression = compression
+        self.schema = None
+        self.writer = None
+
+    def write(self, frame):
+        """
+        Adiciona um bloco de dados ao arquivo.
+
+        Args:
+            frame (pd.DataFrame | pd.Series): Bloco de dados.
+        """
+        if self.file_format == "csv":
+            frame.to_csv(
+                self.path,
+                mode="w" if self.schema is None else "a",
+                header=self.schema is None,
+                index=False,
+            )
+            self.schema = True
+            return
+
+        table = _to_table(frame)
+        if self.schema is None:
+            self.schema = _decoded_schema(table.schema)
+            table = table.cast(self.schema)
+            self.writer = self._open_writer()
+        else:
+            table = table.cast(self.schema)
+
+        self.writer.write_table(table)
+
+    def _open_writer(self):
+        """
+        Cria o escritor do pyarrow para o formato do arquivo.
+
+        Returns:
+            Escritor de Parquet ou de Arrow IPC (Feather).
+        """
+        if self.file_format == "parquet":
+            return pq.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(self.path, self.schema, options=options)
+
+    def close(self):
+        """Finaliza o arquivo, obrigatório para Feather e Parquet."""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
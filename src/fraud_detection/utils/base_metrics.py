@@ -4,6 +4,8 @@ Módulo auxiliar para calcular as métricas do negócio.
 Funções
 -------
 - calculate_revenue: Calcula o faturamento da amostra a partir de um limiar.
+- confusion_table: Calcula a matriz de confusão para vários limiares.
+- revenue_sweep: Calcula o faturamento da amostra para vários limiares.
 - find_best_threshold: Encontra o melhor limiar a partir da amostra
 - get_incoming_pressure_rate: Calcula a pressão de entrada de fraudes.
 - get_approval_rate: Calcula a taxa de aprovação.
@@ -11,9 +13,11 @@ Funções
 - get_precision: Calcula a precisão do modelo.
 - get_recall: Calcula a revocação do modelo.
 - get_false_positive_rate: Calcula a taxa de falsos positivos do modelo base.
+- metrics_table: Calcula os KPIs para vários limiares e colunas de score.
 - show_all_metrics: Exibe todas as métricas de avaliação do modelo base.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -25,6 +29,9 @@ class BaseMetrics:
     Possui funcionalidades para achar o melhor limiar de corte de avaliação,
     além de trazer métricas dos KPIs de interesse para a avaliação do modelo.
 
+    Os KPIs de um limiar são calculados em uma única passada pelos dados e
+    armazenados, considerando que os dados não são alterados.
+
     Iremos utilizar tais métricas para comparar com o novo modelo criado.
 
     Args:
@@ -49,6 +56,9 @@ class BaseMetrics:
         self.default_threshold = 75
         self.best_threshold = None
 
+        # KPIs já calculados de cada limiar
+        self.__metrics_cache = {}
+
     def __check_best_threshold(self):
         """
         Função que verifica se o melhor limiar foi calculado previamente.
@@ -104,38 +114,147 @@ class BaseMetrics:
 
         return total_income, total_fraud_accepted, total_revenue
 
-    def find_best_threshold(self):
+    def confusion_table(self, thresholds=None, score_column=None):
         """
-        Função que encontra o melhor limiar de corte para o modelo base.
+        Função que calcula a matriz de confusão e os valores das transações
+        aceitas para vários limiares com uma única ordenação dos scores.
 
-        O melhor limiar maximiza a receita gerada pelo modelo.
+        As somas acumuladas, em ordem crescente de score, das transações
+        legítimas e fraudulentas e de seus valores fornecem para cada limiar
+        as transações aceitas (score menor que o limiar). As demais,
+        inclusive as sem score, são declinadas.
+
+        VP: fraudes declinadas
+        FP: transações legítimas declinadas
+        VN: transações legítimas aceitas
+        FN: fraudes aceitas
+
+        Args:
+            thresholds (list): Limiares de score para aceitação. Caso vazio,\
+                               utiliza cada score distinto da amostra, além\
+                               de um limiar que aceita todas as transações.
+            score_column (str): Coluna de score avaliada. Caso vazio,\
+                                utiliza a coluna do modelo base.
+
+        Returns:
+            confusion_df (pd.DataFrame): Limiar, VP, FP, VN, FN e valores\
+                                         das transações legítimas e\
+                                         fraudulentas aceitas.
         """
 
-        revenue_list = []
-        for threshold in range(1, 100):
-            revenue_list.append(
-                self.calculate_revenue(threshold),
+        try:
+            scores = self.data[score_column or self.score_column].to_numpy(
+                dtype=float
             )
+            fraud = self.data[self.fraud_column].to_numpy()
+            values = self.data[self.value_column].to_numpy(dtype=float)
+        except KeyError as e:
+            raise KeyError(
+                f"Colunas não encontradas no DataFrame fornecido. {e}"
+            ) from e
+
+        # Scores ausentes ficam ao final e nunca são aceitos
+        order = np.argsort(scores, kind="stable")
+        scores = scores[order]
+        normal = fraud[order] == 0
+        fraudulent = fraud[order] == 1
+        values = np.nan_to_num(values[order])
+
+        cumulative = np.zeros((len(scores) + 1, 4))
+        np.cumsum(
+            np.column_stack(
+                [
+                    normal,
+                    fraudulent,
+                    np.where(normal, values, 0.0),
+                    np.where(fraudulent, values, 0.0),
+                ]
+            ),
+            axis=0,
+            out=cumulative[1:],
+        )
+
+        if thresholds is None:
+            thresholds = np.r_[np.unique(scores[~np.isnan(scores)]), np.inf]
+        thresholds = np.asarray(thresholds, dtype=float)
+        accepted = cumulative[
+            np.searchsorted(scores, thresholds, side="left")
+        ]
+
+        return pd.DataFrame(
+            {
+                "threshold": thresholds,
+                "vp": cumulative[-1, 1] - accepted[:, 1],
+                "fp": cumulative[-1, 0] - accepted[:, 0],
+                "vn": accepted[:, 0],
+                "fn": accepted[:, 1],
+                "normal_accepted": accepted[:, 2],
+                "fraud_accepted": accepted[:, 3],
+            }
+        )
+
+    def revenue_sweep(self, thresholds=None):
+        """
+        Função que calcula o faturamento da amostra para vários limiares com
+        uma única ordenação dos scores, a partir de confusion_table.
+
+        Utiliza as mesmas premissas e o mesmo critério de aceitação (score
+        menor que o limiar) de calculate_revenue.
+
+        Args:
+            thresholds (list): Limiares de score para aceitação. Caso vazio,\
+                               utiliza cada score distinto da amostra, além\
+                               de um limiar que aceita todas as transações.
 
-        revenue_df = pd.DataFrame(
-            revenue_list, columns=["income", "loss", "revenue"]
+        Returns:
+            revenue_df (pd.DataFrame): Limiar, ganhos, prejuízos e\
+                                       faturamento total de cada limiar.
+        """
+
+        confusion_df = self.confusion_table(thresholds)
+
+        # Multiplica-se por 0.1 pois apenas 10% do valor é recebido.
+        total_income = 0.1 * confusion_df["normal_accepted"]
+        total_fraud_accepted = confusion_df["fraud_accepted"]
+
+        return pd.DataFrame(
+            {
+                "threshold": confusion_df["threshold"],
+                "income": total_income,
+                "loss": total_fraud_accepted,
+                "revenue": total_income - total_fraud_accepted,
+            }
         )
-        self.best_threshold = revenue_df["revenue"].idxmax()
 
-        best_record = revenue_df.iloc[self.best_threshold]
-        best_income = best_record["income"]
-        minimum_loss = best_record["loss"]
-        best_revenue = best_record["revenue"]
+    def find_best_threshold(self, continuous=False):
+        """
+        Função que encontra o melhor limiar de corte para o modelo base.
+
+        O melhor limiar maximiza a receita gerada pelo modelo.
+
+        Args:
+            continuous (bool): Avalia cada score distinto da amostra, para\
+                               scores contínuos como probabilidades. Caso\
+                               contrário, avalia os limiares inteiros de 1\
+                               a 99.
+        """
+
+        revenue_df = self.revenue_sweep(
+            None if continuous else range(1, 100)
+        )
+
+        best_record = revenue_df.loc[revenue_df["revenue"].idxmax()]
+        self.best_threshold = best_record["threshold"]
+        if not continuous:
+            self.best_threshold = int(self.best_threshold)
 
         print(
-            "O limiar ótimo encontrado para a amostra é de: %s\n"
-            "Ganhos por transações aprovadas: R$ %.2f\n"
-            "Prejuízos com transações fraudulentas aprovadas: R$ %.2f\n"
-            "Receita gerada com limiar ótimo: R$ %.2f",
-            self.best_threshold,
-            best_income,
-            minimum_loss,
-            best_revenue,
+            "O limiar ótimo encontrado para a amostra é de: "
+            f"{self.best_threshold}\n"
+            f"Ganhos por transações aprovadas: R$ {best_record['income']:.2f}\n"
+            "Prejuízos com transações fraudulentas aprovadas: "
+            f"R$ {best_record['loss']:.2f}\n"
+            f"Receita gerada com limiar ótimo: R$ {best_record['revenue']:.2f}"
         )
 
         return self.best_threshold
@@ -159,6 +278,71 @@ class BaseMetrics:
 
         return incoming_pressure
 
+    def metrics_table(self, thresholds=None, score_columns=None):
+        """
+        Função que calcula os KPIs e o faturamento para vários limiares e
+        colunas de score, uma linha por coluna e limiar.
+
+        Cada coluna de score é ordenada uma única vez (confusion_table), e
+        os KPIs são derivados das contagens da matriz de confusão. As taxas
+        são percentuais, e são vazias quando não há transações no
+        denominador.
+
+        Args:
+            thresholds (list): Limiares de score para aceitação. Caso vazio,\
+                               utiliza cada score distinto de cada coluna.
+            score_columns (list): Colunas de score avaliadas. Caso vazio,\
+                                  utiliza a coluna do modelo base.
+
+        Returns:
+            metrics_df (pd.DataFrame): Coluna de score, limiar, matriz de\
+                                       confusão, KPIs e faturamento.
+        """
+
+        tables = []
+        for score_column in score_columns or [self.score_column]:
+            confusion_df = self.confusion_table(thresholds, score_column)
+            vp, fp = confusion_df["vp"], confusion_df["fp"]
+            vn, fn = confusion_df["vn"], confusion_df["fn"]
+            total = len(self.data)
+            income = 0.1 * confusion_df["normal_accepted"]
+
+            tables.append(
+                confusion_df.assign(
+                    score_column=score_column,
+                    approval_rate=(vn + fn) / total * 100,
+                    decline_rate=(vp + fp) / total * 100,
+                    precision=vp / (vp + fp) * 100,
+                    recall=vp / (vp + fn) * 100,
+                    false_positive_rate=fp / (fp + vn) * 100,
+                    income=income,
+                    loss=confusion_df["fraud_accepted"],
+                    revenue=income - confusion_df["fraud_accepted"],
+                )
+            )
+
+        metrics_df = pd.concat(tables, ignore_index=True)
+        return metrics_df[
+            ["score_column"]
+            + [col for col in metrics_df.columns if col != "score_column"]
+        ]
+
+    def __threshold_metrics(self):
+        """
+        Função que obtém os KPIs do melhor limiar, calculados uma única vez
+        por limiar e armazenados.
+
+        Returns:
+            metrics (pd.Series): Matriz de confusão, KPIs e faturamento.
+        """
+        best_threshold = self.__check_best_threshold()
+
+        if best_threshold not in self.__metrics_cache:
+            self.__metrics_cache[best_threshold] = self.metrics_table(
+                [best_threshold]
+            ).iloc[0]
+        return self.__metrics_cache[best_threshold]
+
     def get_approval_rate(self):
         """
         Função que calcula a taxa de aprovação.
@@ -169,12 +353,7 @@ class BaseMetrics:
         Returns:
             approval_rate (float): Taxa de aprovação.
         """
-        best_threshold = self.__check_best_threshold()
-
-        approved_count = self.data.loc[
-            self.data[self.score_column] < best_threshold
-        ].shape[0]
-        approval_rate = (approved_count / self.data.shape[0]) * 100
+        approval_rate = self.__threshold_metrics()["approval_rate"]
         print(f"Taxa de aprovação total é de {approval_rate:.2f}%")
 
         return approval_rate
@@ -185,17 +364,11 @@ class BaseMetrics:
 
         Calculada como a razão entre o número de transações declinadas\
         e o número total de transações.
-        
+
         Returns:
             decline_rate (float): Taxa de declínio.
         """
-
-        best_threshold = self.__check_best_threshold()
-
-        declined_count = self.data.loc[
-            self.data[self.score_column] > best_threshold
-        ].shape[0]
-        decline_rate = (declined_count / self.data.shape[0]) * 100
+        decline_rate = self.__threshold_metrics()["decline_rate"]
         print(f"Taxa de declínio total é de {decline_rate:.2f}%")
 
         return decline_rate
@@ -212,16 +385,7 @@ class BaseMetrics:
         Returns:
             precision (float): Taxa de precisão.
         """
-
-        best_threshold = self.__check_best_threshold()
-
-        declined_sales = self.data.loc[
-            self.data[self.score_column] > best_threshold
-        ]
-        vp = declined_sales.loc[(self.data[self.fraud_column] == 1)].shape[0]
-        fp = declined_sales.loc[(self.data[self.fraud_column] == 0)].shape[0]
-
-        precision = vp / (vp + fp) * 100
+        precision = self.__threshold_metrics()["precision"]
         print(f"A precisão do modelo é de {precision:.2f}%")
 
         return precision
@@ -238,23 +402,10 @@ class BaseMetrics:
         Returns:
             recall (float): Taxa de revocação.
         """
+        recall = self.__threshold_metrics()["recall"]
+        print(f"A revocação do modelo é de {recall:.2f}%")
 
-        best_threshold = self.__check_best_threshold()
-
-        declined_sales = self.data.loc[
-            self.data[self.score_column] > best_threshold
-        ]
-        vp = declined_sales.loc[(self.data[self.fraud_column] == 1)].shape[0]
-
-        accepted_sales = self.data.loc[
-            self.data[self.score_column] < best_threshold
-        ]
-        fn = accepted_sales.loc[(self.data[self.fraud_column] == 1)].shape[0]
-
-        precision = vp / (vp + fn) * 100
-        print(f"A revocação do modelo é de {precision:.2f}%")
-
-        return precision
+        return recall
 
     def get_false_positive_rate(self):
         """
@@ -268,19 +419,9 @@ class BaseMetrics:
         Returns:
             false_positive_rate (float): Taxa de falsos positivos.
         """
-        best_threshold = self.__check_best_threshold()
-
-        declined_sales = self.data.loc[
-            self.data[self.score_column] > best_threshold
+        false_positive_rate = self.__threshold_metrics()[
+            "false_positive_rate"
         ]
-        fp = declined_sales.loc[(self.data[self.fraud_column] == 0)].shape[0]
-
-        accepted_sales = self.data.loc[
-            self.data[self.score_column] < best_threshold
-        ]
-        vn = accepted_sales.loc[(self.data[self.fraud_column] == 0)].shape[0]
-
-        false_positive_rate = fp / (fp + vn) * 100
         print(f"A taxa de falsos positivos é de {false_positive_rate:.2f}%")
 
         return false_positive_rate
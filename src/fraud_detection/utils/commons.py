@@ -8,6 +8,7 @@ Funções
 - read_yaml: Lê um arquivo yaml e retorna um objeto ConfigBox.
 - create_directories: Cria diretórios de acordo com o caminhos passado.
 - save_json: Salva um arquivo json no caminho especificado.
+- save_yaml: Salva um arquivo yaml no caminho especificado.
 """
 
 import os
@@ -89,3 +90,20 @@ def save_json(path: Path, data: dict):
         json.dump(data, f, indent=4)
 
     logger.info("Dados salvos em arquivo JSON: %s", path)
+
+
+@ensure_annotations
+def save_yaml(path: Path, data: dict):
+    """
+    Salva um arquivo yaml no caminho especificado, mantendo a ordem das
+    chaves do dicionário.
+
+    Args:
+        path (str): Caminho para salvar o arquivo yaml.
+        data (dict): Dados a serem salvos no arquivo yaml.
+    """
+
+    with open(path, "w", encoding="UTF-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+
+    logger.info("Dados salvos em arquivo yaml: %s", path)
@@ -0,0 +1,234 @@
+"""
+Módulo de perfilamento (profiling) das etapas do treinamento.
+
+Com o main.py executado em --profile, cada etapa registra tempo de relógio,
+tempo de CPU, pico de memória residente (RSS) e bytes lidos e escritos pelo
+processo. Dentro das etapas, os componentes marcam subetapas com
+profile_step, que não possui efeito quando nenhum perfilamento está ativo.
+O relatório é salvo em JSON, permitindo comparar execuções.
+
+O tempo de CPU dos processos filhos, como os processos da otimização de
+hiperparâmetros e do bootstrap, é obtido do RUSAGE_CHILDREN e informado
+separadamente. O sistema contabiliza apenas processos filhos finalizados,
+assim os processos devem ser encerrados dentro da etapa. Subetapas podem
+ser medidas em threads, como as escritas em segundo plano, e o tempo de
+CPU do processo inclui todas as threads.
+
+As medidas de memória e de bytes utilizam /proc/self, disponível no Linux.
+Em outros sistemas o pico de RSS é obtido do resource, sem ser reiniciado a
+cada etapa, e os bytes não são informados.
+
+Classes
+-------
+- Profiler: Registra as medidas das etapas e subetapas.
+
+Funções
+-------
+- profile_step: Mede uma subetapa no perfilamento ativo.
+"""
+
+import json
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Perfilamento da etapa em execução, utilizado pelo profile_step
+_ACTIVE = {"profiler": None}
+
+
+def _reset_peak_rss():
+    """Reinicia o pico de RSS do processo (VmHWM), quando suportado."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="UTF-8") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_bytes():
+    """Pico de RSS do processo desde o último reinício, em bytes."""
+    try:
+        with open("/proc/self/status", "r", encoding="UTF-8") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    # ru_maxrss é informado em KB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _io_bytes():
+    """
+    Bytes lidos e escritos pelo processo em chamadas de sistema, incluindo
+    leituras atendidas pelo cache de páginas.
+    """
+    try:
+        with open("/proc/self/io", "r", encoding="UTF-8") as f:
+            counters = dict(line.split(":") for line in f)
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def _children_cpu_seconds():
+    """Tempo de CPU dos processos filhos finalizados, em segundos."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _difference(end, start):
+    """Diferença entre contadores, ou None caso indisponíveis."""
+    if end is None or start is None:
+        return None
+    return end - start
+
+
+class Profiler:
+    """
+    Registra tempo, CPU, memória e bytes de entrada e saída de cada etapa,
+    assim como o tempo das subetapas marcadas com profile_step.
+
+    Subetapas com o mesmo nome são acumuladas, informando a quantidade de
+    chamadas. Subetapas aninhadas são medidas de forma inclusiva.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.stages = []
+        self._steps = None
+        # Subetapas podem ser finalizadas em threads de escrita
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Mede uma etapa, ativando o perfilamento das subetapas.
+
+        Args:
+            name (str): Nome da etapa.
+        """
+        _reset_peak_rss()
+        read_start, written_start = _io_bytes()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        children_start = _children_cpu_seconds()
+
+        self._steps = {}
+        _ACTIVE["profiler"] = self
+        try:
+            yield
+        finally:
+            _ACTIVE["profiler"] = None
+            read_end, written_end = _io_bytes()
+            self.stages.append(
+                {
+                    "name": name,
+                    "status": "executed",
+                    "wall_seconds": time.perf_counter() - wall_start,
+                    "cpu_seconds": time.process_time() - cpu_start,
+                    "children_cpu_seconds": _children_cpu_seconds()
+                    - children_start,
+                    "peak_rss_bytes": _peak_rss_bytes(),
+                    "read_bytes": _difference(read_end, read_start),
+                    "written_bytes": _difference(written_end, written_start),
+                    "steps": self._steps,
+                }
+            )
+            with self._lock:
+                self._steps = None
+
+    def skip(self, name):
+        """
+        Registra uma etapa reutilizada, sem medidas.
+
+        Args:
+            name (str): Nome da etapa.
+        """
+        self.stages.append({"name": name, "status": "reused"})
+
+    @contextmanager
+    def step(self, name):
+        """
+        Mede uma subetapa da etapa em execução.
+
+        Args:
+            name (str): Nome da subetapa.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        children_start = _children_cpu_seconds()
+        try:
+            yield
+        finally:
+            measures = {
+                "wall_seconds": time.perf_counter() - wall_start,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "children_cpu_seconds": _children_cpu_seconds()
+                - children_start,
+            }
+            with self._lock:
+                # Subetapa finalizada após o fim da etapa é descartada
+                if self._steps is not None:
+                    step = self._steps.setdefault(
+                        name, {"calls": 0, **dict.fromkeys(measures, 0.0)}
+                    )
+                    step["calls"] += 1
+                    for key, value in measures.items():
+                        step[key] += value
+
+    def report(self):
+        """
+        Relatório com as medidas de cada etapa e o total da execução.
+
+        Returns:
+            dict: Relatório do perfilamento.
+        """
+        executed = [
+            stage for stage in self.stages if stage["status"] == "executed"
+        ]
+        return {
+            "started_at": self.started_at,
+            "total": {
+                "wall_seconds": sum(s["wall_seconds"] for s in executed),
+                "cpu_seconds": sum(s["cpu_seconds"] for s in executed),
+                "children_cpu_seconds": sum(
+                    s["children_cpu_seconds"] for s in executed
+                ),
+                "peak_rss_bytes": max(
+                    (s["peak_rss_bytes"] for s in executed), default=0
+                ),
+            },
+            "stages": self.stages,
+        }
+
+    def save(self, path):
+        """
+        Salva o relatório em JSON.
+
+        Args:
+            path (str): Caminho do arquivo do relatório.
+        """
+        with open(path, "w", encoding="UTF-8") as f:
+            json.dump(self.report(), f, indent=4)
+
+
+@contextmanager
+def profile_step(name):
+    """
+    Mede uma subetapa caso o perfilamento esteja ativo, senão apenas
+    executa o bloco.
+
+    Args:
+        name (str): Nome da subetapa, como "read_csv".
+    """
+    profiler = _ACTIVE["profiler"]
+    if profiler is None:
+        yield
+        return
+
+    with profiler.step(name):
+        yield
@@ -0,0 +1,185 @@
+"""
+Módulo com sketch de quantis aproximados e mesclável (KLL).
+
+Permite estimar quantis, como a mediana, sem manter todos os valores em
+memória e sem ordená-los por completo. Sketches calculados em blocos de dados
+ou processos diferentes podem ser mesclados em um único resultado.
+
+Referência: Karnin, Lang e Liberty. "Optimal Quantile Approximation in
+Streams" (2016).
+
+Classes
+-------
+- KLLSketch: Sketch de quantis com erro de rank configurável.
+"""
+
+import math
+
+import numpy as np
+
+
+class KLLSketch:
+    """
+    Sketch de quantis KLL implementado com arrays numpy.
+
+    Os valores são armazenados em níveis (compactadores), em que cada item do
+    nível h representa 2^h valores originais. Quando a capacidade total é
+    excedida, o nível mais baixo cheio é ordenado e metade dos seus itens é
+    promovida ao nível seguinte, escolhendo aleatoriamente os itens pares ou
+    ímpares.
+
+    O erro de rank normalizado é aproximadamente inversamente proporcional ao
+    parâmetro k, que é calculado a partir do erro desejado.
+
+    Args:
+        error (float): Erro de rank normalizado aproximado aceitável, por\
+                       exemplo 0.01 para 1% dos valores.
+        random_state (int): Semente para escolha dos itens compactados.
+    """
+
+    # Constante empírica que relaciona k ao erro de rank do KLL
+    ERROR_CONSTANT = 3.3
+    CAPACITY_DECAY = 2 / 3
+    MIN_CAPACITY = 2
+
+    def __init__(self, error=0.01, random_state=42):
+        if not 0 < error < 1:
+            raise ValueError("O erro do sketch deve estar entre 0 e 1.")
+
+        self.error = error
+        self.k = max(8, math.ceil(self.ERROR_CONSTANT / error))
+        self.rng = np.random.default_rng(random_state)
+        self.compactors = [np.empty(0)]
+        self.count = 0
+
+    def _capacity(self, level):
+        """
+        Capacidade do nível, menor para os níveis mais baixos.
+
+        Args:
+            level (int): Nível do compactador.
+
+        Returns:
+            int: Quantidade máxima de itens do nível.
+        """
+        depth = len(self.compactors) - level - 1
+        return max(
+            self.MIN_CAPACITY,
+            math.ceil(self.k * self.CAPACITY_DECAY**depth),
+        )
+
+    def _compress(self):
+        """
+        Compacta os níveis enquanto a quantidade de itens exceder a
+        capacidade total do sketch.
+        """
+        while sum(len(c) for c in self.compactors) > sum(
+            self._capacity(level) for level in range(len(self.compactors))
+        ):
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) < self._capacity(level):
+                    continue
+
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+
+                compactor = np.sort(compactor)
+                # Um item é mantido no nível quando a quantidade é ímpar
+                leftover = compactor[-1:] if len(compactor) % 2 else None
+                pairs = compactor[: len(compactor) - len(compactor) % 2]
+
+                offset = self.rng.integers(0, 2)
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], pairs[offset::2]]
+                )
+                self.compactors[level] = (
+                    leftover if leftover is not None else np.empty(0)
+                )
+                break
+
+    def update(self, values):
+        """
+        Adiciona valores ao sketch, valores ausentes são ignorados.
+
+        Args:
+            values (array-like): Valores numéricos a serem adicionados.
+
+        Returns:
+            KLLSketch: O próprio sketch atualizado.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+
+        self.count += len(values)
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Mescla outro sketch a este, somando os itens de cada nível.
+
+        Args:
+            other (KLLSketch): Sketch calculado sobre outros dados.
+
+        Returns:
+            KLLSketch: O próprio sketch com os dados mesclados.
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate(
+                [self.compactors[level], compactor]
+            )
+
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estima o quantil q dos valores adicionados ao sketch.
+
+        Enquanto nenhuma compactação ocorreu o quantil é exato, calculado
+        como no numpy.
+
+        Args:
+            q (float): Quantil desejado, entre 0 e 1.
+
+        Returns:
+            float: Valor estimado do quantil.
+        """
+        if self.count == 0:
+            return np.nan
+
+        if len(self.compactors) == 1:
+            return float(np.quantile(self.compactors[0], q))
+
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate(
+            [
+                np.full(len(compactor), 2**level)
+                for level, compactor in enumerate(self.compactors)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative_weights = np.cumsum(weights[order])
+
+        position = np.searchsorted(
+            cumulative_weights, q * cumulative_weights[-1], side="left"
+        )
+        return float(items[order][min(position, len(items) - 1)])
+
+    def median(self):
+        """
+        Estima a mediana dos valores adicionados ao sketch.
+
+        Returns:
+            float: Mediana aproximada.
+        """
+        return self.quantile(0.5)
+
+    def __len__(self):
+        """Quantidade de itens armazenados pelo sketch."""
+        return sum(len(compactor) for compactor in self.compactors)
@@ -0,0 +1,272 @@
+"""
+Módulo para leitura tipada dos dados brutos a partir do config/schema.yaml.
+
+A inferência de tipos padrão do pandas lê as colunas numéricas em 64 bits e
+os textos como objetos Python. A leitura guiada pelo schema utiliza os tipos
+declarados, o tipo category para textos de baixa cardinalidade, converte a
+data da compra na leitura e permite ignorar colunas não utilizadas.
+
+Funções
+-------
+- schema_dtypes: Converte o schema em tipos e colunas de data do pandas.
+- read_raw_data: Lê os dados brutos com os tipos do schema.
+- read_new_raw_data: Lê apenas as linhas adicionadas após uma posição do\
+  arquivo, diretamente do arquivo e sem carregar o trecho em memória.
+- raw_data_mark: Tamanho e colunas atuais do arquivo de dados brutos.
+"""
+
+import io
+import os
+
+import pandas as pd
+
+DATE_DTYPE_PREFIX = "datetime64"
+
+# Tamanho dos blocos lidos na busca da última linha completa
+READ_BLOCK_SIZE = 1 << 16
+
+
+def schema_dtypes(schema, downcast_floats=False):
+    """
+    Converte o schema dos dados nos argumentos de tipos do pd.read_csv.
+
+    Args:
+        schema (dict): Colunas e tipos declarados no schema.
+        downcast_floats (bool): Lê as colunas float64 como float32.
+
+    Returns:
+        tuple:
+            - dict: Tipo de cada coluna não temporal.
+            - list(str): Colunas de data a serem convertidas na leitura.
+    """
+    dtypes = {}
+    date_columns = []
+    for col, dtype in schema.items():
+        dtype = str(dtype).strip()
+        if dtype.startswith(DATE_DTYPE_PREFIX):
+            date_columns.append(col)
+        elif downcast_floats and dtype == "float64":
+            dtypes[col] = "float32"
+        else:
+            dtypes[col] = dtype
+
+    return dtypes, date_columns
+
+
+def read_raw_data(
+    path, schema, usecols=None, downcast_floats=False, **options
+):
+    """
+    Lê os dados brutos com os tipos declarados no schema.
+
+    Args:
+        path (Path | io.BytesIO): Arquivo CSV de dados brutos.
+        schema (dict): Colunas e tipos declarados no schema.
+        usecols (list(str)): Colunas a serem lidas, caso vazio todas as\
+                             colunas são lidas.
+        downcast_floats (bool): Lê as colunas float64 como float32.
+        **options: Argumentos repassados ao pd.read_csv, como chunksize\
+                   para leitura em blocos ou names para arquivos sem\
+                   cabeçalho.
+
+    Returns:
+        pd.DataFrame | TextFileReader: Dados lidos ou iterador de blocos.
+    """
+    dtypes, date_columns = schema_dtypes(schema, downcast_floats)
+
+    if usecols is not None:
+        dtypes = {col: dtypes[col] for col in usecols if col in dtypes}
+        date_columns = [col for col in date_columns if col in usecols]
+
+    return pd.read_csv(
+        path,
+        usecols=usecols,
+        dtype=dtypes,
+        parse_dates=date_columns,
+        **options,
+    )
+
+
+class _BoundedReader(io.RawIOBase):
+    """
+    Leitura de um arquivo binário a partir da posição atual até uma posição
+    final, sem carregar o trecho inteiro em memória.
+
+    Args:
+        f (io.BufferedReader): Arquivo aberto em modo binário.
+        end (int): Posição final da leitura.
+    """
+
+    def __init__(self, f, end):
+        super().__init__()
+        self.f = f
+        self.end = end
+
+    def readable(self):
+        """Indica que o trecho pode ser lido."""
+        return True
+
+    def readinto(self, buffer):
+        """
+        Lê o próximo bloco do arquivo no buffer, sem ultrapassar a posição
+        final.
+
+        Args:
+            buffer (memoryview): Buffer de destino.
+
+        Returns:
+            int: Quantidade de bytes lidos, zero ao final do trecho.
+        """
+        size = min(len(buffer), self.end - self.f.tell())
+        if size <= 0:
+            return 0
+        return self.f.readinto(memoryview(buffer)[:size])
+
+
+def _line_end(f, start):
+    """
+    Posição após a última quebra de linha do arquivo, lendo blocos a
+    partir do final, de forma que uma última linha incompleta não é lida.
+
+    Args:
+        f (io.BufferedReader): Arquivo aberto em modo binário.
+        start (int): Posição a partir da qual a quebra de linha é buscada.
+
+    Returns:
+        int: Posição final das linhas completas, ou start caso não existam.
+    """
+    end = f.seek(0, os.SEEK_END)
+    while end > start:
+        block_start = max(end - READ_BLOCK_SIZE, start)
+        f.seek(block_start)
+        newline = f.read(end - block_start).rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        end = block_start
+    return start
+
+
+def _has_content(f, start, end):
+    """
+    Verifica se o trecho do arquivo possui caracteres além de espaços e
+    quebras de linha, lendo blocos a partir do início.
+
+    Args:
+        f (io.BufferedReader): Arquivo aberto em modo binário.
+        start (int): Posição inicial do trecho.
+        end (int): Posição final do trecho.
+
+    Returns:
+        bool: Verdadeiro caso o trecho possua dados.
+    """
+    f.seek(start)
+    while f.tell() < end:
+        block = f.read(min(READ_BLOCK_SIZE, end - f.tell()))
+        if block.strip():
+            return True
+    return False
+
+
+def _read_region(path, start, end, read_options):
+    """
+    Lê as linhas de um trecho do arquivo com o pd.read_csv diretamente do
+    arquivo aberto.
+
+    Args:
+        path (Path): Caminho do arquivo CSV de dados brutos.
+        start (int): Posição inicial do trecho.
+        end (int): Posição final do trecho, após uma quebra de linha.
+        read_options (dict): Argumentos repassados ao read_raw_data.
+
+    Returns:
+        pd.DataFrame: Linhas do trecho.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        return read_raw_data(
+            io.BufferedReader(_BoundedReader(f, end)), **read_options
+        )
+
+
+def _read_region_chunks(path, start, end, read_options):
+    """
+    Lê as linhas de um trecho do arquivo em blocos, mantendo o arquivo
+    aberto enquanto os blocos são consumidos.
+
+    Args:
+        path (Path): Caminho do arquivo CSV de dados brutos.
+        start (int): Posição inicial do trecho.
+        end (int): Posição final do trecho, após uma quebra de linha.
+        read_options (dict): Argumentos repassados ao read_raw_data,\
+                             incluindo chunksize.
+
+    Yields:
+        pd.DataFrame: Blocos de linhas do trecho.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        with read_raw_data(
+            io.BufferedReader(_BoundedReader(f, end)), **read_options
+        ) as reader:
+            yield from reader
+
+
+def read_new_raw_data(path, schema, byte_offset, **read_options):
+    """
+    Lê apenas as linhas adicionadas ao final dos dados brutos após a
+    posição informada, sem percorrer as linhas anteriores. Uma última linha
+    incompleta, ainda sendo escrita, é deixada para a próxima leitura.
+
+    As linhas são interpretadas pelo pd.read_csv diretamente do arquivo, a
+    partir da posição informada, sem carregar o trecho adicionado em
+    memória. Com chunksize, os blocos são lidos à medida que são
+    consumidos.
+
+    Args:
+        path (Path): Caminho do arquivo CSV de dados brutos.
+        schema (dict): Colunas e tipos declarados no schema.
+        byte_offset (int): Posição do arquivo até onde os dados já foram\
+                           lidos.
+        **read_options: Argumentos repassados ao read_raw_data.
+
+    Returns:
+        tuple:
+            - pd.DataFrame | Iterator: Novas linhas, ou iterador de blocos\
+              com chunksize, ou None caso não existam.
+            - int: Nova posição lida do arquivo.
+    """
+    columns = list(pd.read_csv(path, nrows=0).columns)
+
+    with open(path, "rb") as f:
+        end = _line_end(f, byte_offset)
+        if not _has_content(f, byte_offset, end):
+            return None, byte_offset
+
+    read_options = {
+        **read_options,
+        "schema": schema,
+        "header": None,
+        "names": columns,
+    }
+    if read_options.get("chunksize"):
+        data = _read_region_chunks(path, byte_offset, end, read_options)
+    else:
+        data = _read_region(path, byte_offset, end, read_options)
+    return data, end
+
+
+def raw_data_mark(path):
+    """
+    Retorna a marca de leitura dos dados brutos: tamanho do arquivo e
+    colunas do cabeçalho, utilizados pela leitura incremental.
+
+    Args:
+        path (Path): Caminho do arquivo CSV de dados brutos.
+
+    Returns:
+        dict: Tamanho em bytes e colunas do arquivo.
+    """
+    return {
+        "bytes": os.path.getsize(path),
+        "columns": list(pd.read_csv(path, nrows=0).columns),
+    }
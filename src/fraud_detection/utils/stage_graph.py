@@ -0,0 +1,307 @@
+"""
+Módulo de execução incremental das etapas do treinamento.
+
+As etapas são descritas como um grafo, declarando as etapas das quais
+dependem, as entradas externas, as saídas, as seções de configuração e os
+módulos de código utilizados. A impressão digital (fingerprint) de uma etapa
+combina o conteúdo das entradas, as configurações, o código, as versões das
+bibliotecas e as impressões digitais das etapas anteriores.
+
+Assim como no make, uma etapa é reutilizada quando sua impressão digital é a
+mesma da última execução, todas as saídas existem e nenhuma etapa da qual
+depende foi executada novamente.
+
+Classes
+-------
+- Stage: Descrição de uma etapa do grafo.
+- StageRunner: Decide quais etapas executar e registra as execuções.
+
+Funções
+-------
+- file_digest: Hash do conteúdo de um arquivo.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Callable
+
+from tabulate import tabulate
+
+from fraud_detection.utils.artifacts import resolve_artifact_path
+
+# Módulos utilizados por todas as etapas
+COMMON_CODE = (
+    "fraud_detection.config.manager",
+    "fraud_detection.entity.config_entity",
+    "fraud_detection.utils.commons",
+    "fraud_detection.utils.artifact_store",
+    "fraud_detection.utils.artifacts",
+)
+
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Descrição de uma etapa do grafo de treinamento.
+
+    Args:
+        key (str): Identificador da etapa, utilizado no --force.
+        name (str): Nome da etapa exibido nos logs.
+        function (Callable): Função da etapa, recebendo config e store.
+        depends_on (tuple(str)): Identificadores das etapas anteriores.
+        inputs (tuple(str)): Arquivos externos lidos pela etapa.
+        outputs (tuple(str)): Artefatos produzidos, com ou sem extensão.
+        params (tuple(str)): Seções de configuração utilizadas, no formato\
+                             "arquivo.seção", como "config.model_trainer".
+        code (tuple(str)): Módulos de código da etapa.
+        packages (tuple(str)): Bibliotecas cujas versões afetam o resultado.
+    """
+
+    key: str
+    name: str
+    function: Callable
+    depends_on: tuple = ()
+    inputs: tuple = ()
+    outputs: tuple = ()
+    params: tuple = ()
+    code: tuple = ()
+    packages: tuple = ()
+
+
+def file_digest(path, cache=None):
+    """
+    Calcula o hash SHA-256 do conteúdo de um arquivo, lido em blocos.
+
+    Quando informado, o cache guarda o hash junto do tamanho e da data de
+    modificação do arquivo, evitando reler arquivos inalterados.
+
+    Args:
+        path (str): Caminho do arquivo.
+        cache (dict): Hashes já calculados, indexados pelo caminho.
+
+    Returns:
+        str: Hash do conteúdo, ou None caso o arquivo não exista.
+    """
+    if not os.path.exists(path):
+        return None
+
+    stat = os.stat(path)
+    key = str(path)
+    cached = (cache or {}).get(key)
+    if (
+        cached
+        and cached["size"] == stat.st_size
+        and cached["mtime_ns"] == stat.st_mtime_ns
+    ):
+        return cached["digest"]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DIGEST_BLOCK_SIZE), b""):
+            digest.update(block)
+
+    if cache is not None:
+        cache[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest.hexdigest(),
+        }
+    return digest.hexdigest()
+
+
+def _output_exists(path):
+    """Verifica se o artefato existe, com ou sem extensão no caminho."""
+    if os.path.exists(path):
+        return True
+    try:
+        resolve_artifact_path(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _package_version(package):
+    """Versão instalada de uma biblioteca, ou None caso ausente."""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class StageRunner:
+    """
+    Decide quais etapas do grafo precisam ser executadas e registra as
+    impressões digitais e os tempos das execuções em um arquivo JSON.
+
+    Args:
+        stages (list(Stage)): Etapas em ordem topológica.
+        config (ConfigurationManager): Configurações carregadas.
+        state_path (str): Arquivo JSON com o estado da última execução.
+        force (list(str)): Etapas executadas mesmo quando atualizadas,\
+                           "all" força todas as etapas.
+    """
+
+    def __init__(self, stages, config, state_path, force=None):
+        self.stages = stages
+        self.config = config
+        self.state_path = state_path
+        self.force = set(force or [])
+        if "all" in self.force:
+            self.force = {stage.key for stage in stages}
+
+        self.state = {"stages": {}, "files": {}}
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="UTF-8") as f:
+                self.state = json.load(f)
+
+        self.fingerprints = {}
+        self.executed = set()
+        self.results = []
+
+    def _params(self, section):
+        """Valores de uma seção de configuração, como "config.seção"."""
+        value = self.config
+        for attribute in section.split("."):
+            value = getattr(value, attribute)
+        return value
+
+    def fingerprint(self, stage):
+        """
+        Calcula a impressão digital da etapa. As etapas anteriores devem ter
+        sido avaliadas antes, seguindo a ordem topológica.
+
+        Args:
+            stage (Stage): Etapa avaliada.
+
+        Returns:
+            str: Hash das entradas, configurações e código da etapa.
+        """
+        code = COMMON_CODE + stage.code
+        content = {
+            "depends_on": {
+                key: self.fingerprints[key] for key in stage.depends_on
+            },
+            "inputs": {
+                str(path): file_digest(path, self.state["files"])
+                for path in stage.inputs
+            },
+            "params": {
+                section: self._params(section) for section in stage.params
+            },
+            "code": {
+                module: file_digest(importlib.util.find_spec(module).origin)
+                for module in code
+            },
+            "packages": {
+                package: _package_version(package)
+                for package in stage.packages
+            },
+        }
+        fingerprint = hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        self.fingerprints[stage.key] = fingerprint
+        return fingerprint
+
+    def is_up_to_date(self, stage):
+        """
+        Verifica se a etapa pode ser reutilizada: impressão digital igual à
+        da última execução, saídas existentes, nenhuma etapa anterior
+        executada nesta rodada e ausência de --force.
+
+        Args:
+            stage (Stage): Etapa avaliada.
+
+        Returns:
+            bool: True caso a etapa esteja atualizada.
+        """
+        fingerprint = self.fingerprint(stage)
+        previous = self.state["stages"].get(stage.key, {})
+
+        return (
+            stage.key not in self.force
+            and previous.get("fingerprint") == fingerprint
+            and not self.executed.intersection(stage.depends_on)
+            and all(_output_exists(path) for path in stage.outputs)
+        )
+
+    def reuse(self, stage):
+        """
+        Registra a reutilização da etapa, contabilizando o tempo da última
+        execução como tempo economizado.
+
+        Args:
+            stage (Stage): Etapa reutilizada.
+        """
+        self.results.append(
+            {
+                "etapa": stage.name,
+                "situação": "reutilizada",
+                "tempo (s)": 0.0,
+                "tempo economizado (s)": self.state["stages"][stage.key][
+                    "seconds"
+                ],
+            }
+        )
+
+    def run(self, stage, **kwargs):
+        """
+        Executa a etapa e registra sua impressão digital e duração. O estado
+        é salvo apenas em save_state, após a persistência dos artefatos.
+
+        Args:
+            stage (Stage): Etapa executada.
+            **kwargs: Argumentos repassados à função da etapa.
+        """
+        # Uma execução interrompida não deve deixar a etapa como atualizada
+        self.state["stages"].pop(stage.key, None)
+
+        start = time.perf_counter()
+        stage.function(**kwargs)
+        seconds = time.perf_counter() - start
+
+        self.executed.add(stage.key)
+        self.state["stages"][stage.key] = {
+            "fingerprint": self.fingerprints[stage.key],
+            "seconds": seconds,
+        }
+        self.results.append(
+            {
+                "etapa": stage.name,
+                "situação": (
+                    "forçada" if stage.key in self.force else "executada"
+                ),
+                "tempo (s)": seconds,
+                "tempo economizado (s)": 0.0,
+            }
+        )
+
+    def save_state(self):
+        """Salva as impressões digitais das etapas executadas."""
+        with open(self.state_path, "w", encoding="UTF-8") as f:
+            json.dump(self.state, f, indent=4)
+
+    def summary(self):
+        """
+        Resumo da execução, com a situação e o tempo de cada etapa.
+
+        Returns:
+            str: Tabela das etapas e total de tempo economizado.
+        """
+        saved = sum(result["tempo economizado (s)"] for result in self.results)
+        reused = sum(
+            result["situação"] == "reutilizada" for result in self.results
+        )
+        table = tabulate(self.results, headers="keys", floatfmt=".2f")
+        return (
+            f"{table}\n{reused} etapa(s) reutilizada(s), "
+            f"{saved:.2f} s economizados"
+        )